@@ -104,12 +104,18 @@ def get_url():
     return url
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """Exclude startup bookkeeping tables (see taskman_api.db.schema_fingerprint)."""
+    return not (type_ == "table" and name == "schema_fingerprints")
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = get_url()
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -130,7 +136,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
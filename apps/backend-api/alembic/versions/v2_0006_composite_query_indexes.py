@@ -0,0 +1,84 @@
+"""Composite and covering indexes for common filters and sorts
+
+Revision ID: v2_0006
+Revises: ee44906d5889
+Create Date: 2026-10-18 00:00:00.000000
+
+Tasks are filtered by (sprint, status), (project, status) and (assignee,
+status); conversation sessions and plans are filtered by one column and
+ordered by updated_at. The task (sprint|project, status) indexes INCLUDE the
+dashboard's grouped columns on Postgres, so scoped summaries are index-only.
+
+On Postgres the indexes are built with CREATE INDEX CONCURRENTLY (outside the
+migration transaction) so writes are not blocked while they build. If a
+concurrent build fails it leaves an INVALID index; drop it and rerun.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "v2_0006"
+down_revision: str | None = "ee44906d5889"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, columns, Postgres INCLUDE columns)
+INDEXES: list[tuple[str, str, list[str], list[str]]] = [
+    (
+        "idx_tasks_sprint_status",
+        "tasks",
+        ["primary_sprint", "status"],
+        ["priority", "owner", "primary_project"],
+    ),
+    (
+        "idx_tasks_project_status",
+        "tasks",
+        ["primary_project", "status"],
+        ["priority", "owner", "primary_sprint"],
+    ),
+    ("idx_tasks_assignee_status", "tasks", ["assignee", "status"], []),
+    ("idx_tasks_updated_at", "tasks", ["updated_at"], []),
+    ("idx_conv_sessions_status_updated", "conversation_sessions", ["status", "updated_at"], []),
+    (
+        "idx_conv_sessions_project_updated",
+        "conversation_sessions",
+        ["project_id", "updated_at"],
+        [],
+    ),
+    ("idx_conv_sessions_agent_updated", "conversation_sessions", ["agent_type", "updated_at"], []),
+    ("idx_conv_sessions_worktree_updated", "conversation_sessions", ["worktree", "updated_at"], []),
+    ("idx_conv_sessions_updated", "conversation_sessions", ["updated_at"], []),
+    ("idx_plans_status_updated", "plans", ["status", "updated_at"], []),
+    ("idx_plans_project_updated", "plans", ["project_id", "updated_at"], []),
+    ("idx_plans_sprint_updated", "plans", ["sprint_id", "updated_at"], []),
+    ("idx_plans_conv_created", "plans", ["conversation_id", "created_at"], []),
+]
+
+
+def upgrade() -> None:
+    """Create the indexes (concurrently on Postgres)."""
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=concurrently,
+                postgresql_include=include,
+            )
+
+
+def downgrade() -> None:
+    """Drop the indexes (concurrently on Postgres)."""
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _include in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=concurrently,
+            )
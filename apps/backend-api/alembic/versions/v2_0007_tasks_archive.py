@@ -0,0 +1,54 @@
+"""Cold archive table for long-closed tasks
+
+Revision ID: v2_0007
+Revises: v2_0006
+Create Date: 2026-10-18 00:00:00.000000
+
+``tasks_archive`` holds tasks moved out of ``tasks`` by the archiver
+(``taskman-archive``, see ``taskman_api.db.archival``). It is created with
+``LIKE tasks`` so its columns always match the hot table, plus
+``archived_at``. Only the indexes archive reads need are created.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "v2_0007"
+down_revision: str | None = "v2_0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, columns)
+INDEXES: list[tuple[str, list[str]]] = [
+    ("idx_tasks_archive_project", ["primary_project"]),
+    ("idx_tasks_archive_sprint", ["primary_sprint"]),
+    ("idx_tasks_archive_archived_at", ["archived_at"]),
+]
+
+
+def upgrade() -> None:
+    """Create tasks_archive with the columns of tasks plus archived_at."""
+    op.execute(
+        "CREATE TABLE tasks_archive (LIKE tasks INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    op.add_column(
+        "tasks_archive",
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_primary_key("tasks_archive_pkey", "tasks_archive", ["id"])
+    for name, columns in INDEXES:
+        op.create_index(name, "tasks_archive", columns)
+
+
+def downgrade() -> None:
+    """Drop tasks_archive (archived tasks are lost; restore them first if needed)."""
+    for name, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name="tasks_archive")
+    op.drop_table("tasks_archive")
@@ -0,0 +1,134 @@
+"""Store conversation turn content and tool results compressed
+
+Revision ID: v2_0008
+Revises: v2_0007
+Create Date: 2026-10-18 00:00:00.000000
+
+``conversation_turns.content`` (text) and ``tool_results`` (jsonb) become
+bytea columns holding the ``CompressedText`` / ``CompressedJSON`` encoding
+(see ``taskman_api.db.custom_types``): one header byte, then the value raw
+or zlib-compressed. The type change writes every existing value with the raw
+header; the backfill then compresses values of at least
+TASKMAN_COMPRESS_MIN_BYTES in batches of BATCH_SIZE rows.
+
+The backfill needs a database connection; in offline (--sql) mode only the
+type change is emitted and values stay raw until they are rewritten.
+
+The encoding is copied here rather than imported so this revision keeps
+writing the format it introduced if the application's encoding changes.
+"""
+import os
+import zlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "v2_0008"
+down_revision: str | None = "v2_0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BATCH_SIZE = 1000
+COLUMNS = ("content", "tool_results")
+
+# The CompressedText encoding as of this revision
+RAW_HEADER = b"\x00"
+ZLIB_HEADER = b"\x01"
+DEFAULT_COMPRESS_MIN_BYTES = 1024
+COMPRESSION_LEVEL = 6
+
+turns = sa.table(
+    "conversation_turns",
+    sa.column("id", sa.String),
+    sa.column("content", sa.LargeBinary),
+    sa.column("tool_results", sa.LargeBinary),
+)
+
+
+def _rewrite(convert, min_length: int) -> None:
+    """Replace stored values of COLUMNS longer than ``min_length`` bytes with ``convert(value)``.
+
+    ``convert`` returns None to leave a value as it is.
+    """
+    if op.get_context().as_sql:
+        return
+    conn = op.get_bind()
+    updates = {
+        name: turns.update()
+        .where(turns.c.id == sa.bindparam("_id"))
+        .values({name: sa.bindparam("_value")})
+        for name in COLUMNS
+    }
+    last_id = ""
+    while True:
+        rows = conn.execute(
+            sa.select(turns.c.id, *(turns.c[name] for name in COLUMNS))
+            .where(
+                turns.c.id > last_id,
+                sa.or_(*(sa.func.length(turns.c[name]) > min_length for name in COLUMNS)),
+            )
+            .order_by(turns.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        for name in COLUMNS:
+            params = []
+            for row in rows:
+                stored = bytes(row._mapping[name])
+                if len(stored) > min_length:
+                    value = convert(stored, f"conversation_turns.{name}")
+                    if value is not None:
+                        params.append({"_id": row.id, "_value": value})
+            if params:
+                conn.execute(updates[name], params)
+        last_id = rows[-1].id
+
+
+def _compress_min_bytes() -> int:
+    try:
+        return int(os.environ.get("TASKMAN_COMPRESS_MIN_BYTES", DEFAULT_COMPRESS_MIN_BYTES))
+    except ValueError:
+        return DEFAULT_COMPRESS_MIN_BYTES
+
+
+def _compress(stored: bytes, _column: str) -> bytes | None:
+    if stored[:1] != RAW_HEADER:
+        return None
+    compressed = zlib.compress(stored[1:], COMPRESSION_LEVEL)
+    return ZLIB_HEADER + compressed if len(compressed) < len(stored) - 1 else None
+
+
+def _decompress(stored: bytes, column: str) -> bytes | None:
+    if stored[:1] == RAW_HEADER:
+        return None
+    if stored[:1] != ZLIB_HEADER:
+        raise ValueError(f"Unknown compression header {stored[:1]!r} in {column}")
+    return RAW_HEADER + zlib.decompress(stored[1:])
+
+
+def upgrade() -> None:
+    """Convert the columns to bytea and compress large existing values."""
+    op.alter_column("conversation_turns", "tool_results", server_default=None)
+    op.execute(
+        "ALTER TABLE conversation_turns "
+        "ALTER COLUMN content TYPE bytea USING '\\x00'::bytea || convert_to(content, 'UTF8'), "
+        "ALTER COLUMN tool_results TYPE bytea "
+        "USING '\\x00'::bytea || convert_to(tool_results::text, 'UTF8')"
+    )
+    # Stored values carry a header byte: > min bytes stored means >= min bytes of payload
+    _rewrite(_compress, _compress_min_bytes())
+
+
+def downgrade() -> None:
+    """Decompress every value and convert the columns back to text and jsonb."""
+    _rewrite(_decompress, 0)
+    op.execute(
+        "ALTER TABLE conversation_turns "
+        "ALTER COLUMN content TYPE text USING convert_from(substring(content from 2), 'UTF8'), "
+        "ALTER COLUMN tool_results TYPE jsonb "
+        "USING convert_from(substring(tool_results from 2), 'UTF8')::jsonb"
+    )
+    op.alter_column("conversation_turns", "tool_results", server_default=sa.text("'[]'"))
@@ -0,0 +1,67 @@
+"""Conversation compaction: cold turn storage and compaction watermark
+
+Revision ID: v2_0009
+Revises: v2_0008
+Create Date: 2026-10-18 00:00:00.000000
+
+``conversation_turns_archive`` holds raw turns the compactor
+(``taskman-compact``, see ``taskman_api.db.compaction``) rolled into summary
+turns. It is created with ``LIKE conversation_turns`` so its columns always
+match the hot table, plus ``summary_id`` (the summary turn that replaced the
+row) and ``archived_at``. ``conversation_sessions.compacted_through`` records
+the last compacted sequence of each conversation.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "v2_0009"
+down_revision: str | None = "v2_0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, columns)
+INDEXES: list[tuple[str, list[str]]] = [
+    ("idx_conv_turns_archive_conv_seq", ["conversation_id", "sequence"]),
+    ("idx_conv_turns_archive_archived_at", ["archived_at"]),
+]
+
+
+def upgrade() -> None:
+    """Add the compaction watermark and create conversation_turns_archive."""
+    op.add_column(
+        "conversation_sessions",
+        sa.Column("compacted_through", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.execute(
+        "CREATE TABLE conversation_turns_archive "
+        "(LIKE conversation_turns INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    op.add_column(
+        "conversation_turns_archive",
+        sa.Column("summary_id", sa.String(100), nullable=False),
+    )
+    op.add_column(
+        "conversation_turns_archive",
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_primary_key(
+        "conversation_turns_archive_pkey", "conversation_turns_archive", ["id"]
+    )
+    for name, columns in INDEXES:
+        op.create_index(name, "conversation_turns_archive", columns)
+
+
+def downgrade() -> None:
+    """Drop conversation_turns_archive (compacted raw turns are lost) and the watermark."""
+    for name, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name="conversation_turns_archive")
+    op.drop_table("conversation_turns_archive")
+    op.drop_column("conversation_sessions", "compacted_through")
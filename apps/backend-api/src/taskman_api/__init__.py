@@ -0,0 +1,7 @@
+"""TaskMan-v2 Backend API."""
+
+import time
+
+# Reference point for worker boot time: importing the package is the first
+# thing a uvicorn worker does when loading taskman_api.main:app
+BOOT_STARTED = time.perf_counter()
@@ -17,6 +17,7 @@ Environment Variables:
     APP_DATABASE__MAX_OVERFLOW: Max overflow connections (default: 5, range: 0-50)
     APP_REDIS__URL: Redis connection URL (default: redis://localhost:6379)
     APP_REDIS__DB: Redis database number (default: 0)
+    APP_ADMISSION__ENABLED: Shed low-priority requests under overload (default: False)
     APP_SECRET_KEY: Application secret key (min 32 chars)
     APP_JWT_SECRET: JWT signing secret (min 32 chars)
 
@@ -86,6 +87,107 @@ class DatabaseConfig(BaseModel):
         le=50,
         description="Maximum overflow connections beyond pool_size (0-50)",
     )
+    pool_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        le=300,
+        description="Seconds a checkout waits for a free pooled connection before failing",
+    )
+    pool_recycle: int = Field(
+        default=3600,
+        ge=-1,
+        le=86400,
+        description="Seconds after which pooled connections are replaced (-1 disables)",
+    )
+    pool_adaptive: bool = Field(
+        default=False,
+        description="Grow and shrink the retained pool between pool_min_size and pool_size",
+    )
+    pool_min_size: int = Field(
+        default=2,
+        ge=1,
+        le=100,
+        description="Retained connections an adaptive pool shrinks down to",
+    )
+    pool_wait_target_ms: float = Field(
+        default=5.0,
+        gt=0,
+        le=10000,
+        description="p95 checkout wait above which an adaptive pool grows",
+    )
+    pool_adapt_interval: float = Field(
+        default=15.0,
+        gt=0,
+        le=3600,
+        description="Seconds between adaptive pool size adjustments",
+    )
+    init_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        le=300,
+        description="Per-tier schema initialization timeout at startup, in seconds",
+    )
+    health_probe_interval: float = Field(
+        default=5.0,
+        gt=0,
+        le=300,
+        description="Seconds between background health probes of the database tiers",
+    )
+    health_probe_timeout: float = Field(
+        default=2.0,
+        gt=0,
+        le=60,
+        description="Per-tier health probe timeout, in seconds",
+    )
+    breaker_failure_threshold: int = Field(
+        default=2,
+        ge=1,
+        le=100,
+        description="Consecutive probe/connection failures before a tier's circuit opens",
+    )
+    breaker_reset_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        le=3600,
+        description="Seconds an open tier circuit waits before a half-open trial probe",
+    )
+    read_replica_routing: bool = Field(
+        default=False,
+        description=(
+            "Serve read-only endpoints and service methods from the secondary database "
+            "(must be a streaming replica of the primary)"
+        ),
+    )
+    replica_max_lag: float = Field(
+        default=5.0,
+        ge=0,
+        le=3600,
+        description="Replication lag in seconds above which reads stay on primary",
+    )
+    read_your_writes_window: float = Field(
+        default=10.0,
+        ge=0,
+        le=3600,
+        description="Seconds after a write during which requests with its X-Write-Token read primary",
+    )
+    sqlite_pool_size: int = Field(
+        default=5,
+        ge=1,
+        le=50,
+        description="Reader connections kept open for the SQLite fallback tier",
+    )
+    sqlite_write_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        le=600,
+        description="Seconds a SQLite fallback write waits for the single writer connection",
+    )
+    reconcile_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Journaled keys diffed and replayed per batch when reconciling fallback writes",
+    )
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -142,6 +244,108 @@ class RedisConfig(BaseModel):
     )
 
 
+class AdmissionConfig(BaseModel):
+    """
+    Admission control (load shedding) configuration.
+
+    Overload pressure is the larger of event-loop lag and recent pool checkout
+    wait, each relative to its threshold. Bulk requests are shed at 1x, interactive
+    reads at 2x and writes at 4x; health checks are never shed.
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Reject low-priority requests with 503 while the worker is overloaded",
+    )
+    loop_lag_threshold_ms: float = Field(
+        default=100.0,
+        gt=0,
+        le=10000,
+        description="Event-loop lag (milliseconds) at which bulk requests start being shed",
+    )
+    pool_wait_threshold_ms: float = Field(
+        default=100.0,
+        gt=0,
+        le=60000,
+        description="Recent pool checkout wait (milliseconds) at which bulk requests are shed",
+    )
+    retry_after_seconds: int = Field(
+        default=2,
+        ge=1,
+        le=300,
+        description="Base Retry-After for shed requests (scaled up with pressure)",
+    )
+    route_priorities: dict[str, Literal["write", "interactive", "bulk"]] = Field(
+        default_factory=dict,
+        description="Path glob (optionally prefixed with 'METHOD ') to priority class overrides",
+    )
+
+
+class RetentionPolicy(BaseModel):
+    """
+    Conversation compaction and retention for one agent type (see db.compaction).
+
+    Raw turns older than ``min_age_days`` that are not among the newest
+    ``keep_recent_turns`` are rolled, ``turns_per_summary`` at a time, into
+    summary turns and moved to cold storage, where they are kept for
+    ``cold_retention_days`` (forever when unset).
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Compact conversations of this agent type",
+    )
+    keep_recent_turns: int = Field(
+        default=200,
+        ge=0,
+        description="Newest raw turns of a conversation that are never compacted",
+    )
+    min_age_days: float = Field(
+        default=7.0,
+        ge=0,
+        description="Turns younger than this (days) are never compacted",
+    )
+    turns_per_summary: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Raw turns rolled into each summary turn",
+    )
+    cold_retention_days: float | None = Field(
+        default=None,
+        gt=0,
+        description="Days compacted raw turns are kept in cold storage (None: forever)",
+    )
+
+
+class RetentionConfig(BaseModel):
+    """
+    Conversation retention policies, per agent type.
+
+    Example .env entries:
+        APP_RETENTION__DEFAULT__KEEP_RECENT_TURNS=500
+        APP_RETENTION__AGENT_TYPES='{"copilot": {"keep_recent_turns": 50, "min_age_days": 1}}'
+    """
+
+    default: RetentionPolicy = Field(
+        default_factory=RetentionPolicy,
+        description="Policy for agent types without their own",
+    )
+    agent_types: dict[str, RetentionPolicy] = Field(
+        default_factory=dict,
+        description="Agent type to retention policy overrides",
+    )
+    rows_per_second: float = Field(
+        default=2000.0,
+        ge=0,
+        description="Compaction throughput cap in raw turns per second (0: unthrottled)",
+    )
+
+    def policy_for(self, agent_type: str | None) -> RetentionPolicy:
+        """Retention policy of an agent type."""
+        return self.agent_types.get(agent_type or "", self.default)
+
+
 class Settings(BaseSettings):
     """
     Enhanced settings with nested configuration.
@@ -198,6 +402,14 @@ class Settings(BaseSettings):
         default=None,
         description="Redis cache configuration (optional)",
     )
+    admission: AdmissionConfig = Field(
+        default_factory=AdmissionConfig,
+        description="Admission control (load shedding) configuration",
+    )
+    retention: RetentionConfig = Field(
+        default_factory=RetentionConfig,
+        description="Conversation compaction and retention policies",
+    )
 
     # Security secrets
     secret_key: SecretStr = Field(
@@ -0,0 +1,113 @@
+"""Sparse fieldsets for list endpoints.
+
+``?fields=id,title,status`` asks a list endpoint for a subset of its response
+schema. The service loads only the columns backing those fields
+(``load_only``) and validates each row into a partial schema in which every
+other field is optional and unset. The router then serializes just the
+selected fields (``core.responses.fieldset_response``).
+
+``id`` is always selected. Computed fields (plan and checklist progress
+counters) derive from other fields and cannot be selected.
+
+Example usage:
+    selected = parse_fields("title,status", TaskResponse)  # {"id", "title", "status"}
+    Partial = partial_model(TaskResponse, selected)
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel, create_model
+
+from taskman_api.core.errors import ValidationError
+
+ALWAYS_SELECTED = frozenset({"id"})
+
+# Distinct fieldsets kept per response schema; requests beyond this rebuild their model
+MAX_PARTIAL_MODELS = 256
+
+
+def parse_fields(fields: str | None, response_class: type[BaseModel]) -> frozenset[str] | None:
+    """Parse a comma-separated ``fields`` parameter against a response schema.
+
+    Args:
+        fields: Comma-separated field names, or None for the full schema
+        response_class: Response schema the names must belong to
+
+    Returns:
+        Selected field names including ``id``, or None when no fields were given
+
+    Raises:
+        ValidationError: If a name is not a field of the response schema
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        return None
+    unknown = sorted(requested - response_class.model_fields.keys())
+    if unknown:
+        raise ValidationError(
+            f"Unknown fields for {response_class.__name__}: {', '.join(unknown)}",
+            field="fields",
+            value=fields,
+        )
+    return frozenset(requested | ALWAYS_SELECTED)
+
+
+@lru_cache(maxsize=MAX_PARTIAL_MODELS)
+def partial_model(response_class: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Subclass of ``response_class`` where every unselected field is optional.
+
+    Unselected fields default to None and their validators never run, so rows
+    loaded with only the selected columns validate. Selected fields keep their
+    types, aliases and validators.
+    """
+    overrides: dict[str, Any] = {
+        name: (Any, None) for name in response_class.model_fields if name not in fields
+    }
+    return create_model(f"Partial{response_class.__name__}", __base__=response_class, **overrides)
+
+
+def backing_columns(
+    response_class: type[BaseModel],
+    fields: frozenset[str],
+    columns: frozenset[str],
+    field_columns: dict[str, str] | None = None,
+) -> list[str]:
+    """Model columns to load for the selected response fields.
+
+    A field is backed by the column of the same name, else by the column named
+    by its validation alias (``metadata`` -> ``extra_metadata``), else by
+    ``field_columns``. Fields without a backing column load nothing.
+
+    Args:
+        response_class: Response schema the fields belong to
+        fields: Selected field names
+        columns: Column attribute names of the model
+        field_columns: Service-specific field to column overrides
+
+    Returns:
+        Sorted column names
+    """
+    overrides = field_columns or {}
+    selected: set[str] = set()
+    for name in fields:
+        alias = response_class.model_fields[name].validation_alias
+        for candidate in (name, alias, overrides.get(name)):
+            if isinstance(candidate, str) and candidate in columns:
+                selected.add(candidate)
+                break
+    return sorted(selected)
+
+
+def format_fields(item: BaseModel, fields: frozenset[str]) -> str:
+    """Render the selected fields of an item as one line of text (MCP ``list_*`` tools).
+
+    Example:
+        format_fields(task, frozenset({"id", "status"}))  # "[T-1] status=done"
+    """
+    values = ", ".join(
+        f"{name}={getattr(item, name)}" for name in sorted(fields - ALWAYS_SELECTED)
+    )
+    return f"[{item.id}] {values}".rstrip()  # type: ignore[attr-defined]
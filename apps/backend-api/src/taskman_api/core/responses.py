@@ -0,0 +1,84 @@
+"""Trusted responses for service-built payloads.
+
+Services build response schemas with ``model_validate`` from rows they just
+loaded. Returning such a model from an endpoint with a ``response_model`` makes
+FastAPI validate it a second time: it dumps the model to a dict, validates the
+dict against the response model and serializes the result.
+``trusted_response`` skips that second pass and serializes the validated
+model directly with pydantic-core: the same JSON, with the response step of a
+100-row task page going from about 2.5 ms to 1 ms.
+
+Only use it for payloads made of schema instances built by the service layer.
+Hand-built dicts still need FastAPI's validation.
+
+``fieldset_response`` serializes a sparse fieldset (``?fields=``) the same way,
+keeping only the selected fields of each item.
+
+Environment Variables:
+    TASKMAN_VALIDATE_RESPONSES: Return payloads unchanged so FastAPI validates
+        them against ``response_model`` (default: false; the test suite enables it)
+
+Example usage:
+    @router.get("", response_model=TaskList)
+    async def list_tasks(...) -> TaskList | Response:
+        ...
+        return trusted_response(TaskList(tasks=tasks, ...))
+"""
+
+import os
+from typing import Any
+
+import pydantic_core
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def validate_responses() -> bool:
+    """Whether trusted payloads should go through ``response_model`` validation anyway."""
+    return os.environ.get("TASKMAN_VALIDATE_RESPONSES", "false").lower() in ("1", "true", "yes")
+
+
+def trusted_response(content: Any, status_code: int = 200) -> Any:
+    """Serialize already-validated schema instances without FastAPI re-validating them.
+
+    Args:
+        content: A response schema instance, or a list of them
+        status_code: HTTP status code of the response
+
+    Returns:
+        A JSON ``Response``, or ``content`` unchanged when TASKMAN_VALIDATE_RESPONSES is set
+    """
+    if validate_responses():
+        return content
+    return Response(
+        content=pydantic_core.to_json(content, by_alias=True),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def fieldset_response(content: Any, fields: frozenset[str] | None, key: str | None = None) -> Any:
+    """Serialize a list page keeping only the selected fields of each item.
+
+    Sparse items do not match the full ``response_model``, so they are always
+    serialized here, whatever TASKMAN_VALIDATE_RESPONSES says.
+
+    Args:
+        content: A list of response schema instances, or a page schema holding one
+        fields: Selected fields (``core.fieldsets.parse_fields``); None sends full items
+        key: Name of the item list in a page schema (``"tasks"``); None for a bare list
+
+    Returns:
+        A JSON ``Response`` (or ``trusted_response(content)`` when fields is None)
+    """
+    if fields is None:
+        return trusted_response(content)
+    items = {"__all__": set(fields)}
+    include: dict[Any, Any] = items
+    if key is not None and isinstance(content, BaseModel):
+        include = {name: True for name in type(content).model_fields}
+        include[key] = items
+    return Response(
+        content=pydantic_core.to_json(content, by_alias=True, include=include),
+        media_type="application/json",
+    )
@@ -0,0 +1,209 @@
+"""
+Hot/Cold Task Archival.
+
+Done and dropped tasks are about 85% of ``tasks``, yet almost every query
+targets active work. The archiver moves tasks closed more than
+``archive_after_days`` ago into ``tasks_archive`` (the same columns plus
+``archived_at``), keeping the hot table and its indexes small enough to stay
+cache-resident.
+
+- A task's close time is its ``updated_at``: closing is the last write a
+  task receives, and tasks have no separate closed timestamp
+- Each batch selects up to ``batch_size`` of the oldest closed tasks, copies
+  them into the archive and deletes them from ``tasks`` in one transaction.
+  On Postgres the selected rows are locked (``FOR UPDATE SKIP LOCKED``), so a
+  task reopened concurrently is never copied and then lost
+- ``rows_per_second`` caps throughput: the archiver sleeps between batches so
+  a backlog drains without saturating the primary; ``max_batches`` bounds one run
+- Reads include archived tasks only when asked: ``include_archived=true`` on
+  the task list, task detail and dashboard summary endpoints
+
+An archive table was chosen over Postgres partitioning by status and close
+date because the same schema then works on the SQLite fallback tier, and
+partitioning ``tasks`` would mean rebuilding it with the close date in its
+primary key.
+
+Environment Variables:
+    TASKMAN_ARCHIVE_AFTER_DAYS: Days a task stays closed before archival (default: 90)
+    TASKMAN_ARCHIVE_BATCH_SIZE: Tasks moved per transaction (default: 500)
+    TASKMAN_ARCHIVE_ROWS_PER_SECOND: Throughput cap, 0 for none (default: 2000)
+
+Usage:
+    taskman-archive --after-days 90 --batch-size 500 --rows-per-second 2000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+
+import structlog
+import typer
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from taskman_api.core.enums import TaskStatus
+from taskman_api.models.task import TASKS_ARCHIVE, Task
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_ARCHIVE_AFTER_DAYS = 90
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_ROWS_PER_SECOND = 2000.0
+
+CLOSED_STATUSES = (TaskStatus.DONE.value, TaskStatus.DROPPED.value)
+
+
+def _env_number(name: str, default: float) -> float:
+    """Read a numeric environment variable, falling back to ``default`` if unset or invalid."""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass
+class ArchiveReport:
+    """Outcome of one archival run."""
+
+    cutoff: str
+    archived: int = 0
+    batches: int = 0
+    duration_seconds: float = 0.0
+    complete: bool = False
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class TaskArchiver:
+    """Moves long-closed tasks from ``tasks`` into ``tasks_archive`` in rate-limited batches."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        archive_after_days: float | None = None,
+        batch_size: int | None = None,
+        rows_per_second: float | None = None,
+    ) -> None:
+        """Initialize the archiver; unset limits come from the environment.
+
+        Args:
+            engine: Engine of the database holding both tables
+            archive_after_days: Days a task stays closed before it is archived
+            batch_size: Tasks moved per transaction
+            rows_per_second: Throughput cap across batches (0 disables throttling)
+        """
+        self.engine = engine
+        self.archive_after_days = (
+            archive_after_days
+            if archive_after_days is not None
+            else _env_number("TASKMAN_ARCHIVE_AFTER_DAYS", DEFAULT_ARCHIVE_AFTER_DAYS)
+        )
+        self.batch_size = int(
+            batch_size or _env_number("TASKMAN_ARCHIVE_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+        )
+        self.rows_per_second = (
+            rows_per_second
+            if rows_per_second is not None
+            else _env_number("TASKMAN_ARCHIVE_ROWS_PER_SECOND", DEFAULT_ROWS_PER_SECOND)
+        )
+
+    async def _archive_batch(self, cutoff: datetime) -> int:
+        """Move one batch of tasks closed before ``cutoff``; returns the number moved."""
+        tasks = Task.__table__
+        async with self.engine.begin() as conn:
+            query = (
+                select(tasks.c.id)
+                .where(tasks.c.status.in_(CLOSED_STATUSES), tasks.c.updated_at < cutoff)
+                .order_by(tasks.c.updated_at)
+                .limit(self.batch_size)
+            )
+            if conn.dialect.name == "postgresql":
+                query = query.with_for_update(skip_locked=True)
+            ids = list((await conn.execute(query)).scalars())
+            if not ids:
+                return 0
+            await conn.execute(
+                TASKS_ARCHIVE.insert().from_select(
+                    [column.name for column in tasks.columns],
+                    select(tasks).where(tasks.c.id.in_(ids)),
+                )
+            )
+            await conn.execute(delete(tasks).where(tasks.c.id.in_(ids)))
+        return len(ids)
+
+    async def run(self, max_batches: int | None = None) -> ArchiveReport:
+        """Archive tasks closed before the cutoff until none are left or ``max_batches`` ran."""
+        cutoff = datetime.now(UTC) - timedelta(days=self.archive_after_days)
+        report = ArchiveReport(cutoff=cutoff.isoformat())
+        started = time.perf_counter()
+        while max_batches is None or report.batches < max_batches:
+            batch_started = time.perf_counter()
+            moved = await self._archive_batch(cutoff)
+            if not moved:
+                report.complete = True
+                break
+            report.archived += moved
+            report.batches += 1
+            logger.debug("archive_batch_moved", tasks=moved, total=report.archived)
+            if self.rows_per_second > 0:
+                # Sleep off the rest of this batch's time budget
+                budget = moved / self.rows_per_second
+                await asyncio.sleep(max(0.0, budget - (time.perf_counter() - batch_started)))
+        report.duration_seconds = round(time.perf_counter() - started, 3)
+        logger.info("archive_run_finished", **report.to_dict())
+        return report
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+cli = typer.Typer(help="Move long-closed tasks into the tasks archive.")
+
+
+@cli.command()
+def archive(
+    url: str | None = typer.Option(
+        None,
+        "--url",
+        envvar="TASKMAN_ARCHIVE_URL",
+        help="Database URL (default: the configured primary database)",
+    ),
+    after_days: float | None = typer.Option(None, help="Days closed before archival"),
+    batch_size: int | None = typer.Option(None, help="Tasks moved per transaction"),
+    rows_per_second: float | None = typer.Option(None, help="Throughput cap (0: none)"),
+    max_batches: int | None = typer.Option(None, help="Stop after this many batches"),
+) -> None:
+    """Archive tasks closed more than --after-days ago."""
+
+    async def _run() -> ArchiveReport:
+        from taskman_api.config import get_settings
+        from taskman_api.db.connection_manager import ConnectionManager
+
+        target = url or get_settings().database.async_connection_string
+        engine = create_async_engine(ConnectionManager._fix_async_url(target))
+        try:
+            archiver = TaskArchiver(engine, after_days, batch_size, rows_per_second)
+            return await archiver.run(max_batches=max_batches)
+        finally:
+            await engine.dispose()
+
+    report = asyncio.run(_run())
+    state = "complete" if report.complete else "stopped early"
+    typer.echo(
+        f"Archived {report.archived:,} tasks closed before {report.cutoff} in "
+        f"{report.batches} batches ({report.duration_seconds:.1f}s, {state})"
+    )
+
+
+def main() -> None:
+    """Entry point for the taskman-archive CLI."""
+    cli()
+
+
+if __name__ == "__main__":
+    main()
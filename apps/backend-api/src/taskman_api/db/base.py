@@ -10,7 +10,7 @@ Each model must define its own timestamp fields.
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime
+from sqlalchemy import Column, DateTime, Table
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -53,3 +53,17 @@ class Base(DeclarativeBase):
     def to_dict(self) -> dict[str, Any]:
         """Convert model instance to dictionary."""
         return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+
+
+def archive_columns(table: Table) -> list[Column]:
+    """Copies of a table's columns for its cold archive table.
+
+    Column-level indexes are dropped: an archive declares only the indexes its
+    own reads need.
+    """
+    copies = []
+    for column in table.columns:
+        copy = column._copy()
+        copy.index = None
+        copies.append(copy)
+    return copies
@@ -0,0 +1,328 @@
+"""
+Conversation Compaction and Retention.
+
+Long-running agent conversations accumulate tens of thousands of turns. The
+compactor keeps each conversation's hot turns bounded: old raw turns are
+rolled into summary turns (``is_summary``, found by
+``ConversationTurnRepository.find_summaries``) and moved to
+``conversation_turns_archive``.
+
+- Policies are per agent type (``RetentionConfig`` in config.py): a
+  conversation's newest ``keep_recent_turns`` raw turns and any turn younger
+  than ``min_age_days`` stay hot; older raw turns are compacted in chunks of
+  ``turns_per_summary``, oldest first. Only full chunks are compacted
+- Each chunk is one transaction: its raw turns are copied to the archive
+  (content stays compressed), deleted, and replaced by one summary turn at the
+  chunk's last sequence, so reads ordered by sequence keep their order. On
+  Postgres the chunk's rows are locked (``FOR UPDATE SKIP LOCKED``)
+- ``ConversationSession.turn_count`` / ``token_estimate`` are running totals
+  over every turn ever added, compacted or not; ``compacted_through`` records
+  the last compacted sequence. Turn counts and token totals are O(1) reads
+- Archived turns older than a policy's ``cold_retention_days`` are deleted
+- ``rows_per_second`` caps throughput across chunks
+
+Summaries are extractive by default (the first line of each turn); pass a
+``summarizer`` to produce them another way.
+
+Usage:
+    taskman-compact --max-batches 1000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import structlog
+import typer
+from sqlalchemy import delete, func, insert, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from taskman_api.config import RetentionConfig, RetentionPolicy
+from taskman_api.models.conversation import (
+    CONVERSATION_TURNS_ARCHIVE,
+    ConversationSession,
+    ConversationTurn,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Extractive summaries: one line per turn, the whole summary capped
+SUMMARY_LINE_CHARS = 160
+MAX_SUMMARY_CHARS = 16_000
+
+# Rows with ``sequence``, ``role``, ``content`` and ``token_count``, oldest first
+Summarizer = Callable[[Sequence[Any]], str]
+
+
+def extractive_summary(turns: Sequence[Any]) -> str:
+    """Summarize turns as their roles and first lines."""
+    tokens = sum(turn.token_count for turn in turns)
+    lines = [
+        f"Summary of turns {turns[0].sequence}-{turns[-1].sequence} "
+        f"({len(turns)} turns, {tokens} tokens):"
+    ]
+    for turn in turns:
+        text = turn.content.strip()
+        first_line = text.splitlines()[0] if text else ""
+        if len(first_line) > SUMMARY_LINE_CHARS or first_line != text:
+            first_line = first_line[:SUMMARY_LINE_CHARS].rstrip() + "..."
+        lines.append(f"[{turn.sequence}] {turn.role}: {first_line}")
+    return "\n".join(lines)[:MAX_SUMMARY_CHARS]
+
+
+@dataclass
+class CompactionReport:
+    """Outcome of one compaction run."""
+
+    conversations: int = 0
+    summaries: int = 0
+    turns_compacted: int = 0
+    cold_turns_deleted: int = 0
+    duration_seconds: float = 0.0
+    complete: bool = False
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class ConversationCompactor:
+    """Rolls old conversation turns into summary turns and enforces cold retention."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        retention: RetentionConfig | None = None,
+        summarizer: Summarizer = extractive_summary,
+    ) -> None:
+        """Initialize the compactor.
+
+        Args:
+            engine: Engine of the database holding the conversation tables
+            retention: Policies per agent type (default: ``Settings.retention``)
+            summarizer: Builds a summary turn's content from the turns it replaces
+        """
+        if retention is None:
+            from taskman_api.config import get_settings
+
+            retention = get_settings().retention
+        self.engine = engine
+        self.retention = retention
+        self.summarizer = summarizer
+
+    def _policies(self) -> list[RetentionPolicy]:
+        return [self.retention.default, *self.retention.agent_types.values()]
+
+    async def _candidates(self) -> list[tuple[str, str | None]]:
+        """Conversations that may hold a full chunk of compactable turns."""
+        enabled = [policy for policy in self._policies() if policy.enabled]
+        if not enabled:
+            return []
+        # A coarse filter on the running totals; _compact_chunk checks precisely
+        threshold = min(policy.keep_recent_turns + policy.turns_per_summary for policy in enabled)
+        sessions = ConversationSession.__table__
+        async with self.engine.connect() as conn:
+            rows = await conn.execute(
+                select(sessions.c.id, sessions.c.agent_type)
+                .where(sessions.c.turn_count - sessions.c.compacted_through >= threshold)
+                .order_by(sessions.c.id)
+            )
+            return [(row.id, row.agent_type) for row in rows]
+
+    async def _compact_chunk(
+        self, conversation_id: str, policy: RetentionPolicy, now: datetime
+    ) -> int:
+        """Replace the oldest full chunk of compactable turns with a summary turn.
+
+        Returns the number of raw turns compacted (0 when no full chunk is left).
+        """
+        turns = ConversationTurn.__table__
+        async with self.engine.begin() as conn:
+            latest = await conn.scalar(
+                select(func.max(turns.c.sequence)).where(
+                    turns.c.conversation_id == conversation_id
+                )
+            )
+            if latest is None:
+                return 0
+            query = (
+                select(turns)
+                .where(
+                    turns.c.conversation_id == conversation_id,
+                    turns.c.is_summary.is_(False),
+                    turns.c.sequence <= latest - policy.keep_recent_turns,
+                    turns.c.created_at < now - timedelta(days=policy.min_age_days),
+                )
+                .order_by(turns.c.sequence)
+                .limit(policy.turns_per_summary)
+            )
+            if conn.dialect.name == "postgresql":
+                query = query.with_for_update(skip_locked=True)
+            chunk = (await conn.execute(query)).all()
+            if len(chunk) < policy.turns_per_summary:
+                return 0
+
+            ids = [row.id for row in chunk]
+            first, last = chunk[0], chunk[-1]
+            summary_id = f"TURN-{uuid4().hex[:12].upper()}"
+            content = self.summarizer(chunk)
+            await conn.execute(
+                CONVERSATION_TURNS_ARCHIVE.insert().from_select(
+                    [column.name for column in turns.columns] + ["summary_id"],
+                    select(turns, literal(summary_id)).where(turns.c.id.in_(ids)),
+                )
+            )
+            await conn.execute(delete(turns).where(turns.c.id.in_(ids)))
+            await conn.execute(
+                insert(turns).values(
+                    id=summary_id,
+                    conversation_id=conversation_id,
+                    sequence=last.sequence,
+                    role="system",
+                    content=content,
+                    content_type="summary",
+                    tool_calls=[],
+                    tool_results=[],
+                    token_count=max(1, len(content) // 4),
+                    is_summary=True,
+                    extra_metadata={
+                        "compacted": {
+                            "from_sequence": first.sequence,
+                            "to_sequence": last.sequence,
+                            "turns": len(chunk),
+                            "tokens": sum(row.token_count for row in chunk),
+                        }
+                    },
+                    created_at=last.created_at,
+                )
+            )
+            await conn.execute(
+                update(ConversationSession)
+                .where(ConversationSession.id == conversation_id)
+                .values(compacted_through=last.sequence)
+            )
+        return len(chunk)
+
+    async def _expire_cold(self, now: datetime) -> int:
+        """Delete archived turns older than their policy's cold retention."""
+        archive = CONVERSATION_TURNS_ARCHIVE
+        sessions = ConversationSession.__table__
+        overrides = list(self.retention.agent_types)
+        default_scope = or_(
+            sessions.c.agent_type.is_(None), sessions.c.agent_type.not_in(overrides)
+        )
+        scopes = [(self.retention.default, default_scope)] + [
+            (policy, sessions.c.agent_type == agent_type)
+            for agent_type, policy in self.retention.agent_types.items()
+        ]
+        deleted = 0
+        async with self.engine.begin() as conn:
+            for policy, agent_filter in scopes:
+                if policy.cold_retention_days is None:
+                    continue
+                result = await conn.execute(
+                    delete(archive).where(
+                        archive.c.archived_at < now - timedelta(days=policy.cold_retention_days),
+                        archive.c.conversation_id.in_(select(sessions.c.id).where(agent_filter)),
+                    )
+                )
+                deleted += result.rowcount
+        return deleted
+
+    async def run(self, max_batches: int | None = None) -> CompactionReport:
+        """Compact every conversation, then expire cold turns.
+
+        Args:
+            max_batches: Stop after this many summary turns (cold expiry still runs)
+        """
+        now = datetime.now(UTC)
+        report = CompactionReport(complete=True)
+        started = time.perf_counter()
+        rate = self.retention.rows_per_second
+        for conversation_id, agent_type in await self._candidates():
+            policy = self.retention.policy_for(agent_type)
+            if not policy.enabled:
+                continue
+            compacted_any = False
+            while True:
+                if max_batches is not None and report.summaries >= max_batches:
+                    report.complete = False
+                    break
+                batch_started = time.perf_counter()
+                compacted = await self._compact_chunk(conversation_id, policy, now)
+                if not compacted:
+                    break
+                compacted_any = True
+                report.summaries += 1
+                report.turns_compacted += compacted
+                logger.debug(
+                    "compaction_chunk_summarized",
+                    conversation_id=conversation_id,
+                    turns=compacted,
+                )
+                if rate > 0:
+                    # Sleep off the rest of this chunk's time budget
+                    budget = compacted / rate
+                    await asyncio.sleep(max(0.0, budget - (time.perf_counter() - batch_started)))
+            if compacted_any:
+                report.conversations += 1
+            if not report.complete:
+                break
+        report.cold_turns_deleted = await self._expire_cold(now)
+        report.duration_seconds = round(time.perf_counter() - started, 3)
+        logger.info("compaction_run_finished", **report.to_dict())
+        return report
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+cli = typer.Typer(help="Compact long conversations into summary turns.")
+
+
+@cli.command()
+def compact(
+    url: str | None = typer.Option(
+        None,
+        "--url",
+        envvar="TASKMAN_COMPACT_URL",
+        help="Database URL (default: the configured primary database)",
+    ),
+    max_batches: int | None = typer.Option(None, help="Stop after this many summary turns"),
+) -> None:
+    """Compact conversations per the configured retention policies (APP_RETENTION__*)."""
+
+    async def _run() -> CompactionReport:
+        from taskman_api.config import get_settings
+        from taskman_api.db.connection_manager import ConnectionManager
+
+        settings = get_settings()
+        target = url or settings.database.async_connection_string
+        engine = create_async_engine(ConnectionManager._fix_async_url(target))
+        try:
+            compactor = ConversationCompactor(engine, settings.retention)
+            return await compactor.run(max_batches=max_batches)
+        finally:
+            await engine.dispose()
+
+    report = asyncio.run(_run())
+    state = "complete" if report.complete else "stopped early"
+    typer.echo(
+        f"Compacted {report.turns_compacted:,} turns of {report.conversations:,} conversations "
+        f"into {report.summaries:,} summaries; deleted {report.cold_turns_deleted:,} cold "
+        f"turns ({report.duration_seconds:.1f}s, {state})"
+    )
+
+
+def main() -> None:
+    """Entry point for the taskman-compact CLI."""
+    cli()
+
+
+if __name__ == "__main__":
+    main()
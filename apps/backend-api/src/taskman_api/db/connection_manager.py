@@ -3,18 +3,100 @@ Database Connection Manager.
 
 Implements the Dual-Database Architecture pattern (Primary: PostgreSQL, Fallback: SQLite).
 Provides resilient session management and health checking.
+
+Tier health is tracked by per-tier circuit breakers (see tier_health). A
+background prober (``start_health_prober``) probes the tiers concurrently on an
+interval; requests read the active tier from breaker state instead of
+discovering an outage through their own connect timeouts.
+
+With ``read_replica=True`` the secondary also serves reads marked read-only
+(see read_routing); the prober measures its replication lag for the guard.
+
+PostgreSQL pools are sized from settings; with ``adaptive_pool=True`` their
+retained size follows observed checkout waits (see pool_sizing).
+
+Writes made on the fallback tier are journaled and replayed onto the primary
+in the background once it is active again (see reconciliation).
 """
 
+import asyncio
+import contextlib
 import os
+import time
 from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
 
+import sqlalchemy
 import structlog
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy import event, literal_column, select, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import QueuePool
+
+from taskman_api.db.custom_types import json_deserializer, json_serializer
+from taskman_api.db.pool_sizing import (
+    DEFAULT_ADAPT_INTERVAL,
+    DEFAULT_MIN_SIZE,
+    DEFAULT_WAIT_TARGET_MS,
+    AdaptivePoolSizer,
+    supports_resize,
+)
+from taskman_api.db.read_routing import ReadWriteSession
+from taskman_api.db.reconciliation import DEFAULT_BATCH_SIZE, FallbackJournal, FallbackReconciler
+from taskman_api.db.schema_fingerprint import (
+    read_fingerprint,
+    schema_fingerprint,
+    write_fingerprint,
+)
+from taskman_api.db.sqlite_fallback import (
+    DEFAULT_READER_POOL_SIZE,
+    DEFAULT_WRITE_TIMEOUT,
+    SQLiteFallbackSession,
+    create_fallback_engines,
+)
+from taskman_api.db.tier_health import (
+    CLOSED,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RESET_TIMEOUT,
+    OPEN,
+    TierBreaker,
+    is_connection_error,
+)
+from taskman_api.telemetry.request_metrics import instrument_engine, record_tier_probe
+from taskman_api.telemetry.startup_metrics import record_schema_init
 
 logger = structlog.get_logger()
 
+# Per-tier schema initialization limit at startup (seconds)
+DEFAULT_INIT_TIMEOUT = 10.0
+
+# Per-tier health probe limit (seconds); a probe must never take a connect timeout
+DEFAULT_PROBE_TIMEOUT = 2.0
+
+# Replica reads are refused while replication lag exceeds this (seconds)
+DEFAULT_REPLICA_MAX_LAG = 5.0
+
+# Seconds since the replica last replayed a transaction; 0 when it is caught up
+# or is not in recovery (not a streaming replica)
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+# PostgreSQL pool defaults when not configured from settings
+DEFAULT_POOL_SIZE = 20
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_TIMEOUT = 30.0
+DEFAULT_POOL_RECYCLE = 3600
+
+# Tiers in routing priority order
+TIER_ORDER = ("primary", "secondary", "fallback")
+
 
 class ConnectionManager:
     """
@@ -23,8 +105,32 @@ class ConnectionManager:
     """
 
     def __init__(
-        self, primary_url: str, secondary_url: str | None, sqlite_path: str = "taskman.db"
+        self,
+        primary_url: str,
+        secondary_url: str | None,
+        sqlite_path: str = "taskman.db",
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+        read_replica: bool = False,
+        replica_max_lag: float = DEFAULT_REPLICA_MAX_LAG,
+        sqlite_pool_size: int = DEFAULT_READER_POOL_SIZE,
+        sqlite_write_timeout: float = DEFAULT_WRITE_TIMEOUT,
+        reconcile_batch_size: int = DEFAULT_BATCH_SIZE,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_timeout: float = DEFAULT_POOL_TIMEOUT,
+        pool_recycle: int = DEFAULT_POOL_RECYCLE,
+        adaptive_pool: bool = False,
+        pool_min_size: int = DEFAULT_MIN_SIZE,
+        pool_wait_target_ms: float = DEFAULT_WAIT_TARGET_MS,
+        pool_adapt_interval: float = DEFAULT_ADAPT_INTERVAL,
     ):
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
         self.primary_url = self._fix_async_url(primary_url)
         self.secondary_url = self._fix_async_url(secondary_url) if secondary_url else None
         self.sqlite_url = f"sqlite+aiosqlite:///{sqlite_path}"
@@ -38,39 +144,159 @@ class ConnectionManager:
         if self.secondary_url:
             self.secondary_engine = self._create_postgres_engine(self.secondary_url)
 
-        # 3. Initialize Fallback Engine
-        self.fallback_engine = create_async_engine(
-            self.sqlite_url,
-            echo=os.getenv("SQL_ECHO", "false").lower() == "true",
-            connect_args={"check_same_thread": False, "timeout": 60},
-            poolclass=NullPool,
+        # 3. Initialize Fallback Engines: pooled, tuned readers plus a single
+        # writer connection that serializes writes (see sqlite_fallback)
+        self.fallback_engine, self.fallback_writer_engine = create_fallback_engines(
+            self.sqlite_url, pool_size=sqlite_pool_size, write_timeout=sqlite_write_timeout
         )
 
-        # Enable WAL mode for SQLite
-        from sqlalchemy import event
-
-        @event.listens_for(self.fallback_engine.sync_engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA journal_mode=WAL")
-            cursor.close()
-
         # Session Factories
+        # Read/write splitting: primary sessions bind eligible reads to the replica
+        self.read_replica = read_replica and self.secondary_engine is not None
+        self.replica_max_lag = replica_max_lag
+        self.replica_lag: float | None = None
+        routing_kwargs = (
+            {"sync_session_class": ReadWriteSession, "info": {"replica": self.replica_bind}}
+            if self.read_replica
+            else {}
+        )
         self.PrimarySession = async_sessionmaker(
-            self.primary_engine, expire_on_commit=False, autoflush=False
+            self.primary_engine, expire_on_commit=False, autoflush=False, **routing_kwargs
         )
         self.SecondarySession = None
         if self.secondary_engine:
             self.SecondarySession = async_sessionmaker(
                 self.secondary_engine, expire_on_commit=False, autoflush=False
             )
+        # Fallback writes are journaled for replay onto primary
+        self.journal = FallbackJournal()
+        self.reconciler = FallbackReconciler(
+            self.fallback_engine,
+            self.fallback_writer_engine,
+            self.primary_engine,
+            batch_size=reconcile_batch_size,
+        )
         self.FallbackSession = async_sessionmaker(
-            self.fallback_engine, expire_on_commit=False, autoflush=False
+            self.fallback_writer_engine,
+            sync_session_class=SQLiteFallbackSession,
+            info={"reader": self.fallback_engine.sync_engine, "journal": self.journal},
+            expire_on_commit=False,
+            autoflush=False,
         )
 
         # State tracking: "primary", "secondary", "fallback"
         self._active_tier = "primary"
 
+        # Adaptive retained size for the PostgreSQL pools
+        self.pool_adapt_interval = pool_adapt_interval
+        self.pool_sizers: dict[str, AdaptivePoolSizer] = {}
+        if adaptive_pool:
+            for tier, tier_engine in self.engines.items():
+                pool = tier_engine.sync_engine.pool
+                if not isinstance(pool, QueuePool) or tier == "fallback":
+                    continue
+                if not supports_resize(pool):
+                    logger.warning(
+                        "db_pool_adaptive_unsupported",
+                        tier=tier,
+                        sqlalchemy_version=sqlalchemy.__version__,
+                        detail="pool internals not recognized; keeping a fixed pool size",
+                    )
+                    continue
+                self.pool_sizers[tier] = AdaptivePoolSizer(
+                    tier_engine,
+                    tier,
+                    min_size=pool_min_size,
+                    max_size=pool_size,
+                    wait_target_ms=pool_wait_target_ms,
+                )
+        self._pool_sizing: asyncio.Task | None = None
+
+        # Query/checkout timing and checked-out connection counts per tier
+        self._checked_out: dict[str, int] = {}
+        for tier, tier_engine in self.pool_engines.items():
+            sizer = self.pool_sizers.get(tier)
+            instrument_engine(tier_engine, tier, sizer.observe if sizer else None)
+            self._track_checkouts(tier_engine, tier)
+
+        # Circuit breaker per tier, fed by the health prober and request errors
+        self.probe_timeout = probe_timeout
+        self.breakers = {
+            tier: TierBreaker(tier, failure_threshold=failure_threshold, reset_timeout=reset_timeout)
+            for tier in self.engines
+        }
+        self._last_health: dict | None = None
+        self._last_probe_at: float | None = None
+        self._prober: asyncio.Task | None = None
+        self._probe_interval: float | None = None
+        self._probe_now: asyncio.Event | None = None
+
+        # Reconciliation runs once primary is active; due at startup in case
+        # a previous process left journaled fallback writes behind
+        self._reconcile_due = True
+        self._reconciliation: asyncio.Task | None = None
+        self.last_reconciliation: dict | None = None
+
+    @property
+    def engines(self) -> dict[str, AsyncEngine]:
+        """Configured engines keyed by tier name."""
+        engines = {"primary": self.primary_engine}
+        if self.secondary_engine:
+            engines["secondary"] = self.secondary_engine
+        engines["fallback"] = self.fallback_engine
+        return engines
+
+    @property
+    def pool_engines(self) -> dict[str, AsyncEngine]:
+        """Every engine with its own connection pool, including the fallback writer."""
+        return {**self.engines, "fallback_writer": self.fallback_writer_engine}
+
+    async def dispose(self) -> None:
+        """Close every pooled connection."""
+        for tier_engine in self.pool_engines.values():
+            await tier_engine.dispose()
+
+    def _track_checkouts(self, tier_engine: AsyncEngine, tier: str) -> None:
+        """Count checked-out connections for pools that keep no counters of their own."""
+        self._checked_out[tier] = 0
+
+        @event.listens_for(tier_engine.sync_engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            self._checked_out[tier] += 1
+
+        @event.listens_for(tier_engine.sync_engine, "checkin")
+        def _on_checkin(dbapi_connection, connection_record):
+            self._checked_out[tier] -= 1
+
+    def pool_stats(self) -> dict[str, dict]:
+        """Connection pool usage per tier.
+
+        Returns:
+            {tier: {"pool", "checked_out", "idle", "overflow", "size", "capacity"}};
+            size/idle/overflow/capacity are None for unbounded pools (NullPool)
+        """
+        stats = {}
+        for tier, tier_engine in self.pool_engines.items():
+            pool = tier_engine.sync_engine.pool
+            entry = {
+                "pool": type(pool).__name__,
+                "checked_out": self._checked_out.get(tier, 0),
+                "idle": None,
+                "overflow": None,
+                "size": None,
+                "capacity": None,
+            }
+            if isinstance(pool, QueuePool):
+                entry.update(
+                    checked_out=pool.checkedout(),
+                    idle=pool.checkedin(),
+                    overflow=max(pool.overflow(), 0),
+                    size=pool.size(),
+                    capacity=pool.size() + pool._max_overflow,
+                )
+            stats[tier] = entry
+        return stats
+
     def _create_postgres_engine(self, url: str):
         """Helper to create configured Postgres engine."""
         connect_args = {}
@@ -86,11 +312,14 @@ class ConnectionManager:
         return create_async_engine(
             url,
             echo=os.getenv("SQL_ECHO", "false").lower() == "true",
-            pool_size=20,
-            max_overflow=10,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
             pool_pre_ping=True,
-            pool_recycle=3600,
+            pool_recycle=self.pool_recycle,
             connect_args=connect_args,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
         )
 
     @staticmethod
@@ -102,149 +331,397 @@ class ConnectionManager:
             return url.replace("postgres://", "postgresql+asyncpg://", 1)
         return url
 
-    async def check_health(self) -> dict:
-        """Check health of all databases and update active tier."""
-        import time
-
-        status = {
-            "mode": self._active_tier,
-            "primary": {"connected": False, "latency_ms": None, "error": None},
-            "secondary": {"connected": False, "latency_ms": None, "error": None},
-            "fallback": {"connected": False, "latency_ms": None, "error": None},
-        }
-
-        # Check Primary
-        try:
-            start = time.perf_counter()
-            async with self.PrimarySession() as session:
-                await session.execute(text("SELECT 1"))
-                status["primary"]["connected"] = True
-                status["primary"]["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
-        except Exception as e:
-            status["primary"]["error"] = str(e)
-            logger.error("primary_health_check_failed", error=str(e))
+    @property
+    def active_tier(self) -> str:
+        """Tier new sessions are opened on ("none" when every tier is down)."""
+        return self._active_tier
 
-        # Check Secondary
+    def session_factories(self) -> dict[str, async_sessionmaker]:
+        """Configured session factories keyed by tier name, in priority order."""
+        factories = {"primary": self.PrimarySession}
         if self.SecondarySession:
-            try:
-                start = time.perf_counter()
-                async with self.SecondarySession() as session:
-                    await session.execute(text("SELECT 1"))
-                    status["secondary"]["connected"] = True
-                    status["secondary"]["latency_ms"] = round(
-                        (time.perf_counter() - start) * 1000, 2
-                    )
-            except Exception as e:
-                status["secondary"]["error"] = str(e)
-                logger.error("secondary_health_check_failed", error=str(e))
-        else:
-            status["secondary"]["error"] = "Not Configured"
+            factories["secondary"] = self.SecondarySession
+        factories["fallback"] = self.FallbackSession
+        return factories
+
+    def session_factory(self, tier: str | None = None) -> async_sessionmaker:
+        """Session factory for ``tier`` (default: the active tier); no I/O."""
+        factories = self.session_factories()
+        return factories.get(tier or self._active_tier, self.PrimarySession)
+
+    def _select_tier(self, connected: dict[str, bool] | None = None) -> str:
+        """Route to the first tier whose breaker is closed and not just seen down."""
+        connected = connected or {}
+        previous = self._active_tier
+        selected = next(
+            (
+                tier
+                for tier in TIER_ORDER
+                if tier in self.breakers
+                and self.breakers[tier].state == CLOSED
+                and connected.get(tier, True)
+            ),
+            "none",
+        )
+        if selected != previous:
+            if selected == "none":
+                logger.critical("all_databases_down")
+            elif selected == "primary":
+                logger.info("restored_to_primary", previous=previous)
+            else:
+                logger.warning(f"failed_over_to_{selected}", previous=previous)
+        if selected == "fallback":
+            self._reconcile_due = True
+        self._active_tier = selected
+        return selected
+
+    def _breaker_changed(self, breaker: TierBreaker) -> None:
+        log = logger.warning if breaker.state == OPEN else logger.info
+        log(
+            "db_tier_circuit_changed",
+            tier=breaker.tier,
+            state=breaker.state,
+            consecutive_failures=breaker.consecutive_failures,
+            error=breaker.last_error,
+        )
+
+    def report_error(self, tier: str, error: BaseException) -> None:
+        """Feed a request-path error into ``tier``'s breaker.
+
+        Only connection-level errors count; constraint violations and other
+        query errors say nothing about tier health. The failed tier is routed
+        around immediately and the prober (if running) re-probes without
+        waiting for its next interval.
+        """
+        breaker = self.breakers.get(tier)
+        if breaker is None or not is_connection_error(error):
+            return
+        logger.warning(f"{tier}_session_failed", error=str(error))
+        if breaker.record_failure(str(error)):
+            self._breaker_changed(breaker)
+        self._select_tier({tier: False})
+        if self._probe_now is not None:
+            self._probe_now.set()
+
+    def replica_bind(self):
+        """Sync engine for replica reads, or None to keep reads on primary.
+
+        The replica is used only while primary is the active tier, the
+        secondary's circuit is closed and its last measured lag is within
+        ``replica_max_lag`` (unknown lag counts as too much).
+        """
+        if (
+            not self.read_replica
+            or self._active_tier != "primary"
+            or self.breakers["secondary"].state != CLOSED
+            or self.replica_lag is None
+            or self.replica_lag > self.replica_max_lag
+        ):
+            return None
+        return self.secondary_engine.sync_engine
+
+    async def _replica_lag(self, session: AsyncSession) -> float:
+        """Measure replication lag on the secondary (0 for non-PostgreSQL tiers)."""
+        lag = 0.0
+        if session.bind.dialect.name == "postgresql":
+            lag = float(await session.scalar(REPLICA_LAG_SQL) or 0.0)
+        if self.replica_lag is None or (lag > self.replica_max_lag) != (
+            self.replica_lag > self.replica_max_lag
+        ):
+            logger.info(
+                "replica_lag_guard",
+                lag_seconds=round(lag, 3),
+                max_lag_seconds=self.replica_max_lag,
+                serving_reads=lag <= self.replica_max_lag,
+            )
+        self.replica_lag = lag
+        return lag
+
+    async def _probe_tier(self, tier: str, session_factory: async_sessionmaker) -> dict:
+        """Run ``SELECT 1`` on one tier under ``probe_timeout``.
 
-        # Check Fallback
+        The probe is a plain SELECT so the fallback tier answers it from the
+        reader pool instead of queueing behind writes.
+        """
+        entry = {"connected": False, "latency_ms": None, "error": None}
+        start = time.perf_counter()
         try:
-            start = time.perf_counter()
-            async with self.FallbackSession() as session:
-                await session.execute(text("SELECT 1"))
-                status["fallback"]["connected"] = True
-                status["fallback"]["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            async with asyncio.timeout(self.probe_timeout):
+                async with session_factory() as session:
+                    await session.execute(select(literal_column("1")))
+                    if tier == "secondary" and self.read_replica:
+                        entry["lag_seconds"] = await self._replica_lag(session)
         except Exception as e:
-            status["fallback"]["error"] = str(e)
-            logger.error("fallback_health_check_failed", error=str(e))
-
-        # Determine Active Tier
-        if status["primary"]["connected"]:
-            self._active_tier = "primary"
-        elif status["secondary"]["connected"]:
-            if self._active_tier != "secondary":
-                logger.warning("failed_over_to_secondary")
-            self._active_tier = "secondary"
-        elif status["fallback"]["connected"]:
-            if self._active_tier != "fallback":
-                logger.warning("failed_over_to_fallback")
-            self._active_tier = "fallback"
+            entry["error"] = str(e) or type(e).__name__
+            logger.warning(f"{tier}_health_check_failed", error=entry["error"])
+            if tier == "secondary":
+                self.replica_lag = None
         else:
-            self._active_tier = "none"
-            logger.critical("all_databases_down")
+            entry["connected"] = True
+            entry["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        record_tier_probe(tier, entry["connected"], time.perf_counter() - start)
+        return entry
+
+    async def probe(self, force: bool = True) -> dict:
+        """Probe tiers concurrently, update breakers and the active tier.
+
+        Args:
+            force: Probe every tier; otherwise tiers whose breaker is open and
+                still cooling down are skipped (half-open tiers get a trial probe)
+
+        Returns:
+            {"mode", "checked_at", "primary"/"secondary"/"fallback":
+            {"connected", "latency_ms", "error", "circuit"}}
+        """
+        factories = self.session_factories()
+        due = {
+            tier: factory
+            for tier, factory in factories.items()
+            if force or self.breakers[tier].allow_probe()
+        }
+        results = dict(
+            zip(
+                due,
+                await asyncio.gather(*(self._probe_tier(t, f) for t, f in due.items())),
+                strict=True,
+            )
+        )
 
-        status["mode"] = self._active_tier
+        status: dict = {}
+        for tier in TIER_ORDER:
+            if tier not in factories:
+                status[tier] = {"connected": False, "latency_ms": None, "error": "Not Configured"}
+                continue
+            breaker = self.breakers[tier]
+            entry = results.get(tier)
+            if entry is None:
+                entry = {"connected": False, "latency_ms": None, "error": breaker.last_error}
+            else:
+                changed = (
+                    breaker.record_success()
+                    if entry["connected"]
+                    else breaker.record_failure(entry["error"])
+                )
+                if changed:
+                    self._breaker_changed(breaker)
+            breaker.last_probe = entry
+            status[tier] = {**entry, "circuit": breaker.state}
+
+        status["mode"] = self._select_tier(
+            {tier: entry["connected"] for tier, entry in results.items()}
+        )
+        status["checked_at"] = datetime.now(UTC).isoformat()
+        self._last_health = status
+        self._last_probe_at = time.monotonic()
+        if status["mode"] == "primary":
+            self._schedule_reconciliation()
+        elif status["mode"] == "fallback":
+            with contextlib.suppress(Exception):
+                await self.reconciler.refresh_lag()
         return status
 
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Yields a database session from the active tier."""
+    @property
+    def reconciliation_running(self) -> bool:
+        return self._reconciliation is not None and not self._reconciliation.done()
+
+    def _schedule_reconciliation(self, force: bool = False) -> asyncio.Task | None:
+        """Replay journaled fallback writes in the background if any may be pending."""
+        if (force or self._reconcile_due) and not self.reconciliation_running:
+            self._reconciliation = asyncio.create_task(
+                self._reconcile(), name="db-fallback-reconciliation"
+            )
+        return self._reconciliation
 
-        # Determine session factory based on current state optimization
-        session_factory = self.PrimarySession
-        if self._active_tier == "secondary" and self.SecondarySession:
-            session_factory = self.SecondarySession
-        elif self._active_tier == "fallback":
-            session_factory = self.FallbackSession
+    async def reconcile(self) -> dict:
+        """Replay journaled fallback writes onto primary now (joins a run in progress).
 
-        try:
-            async with session_factory() as session:
-                try:
-                    yield session
-                    await session.commit()
-                except Exception:
-                    await session.rollback()
-                    raise
-        except Exception as e:
-            # If current tier failed, try to adapt
-            if session_factory == self.PrimarySession:
-                logger.warning("primary_failed_trying_secondary", error=str(e))
-                # Try Secondary
-                if self.SecondarySession:
-                    try:
-                        async with self.SecondarySession() as session:
-                            self._active_tier = "secondary"
-                            yield session
-                            await session.commit()
-                            return
-                    except Exception as sec_e:
-                        logger.warning("secondary_failed_trying_fallback", error=str(sec_e))
-
-                # Try Fallback
-                self._active_tier = "fallback"
-                async with self.FallbackSession() as session:
-                    yield session
-                    await session.commit()
-
-            elif session_factory == self.SecondarySession:
-                logger.warning("secondary_failed_trying_fallback", error=str(e))
-                self._active_tier = "fallback"
-                async with self.FallbackSession() as session:
-                    yield session
-                    await session.commit()
+        Returns:
+            The ReconciliationReport as a dict (also kept in ``last_reconciliation``)
+        """
+        return await self._schedule_reconciliation(force=True)
 
-            else:
-                logger.error("all_tiers_failed", error=str(e))
-                raise e
+    async def _reconcile(self) -> dict:
+        self._reconcile_due = False
+        report = await self.reconciler.reconcile()
+        # Failed batches, and writes journaled by sessions still open on the
+        # fallback during the run, are retried on the next probe
+        self._reconcile_due = report.outcome != "completed" or report.journaled_during_run > 0
+        self.last_reconciliation = report.to_dict()
+        return self.last_reconciliation
 
-    async def init_models(self, base_class):
-        """Initialize tables in all databases."""
-        # Primary
-        try:
-            async with self.primary_engine.begin() as conn:
-                await conn.run_sync(base_class.metadata.create_all)
-            logger.info("primary_db_initialized")
-        except Exception as e:
-            logger.warning("primary_db_init_failed", error=str(e))
+    async def check_health(self) -> dict:
+        """Probe all databases now and update the active tier."""
+        return await self.probe(force=True)
+
+    async def cached_health(self, max_age: float | None = None) -> dict:
+        """Last probe result, probing only when it is older than ``max_age``.
+
+        Args:
+            max_age: Seconds a result stays fresh; defaults to two prober
+                intervals while the prober runs, otherwise always probe
+        """
+        if max_age is None:
+            max_age = 2 * self._probe_interval if self.prober_running else 0.0
+        if (
+            self._last_health is not None
+            and self._last_probe_at is not None
+            and time.monotonic() - self._last_probe_at <= max_age
+        ):
+            return self._last_health
+        return await self.probe()
 
-        # Secondary
-        if self.secondary_engine:
+    @property
+    def prober_running(self) -> bool:
+        return self._prober is not None and not self._prober.done()
+
+    def start_health_prober(self, interval: float) -> asyncio.Task:
+        """Start the background prober (and adaptive pool sizing) on the running loop.
+
+        Idempotent.
+        """
+        if not self.prober_running:
+            self._probe_interval = interval
+            self._probe_now = asyncio.Event()
+            self._prober = asyncio.create_task(self._probe_loop(interval), name="db-health-prober")
+            logger.info("db_health_prober_started", interval_seconds=interval)
+        if self.pool_sizers and (self._pool_sizing is None or self._pool_sizing.done()):
+            self._pool_sizing = asyncio.create_task(self._pool_sizing_loop(), name="db-pool-sizer")
+        return self._prober
+
+    async def stop_health_prober(self) -> None:
+        """Cancel the background tasks (prober, pool sizing, reconciliation) and wait for them."""
+        task, self._prober = self._prober, None
+        self._probe_now = None
+        for background in (task, self._pool_sizing, self._reconciliation):
+            if background is not None and not background.done():
+                background.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await background
+
+    async def _probe_loop(self, interval: float) -> None:
+        while True:
             try:
-                async with self.secondary_engine.begin() as conn:
-                    await conn.run_sync(base_class.metadata.create_all)
-                logger.info("secondary_db_initialized")
+                await self.probe(force=False)
             except Exception as e:
-                logger.warning("secondary_db_init_failed", error=str(e))
+                logger.error("db_health_probe_failed", error=str(e))
+            probe_now = self._probe_now
+            if probe_now is None:
+                return
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(probe_now.wait(), interval)
+            probe_now.clear()
+
+    async def _pool_sizing_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.pool_adapt_interval)
+            for sizer in self.pool_sizers.values():
+                try:
+                    sizer.adjust()
+                except Exception as e:
+                    logger.error("db_pool_resize_failed", tier=sizer.tier, error=str(e))
 
-        # Fallback
+    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Yields a database session from the active tier.
+
+        The tier comes from breaker state, so requests never retry through
+        dead tiers inline. A connection error is reported to the tier's
+        breaker and re-raised; later requests go to the next healthy tier.
+        """
+        tier = self._active_tier
+        async with self.session_factory(tier)() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception as e:
+                self.report_error(tier, e)
+                await session.rollback()
+                raise
+
+    async def init_models(
+        self,
+        base_class,
+        timeout: float = DEFAULT_INIT_TIMEOUT,
+        force: bool = False,
+    ) -> dict[str, str]:
+        """Initialize tables in all databases concurrently.
+
+        Each tier runs under its own timeout, so a dead tier cannot hold up
+        startup. ``create_all`` is skipped when the tier's recorded schema
+        fingerprint matches ``base_class.metadata`` (see schema_fingerprint).
+
+        Args:
+            base_class: Declarative base whose metadata is created
+            timeout: Per-tier limit in seconds
+            force: Run ``create_all`` even if the fingerprint matches
+
+        Returns:
+            {tier: outcome}, outcome one of created/unchanged/failed/timeout
+        """
+        metadata = base_class.metadata
+        name = f"{base_class.__module__}.{base_class.__qualname__}"
+        self.reconciler.register(metadata)
+        try:
+            fingerprint = schema_fingerprint(metadata)
+        except Exception as e:
+            logger.warning("schema_fingerprint_failed", metadata=name, error=str(e))
+            fingerprint = None
+
+        tiers = self.engines
+        outcomes = await asyncio.gather(
+            *(
+                self._init_tier(tier, tier_engine, metadata, name, fingerprint, timeout, force)
+                for tier, tier_engine in tiers.items()
+            )
+        )
+        results = dict(zip(tiers, outcomes, strict=True))
+        if results["fallback"] in ("created", "unchanged") and not self.journal.ready:
+            try:
+                await self.journal.ensure(self.fallback_writer_engine)
+            except Exception as e:
+                logger.error("fallback_journal_init_failed", error=str(e))
+        return results
+
+    async def _init_tier(
+        self,
+        tier: str,
+        tier_engine: AsyncEngine,
+        metadata,
+        name: str,
+        fingerprint: str | None,
+        timeout: float,
+        force: bool = False,
+    ) -> str:
+        """Create ``metadata`` on one tier unless its fingerprint is current."""
+
+        def sync_schema(conn) -> str:
+            if fingerprint is None:
+                metadata.create_all(conn)
+                return "created"
+            if read_fingerprint(conn, name) == fingerprint and not force:
+                return "unchanged"
+            metadata.create_all(conn)
+            write_fingerprint(conn, name, fingerprint)
+            return "created"
+
+        async def run() -> str:
+            async with tier_engine.begin() as conn:
+                return await conn.run_sync(sync_schema)
+
+        start = time.perf_counter()
         try:
-            async with self.fallback_engine.begin() as conn:
-                await conn.run_sync(base_class.metadata.create_all)
-            logger.info("fallback_db_initialized")
+            outcome = await asyncio.wait_for(run(), timeout)
+        except TimeoutError:
+            outcome = "timeout"
+            logger.warning(f"{tier}_db_init_failed", error=f"timed out after {timeout}s")
         except Exception as e:
-            logger.error("fallback_db_init_failed", error=str(e))
+            outcome = "failed"
+            log = logger.error if tier == "fallback" else logger.warning
+            log(f"{tier}_db_init_failed", error=str(e))
+        else:
+            logger.info(f"{tier}_db_initialized", metadata=name, schema=outcome)
+        duration = time.perf_counter() - start
+        record_schema_init(tier, outcome, duration)
+        return outcome
 
     @property
     def _using_fallback(self):
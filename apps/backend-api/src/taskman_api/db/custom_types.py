@@ -1,5 +1,23 @@
+import os
+import zlib
+from typing import Any
+
+import orjson
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.types import JSON, TypeDecorator
+from sqlalchemy.types import JSON, LargeBinary, TypeDecorator
+
+from taskman_api.telemetry.compression_metrics import (
+    record_compressed_write,
+    record_decompression,
+)
+
+
+def json_serializer(value: Any) -> str:
+    """Engine ``json_serializer``: orjson, accepting non-string dict keys like json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+json_deserializer = orjson.loads
 
 
 class JSONVariant(TypeDecorator):
@@ -14,3 +32,95 @@ class JSONVariant(TypeDecorator):
             return dialect.type_descriptor(JSONB())
         else:
             return dialect.type_descriptor(JSON())
+
+
+# Compressed values are stored as one header byte followed by the payload
+RAW_HEADER = b"\x00"
+ZLIB_HEADER = b"\x01"
+
+# Values smaller than TASKMAN_COMPRESS_MIN_BYTES are stored raw: below a few
+# hundred bytes zlib saves little and costs a decompression on every read
+DEFAULT_COMPRESS_MIN_BYTES = 1024
+COMPRESSION_LEVEL = 6
+
+
+def compress_min_bytes() -> int:
+    """Smallest encoded value (in bytes) that is compressed."""
+    try:
+        return int(os.environ.get("TASKMAN_COMPRESS_MIN_BYTES", DEFAULT_COMPRESS_MIN_BYTES))
+    except ValueError:
+        return DEFAULT_COMPRESS_MIN_BYTES
+
+
+def pack(data: bytes, column: str = "") -> bytes:
+    """Encode ``data`` for a compressed column: zlib when large enough and smaller, else raw."""
+    if len(data) >= compress_min_bytes():
+        compressed = zlib.compress(data, COMPRESSION_LEVEL)
+        if len(compressed) < len(data):
+            record_compressed_write(column, "zlib", len(data), len(compressed) + 1)
+            return ZLIB_HEADER + compressed
+    record_compressed_write(column, "raw", len(data), len(data) + 1)
+    return RAW_HEADER + data
+
+
+def unpack(stored: bytes | str, column: str = "") -> bytes:
+    """Decode a value written by ``pack``.
+
+    A ``str`` is a legacy value from a column still declared TEXT (the SQLite
+    fallback tier is never migrated) and is returned as-is.
+    """
+    if isinstance(stored, str):
+        return stored.encode()
+    stored = bytes(stored)  # drivers may return memoryview
+    header, payload = stored[:1], stored[1:]
+    if header == RAW_HEADER:
+        return payload
+    if header == ZLIB_HEADER:
+        record_decompression(column)
+        return zlib.decompress(payload)
+    raise ValueError(f"Unknown compression header {header!r} in {column or 'column'}")
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text stored as bytes, zlib-compressed once it reaches TASKMAN_COMPRESS_MIN_BYTES.
+
+    Values are decompressed when their column is loaded, so reads that only
+    need other columns should not select it (``load_only``).
+
+    Args:
+        column: Metric label for the column, e.g. "conversation_turns.content"
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, column: str = "", *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.column = column
+
+    def process_bind_param(self, value, _dialect):
+        if value is None:
+            return None
+        return pack(value.encode(), self.column)
+
+    def process_result_value(self, value, _dialect):
+        if value is None:
+            return None
+        return unpack(value, self.column).decode()
+
+
+class CompressedJSON(CompressedText):
+    """
+    JSON stored as bytes like ``CompressedText``; the database cannot query into it.
+    """
+    cache_ok = True
+
+    def process_bind_param(self, value, _dialect):
+        if value is None:
+            return None
+        return pack(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS), self.column)
+
+    def process_result_value(self, value, _dialect):
+        if value is None:
+            return None
+        return orjson.loads(unpack(value, self.column))
@@ -0,0 +1,150 @@
+"""
+Adaptive Connection Pool Sizing.
+
+Every worker used to keep ``pool_size=20, max_overflow=10`` PostgreSQL
+connections per tier, so N uvicorn workers could hold 30 * N connections and
+exhaust ``max_connections`` while mostly idle.
+
+With ``database.pool_adaptive`` enabled, each PostgreSQL tier starts at
+``pool_min_size`` retained connections. Every ``pool_adapt_interval`` seconds
+the retained size is re-targeted within [pool_min_size, pool_size] from the
+checkout waits observed in the last interval:
+
+- p95 wait above ``pool_wait_target_ms``, or any checkout timeout: grow by
+  half (at least one connection). Waits include opening a connection, so
+  churning overflow connections also counts as pressure.
+- p95 wait below half the target and peak checked-out connections below the
+  current size: shrink by one. Connections beyond the new size are closed
+  as they are returned.
+
+``max_overflow`` stays available as burst capacity on top of the current size,
+so a worker never holds more than ``pool_size + max_overflow`` connections.
+
+Resizing edits QueuePool internals. ``supports_resize`` checks the SQLAlchemy
+release and those attributes; ConnectionManager keeps a fixed pool size, with
+a warning, when they do not match.
+"""
+
+import math
+import threading
+from collections import deque
+
+import sqlalchemy
+import structlog
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+logger = structlog.get_logger()
+
+DEFAULT_MIN_SIZE = 2
+DEFAULT_WAIT_TARGET_MS = 5.0
+DEFAULT_ADAPT_INTERVAL = 15.0
+
+# Checkout waits kept per interval (oldest dropped first)
+_MAX_SAMPLES = 10_000
+
+# SQLAlchemy (major, minor) releases whose QueuePool internals resize_pool edits
+RESIZABLE_SQLALCHEMY_VERSIONS = frozenset({(2, 0), (2, 1)})
+
+
+def _sqlalchemy_version() -> tuple[int, ...]:
+    major, minor = sqlalchemy.__version__.split(".")[:2]
+    return int(major), int(minor)
+
+
+def supports_resize(pool: object) -> bool:
+    """Whether ``resize_pool`` can safely resize ``pool`` under the installed SQLAlchemy."""
+    if _sqlalchemy_version() not in RESIZABLE_SQLALCHEMY_VERSIONS:
+        return False
+    if not isinstance(pool, QueuePool):
+        return False
+    queue = getattr(pool, "_pool", None)
+    async_queue = getattr(queue, "__dict__", {}).get("_queue")
+    return (
+        hasattr(pool, "_overflow_lock")
+        and isinstance(getattr(pool, "_overflow", None), int)
+        and isinstance(getattr(queue, "maxsize", None), int)
+        and (async_queue is None or isinstance(getattr(async_queue, "_maxsize", None), int))
+    )
+
+
+def resize_pool(pool: QueuePool, size: int) -> None:
+    """Set the number of connections ``pool`` retains, keeping its overflow accounting.
+
+    QueuePool counts open connections as ``size + _overflow``; moving
+    ``size`` therefore moves ``_overflow`` the other way. The async queue
+    caches its bound on creation, so that copy is updated too. Callers check
+    ``supports_resize`` first.
+    """
+    with pool._overflow_lock:
+        delta = size - pool._pool.maxsize
+        pool._pool.maxsize = size
+        queue = pool._pool.__dict__.get("_queue")
+        if queue is not None:
+            queue._maxsize = size
+        pool._overflow -= delta
+
+
+class AdaptivePoolSizer:
+    """Retargets one engine's pool size from observed checkout waits."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        tier: str,
+        min_size: int = DEFAULT_MIN_SIZE,
+        max_size: int | None = None,
+        wait_target_ms: float = DEFAULT_WAIT_TARGET_MS,
+    ) -> None:
+        self.pool: QueuePool = engine.sync_engine.pool
+        self.tier = tier
+        self.max_size = max_size or self.pool.size()
+        self.min_size = min(min_size, self.max_size)
+        self.wait_target = wait_target_ms / 1000
+        self._lock = threading.Lock()
+        self._waits: deque[float] = deque(maxlen=_MAX_SAMPLES)
+        self._timeouts = 0
+        self._peak = 0
+        resize_pool(self.pool, self.min_size)
+
+    @property
+    def size(self) -> int:
+        return self.pool.size()
+
+    def observe(self, wait_seconds: float, timed_out: bool = False) -> None:
+        """Record one checkout (called from the engine's checkout instrumentation)."""
+        with self._lock:
+            if timed_out:
+                self._timeouts += 1
+            else:
+                self._waits.append(wait_seconds)
+            self._peak = max(self._peak, self.pool.checkedout())
+
+    def adjust(self) -> int:
+        """Retarget the pool from the waits since the last call; returns the new size."""
+        with self._lock:
+            waits = sorted(self._waits)
+            timeouts, peak = self._timeouts, self._peak
+            self._waits.clear()
+            self._timeouts = 0
+            self._peak = self.pool.checkedout()
+
+        size = current = self.size
+        p95 = waits[min(len(waits) - 1, math.ceil(len(waits) * 0.95) - 1)] if waits else 0.0
+        if timeouts or p95 > self.wait_target:
+            size = min(self.max_size, current + max(1, current // 2))
+        elif p95 < self.wait_target / 2 and peak < current:
+            size = max(self.min_size, current - 1)
+
+        if size != current:
+            resize_pool(self.pool, size)
+            logger.info(
+                "db_pool_resized",
+                tier=self.tier,
+                size=size,
+                previous=current,
+                p95_wait_ms=round(p95 * 1000, 2),
+                timeouts=timeouts,
+                peak_checked_out=peak,
+            )
+        return size
@@ -0,0 +1,118 @@
+"""
+Read-Replica Routing.
+
+When ``database.read_replica_routing`` is enabled and a secondary database is
+configured, the secondary serves as a read replica as well as a failover
+target. Primary sessions are ``ReadWriteSession``s: each statement is bound
+per execution, and a plain SELECT goes to the replica when all of these hold:
+
+- the code path is marked read-only, by the ``read_only_request`` route
+  dependency or the ``@read_only`` service-method decorator
+- nothing pinned the request to primary. Write requests (non-GET) and
+  requests carrying a recent ``X-Write-Token`` (read-your-writes) are pinned
+  by ReadRoutingMiddleware, and ``@primary_only`` pins a block of code
+- the session has not written yet (flush, DML or raw SQL)
+- the replica's circuit is closed and its measured lag is within
+  ``database.replica_max_lag`` (see ConnectionManager.replica_bind)
+
+Everything else stays on primary, so unmarked code keeps its current behavior.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from sqlalchemy.orm import Session
+
+# "replica": reads may use the replica; "primary": pinned; None: unmarked
+_routing: ContextVar[str | None] = ContextVar("taskman_read_routing", default=None)
+
+REPLICA = "replica"
+PRIMARY = "primary"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def current_routing() -> str | None:
+    """Routing mark for the current context ("replica", "primary" or None)."""
+    return _routing.get()
+
+
+@contextmanager
+def routing(mark: str) -> Iterator[None]:
+    """Mark the enclosed code; a primary pin is never downgraded to replica."""
+    if mark == REPLICA and _routing.get() == PRIMARY:
+        yield
+        return
+    token = _routing.set(mark)
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+def read_only(func: F) -> F:
+    """Decorate an async service method whose queries may run on the replica."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with routing(REPLICA):
+            return await func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def primary_only(func: F) -> F:
+    """Decorate an async method that must read from primary (e.g. read-modify-write)."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with routing(PRIMARY):
+            return await func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+async def read_only_request() -> AsyncIterator[None]:
+    """Route dependency marking a whole endpoint read-only.
+
+    Must stay ``async``: FastAPI runs sync dependencies in a worker thread,
+    where setting the context variable would not reach the endpoint.
+    """
+    with routing(REPLICA):
+        yield
+
+
+class ReadWriteSession(Session):
+    """Session sending eligible SELECTs to the replica returned by ``info["replica"]``.
+
+    ``info["replica"]`` is a zero-argument callable returning the replica's
+    sync Engine, or None when the replica must not be used right now.
+    """
+
+    _wrote = False
+
+    def get_bind(self, mapper=None, *, clause=None, bind=None, **kw):  # type: ignore[override]
+        if bind is None and not self._wrote:
+            if self._flushing or is_write_statement(clause):
+                # Pin to primary so the session reads its own writes from here on
+                self._wrote = True
+            elif clause is not None and _routing.get() == REPLICA:
+                replica = self.info.get("replica")
+                engine = replica() if replica is not None else None
+                if engine is not None:
+                    return engine
+        return super().get_bind(mapper, clause=clause, bind=bind, **kw)
+
+
+def is_write_statement(clause: Any) -> bool:
+    """DML, raw SQL and locking reads (SELECT ... FOR UPDATE) belong on primary."""
+    if clause is None:
+        return False
+    return not getattr(clause, "is_select", False) or (
+        getattr(clause, "_for_update_arg", None) is not None
+    )
@@ -0,0 +1,533 @@
+"""
+Fallback-to-Primary Reconciliation.
+
+Writes made while the SQLite fallback tier was active used to stay there. The
+fallback now journals them and replays them once the primary is back:
+
+1. Journal: ``SQLiteFallbackSession``s carrying a ``FallbackJournal`` in
+   ``info["journal"]`` record the table and primary key of every row they
+   insert, update or delete in ``fallback_journal``, in the same transaction
+   as the write. That covers ORM flushes and bulk UPDATE/DELETE statements,
+   whose keys are selected before they run.
+2. Diff: journaled keys are sorted and split into ranges of ``batch_size``
+   keys per table. Each range is read from both databases in one query per
+   side and hashed row by row (SHA-256 over normalized column values). Ranges
+   whose digests match are done; otherwise only rows with differing hashes
+   are replayed. Hashing runs client-side because SQLite has no digest
+   function.
+3. Replay: differing rows go to primary as one batched upsert per range,
+   parents before children. Rows gone from the fallback are deleted in
+   batches afterwards, children first.
+4. Conflicts: a differing primary row whose ``updated_at`` is newer than the
+   fallback's write was changed on primary after that write. It is kept,
+   logged and reported (``ReconciliationReport.tables[...].conflicts``)
+   instead of being overwritten.
+
+Replayed, unchanged and conflicting keys leave the journal; keys from failed
+batches stay for the next run. Progress and lag are exported as metrics (see
+telemetry.reconciliation_metrics).
+"""
+
+import hashlib
+import json
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import Any
+
+import structlog
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    event,
+    func,
+    inspect,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from taskman_api.db.sqlite_fallback import SQLiteFallbackSession
+from taskman_api.telemetry.reconciliation_metrics import (
+    record_reconciliation_lag,
+    record_reconciliation_progress,
+    record_reconciliation_rows,
+    record_reconciliation_run,
+)
+
+logger = structlog.get_logger()
+
+# Journaled keys compared and replayed per range
+DEFAULT_BATCH_SIZE = 500
+
+UPSERT = "upsert"
+DELETE = "delete"
+
+# Kept out of Base.metadata: the journal exists only on the fallback tier
+_journal_metadata = MetaData()
+
+FALLBACK_JOURNAL = Table(
+    "fallback_journal",
+    _journal_metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("table_name", String(200), nullable=False, index=True),
+    Column("row_key", String(500), nullable=False),
+    Column("operation", String(10), nullable=False),
+    Column("recorded_at", DateTime(timezone=True), nullable=False),
+)
+
+
+def encode_key(values: Iterable[Any]) -> str:
+    """Journal form of a primary key (JSON list of its column values)."""
+    return json.dumps(list(values), default=str)
+
+
+def _as_utc(value: Any) -> datetime | None:
+    """Timestamp as an aware UTC datetime (naive values are taken as UTC), else None."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _coerce(column: Column, value: Any) -> Any:
+    """Journaled key value (decoded from JSON) as the column's Python type."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if value is None or isinstance(value, python_type):
+        return value
+    try:
+        return python_type(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _normalize(value: Any) -> Any:
+    """Dialect-independent form of a column value for hashing."""
+    if isinstance(value, datetime):
+        return _as_utc(value).isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value.normalize())
+    if isinstance(value, bytes | bytearray | memoryview):
+        return bytes(value).hex()
+    return value
+
+
+def row_hash(row: Mapping[str, Any]) -> str:
+    """SHA-256 of a row's column values, equal across PostgreSQL and SQLite."""
+    payload = json.dumps(
+        {name: _normalize(value) for name, value in row.items()}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _range_digest(hashes: Mapping[str, str]) -> str:
+    return hashlib.sha256(
+        "\n".join(f"{key}={hashes[key]}" for key in sorted(hashes)).encode("utf-8")
+    ).hexdigest()
+
+
+class FallbackJournal:
+    """Records fallback-era writes; one instance is shared by a tier's sessions."""
+
+    def __init__(self) -> None:
+        self.ready = False
+
+    async def ensure(self, engine: AsyncEngine) -> None:
+        """Create the journal table on ``engine`` in its own transaction (at startup)."""
+        async with engine.begin() as conn:
+            await conn.run_sync(FALLBACK_JOURNAL.create, checkfirst=True)
+        self.ready = True
+
+    def record(self, connection, entries: list[dict]) -> None:
+        """Insert journal ``entries`` on the session's (writer) connection."""
+        if not entries:
+            return
+        if not self.ready:
+            # Not ensured yet: create it inside the session's transaction, so a
+            # rollback takes the table with it and the next write checks again
+            FALLBACK_JOURNAL.create(connection, checkfirst=True)
+        connection.execute(FALLBACK_JOURNAL.insert(), entries)
+
+
+def _entry(table: Table, key: Iterable[Any], operation: str, now: datetime) -> dict:
+    return {
+        "table_name": table.name,
+        "row_key": encode_key(key),
+        "operation": operation,
+        "recorded_at": now,
+    }
+
+
+@event.listens_for(SQLiteFallbackSession, "after_flush")
+def _journal_flush(session: Session, flush_context) -> None:
+    """Journal rows written by a flush (new/dirty/deleted still hold pre-flush state)."""
+    journal = session.info.get("journal")
+    if journal is None:
+        return
+    now = datetime.now(UTC)
+    entries = []
+    for operation, objects in (
+        (UPSERT, session.new),
+        (UPSERT, [obj for obj in session.dirty if session.is_modified(obj)]),
+        (DELETE, session.deleted),
+    ):
+        for obj in objects:
+            mapper = inspect(obj).mapper
+            entries.append(
+                _entry(mapper.local_table, mapper.primary_key_from_instance(obj), operation, now)
+            )
+    journal.record(session.connection(), entries)
+
+
+@event.listens_for(SQLiteFallbackSession, "do_orm_execute")
+def _journal_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    """Journal the keys a bulk UPDATE/DELETE is about to touch."""
+    session = orm_execute_state.session
+    journal = session.info.get("journal")
+    if journal is None or not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    statement = orm_execute_state.statement
+    table = statement.table
+    keys = select(*table.primary_key.columns)
+    if statement.whereclause is not None:
+        keys = keys.where(statement.whereclause)
+    connection = session.connection()
+    operation = DELETE if orm_execute_state.is_delete else UPSERT
+    now = datetime.now(UTC)
+    entries = [_entry(table, row, operation, now) for row in connection.execute(keys)]
+    journal.record(connection, entries)
+
+
+def _log_batch_failure(table_name: str, keys: list[str], error: Exception) -> None:
+    logger.warning(
+        "reconciliation_batch_failed", table=table_name, keys=len(keys), error=str(error)
+    )
+
+
+@dataclass
+class Conflict:
+    """A journaled row left as-is because primary changed it after the fallback did."""
+
+    key: str
+    operation: str
+    primary_updated_at: str | None
+    fallback_written_at: str | None
+
+
+@dataclass
+class TableReport:
+    """Per-table reconciliation counts."""
+
+    ranges: int = 0
+    ranges_matched: int = 0
+    upserted: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    conflicts: list[Conflict] = field(default_factory=list)
+
+
+@dataclass
+class ReconciliationReport:
+    """Outcome of one reconciliation run."""
+
+    started_at: str
+    outcome: str = "completed"  # completed / partial (some batches failed) / failed
+    duration_seconds: float = 0.0
+    journaled_keys: int = 0
+    tables: dict[str, TableReport] = field(default_factory=dict)
+    # Journaled tables not registered with the reconciler; left in the journal
+    skipped_tables: list[str] = field(default_factory=list)
+    # Journal entries left after the run (failed, skipped or newly journaled)
+    pending: int = 0
+    journaled_during_run: int = 0
+    error: str | None = None
+
+    @property
+    def conflicts(self) -> int:
+        return sum(len(report.conflicts) for report in self.tables.values())
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "conflicts": self.conflicts}
+
+
+class FallbackReconciler:
+    """Replays journaled fallback writes onto the primary database."""
+
+    def __init__(
+        self,
+        fallback_reader: AsyncEngine,
+        fallback_writer: AsyncEngine,
+        primary: AsyncEngine,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.fallback_reader = fallback_reader
+        self.fallback_writer = fallback_writer
+        self.primary = primary
+        self.batch_size = batch_size
+        self._metadata: dict[int, MetaData] = {}
+
+    def register(self, metadata: MetaData) -> None:
+        """Make ``metadata``'s tables eligible for replay (called by init_models)."""
+        self._metadata[id(metadata)] = metadata
+
+    def _tables(self) -> dict[str, Table]:
+        """Registered tables in dependency order (parents first)."""
+        tables: dict[str, Table] = {}
+        for metadata in self._metadata.values():
+            for table in metadata.sorted_tables:
+                tables.setdefault(table.name, table)
+        return tables
+
+    async def _journal_exists(self) -> bool:
+        async with self.fallback_reader.connect() as conn:
+            return await conn.run_sync(
+                lambda sync_conn: inspect(sync_conn).has_table(FALLBACK_JOURNAL.name)
+            )
+
+    async def refresh_lag(self) -> tuple[int, float]:
+        """Measure and record unreplayed journal entries and the oldest one's age."""
+        pending, lag = 0, 0.0
+        if await self._journal_exists():
+            async with self.fallback_reader.connect() as conn:
+                row = (
+                    await conn.execute(
+                        select(func.count(), func.min(FALLBACK_JOURNAL.c.recorded_at))
+                    )
+                ).one()
+            pending = row[0]
+            oldest = _as_utc(row[1])
+            if oldest is not None:
+                lag = max((datetime.now(UTC) - oldest).total_seconds(), 0.0)
+        record_reconciliation_lag(pending, lag)
+        return pending, lag
+
+    async def _load_journal(self) -> tuple[dict[str, dict[str, datetime]], int]:
+        """Journaled keys per table with their latest write time, and the last entry id."""
+        journal: dict[str, dict[str, datetime]] = {}
+        last_id = 0
+        async with self.fallback_reader.connect() as conn:
+            rows = await conn.execute(
+                select(
+                    FALLBACK_JOURNAL.c.table_name,
+                    FALLBACK_JOURNAL.c.row_key,
+                    func.max(FALLBACK_JOURNAL.c.recorded_at),
+                    func.max(FALLBACK_JOURNAL.c.id),
+                ).group_by(FALLBACK_JOURNAL.c.table_name, FALLBACK_JOURNAL.c.row_key)
+            )
+            for table_name, row_key, recorded_at, entry_id in rows:
+                journal.setdefault(table_name, {})[row_key] = _as_utc(recorded_at)
+                last_id = max(last_id, entry_id)
+        return journal, last_id
+
+    @staticmethod
+    def _key_filter(table: Table, keys: list[str]):
+        pk = list(table.primary_key.columns)
+        decoded = [
+            [_coerce(column, value) for column, value in zip(pk, json.loads(key), strict=True)]
+            for key in keys
+        ]
+        if len(pk) == 1:
+            return pk[0].in_([key[0] for key in decoded])
+        return tuple_(*pk).in_([tuple(key) for key in decoded])
+
+    @staticmethod
+    async def _fetch(engine: AsyncEngine, table: Table, keys: list[str]) -> dict[str, dict]:
+        pk = [column.key for column in table.primary_key.columns]
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                select(table).where(FallbackReconciler._key_filter(table, keys))
+            )
+            rows = [dict(row._mapping) for row in result]
+        return {encode_key(row[name] for name in pk): row for row in rows}
+
+    async def _diff_range(
+        self, table: Table, keys: list[str], written: Mapping[str, datetime], report: TableReport
+    ) -> tuple[dict[str, dict], list[str], list[str]]:
+        """Compare one key range.
+
+        Returns:
+            (rows to upsert by key, keys to delete, keys needing no replay)
+        """
+        fallback_rows = await self._fetch(self.fallback_reader, table, keys)
+        primary_rows = await self._fetch(self.primary, table, keys)
+        fallback_hashes = {key: row_hash(row) for key, row in fallback_rows.items()}
+        primary_hashes = {key: row_hash(row) for key, row in primary_rows.items()}
+        report.ranges += 1
+        if _range_digest(fallback_hashes) == _range_digest(primary_hashes):
+            report.ranges_matched += 1
+            report.unchanged += len(keys)
+            return {}, [], keys
+
+        upserts: dict[str, dict] = {}
+        deletes: list[str] = []
+        settled: list[str] = []
+        has_updated_at = "updated_at" in table.c
+        for key in keys:
+            fallback_hash, primary_hash = fallback_hashes.get(key), primary_hashes.get(key)
+            if fallback_hash == primary_hash:
+                report.unchanged += 1
+                settled.append(key)
+                continue
+            fallback_row, primary_row = fallback_rows.get(key), primary_rows.get(key)
+            operation = UPSERT if fallback_row is not None else DELETE
+            fallback_time = written.get(key)
+            if fallback_row is not None and has_updated_at:
+                fallback_time = _as_utc(fallback_row["updated_at"]) or fallback_time
+            primary_time = None
+            if primary_row is not None and has_updated_at:
+                primary_time = _as_utc(primary_row["updated_at"])
+            if primary_time and fallback_time and primary_time > fallback_time:
+                conflict = Conflict(
+                    key=key,
+                    operation=operation,
+                    primary_updated_at=primary_time.isoformat(),
+                    fallback_written_at=fallback_time.isoformat(),
+                )
+                report.conflicts.append(conflict)
+                logger.warning("reconciliation_conflict", table=table.name, **asdict(conflict))
+                settled.append(key)
+            elif operation == UPSERT:
+                upserts[key] = fallback_row
+            else:
+                deletes.append(key)
+        return upserts, deletes, settled
+
+    async def _upsert(self, table: Table, rows: list[dict]) -> None:
+        async with self.primary.begin() as conn:
+            insert = postgresql.insert if conn.dialect.name == "postgresql" else sqlite.insert
+            statement = insert(table)
+            pk = [column.name for column in table.primary_key.columns]
+            updates = {
+                column.name: statement.excluded[column.name]
+                for column in table.columns
+                if not column.primary_key
+            }
+            statement = (
+                statement.on_conflict_do_update(index_elements=pk, set_=updates)
+                if updates
+                else statement.on_conflict_do_nothing(index_elements=pk)
+            )
+            await conn.execute(statement, rows)
+
+    async def _delete(self, table: Table, keys: list[str]) -> None:
+        async with self.primary.begin() as conn:
+            await conn.execute(delete(table).where(self._key_filter(table, keys)))
+
+    async def _clear_journal(self, table_name: str, keys: list[str], last_id: int) -> None:
+        """Drop settled keys' entries up to ``last_id`` (later writes are replayed next run)."""
+        async with self.fallback_writer.begin() as conn:
+            for start in range(0, len(keys), self.batch_size):
+                await conn.execute(
+                    delete(FALLBACK_JOURNAL).where(
+                        FALLBACK_JOURNAL.c.id <= last_id,
+                        FALLBACK_JOURNAL.c.table_name == table_name,
+                        FALLBACK_JOURNAL.c.row_key.in_(keys[start : start + self.batch_size]),
+                    )
+                )
+
+    async def reconcile(self) -> ReconciliationReport:
+        """Diff and replay every journaled key onto primary."""
+        start = time.perf_counter()
+        report = ReconciliationReport(started_at=datetime.now(UTC).isoformat())
+        try:
+            await self._reconcile(report)
+        except Exception as e:
+            report.outcome = "failed"
+            report.error = str(e)
+            logger.error("reconciliation_failed", error=str(e))
+        report.duration_seconds = round(time.perf_counter() - start, 3)
+        record_reconciliation_run(report.outcome, report.duration_seconds)
+        for name, table_report in report.tables.items():
+            for outcome in ("upserted", "deleted", "unchanged", "failed"):
+                record_reconciliation_rows(name, outcome, getattr(table_report, outcome))
+            record_reconciliation_rows(name, "conflict", len(table_report.conflicts))
+        if report.journaled_keys:
+            logger.info(
+                "reconciliation_finished",
+                outcome=report.outcome,
+                journaled_keys=report.journaled_keys,
+                conflicts=report.conflicts,
+                duration_seconds=report.duration_seconds,
+            )
+        return report
+
+    async def _reconcile(self, report: ReconciliationReport) -> None:
+        if not await self._journal_exists():
+            # Nothing was ever written on the fallback
+            record_reconciliation_lag(0, 0.0)
+            return
+        journal, last_id = await self._load_journal()
+        tables = self._tables()
+        report.skipped_tables = sorted(set(journal) - set(tables))
+        ordered = [name for name in tables if name in journal]
+        report.journaled_keys = sum(len(journal[name]) for name in ordered)
+        done = 0
+        record_reconciliation_progress(done, report.journaled_keys)
+
+        pending_deletes: dict[str, list[str]] = {}
+        settled: dict[str, list[str]] = {}
+        for name in ordered:
+            table, written = tables[name], journal[name]
+            table_report = report.tables[name] = TableReport()
+            keys = sorted(written)
+            for start in range(0, len(keys), self.batch_size):
+                chunk = keys[start : start + self.batch_size]
+                try:
+                    upserts, deletes, chunk_settled = await self._diff_range(
+                        table, chunk, written, table_report
+                    )
+                    if upserts:
+                        await self._upsert(table, list(upserts.values()))
+                except Exception as e:
+                    table_report.failed += len(chunk)
+                    _log_batch_failure(name, chunk, e)
+                else:
+                    table_report.upserted += len(upserts)
+                    settled.setdefault(name, []).extend([*chunk_settled, *upserts])
+                    pending_deletes.setdefault(name, []).extend(deletes)
+                done += len(chunk)
+                record_reconciliation_progress(done, report.journaled_keys)
+
+        # Children before parents so foreign keys hold
+        for name in reversed(ordered):
+            table, keys = tables[name], pending_deletes.get(name, [])
+            for start in range(0, len(keys), self.batch_size):
+                chunk = keys[start : start + self.batch_size]
+                try:
+                    await self._delete(table, chunk)
+                except Exception as e:
+                    report.tables[name].failed += len(chunk)
+                    _log_batch_failure(name, chunk, e)
+                else:
+                    report.tables[name].deleted += len(chunk)
+                    settled.setdefault(name, []).extend(chunk)
+
+        for name, keys in settled.items():
+            await self._clear_journal(name, keys, last_id)
+        if any(table_report.failed for table_report in report.tables.values()):
+            report.outcome = "partial"
+        report.pending, _ = await self.refresh_lag()
+        async with self.fallback_reader.connect() as conn:
+            report.journaled_during_run = await conn.scalar(
+                select(func.count()).where(FALLBACK_JOURNAL.c.id > last_id)
+            )
+
@@ -0,0 +1,82 @@
+"""
+Schema Fingerprinting.
+
+``metadata.create_all`` inspects every table on every startup (one round trip
+per table on PostgreSQL), for every tier and every uvicorn worker. Instead, a
+SHA-256 fingerprint of the declared schema is recorded per metadata in the
+``schema_fingerprints`` table; startup only runs ``create_all`` when the
+recorded fingerprint differs from the code's.
+
+The fingerprint covers tables, columns (type, nullability, keys, server
+defaults), indexes and constraints. It deliberately does not cover data or
+migrations applied outside ``create_all`` - Alembic remains the authority for
+schema changes to existing tables.
+"""
+
+import hashlib
+from typing import Any
+
+from sqlalchemy import Column, Connection, DateTime, MetaData, String, Table, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+# Kept out of Base.metadata so it is never part of its own fingerprint
+_bookkeeping = MetaData()
+
+SCHEMA_FINGERPRINTS = Table(
+    "schema_fingerprints",
+    _bookkeeping,
+    Column("name", String(200), primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+
+
+def _default(default: Any) -> str:
+    """Stable text for a server default (reprs embed object addresses)."""
+    if default is None:
+        return ""
+    return str(getattr(default, "arg", default))
+
+
+def schema_fingerprint(metadata: MetaData) -> str:
+    """SHA-256 of the schema declared by ``metadata``, independent of declaration order."""
+    lines: list[str] = []
+    for name in sorted(metadata.tables):
+        table = metadata.tables[name]
+        lines.append(f"table {name}")
+        for column in table.columns:
+            lines.append(
+                f"  column {column.name} {column.type!r} nullable={column.nullable} "
+                f"pk={column.primary_key} default={_default(column.server_default)}"
+            )
+        for index in sorted(table.indexes, key=lambda ix: ix.name or ""):
+            columns = ",".join(str(expr) for expr in index.expressions)
+            lines.append(f"  index {index.name} ({columns}) unique={index.unique}")
+        for constraint in sorted(
+            table.constraints, key=lambda c: (type(c).__name__, c.name or "", str(list(c)))
+        ):
+            columns = ",".join(column.name for column in constraint.columns)
+            lines.append(f"  {type(constraint).__name__} {constraint.name or ''} ({columns})")
+        for fk in sorted(table.foreign_keys, key=lambda fk: fk.target_fullname):
+            lines.append(f"  fk {fk.parent.name} -> {fk.target_fullname} ondelete={fk.ondelete}")
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+def read_fingerprint(conn: Connection, name: str) -> str | None:
+    """Recorded fingerprint for ``name``; creates the bookkeeping table if missing."""
+    SCHEMA_FINGERPRINTS.create(conn, checkfirst=True)
+    return conn.execute(
+        select(SCHEMA_FINGERPRINTS.c.fingerprint).where(SCHEMA_FINGERPRINTS.c.name == name)
+    ).scalar_one_or_none()
+
+
+def write_fingerprint(conn: Connection, name: str, fingerprint: str) -> None:
+    """Record ``fingerprint`` for ``name`` (upsert; concurrent workers may race)."""
+    insert = postgresql.insert if conn.dialect.name == "postgresql" else sqlite.insert
+    statement = insert(SCHEMA_FINGERPRINTS).values(name=name, fingerprint=fingerprint)
+    conn.execute(
+        statement.on_conflict_do_update(
+            index_elements=[SCHEMA_FINGERPRINTS.c.name],
+            set_={"fingerprint": fingerprint, "updated_at": func.now()},
+        )
+    )
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from taskman_api.config import get_settings
 from taskman_api.db.connection_manager import ConnectionManager
+from taskman_api.telemetry.request_metrics import register_pool_metrics
 
 logger = structlog.get_logger()
 
@@ -23,7 +24,28 @@ SECONDARY_URL = (
 SQLITE_PATH = settings.database.sqlite_path
 
 # Initialize Connection Manager
-manager = ConnectionManager(DATABASE_URL, SECONDARY_URL, SQLITE_PATH)
+manager = ConnectionManager(
+    DATABASE_URL,
+    SECONDARY_URL,
+    SQLITE_PATH,
+    failure_threshold=settings.database.breaker_failure_threshold,
+    reset_timeout=settings.database.breaker_reset_timeout,
+    probe_timeout=settings.database.health_probe_timeout,
+    read_replica=settings.database.read_replica_routing,
+    replica_max_lag=settings.database.replica_max_lag,
+    sqlite_pool_size=settings.database.sqlite_pool_size,
+    sqlite_write_timeout=settings.database.sqlite_write_timeout,
+    reconcile_batch_size=settings.database.reconcile_batch_size,
+    pool_size=settings.database.pool_size,
+    max_overflow=settings.database.max_overflow,
+    pool_timeout=settings.database.pool_timeout,
+    pool_recycle=settings.database.pool_recycle,
+    adaptive_pool=settings.database.pool_adaptive,
+    pool_min_size=settings.database.pool_min_size,
+    pool_wait_target_ms=settings.database.pool_wait_target_ms,
+    pool_adapt_interval=settings.database.pool_adapt_interval,
+)
+register_pool_metrics(manager)
 
 # Compatibility Shims
 engine = manager.primary_engine
@@ -31,13 +53,11 @@ engine = manager.primary_engine
 def AsyncSessionLocal():
     """
     Shim for legacy AsyncSessionLocal usage.
-    Returns a session from the active engine (Primary or Fallback).
-    Note: calling this bypasses the retry logic of manager.get_session(),
+    Returns a session from the active tier (a breaker-state lookup, no I/O).
+    Note: calling this bypasses manager.get_session()'s error reporting,
     but ensures basic compatibility for dependency injection.
     """
-    if manager._using_fallback:
-        return manager.FallbackSession()
-    return manager.PrimarySession()
+    return manager.session_factory()()
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -54,25 +74,42 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-async def init_db(base_class: type | None = None) -> None:
+async def init_db(base_class: type | None = None) -> dict[str, str]:
     """
     Initialize database - create tables if they don't exist.
     Call this during application startup.
-    Initializes both Primary and Fallback.
+    Initializes all tiers concurrently; tiers whose recorded schema
+    fingerprint is current skip create_all.
+
+    Returns:
+        {tier: outcome} (created/unchanged/failed/timeout)
     """
     if base_class is None:
         from taskman_api.db.base import Base
 
         base_class = Base
 
-    await manager.init_models(base_class)
+    return await manager.init_models(base_class, timeout=settings.database.init_timeout)
 
 
 async def check_db_health() -> dict:
     """
     Check database connectivity and return health status.
 
+    Serves the background prober's latest result while it is running and
+    fresh; probes all tiers otherwise.
+
     Returns:
         dict with detailed connectivity info for both primary and fallback
     """
-    return await manager.check_health()
+    return await manager.cached_health()
+
+
+def start_health_prober() -> None:
+    """Start probing the database tiers in the background (call from startup)."""
+    manager.start_health_prober(settings.database.health_probe_interval)
+
+
+async def stop_health_prober() -> None:
+    """Stop the background health prober (call from shutdown)."""
+    await manager.stop_health_prober()
@@ -0,0 +1,107 @@
+"""
+Tuned SQLite Fallback Engines.
+
+The fallback tier used ``NullPool``: every session opened a new SQLite
+connection and re-ran ``PRAGMA journal_mode=WAL``. Concurrent writers then
+raced for the database lock and failed with "database is locked" once the 60s
+busy timeout ran out.
+
+The fallback now uses two engines on the same file:
+
+- Readers: a connection pool (``pool_size``) for SELECTs. WAL lets them run
+  alongside the writer.
+- Writer: a single pooled connection (``pool_size=1, max_overflow=0``). A
+  session that needs to write waits its turn in the pool's async FIFO queue,
+  for at most ``write_timeout``. It no longer spins on SQLite's file lock, so
+  write latency is the queue wait plus the transaction itself.
+
+PRAGMAs (SQLITE_PRAGMAS) are applied once per connection, when the pool
+opens it. ``SQLiteFallbackSession`` binds SELECTs to the reader pool until the
+session first writes; from then on everything goes through the writer, so the
+session reads its own writes.
+"""
+
+import os
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Session
+
+from taskman_api.db.custom_types import json_deserializer, json_serializer
+from taskman_api.db.read_routing import is_write_statement
+
+DEFAULT_READER_POOL_SIZE = 5
+DEFAULT_WRITE_TIMEOUT = 30.0
+
+# Applied in order on every new connection
+SQLITE_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",  # durable across app crashes in WAL mode; fsync at checkpoints
+    "mmap_size": 268_435_456,  # 256 MiB memory-mapped reads
+    "cache_size": -65_536,  # 64 MiB page cache (negative = KiB)
+    "temp_store": "MEMORY",
+}
+
+
+def apply_pragmas(engine: AsyncEngine, pragmas: dict[str, str | int] | None = None) -> None:
+    """Run ``pragmas`` (default: SQLITE_PRAGMAS) once on each new DBAPI connection."""
+    statements = [f"PRAGMA {name}={value}" for name, value in (pragmas or SQLITE_PRAGMAS).items()]
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+
+
+def create_fallback_engines(
+    sqlite_url: str,
+    pool_size: int = DEFAULT_READER_POOL_SIZE,
+    write_timeout: float = DEFAULT_WRITE_TIMEOUT,
+) -> tuple[AsyncEngine, AsyncEngine]:
+    """Create the (reader pool, single writer) engine pair for ``sqlite_url``."""
+    echo = os.getenv("SQL_ECHO", "false").lower() == "true"
+    # sqlite3's busy timeout only matters for other processes (e.g. other
+    # uvicorn workers); writers in this process queue on the writer pool
+    connect_args = {"check_same_thread": False, "timeout": write_timeout}
+
+    reader = create_async_engine(
+        sqlite_url,
+        echo=echo,
+        connect_args=connect_args,
+        pool_size=pool_size,
+        max_overflow=pool_size * 2,
+        pool_pre_ping=False,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
+    )
+    writer = create_async_engine(
+        sqlite_url,
+        echo=echo,
+        connect_args=connect_args,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=write_timeout,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
+    )
+    for engine in (reader, writer):
+        apply_pragmas(engine)
+    return reader, writer
+
+
+class SQLiteFallbackSession(Session):
+    """Session bound to the writer engine that reads from ``info["reader"]`` until it writes."""
+
+    _wrote = False
+
+    def get_bind(self, mapper=None, *, clause=None, bind=None, **kw):  # type: ignore[override]
+        if bind is None and not self._wrote:
+            if self._flushing or is_write_statement(clause):
+                self._wrote = True
+            elif clause is not None:
+                reader = self.info.get("reader")
+                if reader is not None:
+                    return reader
+        return super().get_bind(mapper, clause=clause, bind=bind, **kw)
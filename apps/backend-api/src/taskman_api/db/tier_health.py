@@ -0,0 +1,91 @@
+"""
+Per-Tier Circuit Breakers.
+
+Each database tier (primary, secondary, fallback) has a breaker fed by the
+background health prober and by connection errors seen on real requests:
+
+    closed    -> open       after ``failure_threshold`` consecutive failures
+    open      -> half_open  once ``reset_timeout`` seconds have passed
+    half_open -> closed     after ``success_threshold`` successful trial probes
+    half_open -> open       on any failed trial (the cool-down restarts)
+
+While a breaker is open its tier is neither probed nor routed to, so a dead
+tier costs no connect timeouts. ConnectionManager routes requests to the
+highest-priority closed tier; that choice is a dict lookup, not a probe.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.exc import InterfaceError, OperationalError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+BREAKER_STATES = (CLOSED, HALF_OPEN, OPEN)
+
+DEFAULT_FAILURE_THRESHOLD = 2
+DEFAULT_SUCCESS_THRESHOLD = 1
+DEFAULT_RESET_TIMEOUT = 30.0
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """True for errors that say the tier is unreachable, not that a query was bad."""
+    if getattr(error, "connection_invalidated", False):
+        return True
+    return isinstance(error, OperationalError | InterfaceError | OSError | TimeoutError)
+
+
+@dataclass
+class TierBreaker:
+    """Circuit breaker state for one database tier."""
+
+    tier: str
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD
+    success_threshold: int = DEFAULT_SUCCESS_THRESHOLD
+    reset_timeout: float = DEFAULT_RESET_TIMEOUT
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    consecutive_successes: int = 0
+    opened_at: float | None = None
+    last_error: str | None = None
+    last_probe: dict[str, Any] = field(default_factory=dict)
+
+    def allow_probe(self, now: float | None = None) -> bool:
+        """Whether the tier should be probed; moves open -> half_open after the cool-down."""
+        if self.state != OPEN:
+            return True
+        now = time.monotonic() if now is None else now
+        if self.opened_at is not None and now - self.opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+            self.consecutive_successes = 0
+            return True
+        return False
+
+    def record_success(self) -> bool:
+        """Record a successful probe. Returns True if the state changed."""
+        self.consecutive_failures = 0
+        self.consecutive_successes += 1
+        self.last_error = None
+        if self.state != CLOSED and (
+            self.state == OPEN or self.consecutive_successes >= self.success_threshold
+        ):
+            self.state = CLOSED
+            self.opened_at = None
+            return True
+        return False
+
+    def record_failure(self, error: str, now: float | None = None) -> bool:
+        """Record a failed probe or request. Returns True if the state changed."""
+        self.consecutive_successes = 0
+        self.consecutive_failures += 1
+        self.last_error = error
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.state = OPEN
+            self.opened_at = time.monotonic() if now is None else now
+            return True
+        return False
@@ -2,20 +2,24 @@
 FastAPI Dependencies.
 
 Provides dependency injection for database sessions, repositories, and authentication.
+
+cf_core repositories and services (QSE, context graph) are imported on first
+use, not at module import, to keep worker and CLI cold start fast.
 """
 
+import importlib
+import importlib.util
 from collections.abc import AsyncGenerator
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
-from cf_core.dao.context import ContextRepository
-from cf_core.dao.qse import QSERepository
-from cf_core.services.qse import QSEService
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from taskman_api.auth import User, get_current_admin_user, get_current_user
+from taskman_api.db.read_routing import read_only_request
 from taskman_api.db.session import AsyncSessionLocal, manager
 from taskman_api.repositories.action_list_repository import ActionListRepository
+from taskman_api.repositories.data_loader import enable_data_loaders
 from taskman_api.repositories.postgres_project_repository import PostgresProjectRepository
 from taskman_api.repositories.postgres_sprint_repository import PostgresSprintRepository
 from taskman_api.repositories.postgres_task_repository import PostgresTaskRepository
@@ -31,6 +35,29 @@ from taskman_api.services.project_service import ProjectService
 from taskman_api.services.sprint_service import SprintService
 from taskman_api.services.task_service import TaskService
 
+if TYPE_CHECKING:
+    from cf_core.dao.context import ContextRepository
+    from cf_core.dao.qse import QSERepository
+    from cf_core.services.qse import QSEService
+
+CF_CORE_AVAILABLE = importlib.util.find_spec("cf_core") is not None
+
+_CF_CORE_EXPORTS = {
+    "ContextRepository": "cf_core.dao.context",
+    "QSERepository": "cf_core.dao.qse",
+    "QSEService": "cf_core.services.qse",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve cf_core re-exports lazily (PEP 562)."""
+    module = _CF_CORE_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -41,9 +68,16 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         async def get_items(db: AsyncSession = Depends(get_db_session)):
             ...
     """
+    tier = manager.active_tier
     async with AsyncSessionLocal() as session:
+        # get_by_id / exists lookups made during the request are batched and memoized
+        enable_data_loaders(session)
         try:
             yield session
+        except Exception as e:
+            # Connection errors trip the tier's breaker so later requests fail over
+            manager.report_error(tier, e)
+            raise
         finally:
             await session.close()
 
@@ -51,6 +85,10 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 # Type alias for cleaner dependency injection
 DBSession = Annotated[AsyncSession, Depends(get_db_session)]
 
+# Route marker letting an endpoint's reads use the read replica:
+#     @router.get("/stats", dependencies=[ReadOnly])
+ReadOnly = Depends(read_only_request)
+
 
 # Repository dependencies
 def get_task_repository(session: DBSession) -> TaskRepository:
@@ -83,6 +121,8 @@ def get_qse_repository(session: DBSession) -> "QSERepository":
     """Get QSERepository instance from cf_core with injected session."""
     if not CF_CORE_AVAILABLE:
         raise ImportError("cf_core module is not available")
+    from cf_core.dao.qse import QSERepository
+
     return QSERepository(session)
 
 
@@ -90,6 +130,8 @@ def get_context_repository(session: DBSession) -> "ContextRepository":
     """Get ContextRepository instance from cf_core with injected session."""
     if not CF_CORE_AVAILABLE:
         raise ImportError("cf_core module is not available")
+    from cf_core.dao.context import ContextRepository
+
     return ContextRepository(session)
 
 
@@ -138,6 +180,8 @@ def get_qse_service(session: DBSession) -> "QSEService":
     """Get QSEService instance from cf_core with injected session."""
     if not CF_CORE_AVAILABLE:
         raise ImportError("cf_core module is not available")
+    from cf_core.services.qse import QSEService
+
     return QSEService(get_qse_repository(session))
 
 
@@ -146,14 +190,21 @@ TaskRepo = Annotated[TaskRepository, Depends(get_task_repository)]
 ProjectRepo = Annotated[ProjectRepository, Depends(get_project_repository)]
 SprintRepo = Annotated[SprintRepository, Depends(get_sprint_repository)]
 ActionListRepo = Annotated[ActionListRepository, Depends(get_action_list_repository)]
-ContextRepo = Annotated[ContextRepository, Depends(get_context_repository)]
 
 # Type aliases for service injection
 TaskSvc = Annotated[TaskService, Depends(get_task_service)]
 ProjectSvc = Annotated[ProjectService, Depends(get_project_service)]
 SprintSvc = Annotated[SprintService, Depends(get_sprint_service)]
 ActionListSvc = Annotated[ActionListService, Depends(get_action_list_service)]
-QSESvc = Annotated[QSEService, Depends(get_qse_service)]
+
+# cf_core-backed aliases: FastAPI only needs the Depends marker at runtime, so the
+# concrete classes are named for type checkers only
+if TYPE_CHECKING:
+    ContextRepo = Annotated[ContextRepository, Depends(get_context_repository)]
+    QSESvc = Annotated[QSEService, Depends(get_qse_service)]
+else:
+    ContextRepo = Annotated[Any, Depends(get_context_repository)]
+    QSESvc = Annotated[Any, Depends(get_qse_service)]
 
 
 # Export auth dependencies for router use
@@ -162,6 +213,7 @@ __all__ = [
     "get_current_admin_user",
     "User",
     "DBSession",
+    "ReadOnly",
     "TaskRepo",
     "ProjectRepo",
     "SprintRepo",
@@ -7,26 +7,43 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 import structlog
+from cf_core.logging import configure_logging, shutdown_logging
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy.exc import IntegrityError
 
+from taskman_api import BOOT_STARTED
 from taskman_api.api import health as health_router
 from taskman_api.api import metrics as metrics_router
+from taskman_api.config import get_settings
 from taskman_api.core.errors import AppError, ConflictError, NotFoundError
-from taskman_api.db.session import check_db_health, init_db
-from taskman_api.middleware import LoggingMiddleware
+from taskman_api.db.session import (
+    check_db_health,
+    init_db,
+    manager,
+    start_health_prober,
+    stop_health_prober,
+)
+from taskman_api.middleware import (
+    AdmissionControlMiddleware,
+    LoggingMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    QueryBudgetMiddleware,
+    ReadRoutingMiddleware,
+)
 from taskman_api.rate_limiter import limiter
 from taskman_api.routers import (
     action_lists_router,
     agent_router,
     checklists_router,
     conversations_router,
+    dashboard_router,
     diagnostic_router,
     phases_router,
     plans_router,
@@ -36,6 +53,8 @@ from taskman_api.routers import (
     tasks_router,
 )
 from taskman_api.routers import context as context_router
+from taskman_api.telemetry.loop_lag import loop_lag_monitor
+from taskman_api.telemetry.startup_metrics import record_worker_boot
 
 # OpenTelemetry circuit breaker and metrics
 
@@ -63,6 +82,9 @@ class Settings(BaseSettings):
 
     # Logging Configuration
     log_level: str = "INFO"
+    # Render/write JSON logs on a background thread instead of the event loop
+    log_async_sink: bool = False
+    log_queue_size: int = 10_000
 
     def validate_startup(self) -> list[str]:
         """
@@ -97,12 +119,19 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-# Configure structured logging
-structlog.configure(
+# Configure structured logging (shared with cf_core; APP_LOG_ASYNC_SINK=true
+# moves JSON rendering and stdout writes onto a background writer thread)
+_log_level = settings.log_level.upper()
+if _log_level not in {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}:
+    _log_level = "INFO"  # Reported by validate_startup()
+configure_logging(
+    level=_log_level,
+    format="json",
+    async_sink=settings.log_async_sink,
+    queue_size=settings.log_queue_size,
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer(),
     ],
 )
 logger = structlog.get_logger()
@@ -140,7 +169,10 @@ async def lifespan(_app: FastAPI):
         # Initialize primary API models
         await init_db()
 
-        # Initialize QSE models (using their own Base)
+        # Initialize QSE models (using their own Base). The table modules are
+        # imported here, not by dependencies.py, so register them explicitly.
+        import cf_core.dao.context  # noqa: F401
+        import cf_core.dao.qse  # noqa: F401
         from cf_core.dao.base import Base as QSEBase
 
         await init_db(base_class=QSEBase)
@@ -154,12 +186,18 @@ async def lifespan(_app: FastAPI):
         logger.error("database_init_failed", error=str(e))
         # Continue startup - API can run without DB for health checks
 
+    # Keeps tier breakers and the /health result current off the request path
+    start_health_prober()
+    # event_loop_lag_seconds, also an overload signal for admission control
+    loop_lag_monitor.start()
+
     logger.info(
         "api_startup",
         environment=settings.environment,
         port=settings.api_port,
         database_configured=bool(settings.database_url),
         validation_warnings=len(validation_warnings),
+        boot_seconds=round(record_worker_boot(BOOT_STARTED), 3),
     )
 
     yield
@@ -184,6 +222,11 @@ async def lifespan(_app: FastAPI):
     )
     logger.info("session_end", uptime_seconds=round(uptime_seconds, 2))
     logger.info("api_shutdown")
+    await stop_health_prober()
+    await loop_lag_monitor.stop()
+
+    # Drain the async log sink (no-op when logging synchronously)
+    shutdown_logging()
 
 
 # ============================================================================
@@ -194,6 +237,8 @@ app = FastAPI(
     description="Production REST API for TaskMan-v2 task management system",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson rendering for endpoint return values (error handlers keep JSONResponse)
+    default_response_class=ORJSONResponse,
 )
 
 # Register rate limiter with app state
@@ -215,6 +260,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Read-replica routing (APP_DATABASE__READ_REPLICA_ROUTING): pins write requests
+# and requests carrying a recent X-Write-Token to primary (read-your-writes)
+if manager.read_replica:
+    app.add_middleware(
+        ReadRoutingMiddleware, window=get_settings().database.read_your_writes_window
+    )
+
+# On-demand profiling: admin requests with X-Profile: 1 run under the sampling
+# profiler; collapsed stacks are served by /api/v1/diagnostic/debug/profile/{id}
+app.add_middleware(ProfilingMiddleware)
+
+# Per-request SQL statement tracking, inside LoggingMiddleware so its warnings
+# carry the correlation ID: N+1 and query budget warnings plus a slow-query log
+# (TASKMAN_SLOW_QUERY_MS, TASKMAN_N_PLUS_ONE_THRESHOLD, TASKMAN_QUERY_BUDGET).
+# X-Query-Count / Server-Timing headers are only exposed outside production.
+app.add_middleware(QueryBudgetMiddleware, expose_headers=settings.environment != "production")
+
 
 # ============================================================================
 # Request/Response Logging Middleware (IV-002 Enhancement)
@@ -226,8 +288,28 @@ app.add_middleware(
 # - Sensitive query parameter redaction
 # - Configurable health endpoint exclusion (TASKMAN_LOG_HEALTH_ENDPOINTS)
 # - Log level control via TASKMAN_LOG_LEVEL environment variable
+# - Sampling of fast successful requests (TASKMAN_LOG_SAMPLE_RATE, TASKMAN_LOG_SLOW_MS);
+#   errors and slow requests are always logged
 app.add_middleware(LoggingMiddleware)
 
+# Admission control (APP_ADMISSION__ENABLED): under event-loop lag or pool
+# checkout wait, rejects bulk, then interactive, then write requests with 503 and
+# Retry-After; health checks are never shed. Outside LoggingMiddleware so shed
+# requests cost no logging, inside MetricsMiddleware so the 503s are counted.
+_admission = get_settings().admission
+if _admission.enabled:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        loop_lag_threshold_ms=_admission.loop_lag_threshold_ms,
+        pool_wait_threshold_ms=_admission.pool_wait_threshold_ms,
+        retry_after=_admission.retry_after_seconds,
+        route_priorities=_admission.route_priorities,
+    )
+
+# Prometheus request metrics (outermost, so latency covers all middleware):
+# http_request_duration_seconds{method,route,status}, http_requests_in_flight{method}
+app.add_middleware(MetricsMiddleware)
+
 
 # ============================================================================
 # Response Models
@@ -259,7 +341,7 @@ async def health_check() -> HealthResponse:
     Returns:
         HealthResponse with system status and database connectivity
     """
-    # Perform actual database connectivity check
+    # Latest background probe result (probes inline only if it is stale)
     db_health = await check_db_health()
 
     # Determine overall status based on active mode connectivity
@@ -438,6 +520,7 @@ app.include_router(context_router.router, prefix="/api/v1/context", tags=["conte
 # These routers include their resource prefix in endpoints (e.g., /checklists/search)
 app.include_router(checklists_router, prefix="/api/v1", tags=["checklists"])
 app.include_router(conversations_router, prefix="/api/v1", tags=["conversations"])
+app.include_router(dashboard_router, prefix="/api/v1", tags=["dashboard"])
 app.include_router(phases_router, prefix="/api/v1", tags=["phases"])
 app.include_router(plans_router, prefix="/api/v1", tags=["plans"])
 app.include_router(diagnostic_router, prefix="/api/v1/diagnostic", tags=["diagnostic"])
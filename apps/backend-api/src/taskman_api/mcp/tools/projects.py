@@ -1,8 +1,10 @@
 from mcp.server.fastmcp import FastMCP
 
+from taskman_api.core.errors import ValidationError
+from taskman_api.core.fieldsets import format_fields, parse_fields
 from taskman_api.core.result import Err, Ok
 from taskman_api.dependencies import get_db_session
-from taskman_api.schemas.project import ProjectCreate
+from taskman_api.schemas.project import ProjectCreate, ProjectResponse
 from taskman_api.services.project_service import ProjectService
 
 
@@ -12,23 +14,32 @@ def register_project_tools(mcp: FastMCP):
     @mcp.tool()
     async def list_projects(
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        fields: str | None = None
     ) -> str:
-        """List all projects."""
+        """List all projects.
+
+        ``fields`` is a comma-separated list of project fields to show per
+        project (e.g. "name,status,owner"); only those columns are loaded.
+        """
+        try:
+            selected = parse_fields(fields, ProjectResponse)
+        except ValidationError as e:
+            return f"Error listing projects: {str(e)}"
+
         async for session in get_db_session():
             service = ProjectService(session)
-            # ProjectService.list is the standard method for simple listing
-            # Or assume we need search if filtering is added later
-            try:
-                # Use list() if available, or search strategies
-                # Checking ProjectRepository/Service standard methods
-                projects = await service.project_repo.get_multi(limit=limit, skip=offset)
-                total = await service.project_repo.count()
+            result = await service.search(limit=limit, offset=offset, fields=selected)
 
-                return f"Found {len(projects)} projects (Total: {total}):\n" + \
-                       "\n".join([f"- [{p.id}] {p.name} ({p.status})" for p in projects])
-            except Exception as e:
-                return f"Error listing projects: {str(e)}"
+            match result:
+                case Ok((projects, total)):
+                    if selected is not None:
+                        lines = [f"- {format_fields(p, selected)}" for p in projects]
+                    else:
+                        lines = [f"- [{p.id}] {p.name} ({p.status})" for p in projects]
+                    return f"Found {len(projects)} projects (Total: {total}):\n" + "\n".join(lines)
+                case Err(e):
+                    return f"Error listing projects: {str(e)}"
 
     @mcp.tool()
     async def create_project(
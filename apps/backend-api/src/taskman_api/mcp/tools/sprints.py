@@ -1,9 +1,11 @@
 
 from mcp.server.fastmcp import FastMCP
 
+from taskman_api.core.errors import ValidationError
+from taskman_api.core.fieldsets import format_fields, parse_fields
 from taskman_api.core.result import Err, Ok
 from taskman_api.dependencies import get_db_session
-from taskman_api.schemas.sprint import SprintCreate
+from taskman_api.schemas.sprint import SprintCreate, SprintResponse
 from taskman_api.services.sprint_service import SprintService
 
 
@@ -14,18 +16,39 @@ def register_sprint_tools(mcp: FastMCP):
     async def list_sprints(
         limit: int = 20,
         offset: int = 0,
-        status: str | None = None
+        status: str | None = None,
+        fields: str | None = None
     ) -> str:
-        """List sprints."""
+        """List sprints.
+
+        ``fields`` is a comma-separated list of sprint fields to show per
+        sprint (e.g. "name,status,end_date"); only those columns are loaded.
+        """
+        try:
+            selected = parse_fields(fields, SprintResponse)
+        except ValidationError as e:
+            return f"Error listing sprints: {str(e)}"
+
         async for session in get_db_session():
             service = SprintService(session)
-            try:
-                # Assuming generic repository get_multi or specialized search
-                sprints = await service.sprint_repo.get_multi(limit=limit, skip=offset)
-                return f"Found {len(sprints)} sprints:\n" + \
-                       "\n".join([f"- [{s.id}] {s.name} ({s.status})" for s in sprints])
-            except Exception as e:
-                return f"Error listing sprints: {str(e)}"
+            from taskman_api.core.enums import SprintStatus
+
+            result = await service.search(
+                status=SprintStatus(status) if status else None,
+                limit=limit,
+                offset=offset,
+                fields=selected
+            )
+
+            match result:
+                case Ok((sprints, total)):
+                    if selected is not None:
+                        lines = [f"- {format_fields(s, selected)}" for s in sprints]
+                    else:
+                        lines = [f"- [{s.id}] {s.name} ({s.status})" for s in sprints]
+                    return f"Found {len(sprints)} sprints (Total: {total}):\n" + "\n".join(lines)
+                case Err(e):
+                    return f"Error listing sprints: {str(e)}"
 
     @mcp.tool()
     async def create_sprint(
@@ -1,9 +1,11 @@
 
 from mcp.server.fastmcp import FastMCP
 
+from taskman_api.core.errors import ValidationError
+from taskman_api.core.fieldsets import format_fields, parse_fields
 from taskman_api.core.result import Err, Ok
 from taskman_api.dependencies import get_db_session
-from taskman_api.schemas.task import TaskCreateRequest
+from taskman_api.schemas.task import TaskCreateRequest, TaskResponse
 from taskman_api.services.task_service import TaskService
 
 
@@ -15,9 +17,19 @@ def register_task_tools(mcp: FastMCP):
         status: str | None = None,
         priority: str | None = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        fields: str | None = None
     ) -> str:
-        """List tasks with filtering."""
+        """List tasks with filtering.
+
+        ``fields`` is a comma-separated list of task fields to show per task
+        (e.g. "title,status,due_at"); only those columns are loaded.
+        """
+        try:
+            selected = parse_fields(fields, TaskResponse)
+        except ValidationError as e:
+            return f"Error listing tasks: {str(e)}"
+
         # Manually manage session since we aren't in FastAPI request context
         async for session in get_db_session():
             service = TaskService(session)
@@ -36,14 +48,18 @@ def register_task_tools(mcp: FastMCP):
                 status=search_status,
                 priority=search_priority,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                fields=selected
             )
 
             match result:
                 case Ok((tasks, total)):
                     # Helper to format response
-                    return f"Found {len(tasks)} tasks (Total: {total}):\n" + \
-                           "\n".join([f"- [{t.id}] {t.title} ({t.status})" for t in tasks])
+                    if selected is not None:
+                        lines = [f"- {format_fields(t, selected)}" for t in tasks]
+                    else:
+                        lines = [f"- [{t.id}] {t.title} ({t.status})" for t in tasks]
+                    return f"Found {len(tasks)} tasks (Total: {total}):\n" + "\n".join(lines)
                 case Err(e):
                     return f"Error listing tasks: {str(e)}"
 
@@ -4,6 +4,18 @@ TaskMan API Middleware Package.
 This package contains middleware components for the FastAPI application.
 """
 
+from .admission_middleware import AdmissionControlMiddleware
 from .logging_middleware import LoggingMiddleware
+from .metrics_middleware import MetricsMiddleware
+from .profiling_middleware import ProfilingMiddleware
+from .query_budget_middleware import QueryBudgetMiddleware
+from .read_routing_middleware import ReadRoutingMiddleware
 
-__all__ = ["LoggingMiddleware"]
+__all__ = [
+    "AdmissionControlMiddleware",
+    "LoggingMiddleware",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "QueryBudgetMiddleware",
+    "ReadRoutingMiddleware",
+]
@@ -0,0 +1,176 @@
+"""
+Admission Control (Load Shedding) Middleware.
+
+The slowapi limiter caps requests per client at fixed rates; it does not notice
+when the worker itself is overloaded. This middleware does: it rejects
+low-priority requests fast, with ``503 Service Unavailable`` and
+``Retry-After``, while the worker is saturated. Those requests no longer
+queue behind work that is already late.
+
+Overload pressure is the larger of two signals, each divided by its threshold:
+
+- Event-loop lag (``taskman_api.telemetry.loop_lag``): how late the loop runs
+  a due timer
+- Recent pool checkout wait (``recent_checkout_wait``): how long requests
+  wait for a database connection
+
+Each request has a priority class, and a class is shed once pressure reaches
+its factor:
+
+- ``critical`` (never shed): /health, /health/*, /api/health, /ready, /live
+- ``bulk`` (1x): /metrics, statistics, exports and diagnostics
+- ``interactive`` (2x): other GET/HEAD/OPTIONS requests
+- ``write`` (4x): every other method
+
+``route_priorities`` overrides the class per route. Keys are path globs,
+optionally prefixed with a method (``"POST /api/v1/tasks/bulk*"``); the first
+matching key wins. Health endpoints cannot be overridden.
+
+Usage:
+    from taskman_api.middleware import AdmissionControlMiddleware
+    app.add_middleware(AdmissionControlMiddleware, loop_lag_threshold_ms=100)
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Callable, Mapping
+from fnmatch import fnmatchcase
+
+import structlog
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from taskman_api.telemetry.loop_lag import loop_lag_monitor
+from taskman_api.telemetry.request_metrics import recent_checkout_wait, record_shed
+
+logger = structlog.get_logger(__name__)
+
+CRITICAL = "critical"
+WRITE = "write"
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+# Pressure (signal / threshold) at which each class is shed
+SHED_FACTORS: dict[str, float] = {BULK: 1.0, INTERACTIVE: 2.0, WRITE: 4.0}
+
+# Retry-After is scaled by pressure, up to this multiple of the base value
+MAX_RETRY_AFTER_SCALE = 10
+
+HEALTH_PATHS = frozenset({"/health", "/api/health", "/ready", "/live"})
+
+DEFAULT_BULK_ROUTES = (
+    "/metrics",
+    "*/stats",
+    "*/export",
+    "*/export/*",
+    "/api/v1/diagnostic/*",
+)
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _parse_route(pattern: str) -> tuple[str | None, str]:
+    """Split ``"METHOD /path*"`` into (method, path glob); bare globs match any method."""
+    method, _, path = pattern.strip().partition(" ")
+    if path:
+        return method.upper(), path.strip()
+    return None, method
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware rejecting low-priority requests while the worker is overloaded."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        loop_lag_threshold_ms: float = 100.0,
+        pool_wait_threshold_ms: float = 100.0,
+        retry_after: int = 2,
+        route_priorities: Mapping[str, str] | None = None,
+        lag_source: Callable[[], float] | None = None,
+        wait_source: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialize the admission control middleware.
+
+        Args:
+            app: The ASGI application to wrap
+            loop_lag_threshold_ms: Event-loop lag at which bulk requests are shed
+            pool_wait_threshold_ms: Recent pool checkout wait at which bulk requests are shed
+            retry_after: Base Retry-After in seconds for shed requests
+            route_priorities: Route glob to priority class overrides
+            lag_source: Returns event-loop lag in seconds (default: the loop lag monitor)
+            wait_source: Returns recent checkout wait in seconds (default: pool metrics)
+        """
+        self.app = app
+        self.loop_lag_threshold = loop_lag_threshold_ms / 1000
+        self.pool_wait_threshold = pool_wait_threshold_ms / 1000
+        self.retry_after = retry_after
+        self.lag_source = lag_source or (lambda: loop_lag_monitor.lag)
+        self.wait_source = wait_source or recent_checkout_wait
+        self.routes: list[tuple[str | None, str, str]] = []
+        for pattern, priority in (route_priorities or {}).items():
+            if priority not in SHED_FACTORS:
+                raise ValueError(f"Unknown priority {priority!r} for route {pattern!r}")
+            self.routes.append((*_parse_route(pattern), priority))
+        self.routes.extend((None, pattern, BULK) for pattern in DEFAULT_BULK_ROUTES)
+        self.shedding = False
+
+    def priority(self, method: str, path: str) -> str:
+        """Priority class of a request."""
+        if path in HEALTH_PATHS or path.startswith("/health/"):
+            return CRITICAL
+        for route_method, pattern, priority in self.routes:
+            if (route_method is None or route_method == method) and fnmatchcase(path, pattern):
+                return priority
+        return INTERACTIVE if method in _SAFE_METHODS else WRITE
+
+    def pressure(self) -> tuple[float, float, float]:
+        """Current (pressure, loop lag, pool wait); pressure 1.0 means a signal is at threshold."""
+        lag = self.lag_source()
+        wait = self.wait_source()
+        return max(lag / self.loop_lag_threshold, wait / self.pool_wait_threshold), lag, wait
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Admit the request or reject it with 503 when its class is being shed."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        pressure, lag, wait = self.pressure()
+        if pressure < SHED_FACTORS[BULK]:
+            if self.shedding:
+                self.shedding = False
+                logger.info("load_shedding_stopped", pressure=round(pressure, 2))
+            await self.app(scope, receive, send)
+            return
+
+        priority = self.priority(scope["method"], scope["path"])
+        if priority == CRITICAL or pressure < SHED_FACTORS[priority]:
+            await self.app(scope, receive, send)
+            return
+
+        if not self.shedding:
+            self.shedding = True
+            logger.warning(
+                "load_shedding_started",
+                pressure=round(pressure, 2),
+                loop_lag_ms=round(lag * 1000, 1),
+                pool_wait_ms=round(wait * 1000, 1),
+            )
+        record_shed(priority)
+        retry_after = self.retry_after * min(math.ceil(pressure), MAX_RETRY_AFTER_SCALE)
+        detail = {"detail": "Server overloaded, retry later", "priority": priority}
+        body = json.dumps(detail).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    (b"retry-after", str(retry_after).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
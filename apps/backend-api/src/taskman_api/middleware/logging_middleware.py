@@ -6,10 +6,17 @@ Provides structured JSON logging for all HTTP requests with:
 - Correlation ID tracking (X-Request-ID header)
 - Sensitive parameter redaction
 - Configurable health endpoint exclusion
+- Sampling: errors and slow requests are always logged, fast successful
+  requests only at TASKMAN_LOG_SAMPLE_RATE
+
+Implemented as a raw ASGI middleware (no BaseHTTPMiddleware task/stream
+wrapping) that emits a single ``http_response`` event per request.
 
 Environment Variables:
     TASKMAN_LOG_LEVEL: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     TASKMAN_LOG_HEALTH_ENDPOINTS: Set to "true" to include health checks in logs
+    TASKMAN_LOG_SAMPLE_RATE: Fraction of fast successful requests to log (default: 0.01)
+    TASKMAN_LOG_SLOW_MS: Requests at or above this duration are always logged (default: 500)
 
 Usage:
     from taskman_api.middleware import LoggingMiddleware
@@ -19,18 +26,13 @@ Usage:
 from __future__ import annotations
 
 import os
+import random
 import time
 import uuid
-from typing import TYPE_CHECKING
 
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
-
-if TYPE_CHECKING:
-    from starlette.middleware.base import RequestResponseEndpoint
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Configure module logger
 logger = structlog.get_logger(__name__)
@@ -62,20 +64,8 @@ SENSITIVE_QUERY_PARAMS: frozenset[str] = frozenset({
     "bearer",
 })
 
-
-def _should_log_path(path: str) -> bool:
-    """Check if the path should be logged verbosely.
-
-    Args:
-        path: Request URL path
-
-    Returns:
-        True if path should be logged, False for excluded health endpoints
-    """
-    log_health = os.environ.get("TASKMAN_LOG_HEALTH_ENDPOINTS", "false").lower() == "true"
-    if log_health:
-        return True
-    return path not in EXCLUDED_PATHS
+DEFAULT_SAMPLE_RATE = 0.01
+DEFAULT_SLOW_THRESHOLD_MS = 500.0
 
 
 def _redact_query_params(query_string: str) -> str:
@@ -104,54 +94,66 @@ def _redact_query_params(query_string: str) -> str:
     return "&".join(redacted_params)
 
 
-def _get_client_ip(request: Request) -> str:
+def _get_client_ip(headers: dict[bytes, bytes], client: tuple[str, int] | None) -> str:
     """Extract client IP from request, handling proxies.
 
     Checks X-Forwarded-For and X-Real-IP headers for proxied requests.
 
     Args:
-        request: Starlette request object
+        headers: Lower-cased raw request headers
+        client: ASGI ``scope["client"]`` (host, port) tuple, if any
 
     Returns:
         Client IP address string
     """
     # Check for proxy headers first (most proxies set these)
-    forwarded_for = request.headers.get("X-Forwarded-For")
+    forwarded_for = headers.get(b"x-forwarded-for")
     if forwarded_for:
         # X-Forwarded-For can contain multiple IPs: client, proxy1, proxy2
         # The first one is the original client
-        return forwarded_for.split(",")[0].strip()
+        return forwarded_for.decode("latin-1").split(",")[0].strip()
 
-    real_ip = request.headers.get("X-Real-IP")
+    real_ip = headers.get(b"x-real-ip")
     if real_ip:
-        return real_ip.strip()
+        return real_ip.decode("latin-1").strip()
 
     # Fall back to direct client connection
-    if request.client:
-        return request.client.host
+    if client:
+        return client[0]
 
     return "unknown"
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+def _env_float(name: str, default: float) -> float:
+    """Read a float environment variable, falling back to ``default`` if unset or invalid."""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class LoggingMiddleware:
     """
-    FastAPI/Starlette middleware for structured HTTP request/response logging.
+    ASGI middleware for structured HTTP request/response logging.
 
     Features:
         - Generates or propagates X-Request-ID for correlation
-        - Logs request start with method, path, query, client IP
-        - Logs response with status code and duration in milliseconds
+        - Logs one event per request with method, path, query, client IP,
+          status code and duration in milliseconds
         - Adds X-Response-Time header to all responses
         - Redacts sensitive query parameters
         - Excludes health check endpoints from verbose logs (configurable)
+        - Samples fast successful requests; errors (status >= 400, exceptions)
+          and slow requests are always logged
         - Optional metrics callback for session tracking
 
     Environment Configuration:
         TASKMAN_LOG_LEVEL: Controls log verbosity
         TASKMAN_LOG_HEALTH_ENDPOINTS: "true" to log health checks
+        TASKMAN_LOG_SAMPLE_RATE: Fraction of fast 2xx/3xx requests to log
+        TASKMAN_LOG_SLOW_MS: Slow-request threshold in milliseconds
 
     Example Output:
-        {"timestamp": "2025-12-27T12:00:00Z", "level": "info", "event": "http_request", ...}
         {"timestamp": "2025-12-27T12:00:00.150Z", "level": "info", "event": "http_response", ...}
     """
 
@@ -167,106 +169,119 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         """
         cls._metrics_callback = metrics
 
-    def __init__(self, app: ASGIApp) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float | None = None,
+        slow_threshold_ms: float | None = None,
+    ) -> None:
         """Initialize the logging middleware.
 
         Args:
             app: The ASGI application to wrap
+            sample_rate: Fraction (0-1) of fast successful requests to log;
+                defaults to TASKMAN_LOG_SAMPLE_RATE
+            slow_threshold_ms: Duration at which a request is always logged;
+                defaults to TASKMAN_LOG_SLOW_MS
         """
-        super().__init__(app)
+        self.app = app
         self._log_level = os.environ.get("TASKMAN_LOG_LEVEL", "INFO").upper()
+        self._log_health = (
+            os.environ.get("TASKMAN_LOG_HEALTH_ENDPOINTS", "false").lower() == "true"
+        )
+        if sample_rate is None:
+            sample_rate = _env_float("TASKMAN_LOG_SAMPLE_RATE", DEFAULT_SAMPLE_RATE)
+        if slow_threshold_ms is None:
+            slow_threshold_ms = _env_float("TASKMAN_LOG_SLOW_MS", DEFAULT_SLOW_THRESHOLD_MS)
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.slow_threshold_ms = slow_threshold_ms
+
+    def _sampled(self, status_code: int, duration_ms: float) -> bool:
+        """Decide whether a completed request is logged."""
+        if status_code >= 400 or duration_ms >= self.slow_threshold_ms:
+            return True
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process the request, add timing headers and log the outcome."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Process the request and log timing information.
-
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in the chain
-
-        Returns:
-            Response from the application with timing headers added
-        """
         # Generate or extract correlation ID
-        correlation_id = request.headers.get("X-Request-ID")
-        if not correlation_id:
-            correlation_id = str(uuid.uuid4())
-
-        # Extract request metadata
-        method = request.method
-        path = request.url.path
-        query_string = str(request.url.query) if request.url.query else ""
-        redacted_query = _redact_query_params(query_string)
-        client_ip = _get_client_ip(request)
+        headers = dict(scope["headers"])
+        raw_request_id = headers.get(b"x-request-id")
+        correlation_id = raw_request_id.decode("latin-1") if raw_request_id else str(uuid.uuid4())
 
-        # Bind correlation ID to structlog context for this request
-        structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
+        path = scope["path"]
+        should_log = self._log_health or path not in EXCLUDED_PATHS
+        status_code = 500
 
         # Start timing
         start_time = time.perf_counter()
 
-        # Log request start (if path is not excluded)
-        should_log = _should_log_path(path)
-        if should_log:
-            logger.info(
-                "http_request",
-                method=method,
-                path=path,
-                query=redacted_query if redacted_query else None,
-                correlation_id=correlation_id,
-                client_ip=client_ip,
-            )
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
+                response_headers["X-Request-ID"] = correlation_id
+            await send(message)
+
+        # Bind correlation ID to structlog context for this request
+        with structlog.contextvars.bound_contextvars(correlation_id=correlation_id):
+            try:
+                await self.app(scope, receive, send_with_headers)
+            except Exception as exc:
+                # Calculate duration even on error
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                self._count(500)
+
+                # Log error
+                logger.error(
+                    "http_request_error",
+                    method=scope["method"],
+                    path=path,
+                    correlation_id=correlation_id,
+                    duration_ms=round(duration_ms, 2),
+                    error=str(exc),
+                    error_type=type(exc).__name__,
+                )
+                raise
 
-        # Process request
-        try:
-            response = await call_next(request)
-        except Exception as exc:
-            # Calculate duration even on error
             duration_ms = (time.perf_counter() - start_time) * 1000
+            self._count(status_code)
 
-            # Log error
-            logger.error(
-                "http_request_error",
-                method=method,
-                path=path,
-                correlation_id=correlation_id,
-                duration_ms=round(duration_ms, 2),
-                error=str(exc),
-                error_type=type(exc).__name__,
-            )
-            raise
-
-        # Calculate duration
-        duration_ms = (time.perf_counter() - start_time) * 1000
-
-        # Add timing and correlation headers to response
-        response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
-        response.headers["X-Request-ID"] = correlation_id
-
-        # Update session metrics if callback is set
-        if self._metrics_callback is not None:
-            requests = self._metrics_callback.get("requests_processed")
-            if isinstance(requests, int):
-                self._metrics_callback["requests_processed"] = requests + 1
-            if response.status_code >= 400:
-                errors = self._metrics_callback.get("errors_logged")
-                if isinstance(errors, int):
-                    self._metrics_callback["errors_logged"] = errors + 1
-
-        # Log response (if path is not excluded)
-        if should_log:
-            log_method = logger.info if response.status_code < 400 else logger.warning
-            if response.status_code >= 500:
+            if not should_log or not self._sampled(status_code, duration_ms):
+                return
+
+            log_method = logger.info if status_code < 400 else logger.warning
+            if status_code >= 500:
                 log_method = logger.error
 
+            query = _redact_query_params(scope["query_string"].decode("latin-1"))
             log_method(
                 "http_response",
-                method=method,
+                method=scope["method"],
                 path=path,
-                status_code=response.status_code,
+                query=query or None,
+                status_code=status_code,
                 duration_ms=round(duration_ms, 2),
+                slow=duration_ms >= self.slow_threshold_ms,
                 correlation_id=correlation_id,
+                client_ip=_get_client_ip(headers, scope.get("client")),
             )
 
-        return response
+    def _count(self, status_code: int) -> None:
+        """Update session metrics if a callback is set."""
+        if self._metrics_callback is None:
+            return
+        requests = self._metrics_callback.get("requests_processed")
+        if isinstance(requests, int):
+            self._metrics_callback["requests_processed"] = requests + 1
+        if status_code >= 400:
+            errors = self._metrics_callback.get("errors_logged")
+            if isinstance(errors, int):
+                self._metrics_callback["errors_logged"] = errors + 1
@@ -0,0 +1,60 @@
+"""
+HTTP Request Metrics Middleware.
+
+Records Prometheus request latency by method, route template and status, and
+tracks in-flight requests. Route templates (``/api/v1/tasks/{task_id}``) come
+from ``scope["route"]``, which FastAPI sets on match, so label cardinality is
+bounded by the number of routes; unmatched paths share a single label.
+
+Usage:
+    from taskman_api.middleware import MetricsMiddleware
+    app.add_middleware(MetricsMiddleware)
+"""
+
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from taskman_api.telemetry.request_metrics import UNMATCHED_ROUTE, in_flight, record_request
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency histograms and in-flight gauges."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the metrics middleware.
+
+        Args:
+            app: The ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time the request and record it under its route template."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        gauge = in_flight(method)
+        gauge.inc()
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start_time
+            gauge.dec()
+            route = scope.get("route")
+            record_request(
+                method, getattr(route, "path", None) or UNMATCHED_ROUTE, status_code, duration
+            )
@@ -0,0 +1,99 @@
+"""
+On-Demand Request Profiling Middleware.
+
+Requests carrying ``X-Profile: 1`` and an admin bearer token (checked with
+``get_current_admin_user``) run under the sampling profiler from
+``taskman_api.telemetry.profiler``. The collapsed-stack profile is stored and
+its id returned in ``X-Profile-Id``; fetch it from
+``GET /api/v1/diagnostic/debug/profile/{profile_id}``. ``X-Profile-Summary``
+carries estimated milliseconds per category (db, pydantic, json, await, app).
+
+Requests without the header, or from non-admin callers, pass straight through.
+
+Usage:
+    from taskman_api.middleware import ProfilingMiddleware
+    app.add_middleware(ProfilingMiddleware)
+"""
+
+from __future__ import annotations
+
+import structlog
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from taskman_api.auth import get_current_admin_user, get_current_user
+from taskman_api.telemetry.profiler import Profile, SamplingProfiler, get_profile_store
+
+logger = structlog.get_logger(__name__)
+
+
+async def is_admin_request(headers: dict[bytes, bytes]) -> bool:
+    """Check the request's bearer token with the admin dependency chain."""
+    scheme, _, token = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token.strip())
+    try:
+        await get_current_admin_user(await get_current_user(credentials))
+    except HTTPException:
+        return False
+    return True
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling admin requests that ask for it via X-Profile."""
+
+    def __init__(self, app: ASGIApp, interval_ms: float = 1.0) -> None:
+        """Initialize the profiling middleware.
+
+        Args:
+            app: The ASGI application to wrap
+            interval_ms: Sampling interval in milliseconds
+        """
+        self.app = app
+        self.interval = interval_ms / 1000
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Profile the request when requested by an admin, otherwise pass through."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        if headers.get(b"x-profile") != b"1" or not await is_admin_request(headers):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = SamplingProfiler(interval=self.interval)
+        profile: Profile | None = None
+
+        def finish() -> Profile:
+            nonlocal profile
+            if profile is None:
+                profile = profiler.stop()
+                get_profile_store().save(profile)
+                logger.info(
+                    "request_profiled",
+                    method=scope["method"],
+                    path=scope["path"],
+                    profile_id=profile.profile_id,
+                    **profile.summary(),
+                )
+            return profile
+
+        async def send_with_profile(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Stop at response start: the body is already rendered
+                result = finish()
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-Profile-Id"] = result.profile_id or ""
+                response_headers["X-Profile-Summary"] = result.summary_header()
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            finish()
@@ -0,0 +1,135 @@
+"""
+Per-Request Query Budget Middleware.
+
+Tracks every SQL statement issued while handling a request (see
+``taskman_api.telemetry.query_tracker``) and reports on it:
+
+- ``n_plus_one_suspected``: an identical statement ran at least
+  TASKMAN_N_PLUS_ONE_THRESHOLD times within one request
+- ``query_budget_exceeded``: the request issued more than
+  TASKMAN_QUERY_BUDGET statements
+- ``slow_query``: a single statement took at least TASKMAN_SLOW_QUERY_MS,
+  logged with its bind shape and the request route
+- Optional ``X-Query-Count`` and ``Server-Timing: db;dur=...`` response
+  headers (enabled outside production)
+
+Headers carry the counts at the time the response starts; statements issued
+while a streaming body is sent are still included in the logs.
+
+Environment Variables:
+    TASKMAN_SLOW_QUERY_MS: Slow statement threshold in milliseconds (default: 100)
+    TASKMAN_N_PLUS_ONE_THRESHOLD: Repetitions of one statement flagged as N+1 (default: 5)
+    TASKMAN_QUERY_BUDGET: Statements per request before a budget warning (default: 50)
+
+Usage:
+    from taskman_api.middleware import QueryBudgetMiddleware
+    app.add_middleware(QueryBudgetMiddleware, expose_headers=True)
+"""
+
+from __future__ import annotations
+
+import os
+
+import structlog
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from taskman_api.telemetry.query_tracker import QueryStats, track_queries
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SLOW_QUERY_MS = 100.0
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+DEFAULT_QUERY_BUDGET = 50
+
+# Statements are truncated to this length in N+1 warnings
+_MAX_LOGGED_STATEMENT = 300
+
+
+def _env_number(name: str, default: float) -> float:
+    """Read a numeric environment variable, falling back to ``default`` if unset or invalid."""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class QueryBudgetMiddleware:
+    """ASGI middleware counting, timing and checking SQL statements per request."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        expose_headers: bool = False,
+        slow_query_ms: float | None = None,
+        n_plus_one_threshold: int | None = None,
+        query_budget: int | None = None,
+    ) -> None:
+        """Initialize the query budget middleware.
+
+        Args:
+            app: The ASGI application to wrap
+            expose_headers: Add X-Query-Count and Server-Timing response headers
+            slow_query_ms: Slow statement threshold; defaults to TASKMAN_SLOW_QUERY_MS
+            n_plus_one_threshold: Repetitions of one statement that are flagged;
+                defaults to TASKMAN_N_PLUS_ONE_THRESHOLD
+            query_budget: Statements allowed per request before warning;
+                defaults to TASKMAN_QUERY_BUDGET
+        """
+        self.app = app
+        self.expose_headers = expose_headers
+        if slow_query_ms is None:
+            slow_query_ms = _env_number("TASKMAN_SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS)
+        if n_plus_one_threshold is None:
+            n_plus_one_threshold = int(
+                _env_number("TASKMAN_N_PLUS_ONE_THRESHOLD", DEFAULT_N_PLUS_ONE_THRESHOLD)
+            )
+        if query_budget is None:
+            query_budget = int(_env_number("TASKMAN_QUERY_BUDGET", DEFAULT_QUERY_BUDGET))
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = max(n_plus_one_threshold, 2)
+        self.query_budget = query_budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Track statements for the request and report once it completes."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(scope=scope, slow_threshold_ms=self.slow_query_ms) as stats:
+
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-Query-Count"] = str(stats.count)
+                    headers.append(
+                        "Server-Timing", f'db;dur={stats.total_ms:.2f};desc="{stats.count} queries"'
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers if self.expose_headers else send)
+            finally:
+                self._report(scope, stats)
+
+    def _report(self, scope: Scope, stats: QueryStats) -> None:
+        """Log N+1 suspects and budget overruns for a completed request."""
+        if stats.count < self.n_plus_one_threshold and stats.count <= self.query_budget:
+            return
+        for statement, repetitions in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "n_plus_one_suspected",
+                method=scope["method"],
+                route=stats.route,
+                repetitions=repetitions,
+                statement=statement[:_MAX_LOGGED_STATEMENT],
+            )
+        if stats.count > self.query_budget:
+            logger.warning(
+                "query_budget_exceeded",
+                method=scope["method"],
+                route=stats.route,
+                query_count=stats.count,
+                query_budget=self.query_budget,
+                db_ms=round(stats.total_ms, 2),
+            )
@@ -0,0 +1,79 @@
+"""
+Read-Your-Writes Middleware for Read-Replica Routing.
+
+Pins requests to the primary database where a replica read could be stale
+(see ``taskman_api.db.read_routing``):
+
+- Write requests (any method other than GET/HEAD/OPTIONS) run pinned to
+  primary, including reads made by the services they call. Successful ones
+  return ``X-Write-Token`` (the write time in epoch milliseconds).
+- Requests echoing an ``X-Write-Token`` younger than ``window`` seconds are
+  pinned too, so a client reads its own writes even while the replica lags.
+
+Other requests are left unmarked; read-only endpoints and service methods opt
+in to the replica themselves.
+
+Usage:
+    from taskman_api.middleware import ReadRoutingMiddleware
+    app.add_middleware(ReadRoutingMiddleware, window=10.0)
+"""
+
+from __future__ import annotations
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from taskman_api.db.read_routing import PRIMARY, routing
+
+WRITE_TOKEN_HEADER = "X-Write-Token"
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def is_recent_write(token: bytes | None, window: float, now: float | None = None) -> bool:
+    """Whether a write token is younger than ``window`` seconds (invalid tokens are not)."""
+    if not token:
+        return False
+    try:
+        written_at = int(token) / 1000
+    except ValueError:
+        return False
+    now = time.time() if now is None else now
+    return 0 <= now - written_at < window
+
+
+class ReadRoutingMiddleware:
+    """ASGI middleware pinning writes and read-your-writes requests to primary."""
+
+    def __init__(self, app: ASGIApp, window: float = 10.0) -> None:
+        """Initialize the read routing middleware.
+
+        Args:
+            app: The ASGI application to wrap
+            window: Seconds a write token keeps its requests on primary
+        """
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Pin the request to primary when needed and issue write tokens."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        is_write = scope["method"] not in _SAFE_METHODS
+        token = dict(scope["headers"]).get(WRITE_TOKEN_HEADER.lower().encode("latin-1"))
+        if not is_write and not is_recent_write(token, self.window):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_token(message: Message) -> None:
+            if message["type"] == "http.response.start" and is_write and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers[WRITE_TOKEN_HEADER] = str(int(time.time() * 1000))
+            await send(message)
+
+        with routing(PRIMARY):
+            await self.app(scope, receive, send_with_token)
@@ -5,10 +5,22 @@ Provides persistent conversation tracking across agent sessions.
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Boolean, DateTime, Index, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
-from taskman_api.db.base import Base, TimestampMixin
+from taskman_api.db.base import Base, TimestampMixin, archive_columns
+from taskman_api.db.custom_types import CompressedJSON, CompressedText
 
 
 class ConversationSession(Base, TimestampMixin):
@@ -65,7 +77,7 @@ class ConversationSession(Base, TimestampMixin):
         doc="Associated sprint",
     )
 
-    # State
+    # State: running totals over every turn ever added, compacted or not
     turn_count: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
@@ -80,6 +92,14 @@ class ConversationSession(Base, TimestampMixin):
         doc="Estimated tokens consumed",
     )
 
+    compacted_through: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Highest turn sequence rolled into summary turns (see db.compaction)",
+    )
+
     summary: Mapped[str | None] = mapped_column(
         Text,
         nullable=True,
@@ -134,6 +154,12 @@ class ConversationSession(Base, TimestampMixin):
         Index("idx_conv_sessions_status", "status"),
         Index("idx_conv_sessions_project", "project_id"),
         Index("idx_conv_sessions_created", "created_at"),
+        # Filtered lists are ordered by updated_at
+        Index("idx_conv_sessions_status_updated", "status", "updated_at"),
+        Index("idx_conv_sessions_project_updated", "project_id", "updated_at"),
+        Index("idx_conv_sessions_agent_updated", "agent_type", "updated_at"),
+        Index("idx_conv_sessions_worktree_updated", "worktree", "updated_at"),
+        Index("idx_conv_sessions_updated", "updated_at"),
     )
 
     @property
@@ -182,8 +208,10 @@ class ConversationTurn(Base):
         doc="Role: user, assistant, system, tool",
     )
 
+    # Turn content and tool results dominate the table's size; large values
+    # are stored compressed (see db.custom_types.CompressedText)
     content: Mapped[str] = mapped_column(
-        Text,
+        CompressedText("conversation_turns.content"),
         nullable=False,
         doc="Turn content",
     )
@@ -204,7 +232,7 @@ class ConversationTurn(Base):
     )
 
     tool_results: Mapped[list] = mapped_column(
-        JSON,
+        CompressedJSON("conversation_turns.tool_results"),
         nullable=False,
         default=list,
         doc="Tool execution results",
@@ -243,3 +271,17 @@ class ConversationTurn(Base):
     __table_args__ = (
         Index("idx_conv_turns_conv_seq", "conversation_id", "sequence"),
     )
+
+
+# Cold storage for raw turns rolled into summary turns (see db.compaction): the
+# columns of ``conversation_turns`` plus ``archived_at`` and the ``summary_id``
+# of the summary turn that replaced them. Content stays compressed.
+CONVERSATION_TURNS_ARCHIVE = Table(
+    "conversation_turns_archive",
+    Base.metadata,
+    *archive_columns(ConversationTurn.__table__),
+    Column("summary_id", String(100), nullable=False),
+    Column("archived_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+    Index("idx_conv_turns_archive_conv_seq", "conversation_id", "sequence"),
+    Index("idx_conv_turns_archive_archived_at", "archived_at"),
+)
@@ -104,6 +104,11 @@ class Plan(Base, TimestampMixin):
         Index("idx_plans_status", "status"),
         Index("idx_plans_conv", "conversation_id"),
         Index("idx_plans_project", "project_id"),
+        # Filtered lists are ordered by updated_at (created_at per conversation)
+        Index("idx_plans_status_updated", "status", "updated_at"),
+        Index("idx_plans_project_updated", "project_id", "updated_at"),
+        Index("idx_plans_sprint_updated", "sprint_id", "updated_at"),
+        Index("idx_plans_conv_created", "conversation_id", "created_at"),
     )
 
     @property
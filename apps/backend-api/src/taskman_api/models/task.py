@@ -7,8 +7,20 @@ SQLAlchemy ORM model for tasks table.
 from datetime import datetime
 from typing import Any
 
-from taskman_api.db.base import Base
-from sqlalchemy import JSON, Boolean, DateTime, Float, Index, Integer, String, Text, func
+from taskman_api.db.base import Base, archive_columns
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -334,7 +346,36 @@ class Task(Base):
         Index("idx_tasks_owner", "owner"),
         Index("idx_tasks_primary_project", "primary_project"),
         Index("idx_tasks_primary_sprint", "primary_sprint"),
+        # Composite filters; the dashboard's grouped columns are INCLUDEd on
+        # Postgres so scoped summaries are index-only scans
+        Index(
+            "idx_tasks_sprint_status",
+            "primary_sprint",
+            "status",
+            postgresql_include=["priority", "owner", "primary_project"],
+        ),
+        Index(
+            "idx_tasks_project_status",
+            "primary_project",
+            "status",
+            postgresql_include=["priority", "owner", "primary_sprint"],
+        ),
+        Index("idx_tasks_assignee_status", "assignee", "status"),
+        Index("idx_tasks_updated_at", "updated_at"),
     )
 
     def __repr__(self) -> str:
         return f"<Task(id={self.id}, title='{self.title[:30]}...', status='{self.status}')>"
+
+
+# Cold storage for long-closed tasks (see db.archival): the columns of ``tasks``
+# plus ``archived_at``. Reads include it only when asked (include_archived).
+TASKS_ARCHIVE = Table(
+    "tasks_archive",
+    Base.metadata,
+    *archive_columns(Task.__table__),
+    Column("archived_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+    Index("idx_tasks_archive_project", "primary_project"),
+    Index("idx_tasks_archive_sprint", "primary_sprint"),
+    Index("idx_tasks_archive_archived_at", "archived_at"),
+)
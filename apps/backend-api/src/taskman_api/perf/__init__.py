@@ -0,0 +1,27 @@
+"""
+Performance tooling for TaskMan-v2.
+
+Provides:
+- datagen: Synthetic large-dataset generator for realistic-scale testing
+- loadtest: In-process load test with per-route latency percentiles and baseline gating
+"""
+
+from .datagen import PRESETS, DatasetSpec, DatasetStats, generate_dataset, load_dataset
+from .loadtest import (
+    LoadTestConfig,
+    LoadTestResult,
+    compare_to_baseline,
+    run_load_test,
+)
+
+__all__ = [
+    "PRESETS",
+    "DatasetSpec",
+    "DatasetStats",
+    "LoadTestConfig",
+    "LoadTestResult",
+    "compare_to_baseline",
+    "generate_dataset",
+    "load_dataset",
+    "run_load_test",
+]
@@ -0,0 +1,113 @@
+"""
+Query Plan Checks.
+
+Captures the statements a block of repository code executes and runs
+``EXPLAIN`` on each one, reporting sequential (full-table) scans of large
+tables. A query that loses its index then fails a test instead of slowing
+down production.
+
+- Postgres: ``EXPLAIN (FORMAT JSON)`` with ``enable_seqscan`` off, so a
+  ``Seq Scan`` node means no index can serve the query at all (on a small
+  test dataset the planner would otherwise prefer scans regardless)
+- SQLite: ``EXPLAIN QUERY PLAN``; a ``SCAN <table>`` step without
+  ``USING ... INDEX`` is a full-table scan
+
+Usage:
+    with capture_statements(engine) as statements:
+        await TaskRepository(session).search(sprint_id="S-1", status="new")
+    assert await sequential_scans(engine, statements) == []
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+# Tables whose sequential scans fail a plan check (production-scale row counts)
+LARGE_TABLES = frozenset({"tasks", "conversation_sessions", "conversation_turns", "plans"})
+
+# SQLite full-table scan step, e.g. "SCAN tasks" (index scans read "SCAN tasks USING INDEX ...")
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+
+@dataclass(frozen=True)
+class CapturedStatement:
+    """A SELECT as sent to the driver, with its driver-level parameters."""
+
+    statement: str
+    parameters: Any
+
+
+@dataclass(frozen=True)
+class SequentialScan:
+    """A large table read in full by a captured statement."""
+
+    table: str
+    statement: str
+
+    def __str__(self) -> str:
+        return f"sequential scan of {self.table}: {self.statement}"
+
+
+@contextmanager
+def capture_statements(engine: AsyncEngine) -> Iterator[list[CapturedStatement]]:
+    """Collect every SELECT the engine executes inside the block."""
+    captured: list[CapturedStatement] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            captured.append(CapturedStatement(statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield captured
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+async def sequential_scans(
+    engine: AsyncEngine,
+    statements: list[CapturedStatement],
+    tables: frozenset[str] = LARGE_TABLES,
+) -> list[SequentialScan]:
+    """EXPLAIN each statement and report sequential scans of ``tables``."""
+    found: list[SequentialScan] = []
+    async with engine.connect() as conn:
+        for captured in statements:
+            for table in sorted(await _scanned_tables(conn, captured)):
+                if table in tables:
+                    found.append(SequentialScan(table, captured.statement))
+        await conn.rollback()
+    return found
+
+
+async def _scanned_tables(conn: AsyncConnection, captured: CapturedStatement) -> set[str]:
+    if conn.dialect.name == "postgresql":
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {captured.statement}", captured.parameters
+        )
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return _pg_seq_scans(plan[0]["Plan"])
+
+    result = await conn.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {captured.statement}", captured.parameters
+    )
+    scans = (_SQLITE_SCAN.match(row[-1]) for row in result.all())
+    return {match.group(1) for match in scans if match}
+
+
+def _pg_seq_scans(node: dict[str, Any]) -> set[str]:
+    tables = {node["Relation Name"]} if node.get("Node Type") == "Seq Scan" else set()
+    for child in node.get("Plans", []):
+        tables |= _pg_seq_scans(child)
+    return tables
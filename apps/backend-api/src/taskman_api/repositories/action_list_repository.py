@@ -5,12 +5,14 @@ Data access layer for ActionList entities.
 Updated to match actual database schema.
 """
 
+from collections.abc import Sequence
 from uuid import uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import any_, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from taskman_api.models.action_list import ActionList
+from taskman_api.models.task import Task
 from taskman_api.repositories.base import BaseRepository
 
 
@@ -22,15 +24,6 @@ class ActionListRepository(BaseRepository[ActionList]):
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
-    async def exists(self, entity_id: str) -> bool:
-        """Check if action list exists by ID."""
-        result = await self.session.execute(
-            select(func.count())
-            .select_from(ActionList)
-            .where(ActionList.id == entity_id)
-        )
-        return (result.scalar() or 0) > 0
-
     async def get_active(self, limit: int = 100) -> list[ActionList]:
         """Get all active action lists."""
         result = await self.session.execute(
@@ -103,6 +96,39 @@ class ActionListRepository(BaseRepository[ActionList]):
 
         return list(result.scalars().all()), total
 
+    async def get_tasks(self, list_id: str, columns: Sequence[str] | None = None) -> list[Task]:
+        """Get the tasks of an action list, in list order, with one join.
+
+        ``task_ids`` is an array on PostgreSQL (joined with ``= ANY`` and
+        ordered by ``array_position``) and a JSON array on SQLite (joined
+        through ``json_each``). IDs without a task are skipped.
+
+        Args:
+            list_id: Action list ID
+            columns: Task columns to load (default: all)
+
+        Returns:
+            Tasks in the order of the list's task_ids
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            query = (
+                select(Task)
+                .join(ActionList, Task.id == any_(ActionList.task_ids))
+                .order_by(func.array_position(ActionList.task_ids, Task.id))
+            )
+        else:
+            ids = func.json_each(ActionList.task_ids).table_valued("key", "value")
+            query = (
+                select(Task)
+                .select_from(ActionList)
+                .join(ids, true())
+                .join(Task, Task.id == ids.c.value)
+                .order_by(ids.c.key)
+            )
+        query = self._load_only(query.where(ActionList.id == list_id), columns, Task)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def create_action_list(
         self,
         name: str,
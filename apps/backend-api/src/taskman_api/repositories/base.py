@@ -5,13 +5,16 @@ Abstract base class for all repositories providing common CRUD operations.
 """
 
 from abc import ABC
-from typing import TYPE_CHECKING, Generic, TypeVar
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from taskman_api.db.base import Base
+from taskman_api.repositories.data_loader import data_loader
 
 if TYPE_CHECKING:
     from taskman_api.core.errors import NotFoundError
@@ -48,12 +51,33 @@ class BaseRepository(ABC, Generic[T]):
             self.session = model_or_session  # type: ignore
 
     async def get_by_id(self, entity_id: str | UUID) -> T | None:
-        """Get entity by ID."""
+        """Get entity by ID (batched and memoized per request when DataLoaders are enabled)."""
+        loader = data_loader(self.session, (self.model_class, "get_by_id"), self._load_by_ids)
+        if loader is not None:
+            return await loader.load(str(entity_id))
         result = await self.session.execute(
             select(self.model_class).where(self.model_class.id == entity_id)
         )
         return result.scalar_one_or_none()
 
+    async def _load_by_ids(self, entity_ids: list[str]) -> list[T | None]:
+        """DataLoader batch function for get_by_id: one entity or None per ID."""
+        found = {str(entity.id): entity for entity in await self.get_by_ids(entity_ids)}
+        return [found.get(entity_id) for entity_id in entity_ids]
+
+    async def get_by_ids(
+        self, entity_ids: Sequence[str | UUID], columns: Sequence[str] | None = None
+    ) -> list[T]:
+        """Get the entities with the given IDs in one ``WHERE id IN (...)`` query.
+
+        Rows come back in database order; unknown IDs are skipped.
+        """
+        if not entity_ids:
+            return []
+        query = select(self.model_class).where(self.model_class.id.in_(entity_ids))
+        result = await self.session.execute(self._load_only(query, columns))
+        return list(result.scalars().all())
+
     async def find_by_id(self, entity_id: str | UUID) -> "Result[T, NotFoundError]":
         """Find entity by ID, returning Result pattern.
 
@@ -76,9 +100,33 @@ class BaseRepository(ABC, Generic[T]):
             )
         return Ok(entity)
 
-    async def get_all(self, limit: int = 100, offset: int = 0) -> list[T]:
-        """Get all entities with pagination."""
-        result = await self.session.execute(select(self.model_class).limit(limit).offset(offset))
+    def _load_only(
+        self,
+        query: Select[Any],
+        columns: Sequence[str] | None,
+        model_class: type[Base] | None = None,
+    ) -> Select[Any]:
+        """Restrict an entity query to the given columns (the primary key is always loaded).
+
+        Unloaded attributes are absent from the entity's ``__dict__``; accessing
+        them would lazy-load, which async sessions do not allow.
+
+        Args:
+            query: Entity query to restrict
+            columns: Column attribute names to load; None or empty loads every column
+            model_class: Entity the columns belong to (default: this repository's model)
+        """
+        if not columns:
+            return query
+        model = model_class or self.model_class
+        return query.options(load_only(*(getattr(model, c) for c in columns)))
+
+    async def get_all(
+        self, limit: int = 100, offset: int = 0, columns: Sequence[str] | None = None
+    ) -> list[T]:
+        """Get all entities with pagination, optionally loading only ``columns``."""
+        query = self._load_only(select(self.model_class), columns)
+        result = await self.session.execute(query.limit(limit).offset(offset))
         return list(result.scalars().all())
 
     async def create(self, entity: T) -> T:
@@ -101,16 +149,25 @@ class BaseRepository(ABC, Generic[T]):
 
     async def count(self) -> int:
         """Count total entities."""
-        from sqlalchemy import func
-
         result = await self.session.execute(select(func.count()).select_from(self.model_class))
         return result.scalar() or 0
 
     async def exists(self, entity_id: str | UUID) -> bool:
-        """Check if entity exists by ID.
+        """Check if entity exists by ID (batched and memoized per request with DataLoaders)."""
+        loader = data_loader(self.session, (self.model_class, "exists"), self._load_exists)
+        if loader is not None:
+            return await loader.load(str(entity_id))
+        result = await self.session.execute(
+            select(func.count())
+            .select_from(self.model_class)
+            .where(self.model_class.id == entity_id)
+        )
+        return (result.scalar() or 0) > 0
 
-        Provides default implementation using get_by_id.
-        Subclasses may override for optimized queries.
-        """
-        entity = await self.get_by_id(entity_id)
-        return entity is not None
+    async def _load_exists(self, entity_ids: list[str]) -> list[bool]:
+        """DataLoader batch function for exists: whether each ID exists."""
+        result = await self.session.execute(
+            select(self.model_class.id).where(self.model_class.id.in_(entity_ids))
+        )
+        existing = {str(entity_id) for entity_id in result.scalars()}
+        return [entity_id in existing for entity_id in entity_ids]
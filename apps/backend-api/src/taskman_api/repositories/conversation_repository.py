@@ -6,13 +6,17 @@ Provides specialized queries for conversation session tracking.
 from collections.abc import Sequence
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from taskman_api.core.errors import DatabaseError
 from taskman_api.core.result import Err, Ok, Result
-from taskman_api.models.conversation import ConversationSession, ConversationTurn
+from taskman_api.models.conversation import (
+    CONVERSATION_TURNS_ARCHIVE,
+    ConversationSession,
+    ConversationTurn,
+)
 
 from .base import BaseRepository
 
@@ -308,6 +312,45 @@ class ConversationSessionRepository(BaseRepository[ConversationSession]):
                 )
             )
 
+    async def add_to_totals(
+        self,
+        conversation_id: str,
+        turns: int,
+        tokens: int,
+    ) -> Result[None, DatabaseError]:
+        """Add to a session's running turn and token totals.
+
+        The increment runs in the database, so concurrent turns never lose an update.
+
+        Args:
+            conversation_id: Session ID
+            turns: Turns to add to ``turn_count``
+            tokens: Tokens to add to ``token_estimate``
+
+        Returns:
+            Result with None or error
+        """
+        try:
+            stmt = (
+                update(ConversationSession)
+                .where(ConversationSession.id == conversation_id)
+                .values(
+                    turn_count=ConversationSession.turn_count + turns,
+                    token_estimate=ConversationSession.token_estimate + tokens,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.execute(stmt)
+            return Ok(None)
+        except SQLAlchemyError as e:
+            return Err(
+                DatabaseError(
+                    message=f"Failed to update totals for {conversation_id}",
+                    operation="add_to_totals",
+                    details=str(e),
+                )
+            )
+
 
 class ConversationTurnRepository(BaseRepository[ConversationTurn]):
     """Repository for ConversationTurn with specialized queries.
@@ -333,6 +376,7 @@ class ConversationTurnRepository(BaseRepository[ConversationTurn]):
         conversation_id: str,
         limit: int = 100,
         offset: int = 0,
+        columns: Sequence[str] | None = None,
     ) -> Result[Sequence[ConversationTurn], DatabaseError]:
         """Find turns by conversation ID ordered by sequence.
 
@@ -340,13 +384,15 @@ class ConversationTurnRepository(BaseRepository[ConversationTurn]):
             conversation_id: Parent conversation ID
             limit: Maximum number of results
             offset: Number of results to skip
+            columns: Column attribute names to load (default: all); compressed
+                columns left out are never read or decompressed
 
         Returns:
             Result with list of turns or error
         """
         try:
             stmt = (
-                select(ConversationTurn)
+                self._load_only(select(ConversationTurn), columns)
                 .where(ConversationTurn.conversation_id == conversation_id)
                 .order_by(ConversationTurn.sequence.asc())
                 .limit(limit)
@@ -516,7 +562,9 @@ class ConversationTurnRepository(BaseRepository[ConversationTurn]):
         self,
         conversation_id: str,
     ) -> Result[int, DatabaseError]:
-        """Count turns in a conversation.
+        """Count turns in a conversation, including turns rolled into summaries.
+
+        Reads the session's running total (``turn_count``) instead of counting rows.
 
         Args:
             conversation_id: Parent conversation ID
@@ -525,8 +573,8 @@ class ConversationTurnRepository(BaseRepository[ConversationTurn]):
             Result with turn count or error
         """
         try:
-            stmt = select(func.count(ConversationTurn.id)).where(
-                ConversationTurn.conversation_id == conversation_id
+            stmt = select(ConversationSession.turn_count).where(
+                ConversationSession.id == conversation_id
             )
             result = await self.session.execute(stmt)
             count = result.scalar() or 0
@@ -544,7 +592,9 @@ class ConversationTurnRepository(BaseRepository[ConversationTurn]):
         self,
         conversation_id: str,
     ) -> Result[int, DatabaseError]:
-        """Get total token count for a conversation.
+        """Get total token count for a conversation, including turns rolled into summaries.
+
+        Reads the session's running total (``token_estimate``) instead of summing rows.
 
         Args:
             conversation_id: Parent conversation ID
@@ -553,8 +603,8 @@ class ConversationTurnRepository(BaseRepository[ConversationTurn]):
             Result with total tokens or error
         """
         try:
-            stmt = select(func.sum(ConversationTurn.token_count)).where(
-                ConversationTurn.conversation_id == conversation_id
+            stmt = select(ConversationSession.token_estimate).where(
+                ConversationSession.id == conversation_id
             )
             result = await self.session.execute(stmt)
             total = result.scalar() or 0
@@ -572,7 +622,9 @@ class ConversationTurnRepository(BaseRepository[ConversationTurn]):
         self,
         conversation_id: str,
     ) -> Result[int, DatabaseError]:
-        """Delete all turns for a conversation.
+        """Delete all turns for a conversation, cold-stored ones included.
+
+        Resets the session's running totals.
 
         Args:
             conversation_id: Parent conversation ID
@@ -581,21 +633,24 @@ class ConversationTurnRepository(BaseRepository[ConversationTurn]):
             Result with number of deleted turns or error
         """
         try:
-            from sqlalchemy import delete
-
-            # First count for return value
-            count_result = await self.count_by_conversation(conversation_id)
-            if isinstance(count_result, Err):
-                return count_result
-
-            count = count_result.value
-
-            stmt = delete(ConversationTurn).where(
-                ConversationTurn.conversation_id == conversation_id
+            hot = await self.session.execute(
+                delete(ConversationTurn).where(
+                    ConversationTurn.conversation_id == conversation_id
+                )
+            )
+            cold = await self.session.execute(
+                delete(CONVERSATION_TURNS_ARCHIVE).where(
+                    CONVERSATION_TURNS_ARCHIVE.c.conversation_id == conversation_id
+                )
+            )
+            await self.session.execute(
+                update(ConversationSession)
+                .where(ConversationSession.id == conversation_id)
+                .values(turn_count=0, token_estimate=0, compacted_through=0)
+                .execution_options(synchronize_session=False)
             )
-            await self.session.execute(stmt)
             await self.session.flush()
-            return Ok(count)
+            return Ok(hot.rowcount + cold.rowcount)
         except SQLAlchemyError as e:
             await self.session.rollback()
             return Err(
@@ -0,0 +1,170 @@
+"""
+Request-scoped DataLoaders for repository lookups.
+
+Services look entities up one ID at a time: sprint creation checks its
+project, plan and conversation links check existence, and so on. When a
+session has DataLoaders enabled (``get_db_session`` does this for every
+request), ``BaseRepository.get_by_id`` and ``exists`` go through a loader
+instead of querying directly:
+
+- Lookups made in the same event-loop tick (``asyncio.gather``) are
+  coalesced into one ``WHERE id IN (...)`` query
+- Results are memoized for the rest of the request, so repeated lookups of
+  the same ID cost nothing
+
+Memoized results are dropped whenever the session writes (flush, ORM bulk
+UPDATE/DELETE), commits or rolls back, so a lookup never returns a result
+older than the session's last write. While objects are pending insert or
+delete, lookups bypass the loader and query directly so autoflush applies.
+
+Loaders are kept per read-routing mark (``db.read_routing``): a replica read
+is never served to primary-pinned code.
+
+Usage:
+    enable_data_loaders(session)
+    repo = TaskRepository(session)
+    a, b = await asyncio.gather(repo.get_by_id("T-1"), repo.get_by_id("T-2"))  # one query
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from taskman_api.db.read_routing import current_routing
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# session.info key holding the session's loaders
+LOADERS_KEY = "data_loaders"
+
+# Largest IN list sent in one batch query
+MAX_BATCH_SIZE = 500
+
+
+class DataLoader(Generic[K, V]):
+    """Coalesces ``load(key)`` calls made in one loop tick into one batch call and memoizes results.
+
+    ``batch_load`` receives distinct keys and must return one value per key, in order.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[Sequence[V]]],
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self._cache: dict[K, asyncio.Future[V]] = {}
+        self._queue: list[tuple[K, asyncio.Future[V]]] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V:
+        """Value for ``key``; a key not seen yet is fetched with the current tick's batch."""
+        # Shielded: a cancelled caller must not cancel the future other callers share
+        return await asyncio.shield(self._future(key))
+
+    def _future(self, key: K) -> asyncio.Future[V]:
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        self._queue.append((key, future))
+        if len(self._queue) == 1:
+            loop.call_soon(self._schedule)
+        return future
+
+    def clear(self) -> None:
+        """Forget memoized results; batches already in flight still resolve their callers."""
+        self._cache = {}
+
+    def _schedule(self) -> None:
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.max_batch_size):
+            batch = queue[start : start + self.max_batch_size]
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list[tuple[K, asyncio.Future[V]]]) -> None:
+        keys = [key for key, _ in batch]
+        try:
+            values = await self.batch_load(keys)
+            if len(values) != len(keys):
+                raise ValueError(f"batch_load returned {len(values)} values for {len(keys)} keys")
+        except Exception as e:
+            for key, future in batch:
+                # Failures are not memoized; the next load retries
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), value in zip(batch, values, strict=True):
+            if not future.done():
+                future.set_result(value)
+
+
+def enable_data_loaders(session: AsyncSession | Session) -> None:
+    """Route the session's ``get_by_id`` / ``exists`` lookups through DataLoaders."""
+    session.info.setdefault(LOADERS_KEY, {})
+
+
+def data_loader(
+    session: AsyncSession | Session,
+    key: tuple[Any, ...],
+    batch_load: Callable[[list[Any]], Awaitable[Sequence[Any]]],
+) -> DataLoader[Any, Any] | None:
+    """The session's loader for ``key`` (created on first use), or None to query directly.
+
+    None is returned when loaders are off, or while the session holds pending
+    inserts or deletes that a direct query would autoflush first.
+
+    Args:
+        session: Session the loader is scoped to
+        key: Identifies the lookup, e.g. ``(Task, "get_by_id")``
+        batch_load: Batch function used when the loader is created
+    """
+    loaders: dict[tuple[Any, ...], DataLoader[Any, Any]] | None = session.info.get(LOADERS_KEY)
+    if loaders is None or session.new or session.deleted:
+        return None
+    key = (*key, current_routing())
+    loader = loaders.get(key)
+    if loader is None:
+        loader = loaders[key] = DataLoader(batch_load)
+    return loader
+
+
+def clear_data_loaders(session: Session) -> None:
+    """Forget every memoized lookup of the session."""
+    for loader in session.info.get(LOADERS_KEY, {}).values():
+        loader.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _clear_after_flush(session: Session, _flush_context: Any) -> None:
+    clear_data_loaders(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_after_commit(session: Session) -> None:
+    clear_data_loaders(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_after_rollback(session: Session) -> None:
+    clear_data_loaders(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _clear_after_bulk_write(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        clear_data_loaders(state.session)
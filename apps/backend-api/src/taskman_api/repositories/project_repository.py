@@ -4,6 +4,8 @@ Project Repository.
 Data access layer for Project entities.
 """
 
+from collections.abc import Sequence
+
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,13 +23,6 @@ class ProjectRepository(BaseRepository[Project]):
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
-    async def exists(self, entity_id: str) -> bool:
-        """Check if project exists by ID."""
-        result = await self.session.execute(
-            select(func.count()).select_from(Project).where(Project.id == entity_id)
-        )
-        return (result.scalar() or 0) > 0
-
     async def get_by_status(self, status: str, limit: int = 100) -> list[Project]:
         """Get projects by status."""
         result = await self.session.execute(
@@ -48,6 +43,7 @@ class ProjectRepository(BaseRepository[Project]):
         owner: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        columns: Sequence[str] | None = None,
     ) -> tuple[list[Project], int]:
         """
         Search projects with filters.
@@ -66,8 +62,8 @@ class ProjectRepository(BaseRepository[Project]):
         total_result = await self.session.execute(count_query)
         total = total_result.scalar() or 0
 
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        # Apply pagination and column projection
+        query = self._load_only(query, columns).limit(limit).offset(offset)
         result = await self.session.execute(query)
 
         return list(result.scalars().all()), total
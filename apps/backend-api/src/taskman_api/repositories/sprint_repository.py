@@ -4,6 +4,8 @@ Sprint Repository.
 Data access layer for Sprint entities.
 """
 
+from collections.abc import Sequence
+
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,13 +23,6 @@ class SprintRepository(BaseRepository[Sprint]):
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
-    async def exists(self, entity_id: str) -> bool:
-        """Check if sprint exists by ID."""
-        result = await self.session.execute(
-            select(func.count()).select_from(Sprint).where(Sprint.id == entity_id)
-        )
-        return (result.scalar() or 0) > 0
-
     async def get_by_status(self, status: str, limit: int = 100) -> list[Sprint]:
         """Get sprints by status."""
         result = await self.session.execute(
@@ -55,6 +50,7 @@ class SprintRepository(BaseRepository[Sprint]):
         project_id: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        columns: Sequence[str] | None = None,
     ) -> tuple[list[Sprint], int]:
         """
         Search sprints with filters.
@@ -73,8 +69,8 @@ class SprintRepository(BaseRepository[Sprint]):
         total_result = await self.session.execute(count_query)
         total = total_result.scalar() or 0
 
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        # Apply pagination and column projection
+        query = self._load_only(query, columns).limit(limit).offset(offset)
         result = await self.session.execute(query)
 
         return list(result.scalars().all()), total
@@ -4,16 +4,81 @@ Task Repository.
 Data access layer for Task entities.
 """
 
+from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import CompoundSelect, Select, case, func, literal, null, select, tuple_, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from taskman_api.core.errors import AppError, NotFoundError
 from taskman_api.core.result import Err, Ok, Result
-from taskman_api.models.task import Task
+from taskman_api.models.task import TASKS_ARCHIVE, Task
 from taskman_api.repositories.base import BaseRepository
 
+# Dashboard summary facets: name -> grouped Task attribute. Tasks are assigned
+# through ``owner``; the legacy ``assignee`` column is not written by the API.
+SUMMARY_FACETS = {
+    "status": "status",
+    "priority": "priority",
+    "owner": "owner",
+    "project": "primary_project",
+}
+
+# Task mapped over hot and archived rows, for reads with include_archived
+_TASKS_WITH_ARCHIVE = aliased(
+    Task,
+    union_all(
+        select(Task.__table__),
+        select(*(TASKS_ARCHIVE.c[column.name] for column in Task.__table__.columns)),
+    ).subquery("tasks_with_archive"),
+)
+
+
+def tasks_source(include_archived: bool = False) -> type[Task]:
+    """Entity to read tasks from: ``Task`` (hot rows only) or hot and archived rows."""
+    return _TASKS_WITH_ARCHIVE if include_archived else Task
+
+
+def facet_counts_query(
+    dialect: str,
+    project_id: str | None = None,
+    sprint_id: str | None = None,
+    include_archived: bool = False,
+) -> Select[tuple[str, str | None, int]] | CompoundSelect:
+    """(facet, value, count) rows for every ``SUMMARY_FACETS`` value plus a "total" row.
+
+    Postgres groups by ``GROUPING SETS`` in a single scan; other dialects run
+    one ``GROUP BY`` per facet combined with ``UNION ALL`` in one statement.
+    """
+    source = tasks_source(include_archived)
+    facets = {name: getattr(source, attr) for name, attr in SUMMARY_FACETS.items()}
+    conditions = []
+    if project_id:
+        conditions.append(source.primary_project == project_id)
+    if sprint_id:
+        conditions.append(source.primary_sprint == sprint_id)
+
+    if dialect == "postgresql":
+        # grouping(col) is 0 in the grouping set that groups by col
+        grouped = [(func.grouping(col) == 0, name, col) for name, col in facets.items()]
+        return (
+            select(
+                case(*[(g, literal(name)) for g, name, _ in grouped], else_=literal("total")),
+                case(*[(g, col) for g, _, col in grouped]),
+                func.count(),
+            )
+            .where(*conditions)
+            .group_by(func.grouping_sets(*[tuple_(col) for col in facets.values()], tuple_()))
+        )
+    return union_all(
+        *[
+            select(literal(name), col, func.count()).where(*conditions).group_by(col)
+            for name, col in facets.items()
+        ],
+        select(literal("total"), null(), func.count()).select_from(source).where(*conditions),
+    )
+
 
 class TaskRepository(BaseRepository[Task]):
     """Repository for Task entity operations."""
@@ -23,13 +88,6 @@ class TaskRepository(BaseRepository[Task]):
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
-    async def exists(self, entity_id: str | UUID) -> bool:
-        """Check if task exists by ID."""
-        result = await self.session.execute(
-            select(func.count()).select_from(Task).where(Task.id == entity_id)
-        )
-        return (result.scalar() or 0) > 0
-
     async def get_by_status(self, status: str, limit: int = 100) -> list[Task]:
         """Get tasks by status."""
         result = await self.session.execute(select(Task).where(Task.status == status).limit(limit))
@@ -42,10 +100,13 @@ class TaskRepository(BaseRepository[Task]):
         )
         return list(result.scalars().all())
 
-    async def get_by_sprint(self, sprint_id: str, limit: int = 100) -> list[Task]:
-        """Get tasks by primary sprint ID."""
+    async def get_by_sprint(
+        self, sprint_id: str, limit: int = 100, include_archived: bool = False
+    ) -> list[Task]:
+        """Get tasks by primary sprint ID (archived tasks only with ``include_archived``)."""
+        source = tasks_source(include_archived)
         result = await self.session.execute(
-            select(Task).where(Task.primary_sprint == sprint_id).limit(limit)
+            select(source).where(source.primary_sprint == sprint_id).limit(limit)
         )
         return list(result.scalars().all())
 
@@ -66,39 +127,70 @@ class TaskRepository(BaseRepository[Task]):
         owner: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        columns: Sequence[str] | None = None,
+        include_archived: bool = False,
     ) -> tuple[list[Task], int]:
         """
-        Search tasks with multiple filters.
+        Search tasks with multiple filters; archived tasks only with ``include_archived``.
 
         Returns: (tasks, total_count)
         """
-        query = select(Task)
+        source = tasks_source(include_archived)
+        query = select(source)
 
         # Apply filters
         if status:
-            query = query.where(Task.status == status)
+            query = query.where(source.status == status)
         if priority:
-            query = query.where(Task.priority == priority)
+            query = query.where(source.priority == priority)
         if project_id:
-            query = query.where(Task.primary_project == project_id)
+            query = query.where(source.primary_project == project_id)
         if sprint_id:
-            query = query.where(Task.primary_sprint == sprint_id)
+            query = query.where(source.primary_sprint == sprint_id)
         if assignee:
-            query = query.where(Task.assignee == assignee)
+            query = query.where(source.assignee == assignee)
         if owner:
-            query = query.where(Task.owner == owner)
+            query = query.where(source.owner == owner)
 
         # Get total count
         count_query = select(func.count()).select_from(query.subquery())
         total_result = await self.session.execute(count_query)
         total = total_result.scalar() or 0
 
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        # Apply pagination and column projection
+        query = self._load_only(query, columns, source).limit(limit).offset(offset)
         result = await self.session.execute(query)
 
         return list(result.scalars().all()), total
 
+    async def facet_counts(
+        self,
+        project_id: str | None = None,
+        sprint_id: str | None = None,
+        include_archived: bool = False,
+    ) -> list[tuple[str, str | None, int]]:
+        """
+        Count tasks per value of each dashboard facet (see ``SUMMARY_FACETS``) in one query.
+
+        Returns: (facet, value, count) rows, plus a ("total", None, count) row
+        """
+        dialect = self.session.get_bind().dialect.name
+        query = facet_counts_query(
+            dialect, project_id=project_id, sprint_id=sprint_id, include_archived=include_archived
+        )
+        result = await self.session.execute(query)
+        return [tuple(row) for row in result.all()]
+
+    async def get_including_archived(self, task_id: str) -> Task | None:
+        """Get a task by ID from the hot table or, failing that, the archive."""
+        task = await self.get_by_id(task_id)
+        if task is not None:
+            return task
+        result = await self.session.execute(
+            select(_TASKS_WITH_ARCHIVE).where(_TASKS_WITH_ARCHIVE.id == task_id)
+        )
+        return result.scalars().first()
+
     async def create_task(
         self,
         id: str,
@@ -256,24 +348,42 @@ class TaskRepository(BaseRepository[Task]):
         return Ok(task)
 
     async def find_by_project(
-        self, project_id: str, status: str | None = None, limit: int = 100, offset: int = 0
+        self,
+        project_id: str,
+        status: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        include_archived: bool = False,
     ) -> Result[list[Task], AppError]:
-        """Find tasks by project with Result wrapper."""
+        """Find tasks by project with Result wrapper (archived only with ``include_archived``)."""
         try:
             tasks, _ = await self.search(
-                project_id=project_id, status=status, limit=limit, offset=offset
+                project_id=project_id,
+                status=status,
+                limit=limit,
+                offset=offset,
+                include_archived=include_archived,
             )
             return Ok(tasks)
         except Exception as e:
             return Err(AppError(message=str(e)))
 
     async def find_by_sprint(
-        self, sprint_id: str, status: str | None = None, limit: int = 100, offset: int = 0
+        self,
+        sprint_id: str,
+        status: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        include_archived: bool = False,
     ) -> Result[list[Task], AppError]:
-        """Find tasks by sprint with Result wrapper."""
+        """Find tasks by sprint with Result wrapper (archived only with ``include_archived``)."""
         try:
             tasks, _ = await self.search(
-                sprint_id=sprint_id, status=status, limit=limit, offset=offset
+                sprint_id=sprint_id,
+                status=status,
+                limit=limit,
+                offset=offset,
+                include_archived=include_archived,
             )
             return Ok(tasks)
         except Exception as e:
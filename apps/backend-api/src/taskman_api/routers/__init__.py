@@ -1,25 +1,49 @@
 """
 TaskMan-v2 API Routers Package
 Organizes API endpoints into modular router components.
+
+Routers are imported on first access (PEP 562), so importing one router (tests,
+CLI tools, the MCP server) does not pull in every endpoint module.
 """
 
-from .action_lists import router as action_lists_router
-from .agent import router as agent_router
-from .checklists import router as checklists_router
-from .conversations import router as conversations_router
-from .diagnostic import router as diagnostic_router
-from .phases import router as phases_router
-from .plans import router as plans_router
-from .projects import router as projects_router
-from .qse import router as qse_router
-from .sprints import router as sprints_router
-from .tasks import router as tasks_router
+import importlib
+from typing import Any
+
+_ROUTER_MODULES = {
+    "action_lists_router": "action_lists",
+    "agent_router": "agent",
+    "checklists_router": "checklists",
+    "conversations_router": "conversations",
+    "dashboard_router": "dashboard",
+    "diagnostic_router": "diagnostic",
+    "phases_router": "phases",
+    "plans_router": "plans",
+    "projects_router": "projects",
+    "qse_router": "qse",
+    "sprints_router": "sprints",
+    "tasks_router": "tasks",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _ROUTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    router = importlib.import_module(f".{module}", __name__).router
+    globals()[name] = router
+    return router
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_ROUTER_MODULES})
+
 
 __all__ = [
     "action_lists_router",
     "agent_router",
     "checklists_router",
     "conversations_router",
+    "dashboard_router",
     "diagnostic_router",
     "phases_router",
     "plans_router",
@@ -8,7 +8,10 @@ import structlog
 from fastapi import APIRouter, HTTPException, Query
 from fastapi import status as http_status
 
+from taskman_api.core.fieldsets import parse_fields
+from taskman_api.core.responses import fieldset_response, trusted_response
 from taskman_api.dependencies import ActionListSvc
+from taskman_api.schemas import BatchGetResponse, TaskResponse
 from taskman_api.schemas.action_list import (
     ActionListAddItemRequest,
     ActionListCollection,
@@ -187,12 +190,16 @@ async def list_action_lists(
     action_lists, total = result.value
     logger.info("action_lists_listed", count=len(action_lists), total=total, page=page)
 
-    return ActionListCollection(
-        action_lists=[ActionListResponse.model_validate(al.model_dump()) for al in action_lists],
-        total=total,
-        page=page,
-        per_page=per_page,
-        has_more=offset + per_page < total,
+    return trusted_response(
+        ActionListCollection(
+            action_lists=[
+                ActionListResponse.model_validate(al.model_dump()) for al in action_lists
+            ],
+            total=total,
+            page=page,
+            per_page=per_page,
+            has_more=offset + per_page < total,
+        )
     )
 
 
@@ -455,6 +462,56 @@ async def get_action_list_tasks(
     return task_ids
 
 
+@router.get(
+    "/{list_id}/tasks/hydrated",
+    response_model=BatchGetResponse[TaskResponse],
+    summary="Get action list tasks with details",
+    description="""
+    Retrieve the full tasks of an action list in one request.
+
+    Tasks are loaded with a single join on the list's task IDs and returned
+    in list order. Task IDs that no longer resolve to a task are reported
+    in `missing`.
+
+    **Use Case**: Render an action list without one `GET /tasks/{task_id}` per task.
+
+    **Sparse fieldsets**: `?fields=title,status` returns only those task fields (plus `id`).
+    """,
+    responses={
+        404: {"description": "Action list not found"},
+        422: {"description": "Unknown field in fields"},
+        401: {"description": "Unauthorized - missing or invalid JWT token"},
+        500: {"description": "Internal server error"},
+    },
+    tags=["Action Lists"],
+)
+async def get_action_list_hydrated_tasks(
+    list_id: str,
+    service: ActionListSvc,
+    fields: str | None = Query(
+        None, description="Comma-separated task fields to return (id is always included)"
+    ),
+):
+    """Get hydrated action list tasks endpoint handler."""
+    selected = parse_fields(fields, TaskResponse)
+    result = await service.get_hydrated_tasks(list_id, fields=selected)
+
+    if result.is_failure:
+        logger.error("action_list_tasks_hydrate_failed", list_id=list_id, error=result.error)
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail=str(result.error),
+        )
+
+    tasks, missing = result.value
+    logger.info(
+        "action_list_tasks_hydrated", list_id=list_id, count=len(tasks), missing=len(missing)
+    )
+    return fieldset_response(
+        BatchGetResponse[TaskResponse](items=tasks, missing=missing), selected, key="items"
+    )
+
+
 @router.post(
     "/{list_id}/tasks",
     response_model=ActionListResponse,
@@ -6,8 +6,11 @@ Provides REST endpoints for checklist management.
 from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
 
+from taskman_api.core.fieldsets import parse_fields
+from taskman_api.core.responses import fieldset_response
 from taskman_api.core.result import Err, Ok
-from taskman_api.dependencies import get_checklist_service
+from taskman_api.dependencies import ReadOnly, get_checklist_service
+from taskman_api.schemas.base import BatchGetRequest, BatchGetResponse
 from taskman_api.schemas.checklist import (
     ChecklistCreateRequest,
     ChecklistItemAddRequest,
@@ -142,7 +145,7 @@ async def get_checklists_with_blocked_items(
             raise error
 
 
-@router.get("/checklists/stats")
+@router.get("/checklists/stats", dependencies=[ReadOnly])
 async def get_checklist_stats(
     service: ChecklistService = Depends(get_checklist_service),
 ):
@@ -350,10 +353,18 @@ async def delete_checklist(
             raise error
 
 
-@router.get("/checklists", response_model=list[ChecklistResponse])
+@router.get(
+    "/checklists", response_model=list[ChecklistResponse] | BatchGetResponse[ChecklistResponse]
+)
 async def list_checklists(
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    ids: str | None = Query(
+        default=None, description="Comma-separated ids to fetch in order (see :batchGet)"
+    ),
+    fields: str | None = Query(
+        default=None, description="Comma-separated fields to return (id is always included)"
+    ),
     service: ChecklistService = Depends(get_checklist_service),
 ):
     """List checklists with pagination.
@@ -361,16 +372,50 @@ async def list_checklists(
     Args:
         limit: Maximum results (1-1000, default: 100)
         offset: Results to skip (default: 0)
+        ids: Comma-separated ids; returns a batch get result instead
+        fields: Comma-separated sparse fieldset
         service: Checklist service instance
 
     Returns:
         List of checklists
     """
-    result = await service.list(limit=limit, offset=offset)
+    if ids is not None:
+        return await batch_get_checklists(BatchGetRequest.from_query(ids, fields), service)
+
+    selected = parse_fields(fields, ChecklistResponse)
+    result = await service.list(limit=limit, offset=offset, fields=selected)
 
     match result:
         case Ok(checklists):
-            return checklists
+            return fieldset_response(checklists, selected)
+        case Err(error):
+            raise error
+
+
+@router.post("/checklists:batchGet", response_model=BatchGetResponse[ChecklistResponse])
+async def batch_get_checklists(
+    request: BatchGetRequest,
+    service: ChecklistService = Depends(get_checklist_service),
+):
+    """Get checklists by ID in one query.
+
+    Args:
+        request: IDs in the order wanted, and an optional sparse fieldset
+        service: Checklist service instance
+
+    Returns:
+        Found checklists in request order and the IDs that do not exist
+    """
+    selected = parse_fields(request.fields, ChecklistResponse)
+    result = await service.get_many(request.ids, fields=selected)
+
+    match result:
+        case Ok((checklists, missing)):
+            return fieldset_response(
+                BatchGetResponse[ChecklistResponse](items=checklists, missing=missing),
+                selected,
+                key="items",
+            )
         case Err(error):
             raise error
 
@@ -6,8 +6,10 @@ Provides REST endpoints for conversation session management.
 from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
 
+from taskman_api.core.fieldsets import parse_fields
+from taskman_api.core.responses import fieldset_response
 from taskman_api.core.result import Err, Ok
-from taskman_api.dependencies import get_conversation_service
+from taskman_api.dependencies import ReadOnly, get_conversation_service
 from taskman_api.schemas.conversation import (
     ConversationSessionCreateRequest,
     ConversationSessionResponse,
@@ -90,7 +92,7 @@ async def get_active_conversations(
             raise error
 
 
-@router.get("/conversations/stats")
+@router.get("/conversations/stats", dependencies=[ReadOnly])
 async def get_conversation_stats(
     service: ConversationSessionService = Depends(get_conversation_service),
 ):
@@ -232,6 +234,9 @@ async def delete_conversation(
 async def list_conversations(
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    fields: str | None = Query(
+        default=None, description="Comma-separated fields to return (id is always included)"
+    ),
     service: ConversationSessionService = Depends(get_conversation_service),
 ):
     """List conversations with pagination.
@@ -239,16 +244,18 @@ async def list_conversations(
     Args:
         limit: Maximum results (1-1000, default: 100)
         offset: Results to skip (default: 0)
+        fields: Comma-separated sparse fieldset
         service: Conversation service instance
 
     Returns:
         List of conversations
     """
-    result = await service.list(limit=limit, offset=offset)
+    selected = parse_fields(fields, ConversationSessionResponse)
+    result = await service.list(limit=limit, offset=offset, fields=selected)
 
     match result:
         case Ok(convs):
-            return convs
+            return fieldset_response(convs, selected)
         case Err(error):
             raise error
 
@@ -422,6 +429,9 @@ async def get_turns(
     conversation_id: str,
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    fields: str | None = Query(
+        default=None, description="Comma-separated fields to return (id is always included)"
+    ),
     service: ConversationSessionService = Depends(get_conversation_service),
 ):
     """Get turns for a conversation.
@@ -430,6 +440,8 @@ async def get_turns(
         conversation_id: Conversation identifier
         limit: Maximum results (1-1000, default: 100)
         offset: Results to skip (default: 0)
+        fields: Comma-separated sparse fieldset; turn content is only
+            decompressed when ``content`` is selected
         service: Conversation service instance
 
     Returns:
@@ -438,11 +450,12 @@ async def get_turns(
     Raises:
         404: Conversation not found
     """
-    result = await service.get_turns(conversation_id, limit, offset)
+    selected = parse_fields(fields, ConversationTurnResponse)
+    result = await service.get_turns(conversation_id, limit, offset, fields=selected)
 
     match result:
         case Ok(turns):
-            return turns
+            return fieldset_response(turns, selected)
         case Err(error):
             raise error
 
@@ -0,0 +1,45 @@
+"""Dashboard API endpoints.
+
+Provides aggregate views that replace per-facet list calls from the dashboard.
+"""
+
+from fastapi import APIRouter, Depends
+
+from taskman_api.core.result import Err, Ok
+from taskman_api.dependencies import ReadOnly, get_task_service
+from taskman_api.schemas.task import DashboardSummary
+from taskman_api.services.task_service import TaskService
+
+router = APIRouter()
+
+
+@router.get("/dashboard/summary", response_model=DashboardSummary, dependencies=[ReadOnly])
+async def get_dashboard_summary(
+    project_id: str | None = None,
+    sprint_id: str | None = None,
+    include_archived: bool = False,
+    service: TaskService = Depends(get_task_service),
+):
+    """Get task counts by status, priority, owner and project.
+
+    All facets are computed by one grouped query and cached for a few seconds
+    per scope (TASKMAN_DASHBOARD_CACHE_TTL).
+
+    Args:
+        project_id: Optional project scope
+        sprint_id: Optional sprint scope
+        include_archived: Also count archived (long-closed) tasks
+        service: Task service instance
+
+    Returns:
+        Dashboard summary
+    """
+    result = await service.get_dashboard_summary(
+        project_id=project_id, sprint_id=sprint_id, include_archived=include_archived
+    )
+
+    match result:
+        case Ok(summary):
+            return summary
+        case Err(error):
+            raise error
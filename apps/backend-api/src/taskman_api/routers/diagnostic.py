@@ -1,14 +1,23 @@
 """
-Diagnostic route - adds detailed error logging endpoint
+Diagnostic route - adds detailed error logging and admin-only profiling endpoints
 """
 
 import sys
 import traceback
+from typing import Annotated, Literal
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import status as http_status
+from fastapi.responses import PlainTextResponse
+
+from taskman_api.auth import User, get_current_admin_user
+from taskman_api.db.session import manager
+from taskman_api.telemetry.profiler import SamplingProfiler, get_profile_store
 
 router = APIRouter()
 
+AdminUser = Annotated[User, Depends(get_current_admin_user)]
+
 
 @router.get("/debug/error-test")
 async def error_test():
@@ -38,3 +47,103 @@ async def error_test():
             f.write(f"Python Path:\n{chr(10).join(sys.path)}")
 
         return error_details
+
+
+@router.get("/debug/profile")
+async def profile_route(
+    request: Request,
+    admin: AdminUser,
+    route: Annotated[str, Query(description="Path (and query) of the GET request to profile")],
+    interval_ms: Annotated[float, Query(ge=0.1, le=50)] = 1.0,
+    format: Literal["collapsed", "summary"] = "collapsed",
+):
+    """
+    Profile one in-process GET of ``route`` (admin only).
+
+    The request is dispatched through the full application, middleware
+    included, with the caller's Authorization header. Returns flamegraph
+    collapsed stacks (``format=collapsed``) or a per-category summary; the
+    profile is also stored under the returned ``X-Profile-Id``.
+    """
+    if not route.startswith("/") or route.split("?", 1)[0].rstrip("/").endswith("/debug/profile"):
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail="route must be an absolute path other than the profiler itself",
+        )
+
+    import httpx  # only needed by this admin endpoint
+
+    headers = {"authorization": request.headers.get("authorization", "")}
+    transport = httpx.ASGITransport(app=request.app)
+    async with httpx.AsyncClient(transport=transport, base_url=str(request.base_url)) as client:
+        profiler = SamplingProfiler(interval=interval_ms / 1000)
+        profiler.start()
+        try:
+            response = await client.get(route, headers=headers)
+        finally:
+            profile = profiler.stop()
+
+    profile_id = get_profile_store().save(profile)
+    response_headers = {
+        "X-Profile-Id": profile_id,
+        "X-Profile-Summary": profile.summary_header(),
+        "X-Profiled-Status": str(response.status_code),
+    }
+    if format == "summary":
+        return {
+            "profile_id": profile_id,
+            "route": route,
+            "status_code": response.status_code,
+            "profiled_by": admin.user_id,
+            **profile.summary(),
+        }
+    return PlainTextResponse(profile.collapsed(), headers=response_headers)
+
+
+@router.get(
+    "/debug/profile/{profile_id}",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(get_current_admin_user)],
+)
+async def get_profile(profile_id: str) -> PlainTextResponse:
+    """
+    Fetch a stored profile as flamegraph collapsed stacks (admin only).
+    """
+    collapsed = get_profile_store().load(profile_id)
+    if collapsed is None:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND, detail=f"Profile not found: {profile_id}"
+        )
+    return PlainTextResponse(collapsed)
+
+
+@router.get("/debug/reconciliation", dependencies=[Depends(get_current_admin_user)])
+async def get_reconciliation() -> dict:
+    """
+    Fallback-to-primary reconciliation status (admin only).
+
+    Returns the last run's report, including conflicts left unreplayed, and
+    the journaled fallback writes still pending.
+    """
+    pending, lag_seconds = await manager.reconciler.refresh_lag()
+    return {
+        "running": manager.reconciliation_running,
+        "pending": pending,
+        "lag_seconds": round(lag_seconds, 3),
+        "last_run": manager.last_reconciliation,
+    }
+
+
+@router.post("/debug/reconciliation", dependencies=[Depends(get_current_admin_user)])
+async def run_reconciliation() -> dict:
+    """
+    Replay journaled fallback writes onto primary now (admin only).
+
+    Joins the background run if one is in progress.
+    """
+    if manager.active_tier != "primary":
+        raise HTTPException(
+            status_code=http_status.HTTP_409_CONFLICT,
+            detail=f"Primary database is not active (active tier: {manager.active_tier})",
+        )
+    return await manager.reconcile()
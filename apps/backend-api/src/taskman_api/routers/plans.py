@@ -6,8 +6,11 @@ Provides REST endpoints for plan management.
 from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
 
+from taskman_api.core.fieldsets import parse_fields
+from taskman_api.core.responses import fieldset_response
 from taskman_api.core.result import Err, Ok
-from taskman_api.dependencies import get_plan_service
+from taskman_api.dependencies import ReadOnly, get_plan_service
+from taskman_api.schemas.base import BatchGetRequest, BatchGetResponse
 from taskman_api.schemas.plan import (
     PlanCreateRequest,
     PlanResponse,
@@ -145,7 +148,7 @@ async def get_stalled_plans(
             raise error
 
 
-@router.get("/plans/stats")
+@router.get("/plans/stats", dependencies=[ReadOnly])
 async def get_plan_stats(
     service: PlanService = Depends(get_plan_service),
 ):
@@ -283,10 +286,16 @@ async def delete_plan(
             raise error
 
 
-@router.get("/plans", response_model=list[PlanResponse])
+@router.get("/plans", response_model=list[PlanResponse] | BatchGetResponse[PlanResponse])
 async def list_plans(
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    ids: str | None = Query(
+        default=None, description="Comma-separated ids to fetch in order (see :batchGet)"
+    ),
+    fields: str | None = Query(
+        default=None, description="Comma-separated fields to return (id is always included)"
+    ),
     service: PlanService = Depends(get_plan_service),
 ):
     """List plans with pagination.
@@ -294,16 +303,50 @@ async def list_plans(
     Args:
         limit: Maximum results (1-1000, default: 100)
         offset: Results to skip (default: 0)
+        ids: Comma-separated ids; returns a batch get result instead
+        fields: Comma-separated sparse fieldset
         service: Plan service instance
 
     Returns:
         List of plans
     """
-    result = await service.list(limit=limit, offset=offset)
+    if ids is not None:
+        return await batch_get_plans(BatchGetRequest.from_query(ids, fields), service)
+
+    selected = parse_fields(fields, PlanResponse)
+    result = await service.list(limit=limit, offset=offset, fields=selected)
 
     match result:
         case Ok(plans):
-            return plans
+            return fieldset_response(plans, selected)
+        case Err(error):
+            raise error
+
+
+@router.post("/plans:batchGet", response_model=BatchGetResponse[PlanResponse])
+async def batch_get_plans(
+    request: BatchGetRequest,
+    service: PlanService = Depends(get_plan_service),
+):
+    """Get plans by ID in one query.
+
+    Args:
+        request: IDs in the order wanted, and an optional sparse fieldset
+        service: Plan service instance
+
+    Returns:
+        Found plans in request order and the IDs that do not exist
+    """
+    selected = parse_fields(request.fields, PlanResponse)
+    result = await service.get_many(request.ids, fields=selected)
+
+    match result:
+        case Ok((plans, missing)):
+            return fieldset_response(
+                BatchGetResponse[PlanResponse](items=plans, missing=missing),
+                selected,
+                key="items",
+            )
         case Err(error):
             raise error
 
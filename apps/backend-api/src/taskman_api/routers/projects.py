@@ -5,14 +5,23 @@ Uses Service Layer for business logic and validation.
 """
 
 import structlog
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi import status as http_status
 
 from taskman_api.core.enums import ProjectStatus
 from taskman_api.core.errors import AppError, ConflictError, NotFoundError, ValidationError
+from taskman_api.core.fieldsets import parse_fields
+from taskman_api.core.responses import fieldset_response
 from taskman_api.core.result import Err, Ok
 from taskman_api.dependencies import ProjectSvc
-from taskman_api.schemas import ProjectCreate, ProjectList, ProjectResponse, ProjectUpdate
+from taskman_api.schemas import (
+    BatchGetRequest,
+    BatchGetResponse,
+    ProjectCreate,
+    ProjectList,
+    ProjectResponse,
+    ProjectUpdate,
+)
 
 logger = structlog.get_logger()
 
@@ -22,17 +31,29 @@ router = APIRouter()
 # ============================================================================
 # Endpoints (Service Layer Pattern)
 # ============================================================================
-@router.get("", response_model=ProjectList)
+@router.get("", response_model=ProjectList | BatchGetResponse[ProjectResponse])
 async def list_projects(
     service: ProjectSvc,
     status: str | None = Query(None, description="Filter by status"),
     owner: str | None = Query(None, description="Filter by owner"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
-) -> ProjectList:
+    ids: str | None = Query(
+        None, description="Comma-separated ids to fetch in order (see :batchGet); ignores filters"
+    ),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return per item (id is always included)"
+    ),
+) -> ProjectList | BatchGetResponse[ProjectResponse] | Response:
     """
     List all projects with optional filtering and pagination.
+
+    With ``ids``, returns those projects instead (same as ``POST /projects:batchGet``).
     """
+    if ids is not None:
+        return await batch_get_projects(BatchGetRequest.from_query(ids, fields), service)
+
+    selected = parse_fields(fields, ProjectResponse)
     offset = (page - 1) * per_page
 
     status_enum = None
@@ -48,17 +69,44 @@ async def list_projects(
         owner=owner,
         limit=per_page,
         offset=offset,
+        fields=selected,
     )
 
     match result:
         case Ok((projects, total)):
             logger.info("projects_listed", count=len(projects), total=total, page=page)
-            return ProjectList(
-                projects=projects,
-                total=total,
-                page=page,
-                per_page=per_page,
-                has_more=offset + per_page < total,
+            return fieldset_response(
+                ProjectList(
+                    projects=projects,
+                    total=total,
+                    page=page,
+                    per_page=per_page,
+                    has_more=offset + per_page < total,
+                ),
+                selected,
+                key="projects",
+            )
+        case Err(error):
+            raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+
+@router.post(":batchGet", response_model=BatchGetResponse[ProjectResponse])
+async def batch_get_projects(
+    request: BatchGetRequest, service: ProjectSvc
+) -> BatchGetResponse[ProjectResponse] | Response:
+    """
+    Fetch projects by id in one query, in request order; unknown ids are listed in ``missing``.
+    """
+    selected = parse_fields(request.fields, ProjectResponse)
+    result = await service.get_many(request.ids, fields=selected)
+
+    match result:
+        case Ok((projects, missing)):
+            logger.info("projects_batch_fetched", count=len(projects), missing=len(missing))
+            return fieldset_response(
+                BatchGetResponse[ProjectResponse](items=projects, missing=missing),
+                selected,
+                key="items",
             )
         case Err(error):
             raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(error))
@@ -5,14 +5,18 @@ Uses Service Layer for business logic and validation.
 """
 
 import structlog
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi import status as http_status
 
 from taskman_api.core.enums import SprintStatus
 from taskman_api.core.errors import AppError, NotFoundError, ValidationError
+from taskman_api.core.fieldsets import parse_fields
+from taskman_api.core.responses import fieldset_response
 from taskman_api.core.result import Err, Ok
 from taskman_api.dependencies import SprintSvc
 from taskman_api.schemas import (
+    BatchGetRequest,
+    BatchGetResponse,
     SprintCreate,
     SprintList,
     SprintProgress,
@@ -28,17 +32,29 @@ router = APIRouter()
 # ============================================================================
 # Endpoints (Service Layer Pattern)
 # ============================================================================
-@router.get("", response_model=SprintList)
+@router.get("", response_model=SprintList | BatchGetResponse[SprintResponse])
 async def list_sprints(
     service: SprintSvc,
     status: str | None = Query(None, description="Filter by status"),
     project_id: str | None = Query(None, description="Filter by project"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
-) -> SprintList:
+    ids: str | None = Query(
+        None, description="Comma-separated ids to fetch in order (see :batchGet); ignores filters"
+    ),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return per item (id is always included)"
+    ),
+) -> SprintList | BatchGetResponse[SprintResponse] | Response:
     """
     List all sprints with optional filtering and pagination.
+
+    With ``ids``, returns those sprints instead (same as ``POST /sprints:batchGet``).
     """
+    if ids is not None:
+        return await batch_get_sprints(BatchGetRequest.from_query(ids, fields), service)
+
+    selected = parse_fields(fields, SprintResponse)
     offset = (page - 1) * per_page
 
     status_enum = None
@@ -54,17 +70,44 @@ async def list_sprints(
         project_id=project_id,
         limit=per_page,
         offset=offset,
+        fields=selected,
     )
 
     match result:
         case Ok((sprints, total)):
             logger.info("sprints_listed", count=len(sprints), total=total, page=page)
-            return SprintList(
-                sprints=sprints,
-                total=total,
-                page=page,
-                per_page=per_page,
-                has_more=offset + per_page < total,
+            return fieldset_response(
+                SprintList(
+                    sprints=sprints,
+                    total=total,
+                    page=page,
+                    per_page=per_page,
+                    has_more=offset + per_page < total,
+                ),
+                selected,
+                key="sprints",
+            )
+        case Err(error):
+            raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+
+@router.post(":batchGet", response_model=BatchGetResponse[SprintResponse])
+async def batch_get_sprints(
+    request: BatchGetRequest, service: SprintSvc
+) -> BatchGetResponse[SprintResponse] | Response:
+    """
+    Fetch sprints by id in one query, in request order; unknown ids are listed in ``missing``.
+    """
+    selected = parse_fields(request.fields, SprintResponse)
+    result = await service.get_many(request.ids, fields=selected)
+
+    match result:
+        case Ok((sprints, missing)):
+            logger.info("sprints_batch_fetched", count=len(sprints), missing=len(missing))
+            return fieldset_response(
+                BatchGetResponse[SprintResponse](items=sprints, missing=missing),
+                selected,
+                key="items",
             )
         case Err(error):
             raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(error))
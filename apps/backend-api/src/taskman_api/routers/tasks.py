@@ -5,14 +5,23 @@ Uses Service Layer for business logic and validation.
 """
 
 import structlog
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi import status as http_status
 
 from taskman_api.core.enums import TaskStatus
 from taskman_api.core.errors import AppError, ConflictError, NotFoundError, ValidationError
+from taskman_api.core.fieldsets import parse_fields
+from taskman_api.core.responses import fieldset_response
 from taskman_api.core.result import Err, Ok
 from taskman_api.dependencies import TaskSvc
-from taskman_api.schemas import TaskCreate, TaskList, TaskResponse, TaskUpdate
+from taskman_api.schemas import (
+    BatchGetRequest,
+    BatchGetResponse,
+    TaskCreate,
+    TaskList,
+    TaskResponse,
+    TaskUpdate,
+)
 
 logger = structlog.get_logger()
 
@@ -23,7 +32,7 @@ router = APIRouter()
 # ============================================================================
 # Endpoints (Service Layer Pattern)
 # ============================================================================
-@router.get("", response_model=TaskList)
+@router.get("", response_model=TaskList | BatchGetResponse[TaskResponse])
 async def list_tasks(
     service: TaskSvc,
     status: str | None = Query(None, description="Filter by status"),
@@ -34,10 +43,23 @@ async def list_tasks(
     owner: str | None = Query(None, description="Filter by owner"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
-) -> TaskList:
+    ids: str | None = Query(
+        None, description="Comma-separated ids to fetch in order (see :batchGet); ignores filters"
+    ),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return per item (id is always included)"
+    ),
+    include_archived: bool = Query(False, description="Also list archived (long-closed) tasks"),
+) -> TaskList | BatchGetResponse[TaskResponse] | Response:
     """
     List all tasks with optional filtering and pagination.
+
+    With ``ids``, returns those tasks instead (same as ``POST /tasks:batchGet``).
     """
+    if ids is not None:
+        return await batch_get_tasks(BatchGetRequest.from_query(ids, fields), service)
+
+    selected = parse_fields(fields, TaskResponse)
     offset = (page - 1) * per_page
 
     status_enum = None
@@ -67,17 +89,46 @@ async def list_tasks(
         owner=owner,
         limit=per_page,
         offset=offset,
+        fields=selected,
+        include_archived=include_archived,
     )
 
     match result:
         case Ok((tasks, total)):
             logger.info("tasks_listed", count=len(tasks), total=total, page=page)
-            return TaskList(
-                tasks=tasks,  # Tasks are already TaskResponse objects
-                total=total,
-                page=page,
-                per_page=per_page,
-                has_more=offset + per_page < total,
+            # Tasks are already validated TaskResponse objects
+            return fieldset_response(
+                TaskList(
+                    tasks=tasks,
+                    total=total,
+                    page=page,
+                    per_page=per_page,
+                    has_more=offset + per_page < total,
+                ),
+                selected,
+                key="tasks",
+            )
+        case Err(error):
+            raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+
+@router.post(":batchGet", response_model=BatchGetResponse[TaskResponse])
+async def batch_get_tasks(
+    request: BatchGetRequest, service: TaskSvc
+) -> BatchGetResponse[TaskResponse] | Response:
+    """
+    Fetch tasks by id in one query, in request order; unknown ids are listed in ``missing``.
+    """
+    selected = parse_fields(request.fields, TaskResponse)
+    result = await service.get_many(request.ids, fields=selected)
+
+    match result:
+        case Ok((tasks, missing)):
+            logger.info("tasks_batch_fetched", count=len(tasks), missing=len(missing))
+            return fieldset_response(
+                BatchGetResponse[TaskResponse](items=tasks, missing=missing),
+                selected,
+                key="items",
             )
         case Err(error):
             raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(error))
@@ -108,11 +159,15 @@ async def create_task(task: TaskCreate, service: TaskSvc) -> TaskResponse:
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-async def get_task(task_id: str, service: TaskSvc) -> TaskResponse:
+async def get_task(
+    task_id: str,
+    service: TaskSvc,
+    include_archived: bool = Query(False, description="Also look in archived tasks"),
+) -> TaskResponse:
     """
     Get a specific task by ID.
     """
-    result = await service.get(task_id)
+    result = await service.get(task_id, include_archived=include_archived)
 
     match result:
         case Ok(task):
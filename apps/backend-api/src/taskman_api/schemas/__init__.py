@@ -31,6 +31,8 @@ from taskman_api.schemas.action_list import (
 
 # Base classes and mixins
 from taskman_api.schemas.base import (
+    BatchGetRequest,
+    BatchGetResponse,
     BusinessMetricsMixin,
     ContextForgeMixin,
     DependencyMixin,
@@ -57,7 +59,13 @@ from taskman_api.schemas.sprint import (
 )
 
 # Task schemas
-from taskman_api.schemas.task import TaskCreate, TaskList, TaskResponse, TaskUpdate
+from taskman_api.schemas.task import (
+    DashboardSummary,
+    TaskCreate,
+    TaskList,
+    TaskResponse,
+    TaskUpdate,
+)
 
 __all__ = [
     # Enums
@@ -74,6 +82,8 @@ __all__ = [
     "WorkType",
     # Base
     "TaskManBaseModel",
+    "BatchGetRequest",
+    "BatchGetResponse",
     "TimestampMixin",
     "ObservabilityMixin",
     "OwnershipMixin",
@@ -89,6 +99,7 @@ __all__ = [
     "TaskUpdate",
     "TaskResponse",
     "TaskList",
+    "DashboardSummary",
     # Project
     "ProjectCreate",
     "ProjectUpdate",
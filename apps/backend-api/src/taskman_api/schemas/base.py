@@ -3,9 +3,17 @@ Base schemas and mixins for TaskMan-v2 Pydantic models.
 Provides reusable components for timestamps, observability, and ownership.
 """
 from datetime import datetime
-from typing import Any
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import ValidationError as PydanticValidationError
+
+from taskman_api.core.errors import ValidationError
+
+# Maximum number of ids in one batch get
+MAX_BATCH_IDS = 200
+
+TItem = TypeVar("TItem", bound=BaseModel)
 
 
 class TimestampMixin(BaseModel):
@@ -126,6 +134,41 @@ class TaskManBaseModel(BaseModel):
     )
 
 
+class BatchGetRequest(TaskManBaseModel):
+    """Ids to fetch in one query (``POST /<entities>:batchGet``)."""
+
+    ids: list[str] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_IDS, description="Entity ids, in the order wanted"
+    )
+    fields: str | None = Field(
+        None, description="Comma-separated fields to return per item (id is always included)"
+    )
+
+    @classmethod
+    def from_query(cls, ids: str, fields: str | None = None) -> "BatchGetRequest":
+        """Build a request from ``?ids=a,b,c`` query parameters.
+
+        Raises:
+            ValidationError: If no ids or more than MAX_BATCH_IDS are given
+        """
+        try:
+            return cls(ids=[i.strip() for i in ids.split(",") if i.strip()], fields=fields)
+        except PydanticValidationError as e:
+            raise ValidationError(
+                f"ids must list between 1 and {MAX_BATCH_IDS} ids",
+                field="ids",
+                value=ids,
+                validation_errors=e.errors(include_url=False, include_context=False),
+            ) from e
+
+
+class BatchGetResponse(BaseModel, Generic[TItem]):
+    """Entities found by a batch get, in request order, and the ids that were not found."""
+
+    items: list[TItem] = Field(default_factory=list, description="Found entities in request order")
+    missing: list[str] = Field(default_factory=list, description="Requested ids that do not exist")
+
+
 # Aliases for State Store compatibility
 BaseSchema = TaskManBaseModel
 TimestampSchema = TimestampMixin
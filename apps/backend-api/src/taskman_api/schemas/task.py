@@ -331,5 +331,18 @@ class TaskList(TaskManBaseModel):
     per_page: int = Field(..., ge=1, le=100, description="Items per page")
     has_more: bool = Field(..., description="More pages available")
 
+
+class DashboardSummary(TaskManBaseModel):
+    """Task counts per facet for the dashboard, optionally scoped to a project or sprint."""
+
+    project_id: str | None = Field(None, description="Project scope")
+    sprint_id: str | None = Field(None, description="Sprint scope")
+    total: int = Field(..., ge=0, description="Tasks in scope")
+    by_status: dict[str, int] = Field(default_factory=dict, description="Tasks per status")
+    by_priority: dict[str, int] = Field(default_factory=dict, description="Tasks per priority")
+    by_owner: dict[str, int] = Field(default_factory=dict, description="Tasks per owner")
+    by_project: dict[str, int] = Field(default_factory=dict, description="Tasks per project")
+
+
 TaskCreateRequest = TaskCreate
 TaskUpdateRequest = TaskUpdate
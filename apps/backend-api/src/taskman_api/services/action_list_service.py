@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from taskman_api.core.errors import AppError, NotFoundError, ValidationError
 from taskman_api.core.result import Err, Ok, Result
+from taskman_api.db.read_routing import read_only
 from taskman_api.models.action_list import ActionList
 from taskman_api.repositories.action_list_repository import ActionListRepository
 from taskman_api.schemas import (
@@ -17,9 +18,11 @@ from taskman_api.schemas import (
     ActionListResponse,
     ActionListUpdate,
     ReorderItemsRequest,
+    TaskResponse,
 )
 
 from .base import BaseService
+from .task_service import TaskService
 
 # Global counter for ID generation (mimicking legacy router behavior)
 _action_list_counter = 0
@@ -41,6 +44,7 @@ class ActionListService(
         repository = ActionListRepository(session)
         super().__init__(repository, ActionList, ActionListResponse)
         self.action_list_repo = repository
+        self.task_service = TaskService(session)
 
     async def search(
         self,
@@ -315,6 +319,33 @@ class ActionListService(
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @read_only
+    async def get_hydrated_tasks(
+        self, list_id: str, fields: frozenset[str] | None = None
+    ) -> Result[tuple[list[TaskResponse], list[str]], AppError]:
+        """Get the full tasks of a list, in list order, with one join.
+
+        Args:
+            list_id: Action list ID
+            fields: Sparse task fieldset; only its backing columns are loaded
+
+        Returns:
+            Result containing (tasks, task IDs with no task) or error
+        """
+        try:
+            entity = await self.repository.get_by_id(list_id)
+            if not entity:
+                return Err(NotFoundError(f"Action list {list_id} not found"))
+
+            columns, response_class = self.task_service.project_fields(fields)
+            tasks = await self.action_list_repo.get_tasks(list_id, columns=columns)
+            responses = [self.task_service.to_response(task, response_class) for task in tasks]
+            found = {task.id for task in responses}
+            missing = [t for t in entity.task_ids if isinstance(t, str) and t not in found]
+            return Ok((responses, missing))
+        except Exception as e:
+            return Err(AppError(message=str(e)))
+
     async def add_task_to_action_list(
         self, list_id: str, task_id: str
     ) -> Result[ActionListResponse, AppError]:
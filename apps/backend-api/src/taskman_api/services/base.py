@@ -3,17 +3,23 @@
 Provides reusable business logic layer between repositories and API endpoints.
 """
 
-import json
+import typing
+from dataclasses import dataclass
+from functools import cache
 from typing import Any, Generic, TypeVar
 
+import orjson
 import structlog
 from pydantic import BaseModel
 from sqlalchemy import inspect
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.types import JSON, TypeDecorator
 
 from taskman_api.core.errors import AppError, ConflictError, DatabaseError, NotFoundError
+from taskman_api.core.fieldsets import backing_columns, partial_model
 from taskman_api.core.result import Err, Ok, Result
 from taskman_api.db.base import Base
+from taskman_api.db.read_routing import primary_only, read_only
 from taskman_api.repositories.base import BaseRepository
 
 logger = structlog.get_logger(__name__)
@@ -24,6 +30,52 @@ TUpdate = TypeVar("TUpdate", bound=BaseModel)  # Pydantic update request schema
 TResponse = TypeVar("TResponse", bound=BaseModel)  # Pydantic response schema
 
 
+@dataclass(frozen=True, slots=True)
+class JsonFieldPlan:
+    """Per-model column layout used to (de)serialize rows without re-inspecting the mapper.
+
+    Attributes:
+        columns: Mapped column attribute names
+        json_columns: JSON-typed columns and the container each holds (``list``,
+            ``dict``, or ``None`` when the annotation does not say)
+    """
+
+    columns: frozenset[str]
+    json_columns: dict[str, type | None]
+
+
+def _container_type(annotation: Any) -> type | None:
+    """Return ``list`` or ``dict`` from a ``Mapped[...]`` annotation, if it names one."""
+    if isinstance(annotation, str):
+        inner = annotation.removeprefix("Mapped[")
+        return next((t for t in (list, dict) if inner.startswith(t.__name__)), None)
+    for arg in typing.get_args(annotation) or (annotation,):
+        origin = typing.get_origin(arg) or arg
+        if origin in (list, dict):
+            return origin
+        if typing.get_args(arg) and (found := _container_type(arg)):
+            return found
+    return None
+
+
+@cache
+def json_field_plan(model_class: type) -> JsonFieldPlan:
+    """Build (once per model) the column plan used by BaseService serialization."""
+    mapper = inspect(model_class)
+    annotations: dict[str, Any] = {}
+    for klass in reversed(model_class.__mro__):
+        annotations.update(getattr(klass, "__annotations__", {}))
+
+    json_columns: dict[str, type | None] = {}
+    for key, column in mapper.columns.items():
+        column_type = column.type
+        if isinstance(column_type, TypeDecorator):
+            column_type = column_type.impl_instance
+        if isinstance(column_type, JSON):
+            json_columns[key] = _container_type(annotations.get(key))
+    return JsonFieldPlan(columns=frozenset(mapper.columns.keys()), json_columns=json_columns)
+
+
 class BaseService(Generic[TModel, TCreate, TUpdate, TResponse]):
     """Generic service layer with business logic.
 
@@ -43,6 +95,9 @@ class BaseService(Generic[TModel, TCreate, TUpdate, TResponse]):
                 super().__init__(repository, Task, TaskResponse)
     """
 
+    # Response fields stored under a differently named column (field -> column)
+    field_columns: dict[str, str] = {}
+
     def __init__(
         self,
         repository: BaseRepository[TModel],
@@ -59,58 +114,71 @@ class BaseService(Generic[TModel, TCreate, TUpdate, TResponse]):
         self.repository = repository
         self.model_class = model_class
         self.response_class = response_class
+        self.json_plan = json_field_plan(model_class)
+
+    def project_fields(
+        self, fields: frozenset[str] | None
+    ) -> tuple[list[str] | None, type[TResponse]]:
+        """Columns to load and schema to validate with for a sparse fieldset.
+
+        Args:
+            fields: Selected response fields (see ``core.fieldsets.parse_fields``),
+                or None for full rows
+
+        Returns:
+            (columns, response class); columns is None when every column is loaded
+        """
+        if fields is None:
+            return None, self.response_class
+        columns = backing_columns(
+            self.response_class, fields, self.json_plan.columns, self.field_columns
+        )
+        return columns, partial_model(self.response_class, fields)  # type: ignore[return-value]
 
     def _serialize_json_fields(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Serialize list/dict fields to JSON strings for SQLite compatibility.
+        """Keep only mapped columns from request data.
 
-        Inspects the model to find columns that might need serialization.
-        Currently serializes ALL list/dict values found in data if they map to a column.
+        JSON columns take lists and dicts as-is; the column type encodes them
+        (JSONB on PostgreSQL, JSON text on SQLite).
         """
-        mapper = inspect(self.model_class)
-        valid_columns = set(mapper.columns.keys())
-
-        serialized_data = {}
-        for key, value in data.items():
-            if key in valid_columns:
-                # Auto-serialize lists and dicts to JSON strings
-                if isinstance(value, (list, dict)):
-                    try:
-                        serialized_data[key] = json.dumps(value)
-                    except (TypeError, ValueError):
-                        # Fallback if not serializable
-                        serialized_data[key] = value
-                else:
-                    serialized_data[key] = value
-        return serialized_data
+        columns = self.json_plan.columns
+        return {key: value for key, value in data.items() if key in columns}
 
     def _deserialize_json_fields(self, entity: TModel) -> dict[str, Any]:
-        """Deserialize JSON strings back to list/dict for Pydantic validation.
+        """Convert an entity to a dict for Pydantic validation.
 
-        Converts entity to dict and attempts to parse JSON strings.
+        JSON columns load as lists/dicts from the driver, so only JSON columns
+        holding a string are decoded: rows written before JSON values were
+        stored natively hold a JSON-encoded string.
         """
         # Convert entity to dict, excluding internal SQLAlchemy state
         data = {k: v for k, v in entity.__dict__.items() if not k.startswith("_")}
 
-        mapper = inspect(self.model_class)
-        valid_columns = set(mapper.columns.keys())
-
-        deserialized_data = data.copy()
-
-        for key, value in data.items():
-            if key in valid_columns and isinstance(value, str):
-                stripped = value.strip()
-                # Heuristic check for JSON array or object
-                if (stripped.startswith("{") and stripped.endswith("}")) or (
-                    stripped.startswith("[") and stripped.endswith("]")
-                ):
-                    try:
-                        deserialized_data[key] = json.loads(value)
-                    except json.JSONDecodeError:
-                        # Keep original string if not valid JSON
-                        pass
-
-        return deserialized_data
+        for key, container in self.json_plan.json_columns.items():
+            value = data.get(key)
+            if type(value) is not str:
+                continue
+            try:
+                decoded = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                continue  # Keep original string if not valid JSON
+            if isinstance(decoded, container or (list, dict)):
+                data[key] = decoded
+
+        return data
+
+    def to_response(
+        self, entity: TModel, response_class: type[TResponse] | None = None
+    ) -> TResponse:
+        """Validate an entity into ``response_class`` (default: this service's response schema).
+
+        Pass the response class from ``project_fields`` for sparse fieldsets.
+        """
+        return (response_class or self.response_class).model_validate(
+            self._deserialize_json_fields(entity)
+        )
 
+    @primary_only
     async def create(
         self,
         request: TCreate,
@@ -161,6 +229,7 @@ class BaseService(Generic[TModel, TCreate, TUpdate, TResponse]):
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @read_only
     async def get(
         self,
         entity_id: str,
@@ -193,6 +262,45 @@ class BaseService(Generic[TModel, TCreate, TUpdate, TResponse]):
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @read_only
+    async def get_many(
+        self,
+        entity_ids: list[str],
+        fields: frozenset[str] | None = None,
+    ) -> Result[tuple[list[TResponse], list[str]], AppError]:
+        """Get entities by ID with a single query.
+
+        Args:
+            entity_ids: Entity identifiers; duplicates are returned once
+            fields: Sparse fieldset; only its backing columns are loaded
+
+        Returns:
+            Result containing (entities in request order, IDs not found) or error
+        """
+        try:
+            requested = list(dict.fromkeys(entity_ids))
+            columns, response_class = self.project_fields(fields)
+            entities = await self.repository.get_by_ids(requested, columns=columns)
+
+            found = {str(e.id): e for e in entities}
+            responses = [
+                self.to_response(found[entity_id], response_class)
+                for entity_id in requested
+                if entity_id in found
+            ]
+            missing = [entity_id for entity_id in requested if entity_id not in found]
+
+            logger.debug(
+                "service.get_many.success",
+                model=self.model_class.__name__,
+                found=len(responses),
+                missing=len(missing),
+            )
+            return Ok((responses, missing))
+        except Exception as e:
+            return Err(AppError(message=str(e)))
+
+    @primary_only
     async def update(
         self,
         entity_id: str,
@@ -248,6 +356,7 @@ class BaseService(Generic[TModel, TCreate, TUpdate, TResponse]):
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @primary_only
     async def delete(
         self,
         entity_id: str,
@@ -280,28 +389,36 @@ class BaseService(Generic[TModel, TCreate, TUpdate, TResponse]):
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @read_only
     async def list(
         self,
         limit: int = 100,
         offset: int = 0,
+        fields: frozenset[str] | None = None,
     ) -> Result[list[TResponse], AppError]:
         """List entities with pagination.
 
         Args:
             limit: Maximum number of results (default: 100, max: 1000)
             offset: Number of results to skip (default: 0)
+            fields: Sparse fieldset; only its backing columns are loaded
 
         Returns:
             Result containing list of entity responses or error
         """
         try:
-            entities = await self.repository.get_all(limit=limit, offset=offset)
+            columns, response_class = self.project_fields(fields)
+            if columns is None:
+                entities = await self.repository.get_all(limit=limit, offset=offset)
+            else:
+                entities = await self.repository.get_all(
+                    limit=limit, offset=offset, columns=columns
+                )
 
             # Deserialize JSON fields for each entity
             responses = []
             for e in entities:
-                response_data = self._deserialize_json_fields(e)
-                responses.append(self.response_class.model_validate(response_data))
+                responses.append(self.to_response(e, response_class))
 
             logger.debug(
                 "service.list.success", model=self.model_class.__name__, count=len(responses)
@@ -310,6 +427,7 @@ class BaseService(Generic[TModel, TCreate, TUpdate, TResponse]):
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @read_only
     async def exists(
         self,
         entity_id: str,
@@ -328,6 +446,7 @@ class BaseService(Generic[TModel, TCreate, TUpdate, TResponse]):
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @read_only
     async def count(self) -> Result[int, DatabaseError]:
         """Count total entities.
 
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import flag_modified
 
 from taskman_api.core.errors import AppError, ConflictError, NotFoundError, ValidationError
+from taskman_api.core.fieldsets import backing_columns, partial_model
 from taskman_api.core.result import Err, Ok, Result
 from taskman_api.models.conversation import ConversationSession, ConversationTurn
 from taskman_api.repositories.conversation_repository import (
@@ -25,7 +26,7 @@ from taskman_api.schemas.conversation import (
     ConversationTurnResponse,
 )
 
-from .base import BaseService
+from .base import BaseService, json_field_plan
 
 
 def generate_conversation_id() -> str:
@@ -74,6 +75,7 @@ class ConversationSessionService(
         super().__init__(repository, ConversationSession, ConversationSessionResponse)
         self.conv_repo = repository
         self.turn_repo = ConversationTurnRepository(session)
+        self.turn_plan = json_field_plan(ConversationTurn)
         self.db_session = session
 
     async def create(
@@ -260,10 +262,14 @@ class ConversationSessionService(
         turn = ConversationTurn(**turn_data)
         try:
             created_turn = await self.turn_repo.create(turn)
-            # Update conversation stats
-            conversation.turn_count = next_seq
-            conversation.token_estimate += created_turn.token_count
-            await self.repository.update(conversation)
+            # Update the conversation's running totals
+            totals_result = await self.conv_repo.add_to_totals(
+                conversation_id, turns=1, tokens=created_turn.token_count
+            )
+            if isinstance(totals_result, Err):
+                return totals_result
+            await self.db_session.commit()
+            self.db_session.expire(conversation, ["turn_count", "token_estimate", "updated_at"])
 
             response = ConversationTurnResponse.model_validate(created_turn)
             return Ok(response)
@@ -275,6 +281,7 @@ class ConversationSessionService(
         conversation_id: str,
         limit: int = 100,
         offset: int = 0,
+        fields: frozenset[str] | None = None,
     ) -> Result[list[ConversationTurnResponse], NotFoundError | AppError]:
         """Get turns for a conversation.
 
@@ -282,6 +289,8 @@ class ConversationSessionService(
             conversation_id: Parent conversation ID
             limit: Maximum results
             offset: Results to skip
+            fields: Sparse fieldset; only its backing columns are loaded, so
+                compressed content is decompressed only when requested
 
         Returns:
             Result containing list of turns or error
@@ -302,14 +311,28 @@ class ConversationSessionService(
             case Ok(True):
                 pass
 
+        if fields is None:
+            result = await self.turn_repo.find_by_conversation(conversation_id, limit, offset)
+            match result:
+                case Ok(turns):
+                    return Ok([ConversationTurnResponse.model_validate(t) for t in turns])
+                case Err(error):
+                    return Err(error)
+
+        columns = backing_columns(ConversationTurnResponse, fields, self.turn_plan.columns)
+        response_class = partial_model(ConversationTurnResponse, fields)
         result = await self.turn_repo.find_by_conversation(
-            conversation_id, limit, offset
+            conversation_id, limit, offset, columns=columns
         )
 
         match result:
             case Ok(turns):
+                # Unloaded columns are absent from __dict__ (attribute access would lazy-load)
                 responses = [
-                    ConversationTurnResponse.model_validate(t) for t in turns
+                    response_class.model_validate(
+                        {k: v for k, v in t.__dict__.items() if not k.startswith("_")}
+                    )
+                    for t in turns
                 ]
                 return Ok(responses)
             case Err(error):
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from taskman_api.core.enums import PhaseStatus, ProjectStatus
 from taskman_api.core.errors import AppError, NotFoundError
 from taskman_api.core.result import Err, Ok, Result
+from taskman_api.db.read_routing import primary_only, read_only
 from taskman_api.db.session import manager
 from taskman_api.models.project import Project
 from taskman_api.repositories.postgres_project_repository import PostgresProjectRepository
@@ -53,12 +54,14 @@ class ProjectService(
         self.task_repo = TaskRepository(session)
         self.session = session
 
+    @read_only
     async def search(
         self,
         status: ProjectStatus | None = None,
         owner: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        fields: frozenset[str] | None = None,
     ) -> Result[tuple[list[ProjectResponse], int], AppError]:
         """Search projects with filters.
 
@@ -67,6 +70,7 @@ class ProjectService(
             owner: Optional owner filter
             limit: Maximum results
             offset: Results to skip
+            fields: Sparse fieldset; only its backing columns are loaded
 
         Returns:
             Result containing (projects, total_count) or error
@@ -74,22 +78,22 @@ class ProjectService(
         try:
             repo_status = status.value if status else None
 
+            columns, response_class = self.project_fields(fields)
             projects, total = await self.project_repo.search(
                 status=repo_status,
                 owner=owner,
                 limit=limit,
                 offset=offset,
+                columns=columns,
             )
 
-            responses = [
-                self.response_class.model_validate(self._deserialize_json_fields(project))
-                for project in projects
-            ]
+            responses = [self.to_response(project, response_class) for project in projects]
 
             return Ok((responses, total))
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @read_only
     async def get_metrics(
         self,
         project_id: str,
@@ -125,9 +129,9 @@ class ProjectService(
             case Ok(_):
                 pass
 
-        # Get all tasks for project
+        # Get all tasks for project, archived ones included
         tasks_result = await self.task_repo.find_by_project(
-            project_id, status=None, limit=1000, offset=0
+            project_id, status=None, limit=1000, offset=0, include_archived=True
         )
 
         match tasks_result:
@@ -180,6 +184,7 @@ class ProjectService(
 
                 return Ok(metrics)
 
+    @primary_only
     async def add_sprint(
         self,
         project_id: str,
@@ -217,6 +222,7 @@ class ProjectService(
                     # Sprint already in project, return current state
                     return Ok(project_response)
 
+    @primary_only
     async def remove_sprint(
         self,
         project_id: str,
@@ -251,6 +257,7 @@ class ProjectService(
                     # Sprint not in project, return current state
                     return Ok(project_response)
 
+    @primary_only
     async def change_status(
         self,
         project_id: str,
@@ -271,6 +278,7 @@ class ProjectService(
         update_request = ProjectUpdateRequest(status=new_status)
         return await self.update(project_id, update_request)
 
+    @read_only
     async def get_by_status(
         self,
         status: ProjectStatus,
@@ -305,6 +313,7 @@ class ProjectService(
             case Err(error):
                 return Err(error)
 
+    @read_only
     async def get_by_owner(
         self,
         owner: str,
@@ -340,6 +349,7 @@ class ProjectService(
     # Phase Query Methods
     # =========================================================================
 
+    @read_only
     async def get_by_phase_status(
         self,
         phase_name: str,
@@ -378,6 +388,7 @@ class ProjectService(
             case Err(error):
                 return Err(error)
 
+    @read_only
     async def get_with_blocked_phases(
         self,
         limit: int = 100,
@@ -410,6 +421,7 @@ class ProjectService(
             case Err(error):
                 return Err(error)
 
+    @read_only
     async def get_by_current_phase(
         self,
         phase_name: str,
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from taskman_api.core.enums import PhaseStatus, SprintStatus, TaskStatus
 from taskman_api.core.errors import AppError, NotFoundError
 from taskman_api.core.result import Err, Ok, Result
+from taskman_api.db.read_routing import primary_only, read_only
 from taskman_api.db.session import manager
 from taskman_api.models.sprint import Sprint
 from taskman_api.repositories.postgres_sprint_repository import PostgresSprintRepository
@@ -47,6 +48,8 @@ class SprintService(
                 print(f"Sprint velocity: {points} points")
     """
 
+    field_columns = {"primary_project": "project_id"}
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize SprintService with session.
 
@@ -64,12 +67,14 @@ class SprintService(
         self.project_repo = ProjectRepository(session)
         self.session = session
 
+    @read_only
     async def search(
         self,
         status: SprintStatus | None = None,
         project_id: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        fields: frozenset[str] | None = None,
     ) -> Result[tuple[list[SprintResponse], int], AppError]:
         """Search sprints with filters.
 
@@ -78,6 +83,7 @@ class SprintService(
             project_id: Optional project filter
             limit: Maximum results
             offset: Results to skip
+            fields: Sparse fieldset; only its backing columns are loaded
 
         Returns:
             Result containing (sprints, total_count) or error
@@ -85,22 +91,22 @@ class SprintService(
         try:
             repo_status = status.value if status else None
 
+            columns, response_class = self.project_fields(fields)
             sprints, total = await self.sprint_repo.search(
                 status=repo_status,
                 project_id=project_id,
                 limit=limit,
                 offset=offset,
+                columns=columns,
             )
 
-            responses = [
-                self.response_class.model_validate(self._deserialize_json_fields(sprint))
-                for sprint in sprints
-            ]
+            responses = [self.to_response(sprint, response_class) for sprint in sprints]
 
             return Ok((responses, total))
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @read_only
     async def get_progress(
         self,
         sprint_id: str,
@@ -127,8 +133,10 @@ class SprintService(
             # Reuse burndown calculation for internal logic if efficient,
             # but here we just need summary stats.
 
-            # Get all tasks
-            tasks = await self.task_repo.get_by_sprint(sprint_id, limit=1000)
+            # Get all tasks, including archived ones so closed work still counts
+            tasks = await self.task_repo.get_by_sprint(
+                sprint_id, limit=1000, include_archived=True
+            )
 
             total_tasks = len(tasks)
             completed_tasks = [t for t in tasks if t.status == TaskStatus.DONE]
@@ -162,6 +170,7 @@ class SprintService(
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @primary_only
     async def create(self, create_data: SprintCreateRequest) -> Result[SprintResponse, AppError]:
         """Create a new sprint with validation.
 
@@ -191,6 +200,7 @@ class SprintService(
             data["primary_project"] = data["project_id"]
         return data
 
+    @read_only
     async def calculate_velocity(
         self,
         sprint_id: str,
@@ -219,9 +229,9 @@ class SprintService(
             case Ok(_):
                 pass
 
-        # Get all completed tasks in sprint
+        # Get all completed tasks in sprint, archived ones included
         tasks_result = await self.task_repo.find_by_sprint(
-            sprint_id, status=TaskStatus.DONE, limit=1000, offset=0
+            sprint_id, status=TaskStatus.DONE, limit=1000, offset=0, include_archived=True
         )
 
         match tasks_result:
@@ -234,6 +244,7 @@ class SprintService(
                 )
                 return Ok(total_points)
 
+    @read_only
     async def get_burndown(
         self,
         sprint_id: str,
@@ -272,9 +283,9 @@ class SprintService(
             case Ok(sprint):
                 pass
 
-        # Get all tasks in sprint
+        # Get all tasks in sprint, archived ones included
         all_tasks_result = await self.task_repo.find_by_sprint(
-            sprint_id, status=None, limit=1000, offset=0
+            sprint_id, status=None, limit=1000, offset=0, include_archived=True
         )
 
         match all_tasks_result:
@@ -288,7 +299,11 @@ class SprintService(
 
                 # Get completed tasks
                 completed_tasks_result = await self.task_repo.find_by_sprint(
-                    sprint_id, status=TaskStatus.DONE, limit=1000, offset=0
+                    sprint_id,
+                    status=TaskStatus.DONE,
+                    limit=1000,
+                    offset=0,
+                    include_archived=True,
                 )
 
                 match completed_tasks_result:
@@ -330,6 +345,7 @@ class SprintService(
 
                         return Ok(burndown_data)
 
+    @primary_only
     async def change_status(
         self,
         sprint_id: str,
@@ -350,6 +366,7 @@ class SprintService(
         update_request = SprintUpdateRequest(status=new_status)
         return await self.update(sprint_id, update_request)
 
+    @read_only
     async def get_current_sprints(
         self,
         current_date: date | None = None,
@@ -385,6 +402,7 @@ class SprintService(
             case Err(error):
                 return Err(error)
 
+    @read_only
     async def get_by_project(
         self,
         project_id: str,
@@ -417,6 +435,7 @@ class SprintService(
             case Err(error):
                 return Err(error)
 
+    @read_only
     async def get_by_status(
         self,
         status: SprintStatus,
@@ -447,6 +466,7 @@ class SprintService(
             case Err(error):
                 return Err(error)
 
+    @primary_only
     async def update_metrics(
         self,
         sprint_id: str,
@@ -481,6 +501,7 @@ class SprintService(
     # Phase Query Methods
     # =========================================================================
 
+    @read_only
     async def get_by_phase_status(
         self,
         phase_name: str,
@@ -518,6 +539,7 @@ class SprintService(
             case Err(error):
                 return Err(error)
 
+    @read_only
     async def get_with_blocked_phases(
         self,
         limit: int = 100,
@@ -549,6 +571,7 @@ class SprintService(
             case Err(error):
                 return Err(error)
 
+    @read_only
     async def get_by_current_phase(
         self,
         phase_name: str,
@@ -3,6 +3,8 @@
 Handles task operations, status transitions, and task management.
 """
 
+import os
+import time
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,16 +15,53 @@ from taskman_api.core.errors import (
     ValidationError,
 )
 from taskman_api.core.result import Err, Ok, Result
+from taskman_api.db.read_routing import primary_only, read_only
 from taskman_api.db.session import manager
 from taskman_api.models.task import Task
 from taskman_api.repositories.postgres_task_repository import PostgresTaskRepository
 from taskman_api.repositories.project_repository import ProjectRepository
 from taskman_api.repositories.sprint_repository import SprintRepository
-from taskman_api.repositories.task_repository import TaskRepository
-from taskman_api.schemas.task import TaskCreateRequest, TaskResponse, TaskUpdateRequest
+from taskman_api.repositories.task_repository import SUMMARY_FACETS, TaskRepository
+from taskman_api.schemas.task import (
+    DashboardSummary,
+    TaskCreateRequest,
+    TaskResponse,
+    TaskUpdateRequest,
+)
 
 from .base import BaseService
 
+# Dashboard summaries are reused per (project, sprint, include_archived) scope for
+# TASKMAN_DASHBOARD_CACHE_TTL seconds (0 disables caching)
+DEFAULT_SUMMARY_TTL_SECONDS = 10.0
+MAX_CACHED_SUMMARIES = 256
+_summary_cache: dict[tuple[str | None, str | None, bool], tuple[float, DashboardSummary]] = {}
+
+
+def _summary_ttl() -> float:
+    try:
+        return float(os.environ.get("TASKMAN_DASHBOARD_CACHE_TTL", DEFAULT_SUMMARY_TTL_SECONDS))
+    except ValueError:
+        return DEFAULT_SUMMARY_TTL_SECONDS
+
+
+def clear_summary_cache() -> None:
+    """Drop every cached dashboard summary."""
+    _summary_cache.clear()
+
+
+def _cache_summary(scope: tuple[str | None, str | None, bool], summary: DashboardSummary) -> None:
+    ttl = _summary_ttl()
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    if len(_summary_cache) >= MAX_CACHED_SUMMARIES:
+        for key in [key for key, (expires, _) in _summary_cache.items() if expires <= now]:
+            del _summary_cache[key]
+        if len(_summary_cache) >= MAX_CACHED_SUMMARIES:
+            del _summary_cache[next(iter(_summary_cache))]
+    _summary_cache[scope] = (now + ttl, summary)
+
 
 class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskResponse]):
     """Task business logic and operations.
@@ -59,6 +98,7 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
         self.project_repo = ProjectRepository(session)
         self.sprint_repo = SprintRepository(session)
 
+    @primary_only
     async def create(
         self, create_data: TaskCreateRequest
     ) -> Result[TaskResponse, ValidationError | AppError]:
@@ -94,6 +134,7 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
 
         return await super().create(create_data)
 
+    @primary_only
     async def update(
         self,
         id: str,
@@ -134,6 +175,7 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
 
         return await super().update(id, update_data)
 
+    @primary_only
     async def change_status(
         self,
         task_id: str,
@@ -231,6 +273,7 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
 
         return new in valid_transitions.get(current, [])
 
+    @primary_only
     async def assign_to_sprint(
         self,
         task_id: str,
@@ -258,6 +301,7 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
         update_request = TaskUpdateRequest(primary_sprint=sprint_id)
         return await self.update(task_id, update_request)
 
+    @primary_only
     async def assign_to_project(
         self,
         task_id: str,
@@ -283,6 +327,7 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
         update_request = TaskUpdateRequest(primary_project=project_id)
         return await self.update(task_id, update_request)
 
+    @primary_only
     async def bulk_update(
         self,
         updates: list[dict],
@@ -331,6 +376,7 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
 
         return Ok(results)
 
+    @read_only
     async def search(
         self,
         status: TaskStatus | None = None,
@@ -341,6 +387,8 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
         assignee: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        fields: frozenset[str] | None = None,
+        include_archived: bool = False,
     ) -> Result[tuple[list[TaskResponse], int], AppError]:
         """Search tasks with filters.
 
@@ -355,6 +403,8 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
             assignee: Optional assignee filter
             limit: Maximum results (default: 100, max: 1000)
             offset: Results to skip (default: 0)
+            fields: Sparse fieldset; only its backing columns are loaded
+            include_archived: Also search archived tasks (see db.archival)
 
         Returns:
             Result containing (tasks, total_count) or error
@@ -375,6 +425,7 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
             repo_status = status.value if status else None
             repo_priority = priority.value if priority else None
 
+            columns, response_class = self.project_fields(fields)
             tasks, total = await self.task_repo.search(
                 status=repo_status,
                 priority=repo_priority,
@@ -384,18 +435,98 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
                 owner=owner,  # Added assignee to service method arg too
                 limit=limit,
                 offset=offset,
+                columns=columns,
+                include_archived=include_archived,
             )
 
-            responses = [
-                self.response_class.model_validate(self._deserialize_json_fields(task))
-                for task in tasks
-            ]
+            responses = [self.to_response(task, response_class) for task in tasks]
 
             return Ok((responses, total))
 
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @read_only
+    async def get_dashboard_summary(
+        self,
+        project_id: str | None = None,
+        sprint_id: str | None = None,
+        include_archived: bool = False,
+    ) -> Result[DashboardSummary, AppError]:
+        """Count tasks by status, priority, owner and project in one query.
+
+        Summaries are cached per scope for a few seconds, so dashboards polling
+        the same scope share one query.
+
+        Args:
+            project_id: Optional project scope
+            sprint_id: Optional sprint scope
+            include_archived: Also count archived tasks
+
+        Returns:
+            Result containing the summary or error
+        """
+        scope = (project_id, sprint_id, include_archived)
+        cached = _summary_cache.get(scope)
+        if cached is not None and cached[0] > time.monotonic():
+            return Ok(cached[1])
+
+        try:
+            rows = await self.task_repo.facet_counts(
+                project_id=project_id, sprint_id=sprint_id, include_archived=include_archived
+            )
+        except Exception as e:
+            return Err(AppError(message=str(e)))
+
+        total = 0
+        facets: dict[str, dict[str, int]] = {name: {} for name in SUMMARY_FACETS}
+        for facet, value, count in rows:
+            if facet == "total":
+                total = count
+            else:
+                facets[facet][value or ""] = count
+
+        summary = DashboardSummary(
+            project_id=project_id,
+            sprint_id=sprint_id,
+            total=total,
+            **{f"by_{name}": counts for name, counts in facets.items()},
+        )
+        _cache_summary(scope, summary)
+        return Ok(summary)
+
+    @read_only
+    async def get(
+        self,
+        entity_id: str,
+        include_archived: bool = False,
+    ) -> Result[TaskResponse, NotFoundError | AppError]:
+        """Get task by ID, falling back to the archive with ``include_archived``.
+
+        Args:
+            entity_id: Task identifier
+            include_archived: Also look the task up in the archive
+
+        Returns:
+            Result containing task response or error
+        """
+        if not include_archived:
+            return await super().get(entity_id)
+        try:
+            task = await self.task_repo.get_including_archived(entity_id)
+            if task is None:
+                return Err(
+                    NotFoundError(
+                        message=f"Task not found: {entity_id}",
+                        entity_id=entity_id,
+                        entity_type="Task",
+                    )
+                )
+            return Ok(self.to_response(task))
+        except Exception as e:
+            return Err(AppError(message=str(e)))
+
+    @read_only
     async def get_high_priority_tasks(
         self,
         limit: int = 100,
@@ -418,14 +549,12 @@ class TaskService(BaseService[Task, TaskCreateRequest, TaskUpdateRequest, TaskRe
         """
         try:
             tasks = await self.task_repo.find_high_priority_tasks(limit, offset)
-            responses = [
-                self.response_class.model_validate(self._deserialize_json_fields(task))
-                for task in tasks
-            ]
+            responses = [self.to_response(task) for task in tasks]
             return Ok(responses)
         except Exception as e:
             return Err(AppError(message=str(e)))
 
+    @read_only
     async def get_blocked_tasks(
         self,
         limit: int = 100,
@@ -3,6 +3,9 @@
 Provides:
 - Circuit breaker pattern for OTLP exports
 - Prometheus metrics for circuit breaker state
+- Prometheus request latency, DB query and connection pool metrics
+- Request-scoped SQL statement tracking (query budgets, N+1 detection)
+- On-demand sampling profiler producing flamegraph collapsed stacks
 - Health check endpoint integration
 """
 
@@ -17,6 +20,9 @@ from .metrics import (
     record_circuit_success,
     record_span_export,
 )
+from .profiler import ProfileStore, SamplingProfiler
+from .query_tracker import QueryStats, track_queries
+from .request_metrics import instrument_engine, record_request, register_pool_metrics
 
 __all__ = [
     "CircuitBreakerSpanExporter",
@@ -26,4 +32,11 @@ __all__ = [
     "record_circuit_state",
     "record_circuit_success",
     "record_span_export",
+    "instrument_engine",
+    "record_request",
+    "register_pool_metrics",
+    "ProfileStore",
+    "QueryStats",
+    "SamplingProfiler",
+    "track_queries",
 ]
@@ -7,16 +7,24 @@ Prevents cascading failures when OTLP backend is unreachable:
 
 Fixes:
 - B1: Returns SpanExportResult.FAILURE instead of raising
+
+The gRPC OTLP exporter (and grpc itself) is only imported when the first span
+is exported, so workers and CLI commands that never export pay nothing for it.
 """
 
+from __future__ import annotations
+
 from collections.abc import Sequence
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import structlog
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
 
+if TYPE_CHECKING:
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.trace import ReadableSpan
+
 
 class CircuitBreakerSpanExporter(SpanExporter):
     """Span exporter with circuit breaker pattern.
@@ -37,7 +45,8 @@ class CircuitBreakerSpanExporter(SpanExporter):
         success_threshold: int = 1,
     ):
         """Initialize circuit breaker exporter."""
-        self.otlp_exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
+        self.otlp_endpoint = otlp_endpoint
+        self._otlp_exporter: OTLPSpanExporter | None = None
         self.failure_threshold = failure_threshold
         self.success_threshold = success_threshold
 
@@ -60,6 +69,17 @@ class CircuitBreakerSpanExporter(SpanExporter):
         # ^ This code relies on imports that were at the bottom.
         # I should check where imports are.
 
+    @property
+    def otlp_exporter(self) -> OTLPSpanExporter:
+        """Wrapped OTLP exporter, created on first use."""
+        if self._otlp_exporter is None:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                OTLPSpanExporter,
+            )
+
+            self._otlp_exporter = OTLPSpanExporter(endpoint=self.otlp_endpoint)
+        return self._otlp_exporter
+
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         """Export spans with circuit breaker protection.
 
@@ -153,7 +173,8 @@ class CircuitBreakerSpanExporter(SpanExporter):
 
     def shutdown(self) -> None:
         """Shutdown the exporter."""
-        self.otlp_exporter.shutdown()
+        if self._otlp_exporter is not None:
+            self._otlp_exporter.shutdown()
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """Force flush pending spans."""
@@ -0,0 +1,71 @@
+"""Prometheus metrics for compressed columns (see db.custom_types.CompressedText).
+
+Provides:
+- Bytes written per column before and after compression; their quotient is
+  the column's overall compression ratio
+- Values written per column and encoding (raw / zlib)
+- Compression ratio distribution of compressed values
+- Decompressions per column, to confirm reads that skip a column never decode it
+
+Record functions are wrapped in try/except (see metrics.py, M2).
+"""
+
+import structlog
+from prometheus_client import Counter, Histogram
+
+from .metrics import _should_log_failure
+
+logger = structlog.get_logger(__name__)
+
+db_compression_original_bytes_total = Counter(
+    "db_compression_original_bytes_total",
+    "Bytes of column values written to compressed columns, before compression",
+    ["column"],
+)
+
+db_compression_stored_bytes_total = Counter(
+    "db_compression_stored_bytes_total",
+    "Bytes stored for column values written to compressed columns",
+    ["column"],
+)
+
+db_compression_values_total = Counter(
+    "db_compression_values_total",
+    "Values written to compressed columns, per encoding (raw, zlib)",
+    ["column", "encoding"],
+)
+
+db_compression_ratio = Histogram(
+    "db_compression_ratio",
+    "Original to stored size of compressed values",
+    ["column"],
+    buckets=(1.25, 1.5, 2.0, 3.0, 4.0, 6.0, 8.0, 12.0, 16.0, 32.0),
+)
+
+db_decompressions_total = Counter(
+    "db_decompressions_total",
+    "Compressed values decompressed on read",
+    ["column"],
+)
+
+
+def record_compressed_write(column: str, encoding: str, original: int, stored: int) -> None:
+    """Record one value written to ``column``: its size before and after encoding."""
+    try:
+        db_compression_original_bytes_total.labels(column=column).inc(original)
+        db_compression_stored_bytes_total.labels(column=column).inc(stored)
+        db_compression_values_total.labels(column=column, encoding=encoding).inc()
+        if encoding != "raw":
+            db_compression_ratio.labels(column=column).observe(original / stored)
+    except Exception as e:
+        if _should_log_failure("record_compressed_write"):
+            logger.warning("metric_recording_failed", metric="db_compression", error=str(e))
+
+
+def record_decompression(column: str) -> None:
+    """Count one compressed value of ``column`` decoded on read."""
+    try:
+        db_decompressions_total.labels(column=column).inc()
+    except Exception as e:
+        if _should_log_failure("record_decompression"):
+            logger.warning("metric_recording_failed", metric="db_decompressions", error=str(e))
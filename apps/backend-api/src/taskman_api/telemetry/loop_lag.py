@@ -0,0 +1,83 @@
+"""Event-loop lag monitor.
+
+A background task sleeps for ``interval`` seconds and measures how late it
+wakes up. A busy loop wakes it late: CPU-bound handlers, synchronous I/O, or
+more ready callbacks than the loop can run. That delay is the time every
+ready request waits before it can make progress.
+
+The reported lag rises immediately and decays smoothly, so one quiet sample
+does not hide a saturated loop. It is exported as ``event_loop_lag_seconds``
+and read by admission control (AdmissionControlMiddleware).
+"""
+
+import asyncio
+import contextlib
+
+import structlog
+from prometheus_client import Gauge
+
+from .metrics import _should_log_failure
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_INTERVAL = 0.1
+
+# Fraction of the gap closed per sample while lag is falling
+DEFAULT_DECAY = 0.3
+
+event_loop_lag_seconds = Gauge(
+    "event_loop_lag_seconds",
+    "Smoothed delay of the event loop in running a due timer",
+)
+
+
+class LoopLagMonitor:
+    """Samples event-loop lag in a background task."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, decay: float = DEFAULT_DECAY) -> None:
+        self.interval = interval
+        self.decay = decay
+        self.lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> asyncio.Task:
+        """Start sampling on the running loop (idempotent)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="event-loop-lag-monitor")
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop sampling and reset the lag to 0."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self.lag = 0.0
+
+    def observe(self, sample: float) -> float:
+        """Fold one lag sample into the smoothed lag (fast attack, slow decay)."""
+        if sample >= self.lag:
+            self.lag = sample
+        else:
+            self.lag += (sample - self.lag) * self.decay
+        try:
+            event_loop_lag_seconds.set(self.lag)
+        except Exception as e:
+            if _should_log_failure("record_loop_lag"):
+                logger.warning("metric_recording_failed", metric="event_loop_lag", error=str(e))
+        return self.lag
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.observe(max(loop.time() - started - self.interval, 0.0))
+
+
+loop_lag_monitor = LoopLagMonitor()
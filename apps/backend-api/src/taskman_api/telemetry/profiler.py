@@ -0,0 +1,289 @@
+"""On-demand sampling profiler for single requests.
+
+A daemon thread samples the stack of one asyncio task at a fixed interval and
+aggregates the samples into flamegraph-compatible collapsed stacks
+(``frame;frame;frame count`` lines, as consumed by flamegraph.pl, speedscope
+and inferno).
+
+While the task is running, its stack is read from the event loop thread
+(``sys._current_frames``). While it is suspended, the await chain is walked
+(``cr_await``) instead, so wall-clock time spent waiting on the database shows
+up under the awaiting frames rather than disappearing into the event loop.
+
+Each stack is prefixed with a category root frame so the flamegraph separates:
+- ``db``: SQLAlchemy and DBAPI drivers (queries and awaits on them)
+- ``pydantic``: request/response validation and model construction
+- ``json``: JSON encoding and response rendering
+- ``await``: other suspended time (sleeps, network, queues)
+- ``app``: everything else
+
+Profiles are kept in a ``ProfileStore`` directory so they can be fetched after
+the profiled request has returned.
+
+Usage:
+    profiler = SamplingProfiler()
+    profiler.start()
+    ...  # await the work to profile
+    profile = profiler.stop()
+    profile.collapsed()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+DEFAULT_INTERVAL_SECONDS = 0.001
+DEFAULT_MAX_DEPTH = 128
+DEFAULT_MAX_PROFILES = 50
+
+CATEGORIES = ("db", "pydantic", "json", "await", "app")
+
+# Module prefixes per category, checked from the innermost frame outwards;
+# the first frame that matches decides the category of the sample
+_CATEGORY_MODULES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("db", ("sqlalchemy", "asyncpg", "aiosqlite", "sqlite3", "psycopg")),
+    ("pydantic", ("pydantic", "pydantic_core")),
+    ("json", ("json", "orjson", "fastapi.encoders", "starlette.responses")),
+)
+
+# Event loop plumbing is dropped from collapsed stacks
+_SKIPPED_MODULES = ("asyncio.", "selectors", "threading", "concurrent.futures")
+
+_PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+def _module(frame: FrameType) -> str:
+    return frame.f_globals.get("__name__", "?")
+
+
+def _label(frame: FrameType) -> str:
+    return f"{_module(frame)}:{frame.f_code.co_qualname}"
+
+
+def categorize(modules: list[str], suspended: bool) -> str:
+    """Category of a sample given its frame modules (outermost first)."""
+    for module in reversed(modules):
+        for category, prefixes in _CATEGORY_MODULES:
+            if any(module == prefix or module.startswith(prefix + ".") for prefix in prefixes):
+                return category
+    return "await" if suspended else "app"
+
+
+@dataclass
+class Profile:
+    """Aggregated samples of one profiled request.
+
+    Attributes:
+        stacks: Sample count per collapsed stack (category root first)
+        duration_seconds: Wall-clock time between start and stop
+        interval_seconds: Requested sampling interval
+        profile_id: Identifier assigned by ``ProfileStore.save``
+    """
+
+    stacks: Counter[str] = field(default_factory=Counter)
+    duration_seconds: float = 0.0
+    interval_seconds: float = DEFAULT_INTERVAL_SECONDS
+    profile_id: str | None = None
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def collapsed(self) -> str:
+        """Flamegraph collapsed-stack text, one ``stack count`` line per stack."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self) -> dict[str, Any]:
+        """Estimated milliseconds and share of samples per category."""
+        total = self.samples
+        per_category = Counter({category: 0 for category in CATEGORIES})
+        for stack, count in self.stacks.items():
+            per_category[stack.split(";", 1)[0]] += count
+        ms_per_sample = self.duration_seconds * 1000 / total if total else 0.0
+        return {
+            "duration_ms": round(self.duration_seconds * 1000, 2),
+            "samples": total,
+            "categories": {
+                category: {
+                    "ms": round(count * ms_per_sample, 2),
+                    "share": round(count / total, 4) if total else 0.0,
+                }
+                for category, count in per_category.items()
+            },
+        }
+
+    def summary_header(self) -> str:
+        """Compact ``category=ms`` summary for a response header."""
+        categories = self.summary()["categories"]
+        return ";".join(f"{name}={value['ms']}" for name, value in categories.items())
+
+
+class SamplingProfiler:
+    """Sample one asyncio task's stack from a background thread.
+
+    Args:
+        interval: Seconds between samples (the GIL makes sub-millisecond
+            intervals unreliable)
+        max_depth: Frames kept per sample (the innermost ones)
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ) -> None:
+        self.interval = max(interval, 0.0001)
+        self.max_depth = max_depth
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._task: asyncio.Task | None = None
+        self._thread_id = 0
+        self._started = 0.0
+
+    def start(self, task: asyncio.Task | None = None) -> None:
+        """Start sampling ``task`` (default: the current task).
+
+        Must be called from the event loop thread running the task.
+        """
+        if self._thread is not None:
+            raise RuntimeError("Profiler already started")
+        if task is None:
+            try:
+                task = asyncio.current_task()
+            except RuntimeError:  # No running event loop
+                task = None
+        if task is None:
+            raise RuntimeError("SamplingProfiler must be started inside an asyncio task")
+        self._task = task
+        self._thread_id = threading.get_ident()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="taskman-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Profile:
+        """Stop sampling and return the aggregated profile."""
+        if self._thread is None:
+            raise RuntimeError("Profiler not started")
+        duration = time.perf_counter() - self._started
+        self._stop.set()
+        self._thread.join()
+        return Profile(
+            stacks=self._stacks, duration_seconds=duration, interval_seconds=self.interval
+        )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                stack = self._sample()
+            except Exception:  # noqa: BLE001 - frames can vanish mid-walk
+                continue
+            if stack:
+                self._stacks[stack] += 1
+
+    def _sample(self) -> str | None:
+        coro = self._task.get_coro() if self._task is not None else None
+        root = getattr(coro, "cr_frame", None)
+        if root is None:
+            return None  # Task finished
+
+        frames = self._running_frames(root)
+        suspended = frames is None
+        if suspended:
+            frames = self._await_chain(coro)
+
+        frames = [frame for frame in frames if not _module(frame).startswith(_SKIPPED_MODULES)]
+        if not frames:
+            return None
+        frames = frames[-self.max_depth :]
+        category = categorize([_module(frame) for frame in frames], suspended)
+        return ";".join([category, *(_label(frame) for frame in frames)])
+
+    def _running_frames(self, root: FrameType) -> list[FrameType] | None:
+        """Thread stack from the task's root frame inwards, or None if not running."""
+        frame = sys._current_frames().get(self._thread_id)
+        frames: list[FrameType] = []
+        while frame is not None:
+            frames.append(frame)
+            if frame is root:
+                frames.reverse()
+                return frames
+            frame = frame.f_back
+        return None
+
+    @staticmethod
+    def _await_chain(coro: Any) -> list[FrameType]:
+        """Frames of a suspended coroutine chain, outermost first."""
+        frames: list[FrameType] = []
+        while coro is not None:
+            frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+            if frame is None:
+                break
+            frames.append(frame)
+            coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+        return frames
+
+
+class ProfileStore:
+    """Directory of collapsed-stack files, pruned to the newest ``max_profiles``.
+
+    Args:
+        directory: Storage directory; defaults to TASKMAN_PROFILE_DIR or
+            ``<tmp>/taskman-profiles``
+        max_profiles: Number of profiles kept
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_profiles: int = DEFAULT_MAX_PROFILES,
+    ) -> None:
+        if directory is None:
+            directory = os.environ.get("TASKMAN_PROFILE_DIR") or (
+                Path(tempfile.gettempdir()) / "taskman-profiles"
+            )
+        self.directory = Path(directory)
+        self.max_profiles = max(max_profiles, 1)
+
+    def save(self, profile: Profile) -> str:
+        """Write ``profile`` and return its id."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profile.profile_id = uuid.uuid4().hex
+        (self.directory / f"{profile.profile_id}.collapsed").write_text(
+            profile.collapsed(), encoding="utf-8"
+        )
+        self._prune()
+        return profile.profile_id
+
+    def load(self, profile_id: str) -> str | None:
+        """Collapsed stacks of a stored profile, or None if unknown."""
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        path = self.directory / f"{profile_id}.collapsed"
+        return path.read_text(encoding="utf-8") if path.is_file() else None
+
+    def _prune(self) -> None:
+        files = sorted(
+            self.directory.glob("*.collapsed"), key=lambda path: path.stat().st_mtime, reverse=True
+        )
+        for path in files[self.max_profiles :]:
+            path.unlink(missing_ok=True)
+
+
+@lru_cache
+def get_profile_store() -> ProfileStore:
+    """Process-wide profile store shared by the middleware and diagnostic routes."""
+    return ProfileStore()
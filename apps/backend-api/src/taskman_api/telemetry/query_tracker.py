@@ -0,0 +1,182 @@
+"""Request-scoped SQL statement tracking.
+
+Counts and times every statement executed while a tracker is active, so a
+request (or a test block) can report how many queries it issued and how long
+they took. Trackers live in a ContextVar; SQLAlchemy runs sync cursor hooks in
+a greenlet that shares the calling task's context, so the hooks see the
+tracker of the request that issued the statement.
+
+Provides:
+- ``track_queries()`` context manager yielding a ``QueryStats``
+- N+1 detection: identical statements repeated within one tracker
+- Slow-query log with the statement's bind shape (parameter names and types,
+  never values) and the request route
+- ``install_query_tracking()``: one pair of listeners on the ``Engine`` class,
+  covering every engine (tier engines and test engines alike)
+
+When no tracker is active the hooks cost one ContextVar lookup per statement.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .metrics import _should_log_failure
+
+logger = structlog.get_logger(__name__)
+
+# Statements are truncated to this length in log events
+_MAX_LOGGED_STATEMENT = 500
+
+_active: ContextVar[tuple[QueryStats, ...]] = ContextVar("taskman_query_trackers", default=())
+
+_installed = False
+
+
+@dataclass
+class QueryStats:
+    """Statements observed while a tracker was active.
+
+    Attributes:
+        name: Label used in log events when no ASGI scope is attached
+        scope: ASGI scope of the tracked request; its matched route template
+            (set by routing, i.e. after the tracker starts) labels log events
+        slow_threshold_ms: Statements slower than this are logged; None disables
+        count: Number of statements executed
+        total_seconds: Summed cursor execution time
+        statements: Execution count per distinct SQL string
+    """
+
+    name: str | None = None
+    scope: Mapping[str, Any] | None = field(default=None, repr=False)
+    slow_threshold_ms: float | None = None
+    count: int = 0
+    total_seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def route(self) -> str | None:
+        """Route template of the tracked request, falling back to its path or name."""
+        if self.scope is None:
+            return self.name
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or self.scope.get("path") or self.name
+
+    @property
+    def total_ms(self) -> float:
+        """Summed statement time in milliseconds."""
+        return self.total_seconds * 1000
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements executed at least ``threshold`` times, most frequent first."""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+    def record(
+        self,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        elapsed: float,
+        context: Any = None,
+    ) -> None:
+        """Account for one executed statement."""
+        self.count += 1
+        self.total_seconds += elapsed
+        self.statements[statement] += 1
+        if self.slow_threshold_ms is not None and elapsed * 1000 >= self.slow_threshold_ms:
+            logger.warning(
+                "slow_query",
+                route=self.route,
+                duration_ms=round(elapsed * 1000, 2),
+                statement=statement[:_MAX_LOGGED_STATEMENT],
+                bind_shape=bind_shape(parameters, executemany, _bind_names(context)),
+            )
+
+
+def bind_shape(
+    parameters: Any, executemany: bool = False, names: tuple[str, ...] | None = None
+) -> Any:
+    """Describe bound parameters by name and type without exposing values.
+
+    ``{"id": "T-1"}`` becomes ``{"id": "str"}``. Positional parameters (qmark
+    and numeric DBAPI styles) are keyed by ``names`` when the compiled
+    statement provides them, otherwise reported as a list of type names.
+    executemany batches are reported as ``{"rows": n, "row": <first row>}``.
+    """
+    if executemany and isinstance(parameters, list | tuple):
+        first = bind_shape(parameters[0], names=names) if parameters else None
+        return {"rows": len(parameters), "row": first}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, list | tuple):
+        if names is not None and len(names) == len(parameters):
+            return {name: type(value).__name__ for name, value in zip(names, parameters, strict=True)}
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _bind_names(context: Any) -> tuple[str, ...] | None:
+    """Bind parameter names of a compiled statement, in positional order."""
+    positiontup = getattr(getattr(context, "compiled", None), "positiontup", None)
+    return tuple(positiontup) if positiontup else None
+
+
+@contextmanager
+def track_queries(
+    name: str | None = None,
+    *,
+    scope: Mapping[str, Any] | None = None,
+    slow_threshold_ms: float | None = None,
+) -> Iterator[QueryStats]:
+    """Track statements executed inside the block.
+
+    Trackers nest: a statement is recorded by every active tracker, so a test
+    can wrap several requests while each request keeps its own per-request
+    stats.
+    """
+    install_query_tracking()
+    stats = QueryStats(name=name, scope=scope, slow_threshold_ms=slow_threshold_ms)
+    token = _active.set((*_active.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def install_query_tracking() -> None:
+    """Register the statement hooks on the ``Engine`` class. Idempotent."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _active.get():
+        conn.info.setdefault("tracked_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("tracked_query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    trackers = _active.get()
+    try:
+        for stats in trackers:
+            stats.record(statement, parameters, executemany, elapsed, context)
+    except Exception as e:
+        if _should_log_failure("track_query"):
+            logger.warning("query_tracking_failed", error=str(e))
@@ -0,0 +1,89 @@
+"""Prometheus metrics for fallback-to-primary reconciliation.
+
+Provides:
+- Replication lag: journaled fallback writes not yet replayed on primary, and
+  the age of the oldest one
+- Progress of the running reconciliation (keys examined / keys journaled)
+- Per-table row outcomes (upserted / deleted / unchanged / conflict / failed)
+- Run duration per outcome (completed / partial / failed)
+
+Record functions are wrapped in try/except (see metrics.py, M2).
+"""
+
+import structlog
+from prometheus_client import Counter, Gauge, Histogram
+
+from .metrics import _should_log_failure
+
+logger = structlog.get_logger(__name__)
+
+ROW_OUTCOMES = ("upserted", "deleted", "unchanged", "conflict", "failed")
+
+db_reconciliation_pending_rows = Gauge(
+    "db_reconciliation_pending_rows",
+    "Journaled fallback writes not yet replayed on the primary database",
+)
+
+db_reconciliation_lag_seconds = Gauge(
+    "db_reconciliation_lag_seconds",
+    "Age of the oldest journaled fallback write not yet replayed (0 when caught up)",
+)
+
+db_reconciliation_progress_ratio = Gauge(
+    "db_reconciliation_progress_ratio",
+    "Fraction of journaled keys examined by the current reconciliation run",
+)
+
+db_reconciliation_rows_total = Counter(
+    "db_reconciliation_rows_total",
+    "Journaled rows processed by reconciliation, per table and outcome",
+    ["table", "outcome"],
+)
+
+db_reconciliation_duration_seconds = Histogram(
+    "db_reconciliation_duration_seconds",
+    "Reconciliation run duration",
+    ["outcome"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+
+
+def record_reconciliation_lag(pending_rows: int, lag_seconds: float) -> None:
+    """Record the size and age of the unreplayed journal."""
+    try:
+        db_reconciliation_pending_rows.set(pending_rows)
+        db_reconciliation_lag_seconds.set(lag_seconds)
+    except Exception as e:
+        if _should_log_failure("record_reconciliation_lag"):
+            logger.warning("metric_recording_failed", metric="db_reconciliation_lag", error=str(e))
+
+
+def record_reconciliation_progress(done: int, total: int) -> None:
+    """Record how many of ``total`` journaled keys the running pass has examined."""
+    try:
+        db_reconciliation_progress_ratio.set(done / total if total else 1.0)
+    except Exception as e:
+        if _should_log_failure("record_reconciliation_progress"):
+            logger.warning(
+                "metric_recording_failed", metric="db_reconciliation_progress", error=str(e)
+            )
+
+
+def record_reconciliation_rows(table: str, outcome: str, count: int) -> None:
+    """Count ``count`` rows of ``table`` with one of ROW_OUTCOMES."""
+    if not count:
+        return
+    try:
+        db_reconciliation_rows_total.labels(table=table, outcome=outcome).inc(count)
+    except Exception as e:
+        if _should_log_failure("record_reconciliation_rows"):
+            logger.warning("metric_recording_failed", metric="db_reconciliation_rows", error=str(e))
+
+
+def record_reconciliation_run(outcome: str, duration_seconds: float) -> None:
+    """Record one reconciliation run."""
+    try:
+        db_reconciliation_duration_seconds.labels(outcome=outcome).observe(duration_seconds)
+    except Exception as e:
+        if _should_log_failure("record_reconciliation_run"):
+            logger.warning("metric_recording_failed", metric="db_reconciliation_run", error=str(e))
@@ -0,0 +1,341 @@
+"""Prometheus metrics for HTTP requests, database queries and connection pools.
+
+Provides:
+- Request latency histogram by method, route template and status
+- In-flight request gauge by method
+- Requests shed by admission control, by priority class
+- DB query duration histogram by tier and statement type
+  (SQLAlchemy before/after_cursor_execute hooks)
+- Connection pool checkout wait histogram and checkout timeouts by tier, plus
+  a decaying average of recent waits (``recent_checkout_wait``) for admission
+  control
+- Pool utilization per tier, collected from ConnectionManager at scrape time
+- Tier health probe latency, per-tier circuit breaker state and read-replica lag
+
+Instrumentation runs on every request and query, so labelled children are
+cached in plain dicts: after the first observation a record is one dict lookup
+plus ``observe()``, avoiding ``labels()`` argument handling and locking.
+All record functions are wrapped in try/except (see metrics.py, M2).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from .metrics import _should_log_failure
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from taskman_api.db.connection_manager import ConnectionManager
+
+logger = structlog.get_logger(__name__)
+
+# Route label for requests that matched no route (keeps cardinality bounded)
+UNMATCHED_ROUTE = "__unmatched__"
+
+# Label caches are cleared past this size to bound memory on pathological input
+_MAX_CACHED_LABELS = 4096
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+http_requests_in_flight = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being processed",
+    ["method"],
+)
+
+http_requests_shed = Counter(
+    "http_requests_shed_total",
+    "HTTP requests rejected with 503 by admission control under overload",
+    ["priority"],
+)
+
+db_query_duration = Histogram(
+    "db_query_duration_seconds",
+    "Database cursor execution time in seconds",
+    ["tier", "statement"],
+    buckets=LATENCY_BUCKETS,
+)
+
+db_pool_checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent acquiring a connection from the pool in seconds",
+    ["tier"],
+    buckets=LATENCY_BUCKETS,
+)
+
+db_pool_checkout_timeouts = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Connection checkouts that gave up waiting for a free pooled connection",
+    ["tier"],
+)
+
+db_tier_probe_duration = Histogram(
+    "db_tier_probe_duration_seconds",
+    "Background health probe time per database tier",
+    ["tier", "result"],
+    buckets=LATENCY_BUCKETS,
+)
+
+_request_children: dict[tuple[str, str, int], Any] = {}
+_in_flight_children: dict[str, Any] = {}
+_query_children: dict[tuple[str, str], Any] = {}
+_checkout_children: dict[str, Any] = {}
+
+# Recent checkout wait per tier: (average, monotonic time of last update).
+# Each checkout moves the average RECENT_WAIT_WEIGHT of the way to its wait;
+# between checkouts it halves every RECENT_WAIT_HALF_LIFE seconds.
+RECENT_WAIT_WEIGHT = 0.2
+RECENT_WAIT_HALF_LIFE = 5.0
+_recent_waits: dict[str, tuple[float, float]] = {}
+
+# Statement keyword -> label; anything else is "OTHER"
+_STATEMENT_TYPES = frozenset(
+    {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK", "PRAGMA"}
+)
+
+
+def _child(cache: dict, key: Any, metric: Any, *labels: str) -> Any:
+    """Return the cached labelled child for ``key``, creating it on first use."""
+    child = cache.get(key)
+    if child is None:
+        if len(cache) >= _MAX_CACHED_LABELS:
+            cache.clear()
+        child = cache[key] = metric.labels(*labels)
+    return child
+
+
+def statement_type(statement: str) -> str:
+    """Classify a SQL statement by its leading keyword."""
+    words = statement.lstrip()[:9].split(None, 1)
+    keyword = words[0].upper() if words else ""
+    return keyword if keyword in _STATEMENT_TYPES else "OTHER"
+
+
+def record_request(method: str, route: str, status: int, duration_seconds: float) -> None:
+    """Record a completed HTTP request."""
+    try:
+        key = (method, route, status)
+        child = _child(_request_children, key, http_request_duration, method, route, str(status))
+        child.observe(duration_seconds)
+    except Exception as e:
+        if _should_log_failure("record_request"):
+            logger.warning("metric_recording_failed", metric="http_request", error=str(e))
+
+
+def in_flight(method: str) -> Any:
+    """Return the in-flight gauge child for ``method`` (use ``inc``/``dec``)."""
+    return _child(_in_flight_children, method, http_requests_in_flight, method)
+
+
+def record_shed(priority: str) -> None:
+    """Count a request rejected by admission control."""
+    try:
+        http_requests_shed.labels(priority=priority).inc()
+    except Exception as e:
+        if _should_log_failure("record_shed"):
+            logger.warning("metric_recording_failed", metric="http_shed", error=str(e))
+
+
+def _decayed_wait(tier: str, now: float) -> float:
+    average, updated = _recent_waits.get(tier, (0.0, now))
+    return average * 0.5 ** ((now - updated) / RECENT_WAIT_HALF_LIFE)
+
+
+def _note_recent_wait(tier: str, wait_seconds: float) -> None:
+    now = time.monotonic()
+    average = _decayed_wait(tier, now)
+    _recent_waits[tier] = (average + (wait_seconds - average) * RECENT_WAIT_WEIGHT, now)
+
+
+def recent_checkout_wait() -> float:
+    """Recent average checkout wait in seconds, for the most contended tier."""
+    now = time.monotonic()
+    return max((_decayed_wait(tier, now) for tier in list(_recent_waits)), default=0.0)
+
+
+def record_checkout_wait(tier: str, wait_seconds: float) -> None:
+    """Record the time taken to obtain a pooled connection."""
+    try:
+        _child(_checkout_children, tier, db_pool_checkout_wait, tier).observe(wait_seconds)
+        _note_recent_wait(tier, wait_seconds)
+    except Exception as e:
+        if _should_log_failure("record_checkout_wait"):
+            logger.warning("metric_recording_failed", metric="db_pool_checkout", error=str(e))
+
+
+def record_checkout_timeout(tier: str, wait_seconds: float = 0.0) -> None:
+    """Count a checkout that hit the pool timeout after ``wait_seconds``."""
+    try:
+        db_pool_checkout_timeouts.labels(tier=tier).inc()
+        _note_recent_wait(tier, wait_seconds)
+    except Exception as e:
+        if _should_log_failure("record_checkout_timeout"):
+            logger.warning("metric_recording_failed", metric="db_pool_timeout", error=str(e))
+
+
+def record_tier_probe(tier: str, connected: bool, duration_seconds: float) -> None:
+    """Record one health probe of a database tier."""
+    try:
+        result = "up" if connected else "down"
+        db_tier_probe_duration.labels(tier=tier, result=result).observe(duration_seconds)
+    except Exception as e:
+        if _should_log_failure("record_tier_probe"):
+            logger.warning("metric_recording_failed", metric="db_tier_probe", error=str(e))
+
+
+# ============================================================================
+# SQLAlchemy instrumentation
+# ============================================================================
+def instrument_engine(
+    engine: AsyncEngine,
+    tier: str,
+    checkout_observer: Callable[[float, bool], None] | None = None,
+) -> None:
+    """Attach query timing and pool checkout timing to ``engine``.
+
+    Query time is measured between ``before_cursor_execute`` and
+    ``after_cursor_execute``. Checkout wait wraps ``Engine.raw_connection``,
+    which every ``Connection`` uses to take a DBAPI connection from the pool
+    (including time to open a new one); pool timeouts are counted there too.
+    ``checkout_observer(wait_seconds, timed_out)`` additionally receives every
+    checkout (e.g. an AdaptivePoolSizer). Idempotent per engine.
+    """
+    sync_engine = engine.sync_engine
+    if getattr(sync_engine, "_taskman_instrumented", False):
+        return
+    sync_engine._taskman_instrumented = True
+
+    # Statement kind is cached per SQL string; compiled statements repeat
+    query_children: dict[str, Any] = {}
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start_time")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        try:
+            child = query_children.get(statement)
+            if child is None:
+                if len(query_children) >= _MAX_CACHED_LABELS:
+                    query_children.clear()
+                kind = statement_type(statement)
+                child = query_children[statement] = _child(
+                    _query_children, (tier, kind), db_query_duration, tier, kind
+                )
+            child.observe(elapsed)
+        except Exception as e:
+            if _should_log_failure("record_query"):
+                logger.warning("metric_recording_failed", metric="db_query", error=str(e))
+
+    raw_connection: Callable[[], Any] = sync_engine.raw_connection
+
+    def _timed_raw_connection():
+        start = time.perf_counter()
+        try:
+            connection = raw_connection()
+        except PoolTimeoutError:
+            wait = time.perf_counter() - start
+            record_checkout_timeout(tier, wait)
+            if checkout_observer is not None:
+                checkout_observer(wait, True)
+            raise
+        wait = time.perf_counter() - start
+        record_checkout_wait(tier, wait)
+        if checkout_observer is not None:
+            checkout_observer(wait, False)
+        return connection
+
+    sync_engine.raw_connection = _timed_raw_connection
+
+
+class PoolStatsCollector(Collector):
+    """Expose ConnectionManager.pool_stats() and tier breaker states as gauges at scrape time.
+
+    Reading pool counters on scrape keeps the request path free of
+    bookkeeping beyond the checkout/checkin counters the manager maintains.
+    """
+
+    def __init__(self, manager: ConnectionManager) -> None:
+        self._manager = manager
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        connections = GaugeMetricFamily(
+            "db_pool_connections",
+            "Pool connections by tier and state",
+            labels=["tier", "state"],
+        )
+        utilization = GaugeMetricFamily(
+            "db_pool_utilization_ratio",
+            "Checked-out connections as a fraction of pool capacity",
+            labels=["tier"],
+        )
+        circuit = GaugeMetricFamily(
+            "db_tier_circuit_state",
+            "Database tier circuit breaker state (1 for the current state)",
+            labels=["tier", "state"],
+        )
+        replica_lag = GaugeMetricFamily(
+            "db_replica_lag_seconds",
+            "Replication lag of the read replica at the last health probe",
+        )
+        try:
+            # Imported here: taskman_api.db imports this module at load time
+            from taskman_api.db.tier_health import BREAKER_STATES
+
+            for tier, breaker in getattr(self._manager, "breakers", {}).items():
+                for state in BREAKER_STATES:
+                    circuit.add_metric([tier, state], 1 if breaker.state == state else 0)
+            lag = getattr(self._manager, "replica_lag", None)
+            if lag is not None:
+                replica_lag.add_metric([], lag)
+            for tier, stats in self._manager.pool_stats().items():
+                for state in ("checked_out", "idle", "overflow", "size"):
+                    value = stats.get(state)
+                    if value is not None:
+                        connections.add_metric([tier, state], value)
+                capacity = stats.get("capacity")
+                if capacity:
+                    utilization.add_metric([tier], stats["checked_out"] / capacity)
+        except Exception as e:
+            if _should_log_failure("collect_pool_stats"):
+                logger.warning("metric_recording_failed", metric="db_pool", error=str(e))
+        yield connections
+        yield utilization
+        yield circuit
+        yield replica_lag
+
+
+_pool_collector: PoolStatsCollector | None = None
+
+
+def register_pool_metrics(manager: ConnectionManager) -> None:
+    """Register (or re-point) the pool stats collector for ``manager``."""
+    global _pool_collector
+    if _pool_collector is None:
+        _pool_collector = PoolStatsCollector(manager)
+        REGISTRY.register(_pool_collector)
+    else:
+        _pool_collector._manager = manager
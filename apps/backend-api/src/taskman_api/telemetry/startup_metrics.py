@@ -0,0 +1,57 @@
+"""Prometheus metrics for worker startup.
+
+Provides:
+- Worker boot time: package import to application ready (rolling deploys wait
+  on this for every uvicorn worker)
+- Schema initialization time per tier and outcome
+  (created / unchanged / failed / timeout)
+
+Record functions are wrapped in try/except (see metrics.py, M2).
+"""
+
+import time
+
+import structlog
+from prometheus_client import Gauge, Histogram
+
+from .metrics import _should_log_failure
+
+logger = structlog.get_logger(__name__)
+
+SCHEMA_INIT_OUTCOMES = ("created", "unchanged", "failed", "timeout")
+
+worker_boot_seconds = Gauge(
+    "taskman_worker_boot_seconds",
+    "Seconds from package import until the application was ready to serve",
+)
+
+db_schema_init_seconds = Histogram(
+    "db_schema_init_seconds",
+    "Schema initialization time per tier at startup",
+    ["tier", "outcome"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
+def record_worker_boot(started: float) -> float:
+    """Record boot time since ``started`` (a ``time.perf_counter()`` value).
+
+    Returns:
+        Boot time in seconds
+    """
+    boot_seconds = time.perf_counter() - started
+    try:
+        worker_boot_seconds.set(boot_seconds)
+    except Exception as e:
+        if _should_log_failure("record_worker_boot"):
+            logger.warning("metric_recording_failed", metric="worker_boot", error=str(e))
+    return boot_seconds
+
+
+def record_schema_init(tier: str, outcome: str, duration_seconds: float) -> None:
+    """Record one tier's schema initialization."""
+    try:
+        db_schema_init_seconds.labels(tier=tier, outcome=outcome).observe(duration_seconds)
+    except Exception as e:
+        if _should_log_failure("record_schema_init"):
+            logger.warning("metric_recording_failed", metric="db_schema_init", error=str(e))
@@ -23,6 +23,9 @@ def set_test_environment() -> None:
     connections to development or production databases.
     """
     os.environ["APP_ENVIRONMENT"] = "testing"
+    # Run trusted list responses through response_model validation so schema
+    # drift fails tests (see taskman_api.core.responses)
+    os.environ.setdefault("TASKMAN_VALIDATE_RESPONSES", "true")
 
 
 @pytest.fixture(autouse=True)
@@ -4,6 +4,7 @@ Provides TestClient and database fixtures for E2E endpoint testing.
 """
 
 import os
+from contextlib import contextmanager
 
 # Set environment variables BEFORE importing main module
 # This is required because main.py calls get_settings() at module load time
@@ -30,6 +31,7 @@ from taskman_api.models.action_list import ActionList
 from taskman_api.models.project import Project
 from taskman_api.models.sprint import Sprint
 from taskman_api.models.task import Task
+from taskman_api.telemetry.query_tracker import track_queries
 
 # Test database URL (in-memory SQLite)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -116,3 +118,30 @@ async def client(test_app):
     transport = ASGITransport(app=test_app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
         yield ac
+
+
+@pytest.fixture
+def query_budget():
+    """Assert an upper bound on SQL statements issued inside a block.
+
+    Usage:
+        with query_budget(3):
+            await client.get("/api/v1/tasks/T-1")
+
+    Fails if more than ``max_queries`` statements run, or if any identical
+    statement repeats more than ``max_repeats`` times (an N+1 pattern).
+    """
+
+    @contextmanager
+    def _budget(max_queries: int, *, max_repeats: int | None = None):
+        with track_queries("query_budget") as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"Query budget exceeded: {stats.count} > {max_queries}\n"
+            + "\n".join(f"{n}x {sql}" for sql, n in stats.statements.most_common())
+        )
+        if max_repeats is not None:
+            repeated = stats.repeated(max_repeats + 1)
+            assert not repeated, f"Repeated statements (N+1?): {repeated}"
+
+    return _budget
@@ -100,3 +100,56 @@ class TestActionListIntegration:
         # But wait, we haven't refactored the router yet!
         # This test relies on the router being refactored OR correct behavior of existing router.
         # We will refactor router next.
+
+    async def test_hydrated_tasks(self, client: AsyncClient):
+        """Test hydrated tasks come back in list order with dangling ids reported."""
+        await client.post(
+            "/api/v1/projects",
+            json={"id": "P-AL-HYD", "name": "Hydration", "status": "active", "owner": "o"},
+        )
+        await client.post(
+            "/api/v1/sprints",
+            json={
+                "id": "S-AL-HYD",
+                "name": "Hydration Sprint",
+                "primary_project": "P-AL-HYD",
+                "owner": "o",
+                "start_date": "2025-01-01",
+                "end_date": "2025-01-14",
+            },
+        )
+        for task_id in ("T-AL-HYD-1", "T-AL-HYD-2"):
+            res = await client.post(
+                "/api/v1/tasks",
+                json={
+                    "id": task_id,
+                    "title": f"Task {task_id}",
+                    "summary": "Summary",
+                    "owner": "o",
+                    "primary_project": "P-AL-HYD",
+                    "primary_sprint": "S-AL-HYD",
+                },
+            )
+            assert res.status_code == status.HTTP_201_CREATED, res.text
+        create_res = await client.post(
+            "/api/v1/action-lists",
+            json={"id": "AL-INT-HYD", "title": "Hydration List", "status": "active"},
+        )
+        list_id = create_res.json()["id"]
+        for task_id in ("T-AL-HYD-2", "T-AL-GONE", "T-AL-HYD-1"):
+            await client.post(f"/api/v1/action-lists/{list_id}/tasks", params={"task_id": task_id})
+
+        res = await client.get(f"/api/v1/action-lists/{list_id}/tasks/hydrated")
+        assert res.status_code == status.HTTP_200_OK, res.text
+        data = res.json()
+        assert [t["id"] for t in data["items"]] == ["T-AL-HYD-2", "T-AL-HYD-1"]
+        assert data["items"][0]["title"] == "Task T-AL-HYD-2"
+        assert data["missing"] == ["T-AL-GONE"]
+
+        res_sparse = await client.get(
+            f"/api/v1/action-lists/{list_id}/tasks/hydrated", params={"fields": "title"}
+        )
+        assert res_sparse.json()["items"][1] == {"id": "T-AL-HYD-1", "title": "Task T-AL-HYD-1"}
+
+        res_missing = await client.get("/api/v1/action-lists/AL-NOPE/tasks/hydrated")
+        assert res_missing.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,134 @@
+"""Integration tests for Dashboard API endpoints."""
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.dialects import postgresql
+
+from taskman_api.db.archival import TaskArchiver
+from taskman_api.repositories.task_repository import facet_counts_query
+from taskman_api.services.task_service import clear_summary_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_summary_cache():
+    clear_summary_cache()
+    yield
+    clear_summary_cache()
+
+
+async def _seed(client: AsyncClient) -> None:
+    await client.post(
+        "/api/v1/projects",
+        json={"id": "P-DASH", "name": "Dashboard", "status": "active", "owner": "o"},
+    )
+    for sprint_id in ("S-DASH-1", "S-DASH-2"):
+        await client.post(
+            "/api/v1/sprints",
+            json={
+                "id": sprint_id,
+                "name": f"Sprint {sprint_id}",
+                "primary_project": "P-DASH",
+                "owner": "o",
+                "start_date": "2025-01-01",
+                "end_date": "2025-01-14",
+            },
+        )
+    tasks = [
+        ("T-DASH-1", "S-DASH-1", "new", "p1", "alice"),
+        ("T-DASH-2", "S-DASH-1", "in_progress", "p1", "bob"),
+        ("T-DASH-3", "S-DASH-2", "new", "p2", "alice"),
+    ]
+    for task_id, sprint_id, task_status, priority, owner in tasks:
+        res = await client.post(
+            "/api/v1/tasks",
+            json={
+                "id": task_id,
+                "title": f"Task {task_id}",
+                "summary": "Summary",
+                "status": task_status,
+                "priority": priority,
+                "owner": owner,
+                "primary_project": "P-DASH",
+                "primary_sprint": sprint_id,
+            },
+        )
+        assert res.status_code == status.HTTP_201_CREATED, res.text
+
+
+class TestDashboardSummary:
+    """Integration tests for GET /dashboard/summary."""
+
+    async def test_summary_counts_each_facet(self, client: AsyncClient):
+        """Test every facet is counted within the requested scope."""
+        await _seed(client)
+
+        res = await client.get("/api/v1/dashboard/summary", params={"project_id": "P-DASH"})
+        assert res.status_code == status.HTTP_200_OK, res.text
+        data = res.json()
+        assert data["total"] == 3
+        assert data["by_status"] == {"new": 2, "in_progress": 1}
+        assert data["by_priority"] == {"p1": 2, "p2": 1}
+        assert data["by_owner"] == {"alice": 2, "bob": 1}
+        assert data["by_project"] == {"P-DASH": 3}
+
+        res_sprint = await client.get(
+            "/api/v1/dashboard/summary",
+            params={"project_id": "P-DASH", "sprint_id": "S-DASH-2"},
+        )
+        assert res_sprint.json()["total"] == 1
+        assert res_sprint.json()["by_owner"] == {"alice": 1}
+
+    async def test_summary_is_cached_per_scope(self, client: AsyncClient):
+        """Test a scope's summary is reused until its TTL expires."""
+        await _seed(client)
+        params = {"sprint_id": "S-DASH-1"}
+        first = await client.get("/api/v1/dashboard/summary", params=params)
+        await client.delete("/api/v1/tasks/T-DASH-2")
+
+        cached = await client.get("/api/v1/dashboard/summary", params=params)
+        assert cached.json() == first.json()
+
+        clear_summary_cache()
+        fresh = await client.get("/api/v1/dashboard/summary", params=params)
+        assert fresh.json()["total"] == first.json()["total"] - 1
+
+    async def test_archived_tasks_are_opt_in(self, client: AsyncClient, async_test_engine):
+        """Test archived tasks appear in reads only with include_archived."""
+        await _seed(client)
+        await client.patch("/api/v1/tasks/T-DASH-2", json={"status": "done"})
+        # A negative age puts the cutoff in the future, archiving every closed task
+        archiver = TaskArchiver(async_test_engine, archive_after_days=-1, rows_per_second=0)
+        assert (await archiver.run()).archived == 1
+
+        res = await client.get("/api/v1/tasks/T-DASH-2")
+        assert res.status_code == status.HTTP_404_NOT_FOUND
+        res = await client.get("/api/v1/tasks/T-DASH-2", params={"include_archived": True})
+        assert res.status_code == status.HTTP_200_OK, res.text
+        assert res.json()["status"] == "done"
+
+        res = await client.get("/api/v1/tasks", params={"project_id": "P-DASH"})
+        assert res.json()["total"] == 2
+        res = await client.get(
+            "/api/v1/tasks", params={"project_id": "P-DASH", "include_archived": True}
+        )
+        assert res.json()["total"] == 3
+
+        params = {"project_id": "P-DASH"}
+        hot = await client.get("/api/v1/dashboard/summary", params=params)
+        assert hot.json()["by_status"] == {"new": 2}
+        both = await client.get(
+            "/api/v1/dashboard/summary", params={**params, "include_archived": True}
+        )
+        assert both.json()["by_status"] == {"new": 2, "done": 1}
+
+    def test_postgres_uses_grouping_sets(self):
+        """Test the Postgres query computes all facets in one grouped scan."""
+        query = facet_counts_query("postgresql", project_id="P-DASH")
+        sql = str(query.compile(dialect=postgresql.dialect()))
+
+        assert "UNION" not in sql
+        assert (
+            "GROUP BY GROUPING SETS((tasks.status), (tasks.priority), (tasks.owner), "
+            "(tasks.primary_project), ())"
+        ) in sql
@@ -0,0 +1,165 @@
+"""Per-endpoint SQL query budgets.
+
+Budgets are upper bounds on statements per request. A failure lists every
+statement with its repetitions; raise a budget only when the extra statements
+are intended.
+
+Tests verify:
+- Reads issue a fixed number of statements regardless of page size
+- Writes stay within their budget, including sprint creation and adding a
+  conversation turn however long the conversation is
+- X-Query-Count / Server-Timing headers are exposed outside production
+"""
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from taskman_api.middleware import QueryBudgetMiddleware
+
+PROJECT_ID = "P-QB-001"
+SPRINT_ID = "S-QB-001"
+
+
+def _task(task_id: str) -> dict:
+    return {
+        "id": task_id,
+        "title": "Budget Task",
+        "summary": "Summary",
+        "description": "Desc",
+        "owner": "owner",
+        "priority": "p2",
+        "status": "new",
+        "primary_project": PROJECT_ID,
+        "primary_sprint": SPRINT_ID,
+    }
+
+
+class TestQueryBudgets:
+    """Statement counts for core endpoints."""
+
+    @pytest.fixture(autouse=True)
+    async def seed(self, client: AsyncClient):
+        """Create a project, sprint and a handful of tasks."""
+        res = await client.post(
+            "/api/v1/projects",
+            json={
+                "id": PROJECT_ID,
+                "name": "Budget Project",
+                "mission": "Mission",
+                "start_date": "2025-01-01",
+                "status": "active",
+                "owner": "owner",
+            },
+        )
+        assert res.status_code == status.HTTP_201_CREATED
+        res = await client.post(
+            "/api/v1/sprints",
+            json={
+                "id": SPRINT_ID,
+                "name": "Budget Sprint",
+                "goal": "Goal",
+                "status": "active",
+                "primary_project": PROJECT_ID,
+                "owner": "owner",
+                "start_date": "2025-01-01",
+                "end_date": "2025-01-14",
+                "cadence": "biweekly",
+            },
+        )
+        assert res.status_code == status.HTTP_201_CREATED
+        for i in range(10):
+            res = await client.post("/api/v1/tasks", json=_task(f"T-QB-{i:03d}"))
+            assert res.status_code == status.HTTP_201_CREATED
+
+    async def test_get_task(self, client: AsyncClient, query_budget):
+        with query_budget(1, max_repeats=1):
+            res = await client.get("/api/v1/tasks/T-QB-000")
+        assert res.status_code == status.HTTP_200_OK
+
+    async def test_list_tasks_does_not_scale_with_page_size(
+        self, client: AsyncClient, query_budget
+    ):
+        with query_budget(2, max_repeats=1):
+            res = await client.get("/api/v1/tasks?per_page=10")
+        assert res.status_code == status.HTTP_200_OK
+        assert len(res.json()["tasks"]) == 10
+
+    async def test_create_task(self, client: AsyncClient, query_budget):
+        with query_budget(4):
+            res = await client.post("/api/v1/tasks", json=_task("T-QB-NEW"))
+        assert res.status_code == status.HTTP_201_CREATED
+
+    async def test_update_task(self, client: AsyncClient, query_budget):
+        with query_budget(3):
+            res = await client.patch("/api/v1/tasks/T-QB-001", json={"status": "in_progress"})
+        assert res.status_code == status.HTTP_200_OK
+
+    async def test_create_sprint(self, client: AsyncClient, query_budget):
+        with query_budget(3, max_repeats=1):
+            res = await client.post(
+                "/api/v1/sprints",
+                json={
+                    "id": "S-QB-NEW",
+                    "name": "New Sprint",
+                    "goal": "Goal",
+                    "status": "planning",
+                    "primary_project": PROJECT_ID,
+                    "owner": "owner",
+                    "start_date": "2025-01-15",
+                    "end_date": "2025-01-28",
+                    "cadence": "biweekly",
+                },
+            )
+        assert res.status_code == status.HTTP_201_CREATED, res.text
+
+    async def test_add_turn_does_not_scale_with_conversation_length(
+        self, client: AsyncClient, query_budget
+    ):
+        res = await client.post(
+            "/api/v1/conversations",
+            json={"id": "CONV-QB-001", "title": "Budget Conversation", "agent_type": "claude"},
+        )
+        assert res.status_code == status.HTTP_201_CREATED
+        for sequence in range(1, 6):
+            # Session lookup, next sequence, insert, reload, running totals
+            with query_budget(5, max_repeats=1):
+                res = await client.post(
+                    "/api/v1/conversations/CONV-QB-001/turns",
+                    json={
+                        "id": f"TURN-QB-{sequence}",
+                        "conversation_id": "CONV-QB-001",
+                        "sequence": sequence,
+                        "role": "user",
+                        "content": "Hello",
+                        "token_count": 3,
+                    },
+                )
+            assert res.status_code == status.HTTP_201_CREATED, res.text
+
+    async def test_list_projects(self, client: AsyncClient, query_budget):
+        with query_budget(2, max_repeats=1):
+            res = await client.get("/api/v1/projects")
+        assert res.status_code == status.HTTP_200_OK
+
+    async def test_debug_headers_report_query_count(self, client: AsyncClient, query_budget):
+        with query_budget(1) as stats:
+            res = await client.get("/api/v1/tasks/T-QB-000")
+        assert res.status_code == status.HTTP_200_OK
+        assert res.headers["X-Query-Count"].isdigit()
+        assert 0 < int(res.headers["X-Query-Count"]) == stats.count <= 1
+        assert "db;dur=" in res.headers["Server-Timing"]
+
+    async def test_debug_headers_hidden_when_disabled(
+        self, client: AsyncClient, test_app, monkeypatch
+    ):
+        # The seed requests have built the middleware stack
+        middleware = test_app.middleware_stack
+        while not isinstance(middleware, QueryBudgetMiddleware):
+            middleware = middleware.app
+        monkeypatch.setattr(middleware, "expose_headers", False)
+
+        res = await client.get("/api/v1/tasks/T-QB-000")
+        assert res.status_code == status.HTTP_200_OK
+        assert "X-Query-Count" not in res.headers
+        assert "Server-Timing" not in res.headers
@@ -98,6 +98,28 @@ class TestSprintIntegration:
         # For now asserting 422 as it's a "Unprocessable Entity" logically.
         # Check actual response if it fails.
 
+    async def test_list_sprints_sparse_fields(self, client: AsyncClient):
+        """Test ?fields= maps primary_project onto the sprint's project_id column."""
+        sprint_id = f"{SPRINT_PREFIX}-FIELDS"
+        await client.post(
+            "/api/v1/sprints",
+            json={
+                "id": sprint_id,
+                "name": "Fields Sprint",
+                "primary_project": self.project_id,
+                "start_date": "2025-02-01",
+                "end_date": "2025-02-14",
+                "goal": "Sparse",
+                "owner": "scrum.master",
+            },
+        )
+
+        res = await client.get("/api/v1/sprints?fields=name,primary_project")
+        assert res.status_code == status.HTTP_200_OK, res.text
+        assert res.json()["sprints"] == [
+            {"id": sprint_id, "name": "Fields Sprint", "primary_project": self.project_id}
+        ]
+
     async def test_sprint_velocity_calculation(self, client: AsyncClient):
         """Test sprint progress/velocity metrics."""
         # Setup sprint
@@ -5,6 +5,8 @@ Tests E2E functionality of Conversations, Plans, and Checklists.
 
 from fastapi import status
 
+from taskman_api.telemetry.compression_metrics import db_decompressions_total
+
 
 class TestConversationEndpoints:
     """Test conversation session API endpoints."""
@@ -233,6 +235,21 @@ class TestConversationEndpoints:
         assert data["role"] == "user"
         assert data["content"] == "Hello, world!"
 
+        # Running totals are kept on the conversation
+        await client.post(
+            "/api/v1/conversations/CONV-TURN-001/turns",
+            json={
+                "id": "TURN-002",
+                "conversation_id": "CONV-TURN-001",
+                "sequence": 2,
+                "role": "assistant",
+                "content": "Hi",
+                "token_count": 5,
+            },
+        )
+        conv = (await client.get("/api/v1/conversations/CONV-TURN-001")).json()
+        assert (conv["turn_count"], conv["token_estimate"]) == (2, 15)
+
     async def test_get_turns_for_conversation(self, client):
         """Test getting turns for a conversation."""
         # Create conversation
@@ -265,6 +282,38 @@ class TestConversationEndpoints:
         assert isinstance(data, list)
         assert len(data) == 3
 
+    async def test_large_turn_content_is_decompressed_only_when_selected(self, client):
+        """Test compressed turn content round-trips and sparse lists skip decoding it."""
+        await client.post(
+            "/api/v1/conversations", json={"id": "CONV-ZIP-001", "title": "Compression"}
+        )
+        content = "Traceback (most recent call last):\n  File app.py, line 1\n" * 200 + "Error"
+        await client.post(
+            "/api/v1/conversations/CONV-ZIP-001/turns",
+            json={
+                "id": "TURN-ZIP-001",
+                "conversation_id": "CONV-ZIP-001",
+                "sequence": 1,
+                "role": "tool",
+                "content": content,
+                "tool_results": [{"output": content}],
+            },
+        )
+        decompressions = db_decompressions_total.labels(column="conversation_turns.content")
+        before = decompressions._value.get()
+
+        sparse = await client.get(
+            "/api/v1/conversations/CONV-ZIP-001/turns", params={"fields": "role,token_count"}
+        )
+        assert sparse.status_code == status.HTTP_200_OK, sparse.text
+        assert sparse.json() == [{"id": "TURN-ZIP-001", "role": "tool", "token_count": 0}]
+        assert decompressions._value.get() == before
+
+        full = await client.get("/api/v1/conversations/CONV-ZIP-001/turns")
+        assert full.json()[0]["content"] == content
+        assert full.json()[0]["tool_results"] == [{"output": content}]
+        assert decompressions._value.get() == before + 1
+
     async def test_link_plan_to_conversation(self, client):
         """Test linking a plan to a conversation."""
         # Create conversation
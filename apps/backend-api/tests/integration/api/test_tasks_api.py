@@ -202,6 +202,80 @@ class TestTaskIntegration:
         tasks_owner = data_owner["tasks"]
         assert len(tasks_owner) == 2  # Tasks 0 and 1
 
+    async def test_list_tasks_sparse_fields(self, client: AsyncClient):
+        """Test ?fields= returns only the selected fields (plus id) per task."""
+        await client.post(
+            "/api/v1/tasks",
+            json={
+                "id": f"{TASK_PREFIX}-FIELDS-001",
+                "title": "Sparse",
+                "summary": "Summary",
+                "description": "Desc",
+                "status": "new",
+                "priority": "p1",
+                "owner": "owner",
+                "primary_project": self.project_id,
+                "primary_sprint": self.sprint_id,
+            },
+        )
+
+        res = await client.get("/api/v1/tasks?fields=title, status")
+        assert res.status_code == status.HTTP_200_OK, res.text
+        data = res.json()
+        assert data["total"] == 1
+        assert data["page"] == 1
+        assert data["tasks"] == [
+            {"id": f"{TASK_PREFIX}-FIELDS-001", "title": "Sparse", "status": "new"}
+        ]
+
+        res_unknown = await client.get("/api/v1/tasks?fields=title,nope")
+        assert res_unknown.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert "nope" in res_unknown.json()["detail"]
+
+    async def test_batch_get_tasks(self, client: AsyncClient):
+        """Test batch get preserves request order and reports missing ids."""
+        ids = [f"{TASK_PREFIX}-BATCH-{i}" for i in range(3)]
+        for task_id in ids:
+            await client.post(
+                "/api/v1/tasks",
+                json={
+                    "id": task_id,
+                    "title": task_id,
+                    "summary": "Summary",
+                    "description": "Desc",
+                    "status": "new",
+                    "priority": "p2",
+                    "owner": "owner",
+                    "primary_project": self.project_id,
+                    "primary_sprint": self.sprint_id,
+                },
+            )
+        wanted = [ids[2], "T-MISSING", ids[0], ids[2]]
+
+        res = await client.post("/api/v1/tasks:batchGet", json={"ids": wanted})
+        assert res.status_code == status.HTTP_200_OK, res.text
+        data = res.json()
+        assert [t["id"] for t in data["items"]] == [ids[2], ids[0]]
+        assert data["items"][0]["title"] == ids[2]
+        assert data["missing"] == ["T-MISSING"]
+
+        res_get = await client.get(f"/api/v1/tasks?ids={','.join(wanted)}&fields=status")
+        assert res_get.status_code == status.HTTP_200_OK, res_get.text
+        assert res_get.json() == {
+            "items": [{"id": ids[2], "status": "new"}, {"id": ids[0], "status": "new"}],
+            "missing": ["T-MISSING"],
+        }
+
+        res_spaced = await client.get("/api/v1/tasks", params={"ids": f"{ids[0]}, {ids[1]} ,"})
+        assert res_spaced.status_code == status.HTTP_200_OK, res_spaced.text
+        assert [t["id"] for t in res_spaced.json()["items"]] == [ids[0], ids[1]]
+        assert res_spaced.json()["missing"] == []
+
+        res_empty = await client.get("/api/v1/tasks?ids=")
+        assert res_empty.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        res_empty = await client.post("/api/v1/tasks:batchGet", json={"ids": []})
+        assert res_empty.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     async def test_duplicate_task_id(self, client: AsyncClient):
         """Test creating a task with an existing ID returns 409 Conflict."""
         task_id = f"{TASK_PREFIX}-DUP-001"
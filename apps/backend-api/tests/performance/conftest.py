@@ -1,16 +1,38 @@
 """Performance test fixtures.
 
 Provides database setup and utilities for performance tests.
+
+Environment Variables:
+    TASKMAN_PERF_SCALE: Dataset preset for ``generated_dataset`` (small/medium/large,
+        default: small). Use medium/large locally to benchmark at production scale.
 """
 
+import os
+
+# Settings are read at import time by taskman_api.db.session
+os.environ.setdefault("APP_ENVIRONMENT", "testing")
+os.environ.setdefault("APP_DATABASE__HOST", "localhost")
+os.environ.setdefault("APP_DATABASE__PORT", "5433")
+os.environ.setdefault("APP_DATABASE__USER", "taskman_test")
+os.environ.setdefault("APP_DATABASE__PASSWORD", "test_password")
+os.environ.setdefault("APP_DATABASE__DATABASE", "taskman_test")
+os.environ.setdefault("APP_SECRET_KEY", "test-secret-key-min-32-characters-for-testing")
+os.environ.setdefault("APP_JWT_SECRET", "test-jwt-secret-min-32-characters-for-testing")
+
 from collections.abc import AsyncGenerator
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.pool import StaticPool
 
 from taskman_api.db.base import Base
 from taskman_api.models.action_list import ActionList
+from taskman_api.perf.datagen import PRESETS, DatasetStats, load_dataset
 
 
 @pytest.fixture(scope="function")
@@ -64,3 +86,23 @@ def action_list_factory():
         return ActionList(**{**defaults, **kwargs})
 
     return _create
+
+
+@pytest.fixture(scope="function")
+async def generated_dataset() -> AsyncGenerator[tuple[AsyncEngine, DatasetStats], None]:
+    """In-memory SQLite engine loaded with a synthetic dataset.
+
+    Scale is selected with TASKMAN_PERF_SCALE (default: small).
+    """
+    spec = PRESETS[os.environ.get("TASKMAN_PERF_SCALE", "small")]
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        echo=False,
+    )
+    stats = await load_dataset(engine, spec)
+
+    yield engine, stats
+
+    await engine.dispose()
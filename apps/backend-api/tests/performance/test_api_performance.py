@@ -17,14 +17,20 @@ import statistics
 import time
 from collections.abc import AsyncGenerator
 
+import orjson
 import pytest
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
+from taskman_api.core.responses import trusted_response
 from taskman_api.db.base import Base
 from taskman_api.dependencies import get_db_session
 from taskman_api.main import app
+from taskman_api.schemas import TaskList
 
 # Performance thresholds (milliseconds)
 THRESHOLDS = {
@@ -384,6 +390,77 @@ class TestBulkOperations:
         assert p95 < THRESHOLDS["list_endpoint_p95"]
 
 
+    @pytest.mark.asyncio
+    async def test_trusted_task_page(
+        self, perf_client: AsyncClient, seeded_data: dict, monkeypatch
+    ):
+        """Compare a 100-row /tasks page with and without response_model re-validation.
+
+        The trusted path must produce the same JSON, and its response step
+        (serializing the validated page) must beat FastAPI's
+        dump/validate/serialize round-trip.
+        """
+        for i in range(100):
+            response = await perf_client.post(
+                "/api/v1/tasks",
+                json={
+                    "id": f"T-PERF-PAGE-{i:03d}",
+                    "title": f"Page task {i}",
+                    "summary": "Trusted page benchmark",
+                    "owner": "perf@test.com",
+                    "labels": ["perf", f"batch-{i % 5}"],
+                    "acceptance_criteria": [{"text": "Listed", "done": False}],
+                    "primary_project": seeded_data["project"]["id"],
+                    "primary_sprint": seeded_data["sprint"]["id"],
+                },
+            )
+            assert response.status_code == 201
+
+        async def page(validate: str) -> tuple[float, bytes]:
+            monkeypatch.setenv("TASKMAN_VALIDATE_RESPONSES", validate)
+            times = []
+            for _ in range(20):
+                start = time.perf_counter()
+                response = await perf_client.get("/api/v1/tasks?per_page=100")
+                times.append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200
+            return statistics.median(times), response.content
+
+        validated_p50, validated_body = await page("true")
+        trusted_p50, trusted_body = await page("false")
+        assert len(orjson.loads(trusted_body)["tasks"]) == 100
+        assert orjson.loads(trusted_body) == orjson.loads(validated_body)
+
+        # Response step alone, on the same page
+        task_page = TaskList.model_validate_json(trusted_body)
+        field = create_model_field("Response_list_tasks", TaskList, mode="serialization")
+
+        async def validated_step() -> bytes:
+            content = await serialize_response(
+                field=field, response_content=task_page, is_coroutine=True
+            )
+            return ORJSONResponse(content).body
+
+        step_times: dict[str, list[float]] = {"validated": [], "trusted": []}
+        for _ in range(20):
+            start = time.perf_counter()
+            await validated_step()
+            step_times["validated"].append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            trusted_response(task_page)
+            step_times["trusted"].append((time.perf_counter() - start) * 1000)
+        validated_step_ms = statistics.median(step_times["validated"])
+        trusted_step_ms = statistics.median(step_times["trusted"])
+
+        print(
+            f"\n  Tasks page (100 rows) - request p50 validated: {validated_p50:.1f}ms, "
+            f"trusted: {trusted_p50:.1f}ms; response step validated: "
+            f"{validated_step_ms:.2f}ms, trusted: {trusted_step_ms:.2f}ms"
+        )
+
+        assert trusted_step_ms < validated_step_ms
+
+
 class TestActionListPerformance:
     """Performance tests specific to action list operations."""
 
@@ -0,0 +1,150 @@
+"""Tests for the synthetic dataset generator.
+
+Verifies determinism, realistic skew and bulk loading into SQLite.
+
+Run with: pytest tests/performance/test_datagen.py -v
+"""
+
+from collections import Counter
+from dataclasses import replace
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from taskman_api.models import ConversationSession, ConversationTurn, Task
+from taskman_api.perf.datagen import (
+    PRESETS,
+    DatasetGenerator,
+    DatasetSpec,
+    DatasetStats,
+    generate_dataset,
+)
+
+SMALL = DatasetSpec(projects=5, sprints=20, tasks=500, conversations=10, turns=400, batch_size=128)
+
+
+def _tasks(spec: DatasetSpec) -> list[dict]:
+    return [row for batch in DatasetGenerator(spec).tasks() for row in batch]
+
+
+class TestGeneration:
+    """Row generation without a database."""
+
+    def test_same_seed_is_deterministic(self):
+        assert _tasks(SMALL) == _tasks(SMALL)
+
+    def test_different_seed_changes_rows(self):
+        assert _tasks(SMALL) != _tasks(replace(SMALL, seed=SMALL.seed + 1))
+
+    def test_batches_respect_batch_size(self):
+        batches = list(DatasetGenerator(SMALL).tasks())
+        assert all(len(batch) <= SMALL.batch_size for batch in batches)
+        assert sum(len(batch) for batch in batches) == SMALL.tasks
+
+    def test_most_tasks_are_closed(self):
+        statuses = Counter(row["status"] for row in _tasks(replace(SMALL, tasks=5_000)))
+        closed = statuses["done"] + statuses["dropped"]
+        assert 0.75 < closed / 5_000 < 0.95
+
+    def test_assignees_are_skewed(self):
+        assignees = Counter(row["assignee"] for row in _tasks(replace(SMALL, tasks=5_000)))
+        (_, top), *_ = assignees.most_common(1)
+        # Zipf: the busiest assignee owns far more than a uniform share
+        assert top > 10 * (5_000 / SMALL.users)
+
+    def test_dependencies_reference_earlier_tasks(self):
+        rows = _tasks(SMALL)
+        for index, row in enumerate(rows):
+            for dependency in row["depends_on"] + row["parents"]:
+                assert dependency < row["id"]
+            assert index > 0 or row["depends_on"] == []
+
+    def test_tasks_reference_generated_sprints_and_projects(self):
+        generator = DatasetGenerator(SMALL)
+        sprints = {row["id"]: row["project_id"] for b in generator.sprints() for row in b}
+        for row in _tasks(SMALL):
+            assert sprints[row["primary_sprint"]] == row["primary_project"]
+
+    def test_session_counters_match_turns(self):
+        generator = DatasetGenerator(SMALL)
+        counts = generator.conversation_turn_counts()
+        tokens = [0] * len(counts)
+        turns = [row for b in generator.conversation_turns(counts, tokens) for row in b]
+        sessions = [row for b in generator.conversation_sessions(counts, tokens) for row in b]
+
+        assert len(turns) == SMALL.turns
+        for session in sessions:
+            own = [t for t in turns if t["conversation_id"] == session["id"]]
+            assert session["turn_count"] == len(own)
+            assert session["token_estimate"] == sum(t["token_count"] for t in own)
+            assert [t["sequence"] for t in own] == list(range(1, len(own) + 1))
+
+    def test_context_graph_respects_depth(self):
+        spec = replace(SMALL, contexts=400, context_depth=6)
+        parents = {}
+        for name, rows in DatasetGenerator(spec).context_graph():
+            if name == "context_edges":
+                parents.update(
+                    {r["target_id"]: r["source_id"] for r in rows if r["relation_type"] == "parent_of"}
+                )
+
+        def depth(node):
+            level = 0
+            while node in parents:
+                node, level = parents[node], level + 1
+            return level
+
+        assert max(depth(node) for node in parents) == spec.context_depth - 1
+
+    def test_context_tables_skipped_by_default(self):
+        tables = {table.name for table, _ in generate_dataset(SMALL)}
+        assert "contexts" not in tables
+
+    def test_presets_scale_up(self):
+        assert PRESETS["small"].tasks < PRESETS["medium"].tasks < PRESETS["large"].tasks
+        assert PRESETS["large"].tasks == 1_000_000
+
+
+class TestLoading:
+    """Bulk load into SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_generated_dataset_row_counts(
+        self, generated_dataset: tuple[AsyncEngine, DatasetStats]
+    ):
+        engine, stats = generated_dataset
+
+        async with engine.connect() as conn:
+            tasks = await conn.scalar(select(func.count()).select_from(Task))
+            turns = await conn.scalar(select(func.count()).select_from(ConversationTurn))
+            turn_total = await conn.scalar(select(func.sum(ConversationSession.turn_count)))
+
+        assert tasks == stats.rows["tasks"]
+        assert turns == stats.rows["conversation_turns"] == turn_total
+        assert stats.rows_per_second > 0
+
+        print(
+            f"\n  Datagen - {stats.total_rows:,} rows in {stats.elapsed_seconds:.2f}s "
+            f"({stats.rows_per_second:,.0f} rows/s)"
+        )
+
+    @pytest.mark.asyncio
+    async def test_json_columns_round_trip(
+        self, generated_dataset: tuple[AsyncEngine, DatasetStats]
+    ):
+        engine, _ = generated_dataset
+
+        async with engine.connect() as conn:
+            row = (
+                await conn.execute(
+                    select(Task.acceptance_criteria, Task.actions_taken).where(
+                        Task.id == "T-GEN-0000001"
+                    )
+                )
+            ).one()
+            raw = await conn.scalar(text("SELECT typeof(assignees) FROM tasks LIMIT 1"))
+
+        assert isinstance(row.acceptance_criteria, list)
+        assert isinstance(row.actions_taken, list)
+        assert raw == "text"
@@ -0,0 +1,103 @@
+"""Cold-start import budget for the API worker.
+
+Every uvicorn worker and CLI invocation pays the import cost of
+``taskman_api.main``. These tests import it in a fresh interpreter under
+``python -X importtime`` and fail when the cumulative time exceeds the budget,
+or when optional subsystems that are meant to load lazily (OTLP gRPC exporter,
+httpx, cf_core QSE/context DAOs, TaskManService) are imported eagerly again.
+
+Environment Variables:
+    TASKMAN_IMPORT_BUDGET_MS: Cold import budget for taskman_api.main
+        (default: 3000). Tighten on dedicated CI runners.
+
+Run with: pytest tests/performance/test_import_time.py -v
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+BUDGET_MS = float(os.getenv("TASKMAN_IMPORT_BUDGET_MS", "3000"))
+
+LAZY_MODULES = (
+    "grpc",
+    "opentelemetry.exporter.otlp.proto.grpc.trace_exporter",
+    "httpx",
+    "cf_core.dao.context",
+    "cf_core.dao.qse",
+    "cf_core.services.qse",
+    "cf_core.services.taskman_service",
+)
+
+_SRC = Path(__file__).resolve().parents[2] / "src"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$")
+
+
+@dataclass
+class ColdImport:
+    """One fresh-interpreter import of taskman_api.main."""
+
+    cumulative_us: dict[str, int]
+    modules: set[str]
+
+    @property
+    def total_ms(self) -> float:
+        return self.cumulative_us["taskman_api.main"] / 1000
+
+    def slowest(self, count: int = 10) -> list[str]:
+        ranked = sorted(self.cumulative_us.items(), key=lambda item: item[1], reverse=True)
+        return [f"{name}: {us / 1000:.0f}ms" for name, us in ranked[:count]]
+
+
+def cold_import() -> ColdImport:
+    """Import taskman_api.main in a subprocess with ``-X importtime``."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_SRC), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import json, sys, taskman_api.main; print(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2))
+    return ColdImport(cumulative, set(json.loads(result.stdout.splitlines()[-1])))
+
+
+@pytest.fixture(scope="module")
+def cold() -> ColdImport:
+    # Best of two runs: the first may pay for cold .pyc and filesystem caches
+    return min(cold_import(), cold_import(), key=lambda run: run.total_ms)
+
+
+class TestImportBudget:
+    """Cold import time of the API entry point."""
+
+    def test_main_imports_within_budget(self, cold):
+        assert cold.total_ms <= BUDGET_MS, (
+            f"import taskman_api.main took {cold.total_ms:.0f}ms "
+            f"(budget {BUDGET_MS:.0f}ms); slowest: {cold.slowest()}"
+        )
+
+    @pytest.mark.parametrize("module", LAZY_MODULES)
+    def test_optional_subsystems_load_lazily(self, cold, module):
+        assert module not in cold.modules, f"{module} is imported eagerly by taskman_api.main"
@@ -0,0 +1,146 @@
+"""Tests for the load-test benchmark and baseline comparison.
+
+Run with: pytest tests/performance/test_loadtest.py -v
+"""
+
+import os
+from dataclasses import replace
+
+import pytest
+
+from taskman_api.perf.datagen import PRESETS, load_dataset
+from taskman_api.perf.loadtest import (
+    DEFAULT_MIX,
+    LoadTestConfig,
+    LoadTestResult,
+    RouteStats,
+    app_client,
+    build_schedule,
+    compare_to_baseline,
+    create_engine_for,
+    percentile,
+    run_load_test,
+)
+
+
+def _stats(**overrides) -> RouteStats:
+    defaults = {
+        "count": 100,
+        "errors": 0,
+        "p50_ms": 10.0,
+        "p95_ms": 20.0,
+        "p99_ms": 40.0,
+        "mean_ms": 12.0,
+        "max_ms": 50.0,
+        "throughput_rps": 200.0,
+    }
+    return RouteStats(**{**defaults, **overrides})
+
+
+def _result(**routes: RouteStats) -> LoadTestResult:
+    return LoadTestResult(routes=routes, elapsed_seconds=1.0)
+
+
+class TestStatistics:
+    """Percentiles and per-route summaries."""
+
+    def test_percentile_interpolates(self):
+        samples = [1.0, 2.0, 3.0, 4.0]
+        assert percentile(samples, 0) == 1.0
+        assert percentile(samples, 50) == 2.5
+        assert percentile(samples, 100) == 4.0
+
+    def test_percentile_of_empty_is_zero(self):
+        assert percentile([], 99) == 0.0
+
+    def test_route_stats_from_samples(self):
+        stats = RouteStats.from_samples([0.001 * i for i in range(1, 101)], errors=2, elapsed=2.0)
+        assert stats.count == 100
+        assert stats.errors == 2
+        assert stats.p50_ms == pytest.approx(50.5)
+        assert stats.p99_ms == pytest.approx(99.01)
+        assert stats.throughput_rps == 50.0
+
+    def test_result_json_round_trip(self, tmp_path):
+        result = _result(get_task=_stats(), list_tasks=_stats(p95_ms=33.0))
+        path = tmp_path / "result.json"
+        result.write(path)
+        loaded = LoadTestResult.read(path)
+        assert loaded.routes == result.routes
+        assert loaded.total_requests == 200
+
+
+class TestBaselineComparison:
+    """Regression detection against a stored baseline."""
+
+    def test_within_tolerance_passes(self):
+        baseline = _result(get_task=_stats())
+        current = _result(get_task=_stats(p95_ms=24.0, throughput_rps=170.0))
+        assert compare_to_baseline(current, baseline, tolerance=0.25) == []
+
+    def test_latency_regression_detected(self):
+        baseline = _result(get_task=_stats())
+        current = _result(get_task=_stats(p99_ms=60.0))
+        (regression,) = compare_to_baseline(current, baseline, tolerance=0.25)
+        assert (regression.route, regression.metric) == ("get_task", "p99_ms")
+        assert regression.change == pytest.approx(0.5)
+
+    def test_sub_millisecond_jitter_ignored(self):
+        baseline = _result(metrics=_stats(p50_ms=0.2, p95_ms=0.3, p99_ms=0.4))
+        current = _result(metrics=_stats(p50_ms=0.6, p95_ms=0.9, p99_ms=1.2))
+        assert compare_to_baseline(current, baseline, min_delta_ms=1.0) == []
+
+    def test_throughput_drop_detected(self):
+        baseline = _result(list_tasks=_stats())
+        current = _result(list_tasks=_stats(throughput_rps=100.0))
+        (regression,) = compare_to_baseline(current, baseline, tolerance=0.25)
+        assert regression.metric == "throughput_rps"
+
+    def test_new_errors_detected(self):
+        baseline = _result(create_task=_stats())
+        current = _result(create_task=_stats(errors=3))
+        (regression,) = compare_to_baseline(current, baseline)
+        assert regression.metric == "errors"
+
+    def test_routes_missing_from_baseline_skipped(self):
+        baseline = _result(get_task=_stats())
+        current = _result(get_task=_stats(), new_route=_stats(p99_ms=1_000.0))
+        assert compare_to_baseline(current, baseline) == []
+
+
+class TestRun:
+    """End-to-end run against the app on a generated SQLite file."""
+
+    def test_schedule_is_deterministic(self):
+        spec = PRESETS["small"]
+        config = LoadTestConfig(requests=200, warmup=10)
+        assert build_schedule(spec, config) == build_schedule(spec, config)
+        assert len(build_schedule(spec, config)) == 210
+
+    def test_in_memory_sqlite_rejected(self):
+        with pytest.raises(ValueError, match="file URL"):
+            create_engine_for("sqlite+aiosqlite:///:memory:")
+
+    @pytest.mark.asyncio
+    async def test_mix_runs_without_errors(self, tmp_path):
+        spec = PRESETS[os.environ.get("TASKMAN_PERF_SCALE", "small")]
+        config = LoadTestConfig(concurrency=8, requests=300, warmup=20)
+        engine = create_engine_for(f"sqlite+aiosqlite:///{tmp_path}/loadtest.db")
+        try:
+            await load_dataset(engine, spec)
+            async with app_client(engine) as client:
+                result = await run_load_test(client, spec, config)
+        finally:
+            await engine.dispose()
+
+        assert result.total_requests == config.requests
+        assert {op.name for op in DEFAULT_MIX} == set(result.routes)
+        failing = {name: s.errors for name, s in result.routes.items() if s.errors}
+        assert failing == {}
+
+        # A result compared against itself never regresses
+        assert compare_to_baseline(result, replace(result)) == []
+
+        print(f"\n  Load test - {result.throughput_rps:,.0f} req/s at concurrency 8")
+        for name, stats in sorted(result.routes.items()):
+            print(f"    {name:<22} p50={stats.p50_ms:7.2f}ms p99={stats.p99_ms:7.2f}ms")
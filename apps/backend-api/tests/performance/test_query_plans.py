@@ -0,0 +1,118 @@
+"""Query plan regression tests.
+
+Runs each common repository query against a generated dataset, EXPLAINs the
+statements it issued and fails if any of them scans a large table
+sequentially (see ``taskman_api.perf.query_plans``).
+
+Run with: pytest tests/performance/test_query_plans.py -v
+"""
+
+import importlib.util
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from taskman_api.db.base import Base
+from taskman_api.models import Task
+from taskman_api.perf.datagen import DatasetStats
+from taskman_api.perf.query_plans import capture_statements, sequential_scans
+from taskman_api.repositories.conversation_repository import (
+    ConversationSessionRepository,
+    ConversationTurnRepository,
+)
+from taskman_api.repositories.plan_repository import PlanRepository
+from taskman_api.repositories.task_repository import TaskRepository
+
+MIGRATION = (
+    Path(__file__).parents[2] / "alembic" / "versions" / "v2_0006_composite_query_indexes.py"
+)
+
+Query = Callable[[AsyncSession], Awaitable[Any]]
+
+QUERIES: dict[str, Query] = {
+    # Tasks
+    "task_get_by_id": lambda s: TaskRepository(s).get_by_id("T-000001"),
+    "task_get_by_ids": lambda s: TaskRepository(s).get_by_ids(["T-000001", "T-000002"]),
+    "task_search_status": lambda s: TaskRepository(s).search(status="in_progress"),
+    "task_search_sprint_status": lambda s: TaskRepository(s).search(
+        sprint_id="S-0001", status="in_progress"
+    ),
+    "task_search_project_status": lambda s: TaskRepository(s).search(
+        project_id="P-0001", status="in_progress"
+    ),
+    "task_search_assignee_status": lambda s: TaskRepository(s).search(
+        assignee="user-0001", status="in_progress"
+    ),
+    "task_get_by_sprint": lambda s: TaskRepository(s).get_by_sprint("S-0001"),
+    "task_get_by_project": lambda s: TaskRepository(s).get_by_project("P-0001"),
+    "task_get_by_assignee": lambda s: TaskRepository(s).get_by_assignee("user-0001"),
+    "task_facets_project": lambda s: TaskRepository(s).facet_counts(project_id="P-0001"),
+    "task_facets_sprint": lambda s: TaskRepository(s).facet_counts(sprint_id="S-0001"),
+    # Conversation sessions
+    "conversation_by_status": lambda s: ConversationSessionRepository(s).find_by_status("active"),
+    "conversation_by_project": lambda s: ConversationSessionRepository(s).find_by_project(
+        "P-0001", status="active"
+    ),
+    "conversation_by_worktree": lambda s: ConversationSessionRepository(s).find_by_worktree("main"),
+    "conversation_by_agent_type": lambda s: ConversationSessionRepository(s).find_by_agent_type(
+        "claude"
+    ),
+    "conversation_recent": lambda s: ConversationSessionRepository(s).find_recent(days=7),
+    # Conversation turns
+    "turns_by_conversation": lambda s: ConversationTurnRepository(s).find_by_conversation("C-1"),
+    "turns_by_role": lambda s: ConversationTurnRepository(s).find_by_role("C-1", "user"),
+    "turns_latest_sequence": lambda s: ConversationTurnRepository(s).get_latest_sequence("C-1"),
+    "turns_token_total": lambda s: ConversationTurnRepository(s).get_token_total("C-1"),
+    # Plans
+    "plan_by_status": lambda s: PlanRepository(s).find_by_status("in_progress"),
+    "plan_by_project": lambda s: PlanRepository(s).find_by_project("P-0001", status="approved"),
+    "plan_by_sprint": lambda s: PlanRepository(s).find_by_sprint("S-0001"),
+    "plan_by_conversation": lambda s: PlanRepository(s).find_by_conversation("C-1"),
+    "plan_stalled": lambda s: PlanRepository(s).find_stalled(),
+}
+
+
+@pytest.mark.parametrize("name", sorted(QUERIES))
+async def test_query_uses_an_index(
+    name: str, generated_dataset: tuple[AsyncEngine, DatasetStats]
+):
+    """Every statement of the query reads large tables through an index."""
+    engine, _ = generated_dataset
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    with capture_statements(engine) as statements:
+        async with session_factory() as session:
+            await QUERIES[name](session)
+
+    assert statements, f"{name} issued no SELECT"
+    scans = await sequential_scans(engine, statements)
+    assert not scans, "\n".join(str(scan) for scan in scans)
+
+
+async def test_unindexed_filter_is_reported(generated_dataset: tuple[AsyncEngine, DatasetStats]):
+    """The harness flags a query no index can serve."""
+    engine, _ = generated_dataset
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    with capture_statements(engine) as statements:
+        async with session_factory() as session:
+            await session.execute(select(Task).where(Task.title == "deploy"))
+
+    scans = await sequential_scans(engine, statements)
+    assert [scan.table for scan in scans] == ["tasks"]
+
+
+def test_migration_matches_model_indexes():
+    """The Alembic migration creates exactly the indexes the models declare."""
+    spec = importlib.util.spec_from_file_location("v2_0006", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    for name, table, columns, include in migration.INDEXES:
+        [index] = [i for i in Base.metadata.tables[table].indexes if i.name == name]
+        assert [column.name for column in index.columns] == columns
+        assert (index.dialect_options["postgresql"]["include"] or []) == include
@@ -0,0 +1,123 @@
+"""Unit tests for sparse fieldsets.
+
+Tests verify:
+- fields= parsing always selects id and rejects unknown names
+- Selected fields map to their backing columns (aliases and service overrides)
+- Partial schemas validate rows missing the unselected columns
+- Repositories load only the projected columns
+- Sparse list responses keep only the selected fields
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from taskman_api.core.errors import ValidationError
+from taskman_api.core.fieldsets import (
+    backing_columns,
+    format_fields,
+    parse_fields,
+    partial_model,
+)
+from taskman_api.core.responses import fieldset_response
+from taskman_api.db.base import Base
+from taskman_api.models.plan import Plan
+from taskman_api.repositories.base import BaseRepository
+from taskman_api.schemas.plan import PlanResponse
+from taskman_api.schemas.sprint import SprintResponse
+from taskman_api.services.base import BaseService, json_field_plan
+
+PLAN = {
+    "id": "PLAN-001",
+    "title": "Rollout",
+    "description": "Ship it",
+    "status": "in_progress",
+    "steps": [{"id": "s1", "order": 1, "title": "Deploy", "status": "completed"}],
+    "project_id": "P-API",
+    "tags": ["release"],
+    "extra_metadata": {"team": "api"},
+}
+
+
+class TestParseFields:
+    """fields= parameter parsing."""
+
+    def test_selects_id_and_strips_names(self):
+        assert parse_fields(" title, status ,", PlanResponse) == {"id", "title", "status"}
+        assert parse_fields(None, PlanResponse) is None
+        assert parse_fields(" , ", PlanResponse) is None
+
+    def test_unknown_and_computed_fields_are_rejected(self):
+        with pytest.raises(ValidationError, match="bogus, progress_pct") as exc_info:
+            parse_fields("title,progress_pct,bogus", PlanResponse)
+        assert exc_info.value.status_code == 422
+
+
+class TestProjection:
+    """Field to column mapping and partial schemas."""
+
+    def test_backing_columns(self):
+        columns = json_field_plan(Plan).columns
+        fields = frozenset({"id", "title", "metadata"})
+        assert backing_columns(PlanResponse, fields, columns) == ["extra_metadata", "id", "title"]
+
+        sprint_columns = frozenset({"id", "name", "project_id"})
+        fields = frozenset({"id", "primary_project", "velocity_target_points"})
+        assert backing_columns(SprintResponse, fields, sprint_columns) == ["id"]
+        overrides = {"primary_project": "project_id"}
+        assert backing_columns(SprintResponse, fields, sprint_columns, overrides) == [
+            "id",
+            "project_id",
+        ]
+
+    def test_partial_model_validates_selected_fields_only(self):
+        fields = frozenset({"id", "title", "metadata"})
+        partial = partial_model(PlanResponse, fields)
+
+        plan = partial.model_validate(
+            {"id": "PLAN-001", "title": "Rollout", "extra_metadata": {"team": "api"}}
+        )
+
+        assert isinstance(plan, PlanResponse)
+        assert plan.metadata == {"team": "api"}
+        assert plan.status is None
+        assert partial_model(PlanResponse, fields) is partial
+        assert format_fields(plan, frozenset({"id", "title"})) == "[PLAN-001] title=Rollout"
+
+
+class TestSparseList:
+    """Column projection through BaseService.list."""
+
+    @pytest.mark.asyncio
+    async def test_list_loads_only_selected_columns(self):
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        try:
+            async with factory() as session:
+                session.add(Plan(**PLAN))
+                await session.commit()
+
+            async with factory() as session:
+                repository = BaseRepository(Plan, session)
+                [row] = await repository.get_all(columns=["title"])
+                assert {"id", "title"} <= row.__dict__.keys()
+                assert "description" not in row.__dict__
+                assert "steps" not in row.__dict__
+
+            async with factory() as session:
+                service = BaseService(BaseRepository(Plan, session), Plan, PlanResponse)
+                selected = parse_fields("title,metadata", PlanResponse)
+                plans = (await service.list(fields=selected)).unwrap()
+        finally:
+            await engine.dispose()
+
+        response = fieldset_response(plans, selected)
+        assert response.body == (
+            b'[{"id":"PLAN-001","title":"Rollout","metadata":{"team":"api"}}]'
+        )
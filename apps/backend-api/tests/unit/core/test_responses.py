@@ -0,0 +1,70 @@
+"""Unit tests for trusted responses.
+
+Tests verify:
+- Trusted responses serialize to the same JSON as response_model validation
+- TASKMAN_VALIDATE_RESPONSES returns the payload for FastAPI to validate
+"""
+
+import pytest
+from fastapi import FastAPI, Response
+from httpx import ASGITransport, AsyncClient
+
+from taskman_api.core.responses import trusted_response, validate_responses
+from taskman_api.schemas.plan import PlanResponse
+
+PLAN = {
+    "id": "PLAN-001",
+    "title": "Rollout",
+    "description": None,
+    "status": "in_progress",
+    "steps": [{"id": "s1", "order": 1, "title": "Deploy", "status": "completed"}],
+    "conversation_id": None,
+    "project_id": "P-API",
+    "sprint_id": None,
+    "approved_at": None,
+    "completed_at": None,
+    "tags": ["release"],
+    "extra_metadata": {"team": "api"},
+    "created_at": "2026-01-01T00:00:00Z",
+    "updated_at": "2026-01-02T00:00:00Z",
+}
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/plans", response_model=list[PlanResponse])
+    async def plans() -> list[PlanResponse] | Response:
+        return trusted_response([PlanResponse.model_validate(PLAN)])
+
+    return app
+
+
+class TestTrustedResponse:
+    """Serialization without response_model re-validation."""
+
+    @pytest.mark.asyncio
+    async def test_matches_validated_output(self, monkeypatch):
+        transport = ASGITransport(app=_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            monkeypatch.setenv("TASKMAN_VALIDATE_RESPONSES", "true")
+            validated = await client.get("/plans")
+            monkeypatch.setenv("TASKMAN_VALIDATE_RESPONSES", "false")
+            trusted = await client.get("/plans")
+
+        assert trusted.status_code == validated.status_code == 200
+        assert trusted.headers["content-type"] == "application/json"
+        assert trusted.json() == validated.json()
+        assert trusted.json()[0]["metadata"] == {"team": "api"}
+
+    def test_validation_flag_returns_content(self, monkeypatch):
+        payload = [PlanResponse.model_validate(PLAN)]
+
+        monkeypatch.setenv("TASKMAN_VALIDATE_RESPONSES", "1")
+        assert validate_responses()
+        assert trusted_response(payload) is payload
+
+        monkeypatch.setenv("TASKMAN_VALIDATE_RESPONSES", "false")
+        response = trusted_response(payload, status_code=202)
+        assert isinstance(response, Response)
+        assert response.status_code == 202
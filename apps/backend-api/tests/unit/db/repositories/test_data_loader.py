@@ -0,0 +1,119 @@
+"""Unit tests for request-scoped DataLoaders.
+
+Tests verify:
+- get_by_id / exists calls gathered in one tick share one IN query
+- Results are memoized until the session writes, commits or rolls back
+- Pending inserts bypass the loader so autoflush still applies
+- Failed batches are not memoized
+- Sessions without loaders query directly
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from taskman_api.models.project import Project
+from taskman_api.repositories.data_loader import DataLoader, enable_data_loaders
+from taskman_api.repositories.project_repository import ProjectRepository
+
+
+def _count_selects(session: AsyncSession) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(session.bind.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+@pytest.fixture
+async def seeded_session(async_session: AsyncSession, sample_project: Project) -> AsyncSession:
+    async_session.add(sample_project)
+    await async_session.commit()
+    return async_session
+
+
+class TestDataLoaderRepository:
+    """Batched and memoized repository lookups."""
+
+    @pytest.mark.asyncio
+    async def test_gathered_lookups_share_one_query(self, seeded_session: AsyncSession):
+        enable_data_loaders(seeded_session)
+        repo = ProjectRepository(seeded_session)
+        statements = _count_selects(seeded_session)
+
+        found, missing, again = await asyncio.gather(
+            repo.get_by_id("P-TEST-001"), repo.get_by_id("P-NOPE"), repo.get_by_id("P-TEST-001")
+        )
+
+        assert found is again and found.id == "P-TEST-001"
+        assert missing is None
+        assert len(statements) == 1
+        assert " IN " in statements[0]
+
+        assert await asyncio.gather(repo.exists("P-TEST-001"), repo.exists("P-NOPE")) == [
+            True,
+            False,
+        ]
+        assert len(statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_memoized_until_write(self, seeded_session: AsyncSession):
+        enable_data_loaders(seeded_session)
+        repo = ProjectRepository(seeded_session)
+        statements = _count_selects(seeded_session)
+
+        assert not await repo.exists("P-NEW")
+        assert not await repo.exists("P-NEW")
+        assert len(statements) == 1
+
+        project = Project(
+            id="P-NEW", name="New", status="active", owner="o", start_date="2025-01-01"
+        )
+        seeded_session.add(project)
+        # Pending insert: queried directly so autoflush makes it visible
+        assert await repo.exists("P-NEW")
+        assert await repo.exists("P-NEW")
+
+        await repo.delete(project)
+        assert not await repo.exists("P-NEW")
+        assert len(statements) == 4
+
+    @pytest.mark.asyncio
+    async def test_disabled_session_queries_directly(self, seeded_session: AsyncSession):
+        repo = ProjectRepository(seeded_session)
+        statements = _count_selects(seeded_session)
+
+        await repo.get_by_id("P-TEST-001")
+        await repo.get_by_id("P-TEST-001")
+
+        assert len(statements) == 2
+
+
+class TestDataLoader:
+    """DataLoader batching semantics."""
+
+    @pytest.mark.asyncio
+    async def test_batches_are_split_and_failures_not_memoized(self):
+        calls: list[list[int]] = []
+
+        async def batch_load(keys: list[int]) -> list[int]:
+            calls.append(keys)
+            if len(calls) == 1:
+                raise RuntimeError("database unavailable")
+            return [key * 10 for key in keys]
+
+        loader = DataLoader(batch_load, max_batch_size=2)
+        with pytest.raises(RuntimeError):
+            await loader.load(1)
+
+        assert await asyncio.gather(*(loader.load(key) for key in (1, 2, 3))) == [10, 20, 30]
+        assert calls == [[1], [1, 2], [3]]
+
+        loader.clear()
+        assert await loader.load(3) == 30
+        assert calls[-1] == [3]
@@ -0,0 +1,165 @@
+"""Unit tests for hot/cold task archival.
+
+Tests verify:
+- Only tasks closed before the cutoff move to tasks_archive, in batches
+- max_batches bounds a run and a rerun picks up where it stopped
+- Task reads include archived tasks only with include_archived
+- Sprint velocity still counts archived done tasks
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from taskman_api.db.archival import TaskArchiver
+from taskman_api.db.base import Base
+from taskman_api.models.sprint import Sprint
+from taskman_api.models.task import TASKS_ARCHIVE, Task
+from taskman_api.repositories.task_repository import TaskRepository
+from taskman_api.services.sprint_service import SprintService
+
+NOW = datetime.now(UTC)
+
+# (id, status, days since last update)
+TASKS = [
+    ("T-OLD-DONE-1", "done", 200),
+    ("T-OLD-DONE-2", "done", 150),
+    ("T-OLD-DROPPED", "dropped", 120),
+    ("T-RECENT-DONE", "done", 10),
+    ("T-OLD-OPEN", "in_progress", 300),
+]
+ARCHIVABLE = {"T-OLD-DONE-1", "T-OLD-DONE-2", "T-OLD-DROPPED"}
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        for task_id, status, age_days in TASKS:
+            session.add(
+                Task(
+                    id=task_id,
+                    title=task_id,
+                    status=status,
+                    owner="alice",
+                    primary_project="P-ARCH",
+                    primary_sprint="S-ARCH",
+                    updated_at=NOW - timedelta(days=age_days),
+                )
+            )
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+async def _ids(engine, table) -> set[str]:
+    async with engine.connect() as conn:
+        return set((await conn.execute(select(table.c.id))).scalars())
+
+
+async def test_moves_only_long_closed_tasks(engine):
+    archiver = TaskArchiver(engine, archive_after_days=90, batch_size=2, rows_per_second=0)
+
+    report = await archiver.run()
+
+    assert report.archived == 3
+    assert report.batches == 2
+    assert report.complete
+    assert await _ids(engine, TASKS_ARCHIVE) == ARCHIVABLE
+    assert await _ids(engine, Task.__table__) == {"T-RECENT-DONE", "T-OLD-OPEN"}
+    async with engine.connect() as conn:
+        archived_at = await conn.scalar(select(func.count(TASKS_ARCHIVE.c.archived_at)))
+    assert archived_at == 3
+
+
+async def test_max_batches_bounds_a_run(engine):
+    archiver = TaskArchiver(engine, archive_after_days=90, batch_size=1, rows_per_second=0)
+
+    first = await archiver.run(max_batches=2)
+    assert (first.archived, first.complete) == (2, False)
+    # Oldest first
+    assert await _ids(engine, TASKS_ARCHIVE) == {"T-OLD-DONE-1", "T-OLD-DONE-2"}
+
+    second = await archiver.run()
+    assert (second.archived, second.complete) == (1, True)
+    assert await _ids(engine, TASKS_ARCHIVE) == ARCHIVABLE
+
+
+async def test_rate_limit_paces_batches(engine, monkeypatch):
+    sleeps: list[float] = []
+
+    async def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("taskman_api.db.archival.asyncio.sleep", _sleep)
+    archiver = TaskArchiver(engine, archive_after_days=90, batch_size=2, rows_per_second=4)
+
+    await archiver.run()
+
+    # 2 then 1 rows at 4 rows/s: up to 0.5s and 0.25s per batch, less time spent
+    assert len(sleeps) == 2
+    assert 0 < sleeps[0] <= 0.5
+    assert 0 < sleeps[1] <= 0.25
+
+
+async def test_reads_include_archive_only_when_asked(engine):
+    await TaskArchiver(engine, archive_after_days=90, rows_per_second=0).run()
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as session:
+        repo = TaskRepository(session)
+        hot, hot_total = await repo.search(project_id="P-ARCH")
+        both, both_total = await repo.search(project_id="P-ARCH", include_archived=True)
+        assert {task.id for task in hot} == {"T-RECENT-DONE", "T-OLD-OPEN"}
+        assert {task.id for task in both} == {task_id for task_id, _, _ in TASKS}
+        assert (hot_total, both_total) == (2, 5)
+
+        assert await repo.get_including_archived("T-OLD-DROPPED") is not None
+        assert await repo.get_including_archived("T-MISSING") is None
+
+        hot_counts = await repo.facet_counts(project_id="P-ARCH")
+        all_counts = await repo.facet_counts(project_id="P-ARCH", include_archived=True)
+        assert ("total", None, 2) in hot_counts
+        assert ("total", None, 5) in all_counts
+        assert ("status", "done", 3) in all_counts
+
+
+async def test_sprint_velocity_counts_archived_tasks(engine):
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add(
+            Sprint(
+                id="S-ARCH",
+                name="Archive Sprint",
+                status="closed",
+                cadence="biweekly",
+                project_id="P-ARCH",
+                start_date="2025-01-01",
+                end_date="2025-01-14",
+            )
+        )
+        # Keep updated_at, the close time the archiver goes by
+        await session.execute(update(Task).values(estimate_points=3, updated_at=Task.updated_at))
+        await session.commit()
+
+    async def _velocity() -> float:
+        async with session_factory() as session:
+            result = await SprintService(session).calculate_velocity("S-ARCH")
+            return result.ok()
+
+    before = await _velocity()
+    await TaskArchiver(engine, archive_after_days=90, rows_per_second=0).run()
+
+    assert before == 9
+    assert await _ids(engine, TASKS_ARCHIVE) == ARCHIVABLE
+    assert await _velocity() == before
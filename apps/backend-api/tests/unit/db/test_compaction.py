@@ -0,0 +1,195 @@
+"""Unit tests for conversation compaction and retention.
+
+Tests verify:
+- Old raw turns outside the recent window are rolled into summary turns and archived
+- Policies apply per agent type; young turns and partial chunks stay raw
+- Running totals keep counting compacted turns (O(1) stats reads)
+- max_batches bounds a run; cold turns past their retention are deleted
+"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from taskman_api.config import RetentionConfig, RetentionPolicy
+from taskman_api.db.base import Base
+from taskman_api.db.compaction import ConversationCompactor, extractive_summary
+from taskman_api.models.conversation import (
+    CONVERSATION_TURNS_ARCHIVE,
+    ConversationSession,
+    ConversationTurn,
+)
+from taskman_api.repositories.conversation_repository import ConversationTurnRepository
+
+NOW = datetime.now(UTC)
+
+# (conversation, agent type, turns, age of the first turn in days)
+CONVERSATIONS = [
+    ("CONV-OLD", "claude", 25, 30),
+    ("CONV-COPILOT", "copilot", 25, 30),
+    ("CONV-YOUNG", "claude", 25, 1),
+]
+
+RETENTION = RetentionConfig(
+    default=RetentionPolicy(keep_recent_turns=5, min_age_days=7, turns_per_summary=10),
+    agent_types={"copilot": RetentionPolicy(keep_recent_turns=20, turns_per_summary=10)},
+    rows_per_second=0,
+)
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        for conversation_id, agent_type, count, age_days in CONVERSATIONS:
+            session.add(
+                ConversationSession(
+                    id=conversation_id,
+                    title=conversation_id,
+                    agent_type=agent_type,
+                    turn_count=count,
+                    token_estimate=10 * count,
+                )
+            )
+            started = NOW - timedelta(days=age_days)
+            for sequence in range(1, count + 1):
+                session.add(
+                    ConversationTurn(
+                        id=f"{conversation_id}-{sequence:03d}",
+                        conversation_id=conversation_id,
+                        sequence=sequence,
+                        role="user" if sequence % 2 else "assistant",
+                        content=f"Message {sequence}\nmore detail",
+                        token_count=10,
+                        created_at=started + timedelta(minutes=sequence),
+                    )
+                )
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+async def _hot_turns(engine, conversation_id: str) -> list[tuple[int, bool]]:
+    async with engine.connect() as conn:
+        rows = await conn.execute(
+            select(ConversationTurn.sequence, ConversationTurn.is_summary)
+            .where(ConversationTurn.conversation_id == conversation_id)
+            .order_by(ConversationTurn.sequence)
+        )
+        return [tuple(row) for row in rows]
+
+
+async def test_rolls_old_turns_into_summaries(engine):
+    report = await ConversationCompactor(engine, RETENTION).run()
+
+    assert (report.conversations, report.summaries, report.turns_compacted) == (1, 2, 20)
+    assert report.complete
+    hot = await _hot_turns(engine, "CONV-OLD")
+    assert hot == [(10, True), (20, True)] + [(seq, False) for seq in range(21, 26)]
+    # Copilot keeps 20 recent turns (no full chunk left); young turns are not due
+    assert len(await _hot_turns(engine, "CONV-COPILOT")) == 25
+    assert len(await _hot_turns(engine, "CONV-YOUNG")) == 25
+
+    async with engine.connect() as conn:
+        archived = (
+            await conn.execute(
+                select(
+                    CONVERSATION_TURNS_ARCHIVE.c.sequence,
+                    CONVERSATION_TURNS_ARCHIVE.c.content,
+                    CONVERSATION_TURNS_ARCHIVE.c.summary_id,
+                ).order_by(CONVERSATION_TURNS_ARCHIVE.c.sequence)
+            )
+        ).all()
+        compacted_through = await conn.scalar(
+            select(ConversationSession.compacted_through).where(
+                ConversationSession.id == "CONV-OLD"
+            )
+        )
+    assert [row.sequence for row in archived] == list(range(1, 21))
+    assert archived[0].content == "Message 1\nmore detail"
+    assert len({row.summary_id for row in archived}) == 2
+    assert compacted_through == 20
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        repo = ConversationTurnRepository(session)
+        summaries = (await repo.find_summaries("CONV-OLD")).value
+        assert summaries[0].extra_metadata["compacted"] == {
+            "from_sequence": 1,
+            "to_sequence": 10,
+            "turns": 10,
+            "tokens": 100,
+        }
+        assert summaries[0].content.startswith("Summary of turns 1-10 (10 turns, 100 tokens):")
+        assert "[2] assistant: Message 2..." in summaries[0].content
+        # Running totals still cover the compacted turns
+        assert (await repo.count_by_conversation("CONV-OLD")).value == 25
+        assert (await repo.get_token_total("CONV-OLD")).value == 250
+
+    rerun = await ConversationCompactor(engine, RETENTION).run()
+    assert rerun.summaries == 0
+
+
+async def test_max_batches_bounds_a_run(engine):
+    first = await ConversationCompactor(engine, RETENTION).run(max_batches=1)
+    assert (first.summaries, first.complete) == (1, False)
+
+    second = await ConversationCompactor(engine, RETENTION).run()
+    assert (second.summaries, second.complete) == (1, True)
+    assert [seq for seq, summary in await _hot_turns(engine, "CONV-OLD") if summary] == [10, 20]
+
+
+async def test_disabled_policy_skips_agent_type(engine):
+    retention = RETENTION.model_copy(
+        update={"default": RetentionPolicy(enabled=False, keep_recent_turns=5)}
+    )
+    report = await ConversationCompactor(engine, retention).run()
+    assert report.summaries == 0
+
+
+async def test_cold_turns_expire_after_retention(engine):
+    await ConversationCompactor(engine, RETENTION).run()
+    async with engine.begin() as conn:
+        await conn.execute(
+            update(CONVERSATION_TURNS_ARCHIVE)
+            .where(CONVERSATION_TURNS_ARCHIVE.c.sequence <= 10)
+            .values(archived_at=NOW - timedelta(days=400))
+        )
+
+    keep_forever = await ConversationCompactor(engine, RETENTION).run()
+    assert keep_forever.cold_turns_deleted == 0
+
+    retention = RETENTION.model_copy(
+        update={
+            "default": RETENTION.default.model_copy(update={"cold_retention_days": 365}),
+        }
+    )
+    report = await ConversationCompactor(engine, retention).run()
+    assert report.cold_turns_deleted == 10
+    async with engine.connect() as conn:
+        remaining = await conn.scalar(select(func.count()).select_from(CONVERSATION_TURNS_ARCHIVE))
+    assert remaining == 10
+
+
+def test_extractive_summary_truncates_long_lines():
+    turns = [
+        SimpleNamespace(sequence=1, role="tool", content="x" * 500, token_count=5),
+        SimpleNamespace(sequence=2, role="tool", content="done", token_count=5),
+    ]
+
+    lines = extractive_summary(turns).splitlines()
+
+    assert lines[0] == "Summary of turns 1-2 (2 turns, 10 tokens):"
+    assert lines[1] == "[1] tool: " + "x" * 160 + "..."
+    assert lines[2] == "[2] tool: done"
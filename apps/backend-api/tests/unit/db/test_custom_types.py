@@ -0,0 +1,126 @@
+"""Unit tests for compressed column types.
+
+Tests verify:
+- Values at or above TASKMAN_COMPRESS_MIN_BYTES are stored zlib-compressed
+- Small and incompressible values are stored raw; both read back unchanged
+- Compression ratio and decompression metrics are recorded per column
+- Legacy text values in unmigrated TEXT columns still read back
+"""
+
+import os
+import zlib
+
+import pytest
+from sqlalchemy import Column, Integer, Table, column, insert, select, table, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from taskman_api.db.custom_types import (
+    RAW_HEADER,
+    ZLIB_HEADER,
+    CompressedJSON,
+    CompressedText,
+    pack,
+    unpack,
+)
+from taskman_api.telemetry.compression_metrics import (
+    db_compression_values_total,
+    db_decompressions_total,
+)
+
+LARGE_TEXT = "the quick brown fox jumps over the lazy dog. " * 100
+
+
+class CompressBase(DeclarativeBase):
+    pass
+
+
+NOTES = Table(
+    "notes",
+    CompressBase.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("body", CompressedText("notes.body")),
+    Column("payload", CompressedJSON("notes.payload")),
+)
+
+
+def _sample(metric, **labels) -> float:
+    return metric.labels(**labels)._value.get()
+
+
+def test_pack_compresses_large_values_only():
+    large = LARGE_TEXT.encode()
+
+    packed = pack(large)
+    assert packed[:1] == ZLIB_HEADER
+    assert len(packed) < len(large) / 5
+    assert unpack(packed) == large
+
+    assert pack(b"short") == RAW_HEADER + b"short"
+    assert unpack(RAW_HEADER + b"short") == b"short"
+
+
+def test_incompressible_values_stay_raw():
+    noise = os.urandom(4096)
+    assert pack(noise) == RAW_HEADER + noise
+
+
+def test_threshold_comes_from_environment(monkeypatch):
+    monkeypatch.setenv("TASKMAN_COMPRESS_MIN_BYTES", "10")
+    assert pack(b"a" * 64)[:1] == ZLIB_HEADER
+    monkeypatch.setenv("TASKMAN_COMPRESS_MIN_BYTES", "100")
+    assert pack(b"a" * 64)[:1] == RAW_HEADER
+
+
+def test_unknown_header_is_rejected():
+    with pytest.raises(ValueError, match="Unknown compression header"):
+        unpack(b"\x7fdata", "notes.body")
+
+
+async def test_columns_round_trip_and_record_metrics():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(CompressBase.metadata.create_all)
+    payload = [{"output": LARGE_TEXT}, {"exit_code": 0}]
+    compressed_before = _sample(db_compression_values_total, column="notes.body", encoding="zlib")
+    decompressed_before = _sample(db_decompressions_total, column="notes.body")
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(NOTES),
+            [
+                {"id": 1, "body": LARGE_TEXT, "payload": payload},
+                {"id": 2, "body": "short", "payload": []},
+            ],
+        )
+        rows = (await conn.execute(select(NOTES).order_by(NOTES.c.id))).all()
+        raw = table("notes", column("id"), column("body"))
+        stored = (await conn.execute(select(raw.c.body).order_by(raw.c.id))).scalars().all()
+    await engine.dispose()
+
+    assert [tuple(row) for row in rows] == [(1, LARGE_TEXT, payload), (2, "short", [])]
+    assert stored[0][:1] == ZLIB_HEADER
+    assert zlib.decompress(stored[0][1:]).decode() == LARGE_TEXT
+    assert stored[1] == RAW_HEADER + b"short"
+    assert _sample(db_compression_values_total, column="notes.body", encoding="zlib") == (
+        compressed_before + 1
+    )
+    assert _sample(db_decompressions_total, column="notes.body") == decompressed_before + 1
+
+
+async def test_legacy_text_rows_read_back():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        # The pre-compression schema, as left on an unmigrated fallback database
+        await conn.execute(text("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT, payload JSON)"))
+        await conn.execute(
+            text("INSERT INTO notes VALUES (1, 'legacy body', '[{\"exit_code\": 0}]')")
+        )
+        await conn.execute(insert(NOTES), [{"id": 2, "body": LARGE_TEXT, "payload": []}])
+        rows = (await conn.execute(select(NOTES).order_by(NOTES.c.id))).all()
+    await engine.dispose()
+
+    assert [tuple(row) for row in rows] == [
+        (1, "legacy body", [{"exit_code": 0}]),
+        (2, LARGE_TEXT, []),
+    ]
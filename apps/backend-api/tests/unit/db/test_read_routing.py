@@ -0,0 +1,209 @@
+"""Unit tests for read-replica routing.
+
+Tests verify:
+- Marked reads go to the replica; writes, locking reads and unmarked code stay on primary
+- A session that has written reads its own writes from primary
+- Primary pins (write requests, X-Write-Token) override read-only marks
+- The replica is refused when its circuit is not closed or it lags too far behind
+"""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Column, Integer, String, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from taskman_api.db.connection_manager import ConnectionManager
+from taskman_api.db.read_routing import (
+    PRIMARY,
+    REPLICA,
+    ReadWriteSession,
+    current_routing,
+    read_only,
+    routing,
+)
+from taskman_api.db.tier_health import OPEN
+from taskman_api.dependencies import ReadOnly
+from taskman_api.middleware import ReadRoutingMiddleware
+from taskman_api.middleware.read_routing_middleware import WRITE_TOKEN_HEADER, is_recent_write
+
+
+class RoutingBase(DeclarativeBase):
+    pass
+
+
+class Item(RoutingBase):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    source = Column(String(20))
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engines = {}
+    for name in ("primary", "replica"):
+        engines[name] = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engines[name].begin() as conn:
+            await conn.run_sync(RoutingBase.metadata.create_all)
+            await conn.execute(Item.__table__.insert().values(id=1, source=name))
+
+    replica = {"engine": engines["replica"].sync_engine}
+    factory = async_sessionmaker(
+        engines["primary"],
+        sync_session_class=ReadWriteSession,
+        info={"replica": lambda: replica["engine"]},
+        expire_on_commit=False,
+    )
+    factory.replica = replica
+    yield factory
+    for engine in engines.values():
+        await engine.dispose()
+
+
+async def _source(session) -> str:
+    return await session.scalar(select(Item.source).where(Item.id == 1))
+
+
+class TestReadWriteSession:
+    """Per-statement binding."""
+
+    @pytest.mark.asyncio
+    async def test_unmarked_reads_stay_on_primary(self, session_factory):
+        async with session_factory() as session:
+            assert await _source(session) == "primary"
+
+    @pytest.mark.asyncio
+    async def test_read_only_methods_use_replica(self, session_factory):
+        @read_only
+        async def lookup(session):
+            return await _source(session)
+
+        async with session_factory() as session:
+            assert await lookup(session) == "replica"
+            assert current_routing() is None
+
+    @pytest.mark.asyncio
+    async def test_session_reads_its_own_writes(self, session_factory):
+        async with session_factory() as session:
+            session.add(Item(id=2, source="new"))
+            await session.flush()
+            with routing(REPLICA):
+                assert await _source(session) == "primary"
+
+    @pytest.mark.asyncio
+    async def test_locking_reads_and_pins_stay_on_primary(self, session_factory):
+        async with session_factory() as session:
+            with routing(REPLICA):
+                locked = select(Item.source).where(Item.id == 1).with_for_update()
+                assert await session.scalar(locked) == "primary"
+
+        async with session_factory() as session:
+            with routing(PRIMARY), routing(REPLICA):
+                assert await _source(session) == "primary"
+
+    @pytest.mark.asyncio
+    async def test_unavailable_replica_falls_back_to_primary(self, session_factory):
+        session_factory.replica["engine"] = None
+        async with session_factory() as session:
+            with routing(REPLICA):
+                assert await _source(session) == "primary"
+
+
+class TestReplicaGuard:
+    """ConnectionManager.replica_bind."""
+
+    @pytest.fixture
+    async def manager(self, tmp_path):
+        manager = ConnectionManager(
+            "postgresql://u:p@localhost:1/primary",
+            "postgresql://u:p@localhost:1/replica",
+            str(tmp_path / "fallback.db"),
+            read_replica=True,
+            replica_max_lag=5.0,
+        )
+        yield manager
+        await manager.dispose()
+
+    @pytest.mark.asyncio
+    async def test_lag_guard(self, manager):
+        assert manager.replica_bind() is None  # lag not measured yet
+
+        manager.replica_lag = 1.0
+        assert manager.replica_bind() is manager.secondary_engine.sync_engine
+
+        manager.replica_lag = 10.0
+        assert manager.replica_bind() is None
+
+    @pytest.mark.asyncio
+    async def test_circuit_and_failover(self, manager):
+        manager.replica_lag = 0.0
+        manager.breakers["secondary"].state = OPEN
+        assert manager.replica_bind() is None
+
+        manager.breakers["secondary"].state = "closed"
+        manager._active_tier = "secondary"
+        assert manager.replica_bind() is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_flag(self, tmp_path):
+        manager = ConnectionManager(
+            "postgresql://u:p@localhost:1/primary",
+            "postgresql://u:p@localhost:1/replica",
+            str(tmp_path / "fallback.db"),
+        )
+        manager.replica_lag = 0.0
+        assert manager.replica_bind() is None
+        assert manager.PrimarySession.kw.get("sync_session_class") is None
+
+
+class TestReadRoutingMiddleware:
+    """Write pins and read-your-writes tokens."""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+
+        @app.get("/plain")
+        async def plain():
+            return {"routing": current_routing()}
+
+        @app.get("/marked", dependencies=[ReadOnly])
+        async def marked():
+            return {"routing": current_routing()}
+
+        @app.post("/write")
+        async def write():
+            return {"routing": current_routing()}
+
+        app.add_middleware(ReadRoutingMiddleware, window=10.0)
+        return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+    @pytest.mark.asyncio
+    async def test_routing_marks(self, client):
+        async with client:
+            write = await client.post("/write")
+            token = write.headers[WRITE_TOKEN_HEADER]
+            marked = await client.get("/marked")
+            pinned = await client.get("/marked", headers={WRITE_TOKEN_HEADER: token})
+            stale = await client.get(
+                "/marked", headers={WRITE_TOKEN_HEADER: str(int((time.time() - 60) * 1000))}
+            )
+            plain = await client.get("/plain")
+
+        assert write.json() == {"routing": PRIMARY}
+        assert marked.json() == {"routing": REPLICA}
+        assert pinned.json() == {"routing": PRIMARY}
+        assert stale.json() == {"routing": REPLICA}
+        assert plain.json() == {"routing": None}
+        assert WRITE_TOKEN_HEADER not in marked.headers
+
+    def test_is_recent_write(self):
+        now = 1_000_000.0
+        assert is_recent_write(b"999995000", window=10, now=now)
+        assert not is_recent_write(b"999980000", window=10, now=now)
+        assert not is_recent_write(b"not-a-number", window=10, now=now)
+        assert not is_recent_write(None, window=10, now=now)
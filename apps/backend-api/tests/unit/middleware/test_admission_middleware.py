@@ -0,0 +1,155 @@
+"""Unit tests for the admission control middleware.
+
+Tests verify:
+- Requests pass untouched below the overload threshold
+- Bulk requests are shed first, then interactive reads, then writes
+- Health endpoints are never shed
+- Shed requests get 503 with a pressure-scaled Retry-After
+- Route priority overrides, including method-qualified globs
+- The loop lag monitor detects a blocked event loop
+"""
+
+import asyncio
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from taskman_api.middleware import AdmissionControlMiddleware
+from taskman_api.telemetry import request_metrics
+from taskman_api.telemetry.loop_lag import LoopLagMonitor
+
+
+async def _ok(request):
+    return PlainTextResponse("ok")
+
+
+class _Signals:
+    def __init__(self) -> None:
+        self.lag = 0.0
+        self.wait = 0.0
+
+
+def _client(signals: _Signals, **kwargs) -> AsyncClient:
+    inner = Starlette(
+        routes=[
+            Route(path, _ok, methods=["GET", "POST"])
+            for path in (
+                "/health",
+                "/health/telemetry",
+                "/metrics",
+                "/api/v1/tasks",
+                "/api/v1/plans/stats",
+                "/api/v1/search",
+            )
+        ]
+    )
+    app = AdmissionControlMiddleware(
+        inner,
+        loop_lag_threshold_ms=100,
+        pool_wait_threshold_ms=50,
+        lag_source=lambda: signals.lag,
+        wait_source=lambda: signals.wait,
+        **kwargs,
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def _statuses(client: AsyncClient) -> dict[str, int]:
+    requests = {
+        "health": ("GET", "/health/telemetry"),
+        "metrics": ("GET", "/metrics"),
+        "stats": ("GET", "/api/v1/plans/stats"),
+        "read": ("GET", "/api/v1/tasks"),
+        "write": ("POST", "/api/v1/tasks"),
+    }
+    return {
+        name: (await client.request(method, path)).status_code
+        for name, (method, path) in requests.items()
+    }
+
+
+class TestShedding:
+    """Priority-ordered rejection under pressure."""
+
+    @pytest.mark.asyncio
+    async def test_priorities_shed_in_order(self):
+        signals = _Signals()
+        async with _client(signals) as client:
+            assert set((await _statuses(client)).values()) == {200}
+
+            signals.lag = 0.15  # 1.5x
+            assert await _statuses(client) == {
+                "health": 200,
+                "metrics": 503,
+                "stats": 503,
+                "read": 200,
+                "write": 200,
+            }
+
+            signals.wait = 0.125  # 2.5x, from the pool signal
+            statuses = await _statuses(client)
+            assert (statuses["read"], statuses["write"]) == (503, 200)
+
+            signals.lag = 1.0  # 10x
+            statuses = await _statuses(client)
+            assert (statuses["health"], statuses["write"]) == (200, 503)
+            assert (await client.get("/health")).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_shed_response_has_retry_after(self):
+        signals = _Signals()
+        signals.lag = 0.25
+        async with _client(signals, retry_after=3) as client:
+            response = await client.get("/metrics")
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "9"  # 3s * ceil(2.5)
+        assert response.json()["priority"] == "bulk"
+
+    @pytest.mark.asyncio
+    async def test_route_overrides(self):
+        signals = _Signals()
+        signals.lag = 0.15
+        overrides = {"/api/v1/plans/stats": "interactive", "GET /api/v1/search": "bulk"}
+        async with _client(signals, route_priorities=overrides) as client:
+            assert (await client.get("/api/v1/plans/stats")).status_code == 200
+            assert (await client.get("/api/v1/search")).status_code == 503
+            assert (await client.post("/api/v1/search")).status_code == 200
+
+    def test_unknown_priority_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown priority"):
+            AdmissionControlMiddleware(_ok, route_priorities={"/x": "urgent"})
+
+
+class TestSignals:
+    """Overload signal sources."""
+
+    @pytest.mark.asyncio
+    async def test_loop_lag_monitor_detects_blocking(self):
+        monitor = LoopLagMonitor(interval=0.05)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.06)
+            assert monitor.lag < 0.05
+            time.sleep(0.2)  # block the loop
+            await asyncio.sleep(0.01)  # the overdue monitor wakes first
+            assert monitor.lag >= 0.1
+        finally:
+            await monitor.stop()
+        assert monitor.lag == 0.0
+
+    def test_recent_checkout_wait_decays(self, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr(request_metrics, "_recent_waits", {})
+        monkeypatch.setattr(request_metrics.time, "monotonic", lambda: clock[0])
+
+        for _ in range(20):
+            request_metrics.record_checkout_wait("admission", 0.5)
+        assert request_metrics.recent_checkout_wait() == pytest.approx(0.5, rel=0.05)
+
+        clock[0] += request_metrics.RECENT_WAIT_HALF_LIFE
+        assert request_metrics.recent_checkout_wait() == pytest.approx(0.25, rel=0.05)
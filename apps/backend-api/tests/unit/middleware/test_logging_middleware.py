@@ -0,0 +1,143 @@
+"""Unit tests for the ASGI logging middleware.
+
+Tests verify:
+- X-Request-ID propagation and X-Response-Time header
+- Query parameter redaction and health endpoint exclusion
+- Sampling: errors and slow requests always logged, fast successes sampled
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from structlog.testing import capture_logs
+
+from taskman_api.middleware.logging_middleware import LoggingMiddleware, _redact_query_params
+
+
+async def _ok(request):
+    return PlainTextResponse("ok")
+
+
+async def _missing(request):
+    return PlainTextResponse("missing", status_code=404)
+
+
+async def _boom(request):
+    raise RuntimeError("boom")
+
+
+def _app(**middleware_kwargs) -> LoggingMiddleware:
+    inner = Starlette(
+        routes=[
+            Route("/ok", _ok),
+            Route("/missing", _missing),
+            Route("/boom", _boom),
+            Route("/health", _ok),
+        ]
+    )
+    return LoggingMiddleware(inner, **middleware_kwargs)
+
+
+async def _get(app, path: str, **kwargs):
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, **kwargs)
+
+
+def _events(logs: list[dict], event: str) -> list[dict]:
+    return [entry for entry in logs if entry["event"] == event]
+
+
+class TestHeaders:
+    """Correlation and timing headers."""
+
+    @pytest.mark.asyncio
+    async def test_request_id_propagated(self):
+        response = await _get(_app(), "/ok", headers={"X-Request-ID": "req-123"})
+        assert response.headers["X-Request-ID"] == "req-123"
+        assert response.headers["X-Response-Time"].endswith("ms")
+
+    @pytest.mark.asyncio
+    async def test_request_id_generated(self):
+        response = await _get(_app(), "/ok")
+        assert len(response.headers["X-Request-ID"]) == 36
+
+
+class TestLogging:
+    """Log content, redaction and exclusion."""
+
+    @pytest.mark.asyncio
+    async def test_single_event_with_redacted_query(self):
+        with capture_logs() as logs:
+            await _get(_app(sample_rate=1.0), "/ok?token=abc&page=2")
+
+        (event,) = _events(logs, "http_response")
+        assert event["status_code"] == 200
+        assert event["query"] == "token=***REDACTED***&page=2"
+        assert event["client_ip"] == "127.0.0.1"
+        assert _events(logs, "http_request") == []
+
+    @pytest.mark.asyncio
+    async def test_forwarded_for_used_as_client_ip(self):
+        with capture_logs() as logs:
+            await _get(
+                _app(sample_rate=1.0), "/ok", headers={"X-Forwarded-For": "10.0.0.1, 10.0.0.2"}
+            )
+        assert _events(logs, "http_response")[0]["client_ip"] == "10.0.0.1"
+
+    @pytest.mark.asyncio
+    async def test_health_endpoint_excluded(self, monkeypatch):
+        monkeypatch.delenv("TASKMAN_LOG_HEALTH_ENDPOINTS", raising=False)
+        with capture_logs() as logs:
+            await _get(_app(sample_rate=1.0), "/health")
+        assert _events(logs, "http_response") == []
+
+    def test_redaction_is_case_insensitive(self):
+        assert _redact_query_params("API_KEY=x&q=1") == "API_KEY=***REDACTED***&q=1"
+
+
+class TestSampling:
+    """Sampling decisions."""
+
+    @pytest.mark.asyncio
+    async def test_fast_success_dropped_at_zero_rate(self):
+        with capture_logs() as logs:
+            await _get(_app(sample_rate=0.0), "/ok")
+        assert _events(logs, "http_response") == []
+
+    @pytest.mark.asyncio
+    async def test_errors_always_logged(self):
+        with capture_logs() as logs:
+            await _get(_app(sample_rate=0.0), "/missing")
+        (event,) = _events(logs, "http_response")
+        assert event["log_level"] == "warning"
+
+    @pytest.mark.asyncio
+    async def test_slow_requests_always_logged(self):
+        with capture_logs() as logs:
+            await _get(_app(sample_rate=0.0, slow_threshold_ms=0.0), "/ok")
+        (event,) = _events(logs, "http_response")
+        assert event["slow"] is True
+
+    @pytest.mark.asyncio
+    async def test_exceptions_logged_and_counted(self):
+        metrics = {"requests_processed": 0, "errors_logged": 0}
+        LoggingMiddleware.set_metrics(metrics)
+        try:
+            with capture_logs() as logs:
+                response = await _get(_app(sample_rate=0.0), "/boom")
+        finally:
+            LoggingMiddleware._metrics_callback = None
+
+        assert response.status_code == 500
+        assert _events(logs, "http_request_error")[0]["error_type"] == "RuntimeError"
+        assert metrics == {"requests_processed": 1, "errors_logged": 1}
+
+    def test_sample_rate_from_environment(self, monkeypatch):
+        monkeypatch.setenv("TASKMAN_LOG_SAMPLE_RATE", "0.25")
+        monkeypatch.setenv("TASKMAN_LOG_SLOW_MS", "not-a-number")
+        middleware = _app()
+        assert middleware.sample_rate == 0.25
+        assert middleware.slow_threshold_ms == 500.0
@@ -4,6 +4,8 @@ Tests generic CRUD operations with mock repositories.
 """
 
 
+from unittest.mock import AsyncMock
+
 import pytest
 
 from taskman_api.core.enums import Priority
@@ -11,7 +13,7 @@ from taskman_api.core.errors import AppError, ConflictError, NotFoundError
 from taskman_api.core.result import Err, Ok
 from taskman_api.models.task import Task
 from taskman_api.schemas.task import TaskCreateRequest, TaskResponse, TaskUpdateRequest
-from taskman_api.services.base import BaseService
+from taskman_api.services.base import BaseService, json_field_plan
 
 
 class TestBaseServiceCreate:
@@ -248,6 +250,29 @@ class TestBaseServiceList:
         assert len(tasks) == 0
 
 
+class TestBaseServiceGetMany:
+    """Test suite for BaseService.get_many batch lookups."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_orders_and_reports_missing(self, mock_task_repository, sample_task):
+        """Test results follow request order, deduplicated, with unknown IDs reported."""
+        # Arrange
+        service = BaseService(mock_task_repository, Task, TaskResponse)
+        mock_task_repository.get_by_ids = AsyncMock(return_value=[sample_task])
+
+        # Act
+        result = await service.get_many(["T-NONE", sample_task.id, "T-NONE"])
+
+        # Assert
+        assert isinstance(result, Ok)
+        tasks, missing = result.ok()
+        assert [task.id for task in tasks] == [sample_task.id]
+        assert missing == ["T-NONE"]
+        mock_task_repository.get_by_ids.assert_called_once_with(
+            ["T-NONE", sample_task.id], columns=None
+        )
+
+
 class TestBaseServiceUtility:
     """Test suite for BaseService utility methods."""
 
@@ -300,3 +325,39 @@ class TestBaseServiceUtility:
         assert isinstance(result, Ok)
         assert result.ok() == 42
         mock_task_repository.count.assert_called_once()
+
+
+class TestBaseServiceJsonFields:
+    """Test suite for the per-model JSON serialization plan."""
+
+    def test_plan_lists_json_columns_once(self):
+        """Test the plan names JSON columns with their containers and is cached."""
+        plan = json_field_plan(Task)
+
+        assert plan is json_field_plan(Task)
+        assert plan.json_columns["assignees"] is list
+        assert plan.json_columns["quality_gates"] is dict
+        assert "title" not in plan.json_columns
+        assert "title" in plan.columns
+
+    def test_serialize_keeps_json_values_native(self, mock_task_repository):
+        """Test lists stay lists for the JSON column type and unknown keys are dropped."""
+        service = BaseService(mock_task_repository, Task, TaskResponse)
+
+        data = service._serialize_json_fields({"labels": ["a"], "title": "T", "bogus": 1})
+
+        assert data == {"labels": ["a"], "title": "T"}
+
+    def test_deserialize_decodes_only_legacy_json_strings(self, mock_task_repository, sample_task):
+        """Test encoded strings in JSON columns are decoded; text columns are left alone."""
+        service = BaseService(mock_task_repository, Task, TaskResponse)
+        sample_task.labels = '["legacy"]'
+        sample_task.observability = '["wrong container"]'
+        sample_task.description = "[1, 2]"
+
+        data = service._deserialize_json_fields(sample_task)
+
+        assert data["labels"] == ["legacy"]
+        assert data["assignees"] == ["assignee1"]
+        assert data["observability"] == '["wrong container"]'
+        assert data["description"] == "[1, 2]"
@@ -64,7 +64,11 @@ class TestSprintServiceMetrics:
 
             # Verify repository was called with correct filter
             mock_task_repository.find_by_sprint.assert_called_with(
-                "S-TEST-001", status=TaskStatus.DONE, limit=1000, offset=0
+                "S-TEST-001",
+                status=TaskStatus.DONE,
+                limit=1000,
+                offset=0,
+                include_archived=True,
             )
 
     @pytest.mark.asyncio
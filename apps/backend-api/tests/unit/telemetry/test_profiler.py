@@ -0,0 +1,200 @@
+"""Unit tests for the on-demand request profiler.
+
+Tests verify:
+- Samples are categorized (db, pydantic, json, await, app) and collapsed
+- Suspended time is attributed through the task's await chain
+- Profiles are stored, pruned and loaded by id
+- X-Profile and /debug/profile are admin-only
+"""
+
+import asyncio
+import time
+from collections import Counter
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from taskman_api.auth import create_access_token
+from taskman_api.middleware import ProfilingMiddleware
+from taskman_api.routers import diagnostic_router
+from taskman_api.telemetry import profiler as profiler_module
+from taskman_api.telemetry.profiler import (
+    Profile,
+    ProfileStore,
+    SamplingProfiler,
+    categorize,
+)
+
+
+def _auth(*roles: str) -> dict[str, str]:
+    token = create_access_token({"sub": "user-1", "email": "u@example.com", "roles": list(roles)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProfileStore(tmp_path)
+
+
+@pytest.fixture
+def app(store, monkeypatch):
+    import taskman_api.middleware.profiling_middleware as middleware_module
+    import taskman_api.routers.diagnostic as diagnostic_module
+
+    monkeypatch.setattr(middleware_module, "get_profile_store", lambda: store)
+    monkeypatch.setattr(diagnostic_module, "get_profile_store", lambda: store)
+
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        deadline = time.perf_counter() + 0.02
+        while time.perf_counter() < deadline:
+            pass
+        await asyncio.sleep(0.02)
+        return {"ok": True}
+
+    app.include_router(diagnostic_router, prefix="/api/v1/diagnostic")
+    app.add_middleware(ProfilingMiddleware)
+    return app
+
+
+class TestCategorize:
+    """Innermost matching module decides the category."""
+
+    @pytest.mark.parametrize(
+        ("modules", "suspended", "expected"),
+        [
+            (["taskman_api.routers.tasks", "sqlalchemy.ext.asyncio.session"], True, "db"),
+            (["fastapi.routing", "pydantic.type_adapter"], False, "pydantic"),
+            (["fastapi.routing", "fastapi.encoders"], False, "json"),
+            (["sqlalchemy.orm", "pydantic.main"], False, "pydantic"),
+            (["taskman_api.routers.tasks"], True, "await"),
+            (["taskman_api.routers.tasks"], False, "app"),
+            (["jsonschema_like"], False, "app"),
+        ],
+    )
+    def test_categories(self, modules, suspended, expected):
+        assert categorize(modules, suspended) == expected
+
+
+class TestSamplingProfiler:
+    """Stack sampling of one task."""
+
+    @pytest.mark.asyncio
+    async def test_running_and_suspended_samples(self):
+        async def busy_then_sleep():
+            deadline = time.perf_counter() + 0.03
+            while time.perf_counter() < deadline:
+                pass
+            await asyncio.sleep(0.03)
+
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        await busy_then_sleep()
+        profile = profiler.stop()
+
+        summary = profile.summary()
+        assert profile.samples > 0
+        assert summary["categories"]["app"]["ms"] > 0
+        assert summary["categories"]["await"]["ms"] > 0
+        assert any("busy_then_sleep" in stack for stack in profile.stacks)
+        for line in profile.collapsed().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert stack.split(";", 1)[0] in profiler_module.CATEGORIES
+            assert int(count) > 0
+
+    @pytest.mark.asyncio
+    async def test_database_awaits_are_categorized(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+        profiler = SamplingProfiler(interval=0.0005)
+        try:
+            async with engine.connect() as conn:
+                profiler.start()
+                for _ in range(200):
+                    await conn.execute(text("SELECT 1"))
+                profile = profiler.stop()
+        finally:
+            await engine.dispose()
+
+        assert profile.summary()["categories"]["db"]["ms"] > 0
+
+    def test_start_requires_task(self):
+        with pytest.raises(RuntimeError, match="asyncio task"):
+            SamplingProfiler().start()
+
+
+class TestProfileStore:
+    """Collapsed-stack persistence."""
+
+    def test_save_load_and_prune(self, tmp_path):
+        store = ProfileStore(tmp_path, max_profiles=2)
+        ids = [store.save(Profile(stacks=Counter({f"app;f{i}": 1}))) for i in range(3)]
+
+        assert store.load(ids[-1]) == "app;f2 1\n"
+        assert len(list(tmp_path.glob("*.collapsed"))) == 2
+
+    def test_load_rejects_path_like_ids(self, tmp_path):
+        assert ProfileStore(tmp_path).load("../etc/passwd") is None
+
+
+class TestAdminGating:
+    """X-Profile header and diagnostic routes."""
+
+    @pytest.mark.asyncio
+    async def test_admin_x_profile_stores_profile(self, app, store):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            res = await client.get("/work", headers={"X-Profile": "1", **_auth("admin")})
+            fetched = await client.get(
+                f"/api/v1/diagnostic/debug/profile/{res.headers['X-Profile-Id']}",
+                headers=_auth("admin"),
+            )
+
+        assert res.status_code == 200
+        assert "await=" in res.headers["X-Profile-Summary"]
+        assert fetched.status_code == 200
+        assert fetched.text == store.load(res.headers["X-Profile-Id"])
+
+    @pytest.mark.asyncio
+    async def test_non_admin_x_profile_is_ignored(self, app, store):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            res = await client.get("/work", headers={"X-Profile": "1", **_auth("user")})
+            anonymous = await client.get("/work", headers={"X-Profile": "1"})
+
+        assert res.status_code == anonymous.status_code == 200
+        assert "X-Profile-Id" not in res.headers
+        assert not list(store.directory.glob("*.collapsed"))
+
+    @pytest.mark.asyncio
+    async def test_profile_route_endpoint(self, app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            res = await client.get(
+                "/api/v1/diagnostic/debug/profile",
+                params={"route": "/work"},
+                headers=_auth("admin"),
+            )
+            summary = await client.get(
+                "/api/v1/diagnostic/debug/profile",
+                params={"route": "/work", "format": "summary"},
+                headers=_auth("admin"),
+            )
+            forbidden = await client.get(
+                "/api/v1/diagnostic/debug/profile", params={"route": "/work"}, headers=_auth()
+            )
+            recursive = await client.get(
+                "/api/v1/diagnostic/debug/profile",
+                params={"route": "/api/v1/diagnostic/debug/profile"},
+                headers=_auth("admin"),
+            )
+
+        assert res.status_code == 200
+        assert res.headers["X-Profiled-Status"] == "200"
+        assert "work" in res.text
+        assert summary.json()["status_code"] == 200
+        assert set(summary.json()["categories"]) == set(profiler_module.CATEGORIES)
+        assert forbidden.status_code == 403
+        assert recursive.status_code == 400
@@ -0,0 +1,126 @@
+"""Unit tests for request-scoped query tracking.
+
+Tests verify:
+- Statements are counted and timed only while a tracker is active
+- Nested trackers each record the statement
+- Bind shapes expose parameter names and types, never values
+- Slow statements are logged with route and bind shape
+- QueryBudgetMiddleware headers and N+1 / budget warnings
+"""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from structlog.testing import capture_logs
+
+from taskman_api.middleware import QueryBudgetMiddleware
+from taskman_api.telemetry.query_tracker import bind_shape, track_queries
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    yield engine
+    await engine.dispose()
+
+
+class TestBindShape:
+    """Parameter shape descriptions."""
+
+    def test_named_parameters(self):
+        assert bind_shape({"id": "T-1", "limit": 10}) == {"id": "str", "limit": "int"}
+
+    def test_positional_parameters(self):
+        assert bind_shape(("T-1", None)) == ["str", "NoneType"]
+
+    def test_positional_parameters_with_names(self):
+        assert bind_shape(("T-1", 5), names=("id", "limit")) == {"id": "str", "limit": "int"}
+
+    def test_executemany(self):
+        assert bind_shape([("a",), ("b",)], executemany=True) == {"rows": 2, "row": ["str"]}
+
+
+class TestTracking:
+    """ContextVar-scoped statement recording."""
+
+    @pytest.mark.asyncio
+    async def test_counts_only_inside_tracker(self, engine):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            with track_queries("outer") as outer:
+                await conn.execute(text("SELECT 1"))
+                with track_queries("inner") as inner:
+                    await conn.execute(text("SELECT 1"))
+                    await conn.execute(text("SELECT 2"))
+            await conn.execute(text("SELECT 1"))
+
+        assert outer.count == 3
+        assert inner.count == 2
+        assert outer.statements["SELECT 1"] == 2
+        assert outer.repeated(2) == [("SELECT 1", 2)]
+        assert outer.total_seconds > 0
+
+    @pytest.mark.asyncio
+    async def test_slow_query_logged_with_bind_shape(self, engine):
+        with capture_logs() as logs, track_queries("route-x", slow_threshold_ms=0):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT :value"), {"value": "secret"})
+
+        (event,) = [log for log in logs if log["event"] == "slow_query"]
+        assert event["route"] == "route-x"
+        assert event["bind_shape"] == {"value": "str"}
+        assert "secret" not in str(event)
+
+
+class TestMiddleware:
+    """QueryBudgetMiddleware reporting."""
+
+    def _app(self, engine, **options) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str, n: int = 1):
+            async with engine.connect() as conn:
+                for _ in range(n):
+                    await conn.execute(text("SELECT :id"), {"id": item_id})
+            return {"id": item_id}
+
+        app.add_middleware(QueryBudgetMiddleware, **options)
+        return app
+
+    @pytest.mark.asyncio
+    async def test_headers_exposed_when_enabled(self, engine):
+        app = self._app(engine, expose_headers=True)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            res = await client.get("/items/a?n=3")
+
+        assert res.headers["X-Query-Count"] == "3"
+        assert res.headers["Server-Timing"].endswith('desc="3 queries"')
+
+    @pytest.mark.asyncio
+    async def test_headers_hidden_by_default(self, engine):
+        app = self._app(engine)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            res = await client.get("/items/a")
+
+        assert "X-Query-Count" not in res.headers
+        assert "Server-Timing" not in res.headers
+
+    @pytest.mark.asyncio
+    async def test_n_plus_one_and_budget_warnings(self, engine):
+        app = self._app(engine, n_plus_one_threshold=3, query_budget=4)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            with capture_logs() as logs:
+                await client.get("/items/a?n=2")
+                await client.get("/items/b?n=5")
+
+        n_plus_one = [log for log in logs if log["event"] == "n_plus_one_suspected"]
+        exceeded = [log for log in logs if log["event"] == "query_budget_exceeded"]
+        assert len(n_plus_one) == 1
+        assert n_plus_one[0]["route"] == "/items/{item_id}"
+        assert n_plus_one[0]["repetitions"] == 5
+        assert len(exceeded) == 1
+        assert exceeded[0]["query_count"] == 5
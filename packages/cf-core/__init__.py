@@ -32,11 +32,38 @@ CLI Usage::
     python -m cf_core.cli.main --machine task list  # JSON output
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-# Re-export common types for convenience
-from cf_core.models.task import Task
-from cf_core.services.taskman_service import TaskManService
-from cf_core.shared import NotFoundException, Result
+# Re-export common types for convenience. Resolved on first access (PEP 562) so
+# importing a light subpackage such as cf_core.logging does not load the models
+# and TaskManService.
+_LAZY_EXPORTS = {
+    "Task": "cf_core.models.task",
+    "TaskManService": "cf_core.services.taskman_service",
+    "NotFoundException": "cf_core.shared",
+    "Result": "cf_core.shared",
+}
+
+if TYPE_CHECKING:
+    from cf_core.models.task import Task
+    from cf_core.services.taskman_service import TaskManService
+    from cf_core.shared import NotFoundException, Result
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
+
 
 __all__ = ["Result", "NotFoundException", "TaskManService", "Task", "__version__"]
@@ -9,6 +9,7 @@ fragmented implementations across the codebase. Key features:
 - ThreadPoolExecutor and subprocess context propagation
 - Backward compatibility with existing ulog() API
 - Feature flag support for gradual migration
+- Opt-in queue-backed async sink that renders/writes off the event loop
 
 Example:
     Basic usage:
@@ -48,7 +49,7 @@ _CFCORE_LOGGING_ENABLED = os.getenv("CFCORE_LOGGING_V3", "1").lower() in ("1", "
 
 if _CFCORE_LOGGING_ENABLED:
     # New cf_core.logging implementation
-    from .core import configure_logging, get_logger, ulog
+    from .core import configure_logging, get_log_sink, get_logger, shutdown_logging, ulog
     from .correlation import (
         correlation_context,
         get_correlation_id,
@@ -59,12 +60,17 @@ if _CFCORE_LOGGING_ENABLED:
     from .decorators import logged_action
     from .evidence import canonicalize, capture_evidence, hash_evidence
     from .runtime import Runtime, RuntimeBuilder
+    from .sink import AsyncLogSink
 
     __all__ = [
         # Core logging API
         "configure_logging",
         "get_logger",
         "ulog",
+        # Async sink
+        "AsyncLogSink",
+        "get_log_sink",
+        "shutdown_logging",
         # Correlation management
         "correlation_context",
         "get_correlation_id",
@@ -100,6 +106,9 @@ else:
         def configure_logging(**kwargs):
             """Stub - configure_logging not available in legacy mode."""
             pass
+        def shutdown_logging(timeout: float = 5.0) -> None:
+            """Stub - no async sink in legacy mode."""
+            pass
         def get_correlation_id() -> str:
             """Stub - returns empty string in legacy mode."""
             return ""
@@ -109,6 +118,7 @@ else:
             "ulog",
             "RuntimeBuilder",
             "configure_logging",
+            "shutdown_logging",
             "get_correlation_id"
         ]
 
@@ -123,8 +133,13 @@ else:
         def configure_logging(**kwargs):
             """Stub configure_logging implementation."""
             pass
+        def shutdown_logging(timeout: float = 5.0) -> None:
+            """Stub shutdown_logging implementation."""
+            pass
         def get_correlation_id() -> str:
             """Stub get_correlation_id implementation."""
             return ""
 
-        __all__ = ["get_logger", "ulog", "configure_logging", "get_correlation_id"]
+        __all__ = [
+            "get_logger", "ulog", "configure_logging", "shutdown_logging", "get_correlation_id"
+        ]
@@ -10,6 +10,7 @@ Key Features:
 - Configurable output formats (JSON, text)
 - Legacy ulog() API compatibility
 - LOG-001..009 baseline event support
+- Opt-in queue-backed async sink (rendering and writes off the event loop)
 
 Authority: docs/prd/PRD-CFCORE-LOGGING.md (FR-001, FR-002, FR-008)
 """
@@ -26,10 +27,14 @@ except ImportError:
     _STRUCTLOG_AVAILABLE = False
 
 from .correlation import get_correlation_id
+from .sink import AsyncLogSink
 
 # Global logger instance
 _logger: structlog.stdlib.BoundLogger | logging.Logger | None = None
 _configured = False
+_sink: AsyncLogSink | None = None
+# configure_logging arguments, to reconfigure synchronously on shutdown
+_last_config: dict[str, Any] | None = None
 
 
 def _add_correlation_processor(logger, method_name, event_dict):
@@ -42,6 +47,11 @@ def configure_logging(
     level: str = "INFO",
     format: str = "json",
     output: str = "console",
+    *,
+    async_sink: bool | None = None,
+    queue_size: int = 10_000,
+    drop_policy: str = "drop_newest",
+    processors: list[Any] | None = None,
     **kwargs: Any
 ) -> None:
     """Configure the logging system (FR-008).
@@ -53,6 +63,12 @@ def configure_logging(
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         format: Output format ("json" or "text")
         output: Output destination ("console", "file", or file path)
+        async_sink: Render and write JSON logs on a background thread via a
+            bounded queue (default: CFCORE_LOG_ASYNC env var, off)
+        queue_size: Maximum pending events for the async sink
+        drop_policy: Async sink overflow policy ("drop_newest" or "drop_oldest")
+        processors: Replace the default structlog processor chain (renderer
+            excluded); used by applications that keep their own chain
         **kwargs: Additional configuration options
 
     Raises:
@@ -65,8 +81,11 @@ def configure_logging(
 
         # Configure text logging to file
         configure_logging(level="DEBUG", format="text", output="/var/log/app.log")
+
+        # Non-blocking JSON logging for async services
+        configure_logging(level="INFO", format="json", async_sink=True)
     """
-    global _logger, _configured
+    global _logger, _configured, _last_config
 
     # Validate parameters
     valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
@@ -83,13 +102,46 @@ def configure_logging(
             "structlog is required for JSON format. Install with: pip install structlog"
         )
 
+    if async_sink is None:
+        async_sink = os.getenv("CFCORE_LOG_ASYNC", "0").lower() in ("1", "true", "yes")
+
+    # Replace any sink from a previous configuration, flushing what it holds
+    _stop_sink()
+
     # Configure based on format
     if format.lower() == "json" and _STRUCTLOG_AVAILABLE:
-        _configure_structlog(level, output, **kwargs)
+        if async_sink:
+            _start_sink(output, queue_size, drop_policy)
+        if processors is not None:
+            _configure_structlog_chain(level, output, processors)
+        else:
+            _configure_structlog(level, output, **kwargs)
     else:
         _configure_stdlib(level, format, output, **kwargs)
 
     _configured = True
+    _last_config = {
+        "level": level,
+        "format": format,
+        "output": output,
+        "processors": processors,
+        **kwargs,
+    }
+
+
+def _start_sink(output: str, queue_size: int, drop_policy: str) -> None:
+    """Create the global async sink writing to ``output``."""
+    global _sink
+
+    stream = None if output == "console" else open(output, "a", encoding="utf-8")  # noqa: SIM115
+    _sink = AsyncLogSink(
+        stream, max_queue=queue_size, drop_policy=drop_policy, close_stream=stream is not None
+    )
+
+
+def _renderer() -> Any:
+    """Final processor: the async sink if enabled, else synchronous JSON rendering."""
+    return _sink if _sink is not None else structlog.processors.JSONRenderer()
 
 
 def _configure_structlog(level: str, output: str, **kwargs: Any) -> None:
@@ -108,8 +160,8 @@ def _configure_structlog(level: str, output: str, **kwargs: Any) -> None:
         structlog.processors.StackInfoRenderer(),
     ]
 
-    # Add JSON formatter for machine-readable output
-    processors.append(structlog.processors.JSONRenderer())
+    # Add JSON formatter (or the async sink) for machine-readable output
+    processors.append(_renderer())
 
     # Configure structlog
     structlog.configure(
@@ -136,6 +188,56 @@ def _configure_structlog(level: str, output: str, **kwargs: Any) -> None:
     _logger = structlog.get_logger()
 
 
+def _configure_structlog_chain(level: str, output: str, processors: list[Any]) -> None:
+    """Configure structlog with a caller-supplied processor chain.
+
+    Uses a level-filtering bound logger and writes directly (no stdlib
+    logging), matching a plain ``structlog.configure(processors=[...])`` setup.
+    """
+    global _logger
+
+    if output == "console" or _sink is not None:
+        logger_factory = structlog.PrintLoggerFactory()
+    else:
+        logger_factory = structlog.WriteLoggerFactory(open(output, "a", encoding="utf-8"))  # noqa: SIM115
+
+    structlog.configure(
+        processors=[*processors, _renderer()],
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, level.upper())),
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
+    )
+
+    _logger = structlog.get_logger()
+
+
+def get_log_sink() -> AsyncLogSink | None:
+    """Return the active async sink, if ``configure_logging(async_sink=True)`` was used."""
+    return _sink
+
+
+def shutdown_logging(timeout: float = 5.0) -> None:
+    """Flush and stop the async sink, if any. Safe to call more than once.
+
+    Call from application shutdown hooks so queued events are not lost.
+    Logging is then reconfigured with the synchronous renderer, so later
+    log calls are still written.
+    """
+    if _stop_sink(timeout) and _last_config is not None:
+        configure_logging(**_last_config, async_sink=False)
+
+
+def _stop_sink(timeout: float = 5.0) -> bool:
+    """Flush and stop the async sink; returns True if one was running."""
+    global _sink
+
+    if _sink is None:
+        return False
+    _sink.close(timeout)
+    _sink = None
+    return True
+
+
 def _configure_stdlib(level: str, format: str, output: str, **kwargs: Any) -> None:
     """Configure stdlib logging for text output."""
     global _logger
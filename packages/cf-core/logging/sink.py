@@ -0,0 +1,275 @@
+"""Queue-backed asynchronous log sink for cf_core.logging.
+
+Moves JSON rendering and stream writes off the calling thread (typically the
+asyncio event loop). Structlog processors still run inline - they are cheap -
+but the final processor hands the event dict to a bounded queue and drops the
+event from the synchronous pipeline. A daemon writer thread drains the queue,
+renders each event (orjson when installed, stdlib json otherwise) and writes
+lines to the stream in batches.
+
+Key Features:
+- Bounded queue with a configurable overflow policy ("drop_newest" or
+  "drop_oldest"); the caller never blocks
+- Drop counters exposed via ``AsyncLogSink.stats``
+- ``flush()`` for tests/shutdown and ``close()`` registered with atexit
+- Events logged after ``close()`` are written synchronously, not dropped
+
+Example:
+    from cf_core.logging import configure_logging, shutdown_logging
+
+    configure_logging(level="INFO", format="json", async_sink=True)
+    ...
+    shutdown_logging()  # flush pending events on application shutdown
+
+Authority: docs/prd/PRD-CFCORE-LOGGING.md (FR-008)
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import queue
+import sys
+import threading
+from collections.abc import MutableMapping
+from typing import IO, Any
+
+try:
+    import structlog
+    _STRUCTLOG_AVAILABLE = True
+except ImportError:
+    _STRUCTLOG_AVAILABLE = False
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+DROP_POLICIES = frozenset({"drop_newest", "drop_oldest"})
+
+# Sentinel used to wake the writer for flush/close
+_FLUSH = object()
+_STOP = object()
+
+
+def render_json(event_dict: MutableMapping[str, Any]) -> str:
+    """Render an event dict as a single JSON line (orjson when available)."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(
+            event_dict, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(event_dict, default=str)
+
+
+class AsyncLogSink:
+    """Bounded queue plus background writer thread for structured log events.
+
+    Instances are structlog processors: place one last in the processor chain
+    (instead of a renderer). The event is enqueued and ``structlog.DropEvent``
+    is raised so nothing is rendered or written on the calling thread.
+
+    Args:
+        stream: Text stream to write to (default: sys.stdout)
+        max_queue: Maximum number of pending events before the drop policy applies
+        batch_size: Maximum number of events rendered per write
+        drop_policy: "drop_newest" discards the incoming event on overflow,
+            "drop_oldest" evicts the oldest pending event to make room
+        close_stream: Close ``stream`` when the sink is closed (for owned files)
+    """
+
+    def __init__(
+        self,
+        stream: IO[str] | None = None,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        drop_policy: str = "drop_newest",
+        close_stream: bool = False,
+    ) -> None:
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(
+                f"Invalid drop policy: {drop_policy}. Must be one of {set(DROP_POLICIES)}"
+            )
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+
+        self._stream = stream
+        self._close_stream = close_stream
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._batch_size = max(1, batch_size)
+        self._drop_policy = drop_policy
+        self._lock = threading.Lock()
+        self._flushed = threading.Condition(self._lock)
+        self._flush_generation = 0
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._errors = 0
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="cf-core-log-sink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def __call__(self, logger: Any, method_name: str, event_dict: MutableMapping[str, Any]):
+        """Structlog processor: enqueue the event and drop it from the sync pipeline.
+
+        Once the sink is closed, events are written through on the calling
+        thread instead, since loggers cached before shutdown keep this sink
+        as their final processor. If the sink's own stream is already closed,
+        the rendered line is returned for structlog's logger to write.
+        """
+        if self._closed:
+            if self._close_stream and self._stream is not None and self._stream.closed:
+                return render_json(event_dict)
+            self._write([event_dict])
+            raise structlog.DropEvent
+        self.enqueue(event_dict)
+        raise structlog.DropEvent
+
+    def enqueue(self, event_dict: MutableMapping[str, Any]) -> bool:
+        """Queue an event for rendering. Never blocks.
+
+        Returns:
+            True if the event was queued, False if it was dropped
+        """
+        if self._closed:
+            self._count_drop()
+            return False
+        try:
+            self._queue.put_nowait(event_dict)
+        except queue.Full:
+            if self._drop_policy == "drop_newest":
+                self._count_drop()
+                return False
+            # drop_oldest: evict one pending event and retry once
+            if self._evict_oldest():
+                self._count_drop()
+            try:
+                self._queue.put_nowait(event_dict)
+            except queue.Full:
+                self._count_drop()
+                return False
+        with self._lock:
+            self._enqueued += 1
+        return True
+
+    def _evict_oldest(self) -> bool:
+        """Remove the oldest pending event, leaving flush/stop markers queued."""
+        with self._queue.mutex:
+            pending = self._queue.queue
+            for index, item in enumerate(pending):
+                if item is not _FLUSH and item is not _STOP:
+                    del pending[index]
+                    self._queue.not_full.notify()
+                    return True
+        return False
+
+    def _count_drop(self) -> None:
+        with self._lock:
+            self._dropped += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters: enqueued, written, dropped, write errors and current queue depth."""
+        with self._lock:
+            return {
+                "enqueued": self._enqueued,
+                "written": self._written,
+                "dropped": self._dropped,
+                "errors": self._errors,
+                "pending": self._queue.qsize(),
+            }
+
+    # ------------------------------------------------------------------
+    # Writer side
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        """Writer loop: block for one item, then drain up to batch_size more."""
+        while True:
+            item = self._queue.get()
+            batch: list[MutableMapping[str, Any]] = []
+            markers: list[object] = []
+            while True:
+                if item is _FLUSH or item is _STOP:
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= self._batch_size or markers:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+            if markers:
+                with self._flushed:
+                    self._flush_generation += 1
+                    self._flushed.notify_all()
+                if _STOP in markers:
+                    return
+
+    def _write(self, batch: list[MutableMapping[str, Any]]) -> None:
+        lines = []
+        for event_dict in batch:
+            try:
+                lines.append(render_json(event_dict))
+            except Exception:  # noqa: BLE001 - a bad event must not kill the writer
+                with self._lock:
+                    self._errors += 1
+        if not lines:
+            return
+        stream = self._stream or sys.stdout
+        try:
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+        except Exception:  # noqa: BLE001 - e.g. closed stream at interpreter exit
+            with self._lock:
+                self._errors += len(lines)
+            return
+        with self._lock:
+            self._written += len(lines)
+
+    def _signal(self, marker: object, timeout: float) -> bool:
+        """Send a marker to the writer and wait until it has been processed."""
+        if not self._thread.is_alive():
+            return False
+        with self._flushed:
+            generation = self._flush_generation
+        try:
+            # Markers bypass the size bound semantics by blocking briefly
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        with self._flushed:
+            return self._flushed.wait_for(
+                lambda: self._flush_generation > generation, timeout=timeout
+            )
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until all events queued before this call are written.
+
+        Returns:
+            True if the writer caught up within ``timeout``
+        """
+        return self._signal(_FLUSH, timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending events and stop the writer thread. Idempotent."""
+        if self._closed:
+            return
+        self._closed = True
+        self._signal(_STOP, timeout)
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+        if self._close_stream and self._stream is not None:
+            self._stream.close()
@@ -0,0 +1,177 @@
+import io
+import json
+import threading
+
+import pytest
+import structlog
+
+from cf_core.logging import configure_logging, get_log_sink, shutdown_logging
+from cf_core.logging.sink import AsyncLogSink, render_json
+
+
+class _BlockingStream(io.StringIO):
+    """Stream whose writes wait until released, to back up the queue."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait(timeout=5)
+        return super().write(text)
+
+
+def _lines(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_sink_renders_events_in_order():
+    stream = io.StringIO()
+    sink = AsyncLogSink(stream, batch_size=4)
+    for i in range(10):
+        assert sink.enqueue({"event": "tick", "i": i})
+
+    assert sink.flush()
+    assert [line["i"] for line in _lines(stream)] == list(range(10))
+    assert sink.stats["written"] == 10
+    sink.close()
+
+
+def test_processor_drops_event_from_sync_pipeline():
+    sink = AsyncLogSink(io.StringIO())
+    with pytest.raises(structlog.DropEvent):
+        sink(None, "info", {"event": "x"})
+    sink.close()
+
+
+def test_drop_newest_counts_overflow():
+    stream = _BlockingStream()
+    sink = AsyncLogSink(stream, max_queue=2, batch_size=1, drop_policy="drop_newest")
+    results = [sink.enqueue({"event": "e", "i": i}) for i in range(20)]
+    stream.release.set()
+    sink.flush()
+
+    assert results.count(False) == sink.stats["dropped"] > 0
+    assert sink.stats["written"] + sink.stats["dropped"] == 20
+    sink.close()
+
+
+def test_drop_oldest_keeps_latest_events():
+    stream = _BlockingStream()
+    sink = AsyncLogSink(stream, max_queue=2, batch_size=1, drop_policy="drop_oldest")
+    for i in range(20):
+        sink.enqueue({"event": "e", "i": i})
+    stream.release.set()
+    sink.flush()
+
+    assert _lines(stream)[-1]["i"] == 19
+    assert sink.stats["dropped"] > 0
+    sink.close()
+
+
+def test_drop_oldest_never_evicts_pending_flush():
+    stream = _BlockingStream()
+    sink = AsyncLogSink(stream, max_queue=2, batch_size=1, drop_policy="drop_oldest")
+    sink.enqueue({"event": "e", "i": 0})
+    while sink.stats["pending"]:  # writer holds event 0, blocked on the stream
+        threading.Event().wait(0.01)
+    sink.enqueue({"event": "e", "i": 1})
+    flushed = []
+    flusher = threading.Thread(target=lambda: flushed.append(sink.flush(timeout=2)))
+    flusher.start()
+    while sink.stats["pending"] < 2:  # event 1 and the flush marker
+        threading.Event().wait(0.01)
+
+    for i in range(2, 20):
+        sink.enqueue({"event": "e", "i": i})
+    stream.release.set()
+    flusher.join()
+
+    assert flushed == [True]
+    assert sink.stats["dropped"] == 18
+    sink.close()
+    assert not sink._thread.is_alive()
+    assert [line["i"] for line in _lines(stream)] == [0, 19]
+
+
+def test_close_flushes_and_rejects_new_events():
+    stream = io.StringIO()
+    sink = AsyncLogSink(stream)
+    sink.enqueue({"event": "last"})
+    sink.close()
+
+    assert _lines(stream) == [{"event": "last"}]
+    assert sink.enqueue({"event": "late"}) is False
+    assert sink.stats["dropped"] == 1
+
+
+def test_closed_sink_writes_through():
+    stream = io.StringIO()
+    sink = AsyncLogSink(stream)
+    sink.close()
+
+    with pytest.raises(structlog.DropEvent):
+        sink(None, "info", {"event": "late"})
+    assert _lines(stream) == [{"event": "late"}]
+    assert sink.stats["written"] == 1
+
+
+def test_invalid_drop_policy_rejected():
+    with pytest.raises(ValueError, match="drop policy"):
+        AsyncLogSink(io.StringIO(), drop_policy="block")
+
+
+def test_render_json_handles_non_serializable_values():
+    assert json.loads(render_json({"event": "x", "obj": object}))["obj"].startswith("<class")
+
+
+def test_configure_logging_routes_through_sink(tmp_path):
+    log_file = tmp_path / "app.log"
+    configure_logging(
+        level="INFO",
+        format="json",
+        output=str(log_file),
+        async_sink=True,
+        processors=[structlog.processors.add_log_level],
+    )
+    try:
+        sink = get_log_sink()
+        assert sink is not None
+        structlog.get_logger().info("async_event", answer=42)
+        structlog.get_logger().debug("filtered_event")
+        sink.flush()
+    finally:
+        shutdown_logging()
+        structlog.reset_defaults()
+
+    (line,) = _lines(io.StringIO(log_file.read_text()))
+    assert line == {"event": "async_event", "answer": 42, "level": "info"}
+    assert get_log_sink() is None
+
+
+def test_logging_continues_after_shutdown(tmp_path, capsys):
+    log_file = tmp_path / "app.log"
+    configure_logging(
+        level="INFO",
+        format="json",
+        output=str(log_file),
+        async_sink=True,
+        processors=[structlog.processors.add_log_level],
+    )
+    cached = structlog.get_logger()
+    try:
+        cached.info("before_shutdown")
+        shutdown_logging()
+        structlog.get_logger().info("new_logger_after_shutdown")
+        # Cached before shutdown: its chain still ends in the closed sink
+        cached.info("cached_logger_after_shutdown")
+    finally:
+        shutdown_logging()
+        structlog.reset_defaults()
+
+    events = [line["event"] for line in _lines(io.StringIO(log_file.read_text()))]
+    assert events == ["before_shutdown", "new_logger_after_shutdown"]
+    assert json.loads(capsys.readouterr().out) == {
+        "event": "cached_logger_after_shutdown",
+        "level": "info",
+    }